@@ -0,0 +1,22 @@
+-- Migration: 004_async_jobs_seq_counters
+-- Description: Per-job sequence counters for job_events / job_results on the jobs row
+-- Depends on: 003_async_jobs_results
+-- Note: DbAsyncJobStore allocates event_seq / result_seq by incrementing these
+--       counters in the same UPDATE as the status change instead of running
+--       COUNT(*) / MAX() over the job's history on every write.
+
+BEGIN;
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS last_event_seq  integer NOT NULL DEFAULT 0;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS last_result_seq integer NOT NULL DEFAULT 0;
+
+-- -------------------------------------------------------------------------
+-- Backfill from existing history (idempotent; never lowers a counter)
+-- -------------------------------------------------------------------------
+UPDATE jobs j
+SET last_event_seq  = GREATEST(j.last_event_seq,
+                               COALESCE((SELECT MAX(e.event_seq) FROM job_events e WHERE e.job_id = j.job_id), 0)),
+    last_result_seq = GREATEST(j.last_result_seq,
+                               COALESCE((SELECT MAX(r.result_seq) FROM job_results r WHERE r.job_id = j.job_id), 0));
+
+COMMIT;
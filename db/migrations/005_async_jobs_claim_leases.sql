@@ -0,0 +1,45 @@
+-- Migration: 005_async_jobs_claim_leases
+-- Description: DB-backed job claiming for multi-node async workers (leases + LISTEN/NOTIFY)
+-- Depends on: 004_async_jobs_seq_counters
+-- Note: Workers claim open jobs with SELECT ... FOR UPDATE SKIP LOCKED and hold a
+--       time-limited lease (lease_owner / lease_expires_at) that they renew by
+--       heartbeat. Jobs whose lease expired are claimable again. New queued jobs
+--       and released leases are announced on the NOTIFY channel `async_jobs`
+--       (payload: job_id), so idle workers wake up without polling.
+
+BEGIN;
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS lease_owner      text;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS lease_expires_at timestamptz;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS claim_count      integer NOT NULL DEFAULT 0;
+
+-- Claim scan: open jobs in FIFO order (partial index stays small)
+CREATE INDEX IF NOT EXISTS jobs_claimable_idx ON jobs(queued_at)
+    WHERE status IN ('queued', 'running', 'partial');
+
+-- -------------------------------------------------------------------------
+-- NOTIFY async_jobs on new queued jobs and on released/expired leases
+-- -------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION async_jobs_notify_claimable() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('async_jobs', NEW.job_id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS jobs_notify_queued ON jobs;
+CREATE TRIGGER jobs_notify_queued
+    AFTER INSERT ON jobs
+    FOR EACH ROW
+    WHEN (NEW.status = 'queued')
+    EXECUTE FUNCTION async_jobs_notify_claimable();
+
+DROP TRIGGER IF EXISTS jobs_notify_lease_released ON jobs;
+CREATE TRIGGER jobs_notify_lease_released
+    AFTER UPDATE OF lease_owner ON jobs
+    FOR EACH ROW
+    WHEN (OLD.lease_owner IS NOT NULL AND NEW.lease_owner IS NULL
+          AND NEW.status IN ('queued', 'running', 'partial'))
+    EXECUTE FUNCTION async_jobs_notify_claimable();
+
+COMMIT;
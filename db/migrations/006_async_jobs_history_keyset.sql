@@ -0,0 +1,51 @@
+-- Migration: 006_async_jobs_history_keyset
+-- Description: Keyset indexes + maintained job counters for /analyze/history
+-- Depends on: 005_async_jobs_claim_leases
+-- Note: History pages are read newest-first with a (queued_at, job_id) cursor
+--       instead of LIMIT/OFFSET; totals come from job_counts (kept in sync by
+--       trigger) instead of COUNT(*) over all of a tenant's jobs.
+
+BEGIN;
+
+-- -------------------------------------------------------------------------
+-- Keyset indexes: WHERE org_id [AND user_id] ORDER BY queued_at DESC, job_id DESC
+-- -------------------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS jobs_org_user_queued_idx ON jobs(org_id, user_id, queued_at DESC, job_id DESC);
+CREATE INDEX IF NOT EXISTS jobs_org_queued_idx      ON jobs(org_id, queued_at DESC, job_id DESC);
+
+-- -------------------------------------------------------------------------
+-- job_counts — jobs per (org_id, user_id); user_id '' = jobs without user
+-- -------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS job_counts (
+    org_id    text    NOT NULL,
+    user_id   text    NOT NULL DEFAULT '',
+    job_count bigint  NOT NULL DEFAULT 0,
+    PRIMARY KEY (org_id, user_id)
+);
+
+CREATE OR REPLACE FUNCTION async_jobs_maintain_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO job_counts (org_id, user_id, job_count)
+        VALUES (NEW.org_id, COALESCE(NEW.user_id, ''), 1)
+        ON CONFLICT (org_id, user_id) DO UPDATE SET job_count = job_counts.job_count + 1;
+        RETURN NEW;
+    END IF;
+    UPDATE job_counts SET job_count = job_count - 1
+    WHERE org_id = OLD.org_id AND user_id = COALESCE(OLD.user_id, '');
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS jobs_maintain_counts ON jobs;
+CREATE TRIGGER jobs_maintain_counts
+    AFTER INSERT OR DELETE ON jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION async_jobs_maintain_counts();
+
+-- Backfill (idempotent: recomputes every row from jobs)
+INSERT INTO job_counts (org_id, user_id, job_count)
+SELECT org_id, COALESCE(user_id, ''), COUNT(*) FROM jobs GROUP BY org_id, COALESCE(user_id, '')
+ON CONFLICT (org_id, user_id) DO UPDATE SET job_count = EXCLUDED.job_count;
+
+COMMIT;
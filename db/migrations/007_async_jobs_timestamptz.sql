@@ -0,0 +1,56 @@
+-- Migration: 007_async_jobs_timestamptz
+-- Description: Native timestamptz columns + time-range indexes for the async jobs schema
+-- Depends on: 006_async_jobs_history_keyset
+-- Note: jobs.queued_at/started_at/finished_at/updated_at, job_events.occurred_at
+--       and job_results.created_at were ISO-8601 text. They are converted in
+--       place (the stored strings always carry an offset, so the cast is exact)
+--       and dependent indexes are rebuilt by the ALTER. DbAsyncJobStore keeps
+--       writing ISO strings and returns timestamptz values as UTC ISO strings,
+--       so it works against the schema before and after this migration and the
+--       wire format does not change.
+--       The conversion rewrites the three tables; run it in a maintenance window
+--       on large installations.
+
+BEGIN;
+
+-- -------------------------------------------------------------------------
+-- text -> timestamptz (guarded, so re-running on a converted schema is a no-op)
+-- -------------------------------------------------------------------------
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'jobs' AND column_name = 'queued_at') = 'text' THEN
+        ALTER TABLE jobs
+            ALTER COLUMN queued_at   TYPE timestamptz USING queued_at::timestamptz,
+            ALTER COLUMN started_at  TYPE timestamptz USING NULLIF(started_at, '')::timestamptz,
+            ALTER COLUMN finished_at TYPE timestamptz USING NULLIF(finished_at, '')::timestamptz,
+            ALTER COLUMN updated_at  TYPE timestamptz USING updated_at::timestamptz;
+    END IF;
+
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'job_events' AND column_name = 'occurred_at') = 'text' THEN
+        ALTER TABLE job_events
+            ALTER COLUMN occurred_at TYPE timestamptz USING occurred_at::timestamptz;
+    END IF;
+
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'job_results' AND column_name = 'created_at') = 'text' THEN
+        ALTER TABLE job_results
+            ALTER COLUMN created_at TYPE timestamptz USING created_at::timestamptz;
+    END IF;
+END;
+$$;
+
+-- -------------------------------------------------------------------------
+-- Time-range indexes for retention deletes
+-- -------------------------------------------------------------------------
+-- job_events / job_results are append-only, so insertion order follows the
+-- timestamp and a BRIN index stays tiny while still pruning range deletes.
+CREATE INDEX IF NOT EXISTS job_events_occurred_at_brin  ON job_events  USING brin (occurred_at);
+CREATE INDEX IF NOT EXISTS job_results_created_at_brin  ON job_results USING brin (created_at);
+
+-- Terminal jobs by finish time (job retention / archival scans)
+CREATE INDEX IF NOT EXISTS jobs_terminal_finished_at_idx ON jobs(finished_at)
+    WHERE status IN ('completed', 'failed', 'canceled');
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Migration: 008_async_jobs_result_reuse
+-- Description: Result reuse for identical /analyze requests (request_payload_hash lookup)
+-- Depends on: 007_async_jobs_timestamptz
+-- Note: With ASYNC_RESULT_REUSE_MAX_AGE_SECONDS > 0 a new async job whose
+--       canonical payload hash matches a completed job of the same org inside
+--       the freshness window is stored as completed right away and points at
+--       that job's final result (reused_from_job_id) instead of re-running the
+--       pipeline. Reused jobs are not reuse sources themselves, so the window
+--       always counts from the last real computation.
+
+BEGIN;
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS reused_from_job_id text;
+
+CREATE INDEX IF NOT EXISTS jobs_reuse_lookup_idx ON jobs(org_id, request_payload_hash, finished_at DESC)
+    WHERE status = 'completed' AND reused_from_job_id IS NULL;
+
+COMMIT;
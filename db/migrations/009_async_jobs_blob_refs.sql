@@ -0,0 +1,16 @@
+-- Migration: 009_async_jobs_blob_refs
+-- Description: Reference lookups for the result blob GC
+-- Depends on: 008_async_jobs_result_reuse
+-- Note: cleanup_retention deletes blobs under ASYNC_RESULT_BLOB_DIR that are
+--       referenced by neither job_results.s3_key nor jobs.request_payload_ref.
+--       It checks candidate keys in batches (= ANY(...)); without these
+--       indexes every batch would scan both tables.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS job_results_s3_key_idx ON job_results(s3_key)
+    WHERE s3_key IS NOT NULL;
+CREATE INDEX IF NOT EXISTS jobs_request_payload_ref_idx ON jobs(request_payload_ref)
+    WHERE request_payload_ref IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,25 @@
+-- Migration: 010_async_jobs_event_notify
+-- Description: NOTIFY on new job events (wakes /analyze/jobs/{id}/events waiters on other nodes)
+-- Depends on: 009_async_jobs_blob_refs
+-- Note: API nodes keep one LISTEN async_job_events connection and publish each
+--       notification (payload: job_id:event_seq) into their in-process event
+--       hub, so long-poll/SSE waiters wake up as soon as a worker on another
+--       node writes an event instead of after the poll interval. NOTIFY is
+--       delivered on commit; rolled-back events are never announced.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION async_jobs_notify_event() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('async_job_events', NEW.job_id || ':' || NEW.event_seq);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS job_events_notify_inserted ON job_events;
+CREATE TRIGGER job_events_notify_inserted
+    AFTER INSERT ON job_events
+    FOR EACH ROW
+    EXECUTE FUNCTION async_jobs_notify_event();
+
+COMMIT;
@@ -0,0 +1,14 @@
+-- Migration: 011_async_jobs_request_payload
+-- Description: Inline request payload for async jobs (options, preferences, batch queries)
+-- Depends on: 010_async_jobs_event_notify
+-- Note: Workers rebuild the analysis from the stored request payload. Without
+--       ASYNC_RESULT_BLOB_DIR the payload is kept in jobs.request_payload_json;
+--       with a blob store it stays a blob referenced by request_payload_ref and
+--       the column is NULL. Existing rows keep NULL (query and
+--       intelligence_mode remain on their own columns).
+
+BEGIN;
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS request_payload_json jsonb;
+
+COMMIT;
@@ -2,8 +2,9 @@
 """backfill_async_jobs_to_db.py — One-shot migration of async jobs from file store to DB.
 
 Reads ``runtime/async_jobs/store.v1.json`` (or the path set by
-``ASYNC_JOBS_STORE_FILE``) and writes jobs, events, and results into the
-Postgres schema created by migrations 002 + 003.
+``ASYNC_JOBS_STORE_FILE``), replays its append-only journal
+(``store.v1.json.journal``) on top and writes jobs, events, and results into the
+Postgres schema created by migrations 002 - 004.
 
 Features:
 - Idempotent: jobs/results that already exist in the DB are silently skipped
@@ -11,6 +12,9 @@ Features:
 - ``--dry-run``: parse + validate without writing to DB.
 - Tolerates missing or malformed fields in the JSON file (best-effort).
 - Progress counters for jobs, events, and results inserted / skipped.
+- Per-job sequence counters (``jobs.last_event_seq`` / ``last_result_seq``,
+  migration 004) are raised to the backfilled maxima, so later transitions
+  continue the sequence.
 
 Usage:
     python scripts/backfill_async_jobs_to_db.py --dry-run
@@ -38,6 +42,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.api.async_jobs import journal_file_for, replay_journal
+
 _DEFAULT_STORE_FILE = "runtime/async_jobs/store.v1.json"
 
 
@@ -86,6 +96,16 @@ def _load_store_file(path: Path) -> dict[str, Any]:
     if not isinstance(data, dict):
         print("[ERROR] store file root must be a JSON object", file=sys.stderr)
         sys.exit(1)
+    journal_path = journal_file_for(path)
+    if journal_path.exists():
+        for key in ("jobs", "results", "events", "notifications"):
+            if not isinstance(data.get(key), dict):
+                data[key] = {}
+        stats = replay_journal(data, journal_path)
+        print(
+            f"[INFO] journal replayed: {stats['applied']} records applied, "
+            f"{stats['torn']} unreadable skipped",
+        )
     return data
 
 
@@ -230,24 +250,47 @@ def _insert_result_if_not_exists(
     else:
         summary = str(result_payload)
 
+    # Blob-backed file-store results (ASYNC_RESULT_BLOB_DIR) keep their reference.
+    size_bytes = result.get("size_bytes")
     cur.execute(
         """
         INSERT INTO job_results (
             result_id, job_id, org_id, user_id,
             result_kind, result_seq, schema_version,
+            s3_bucket, s3_key, checksum_sha256, size_bytes,
             content_type, summary_json, created_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         ON CONFLICT (result_id) DO NOTHING
         """,
         (
             result_id, job_id, org_id, user_id,
             result_kind, result_seq, schema_version,
+            _safe_str(result.get("s3_bucket")) or None,
+            _safe_str(result.get("s3_key")) or None,
+            _safe_str(result.get("checksum_sha256")) or None,
+            _safe_int(size_bytes, 0) if size_bytes is not None else None,
             "application/json", summary, created_at,
         ),
     )
     return cur.rowcount > 0
 
 
+_SYNC_SEQ_COUNTERS_SQL = """
+UPDATE jobs j
+SET last_event_seq  = GREATEST(j.last_event_seq,
+                               COALESCE((SELECT MAX(e.event_seq) FROM job_events e WHERE e.job_id = j.job_id), 0)),
+    last_result_seq = GREATEST(j.last_result_seq,
+                               COALESCE((SELECT MAX(r.result_seq) FROM job_results r WHERE r.job_id = j.job_id), 0))
+WHERE j.job_id = ANY(%s)
+"""
+
+
+def _sync_seq_counters(cur: Any, job_ids: list[str]) -> None:
+    """Raise jobs.last_event_seq / last_result_seq to the backfilled maxima."""
+    if job_ids:
+        cur.execute(_SYNC_SEQ_COUNTERS_SQL, (job_ids,))
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -345,6 +388,7 @@ def main() -> None:
             else:
                 results_skipped += 1
 
+        _sync_seq_counters(cur, [str(job_id) for job_id in jobs])
         conn.commit()
         print(
             f"[OK]   jobs:    {jobs_inserted} inserted, {jobs_skipped} skipped (already present or invalid)"
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Mini-Benchmark: Query-Parsing + Kandidaten-Scoring (AddressMatcher).
+
+Simuliert den CPU-Hotpath eines Batch-Laufs ohne Netzwerk: pro Zeile wird die
+Query geparst, ein Satz SearchServer-ähnlicher Kandidaten vorbewertet und die
+besten Kandidaten gegen GWR-Attribute nachbewertet.
+
+Usage (from repo root):
+
+  python3 scripts/bench_address_matcher.py
+  python3 scripts/bench_address_matcher.py --rows 20000 --candidates 8
+
+Gemessen werden ein Kaltlauf (leere Normalisierungs-Caches) und ein Warmlauf
+(gleicher Korpus erneut, z. B. Retry eines Batches).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.api import address_intel
+
+
+_STREETS = (
+    "Bahnhofstrasse",
+    "Wassergasse",
+    "Spisergasse",
+    "Seestrasse",
+    "Hauptstrasse",
+    "Dorfstrasse",
+    "Kirchgasse",
+    "Rue du Lac",
+    "Avenue de la Gare",
+    "Via Nassa",
+    "St. Leonhard-Str.",
+    "Zürcherstrasse",
+    "Marktgasse",
+    "Schulhausstrasse",
+    "Rosenbergstrasse",
+)
+_LOCALITIES = (
+    ("8001", "Zürich"),
+    ("9000", "St. Gallen"),
+    ("3011", "Bern"),
+    ("4051", "Basel"),
+    ("1003", "Lausanne"),
+    ("6900", "Lugano"),
+    ("8640", "Rapperswil"),
+    ("6003", "Luzern"),
+    ("1290", "Versoix"),
+    ("7000", "Chur"),
+)
+
+
+def build_corpus(*, rows: int, candidates: int, seed: int) -> list[tuple[str, list[dict[str, Any]], dict[str, Any]]]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(rows):
+        street = rng.choice(_STREETS)
+        number = f"{rng.randint(1, 120)}{rng.choice(['', '', '', 'a', 'B'])}"
+        plz, city = rng.choice(_LOCALITIES)
+        query = f"{street} {number}, {plz} {city}"
+
+        raw_candidates = []
+        for rank in range(candidates):
+            cand_street = street if rank == 0 else rng.choice(_STREETS)
+            cand_plz, cand_city = (plz, city) if rank < 2 else rng.choice(_LOCALITIES)
+            raw_candidates.append(
+                {
+                    "featureId": f"{rng.randint(100000, 9999999)}_0",
+                    "label": f"{cand_street} {number} <b>{cand_plz} {cand_city}</b>",
+                    "detail": f"{cand_street} {number} {cand_plz} {cand_city}".lower(),
+                    "origin": "address",
+                    "rank": rank + 1,
+                }
+            )
+        gwr = {
+            "strname_deinr": f"{street} {number}",
+            "plz_plz6": f"{plz}00",
+            "dplzname": city,
+            "gstat": 1004,
+        }
+        corpus.append((query, raw_candidates, gwr))
+    return corpus
+
+
+def run_once(corpus: list[tuple[str, list[dict[str, Any]], dict[str, Any]]], *, hydrate: int) -> float:
+    started = time.perf_counter()
+    for query, raw_candidates, gwr in corpus:
+        parts = address_intel.parse_query_parts(query)
+        ranked = address_intel.build_candidate_list(raw_candidates, parts)
+        matcher = address_intel.AddressMatcher(parts)
+        for cand in ranked[:hydrate]:
+            matcher.score_detail({"adr_official": True}, gwr)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--candidates", type=int, default=6)
+    parser.add_argument("--hydrate", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=750)
+    args = parser.parse_args()
+
+    corpus = build_corpus(rows=args.rows, candidates=args.candidates, seed=args.seed)
+
+    address_intel._normalize_text_cached.cache_clear()
+    address_intel._tokenize_cached.cache_clear()
+    cold = run_once(corpus, hydrate=args.hydrate)
+    warm = run_once(corpus, hydrate=args.hydrate)
+    info = address_intel._normalize_text_cached.cache_info()
+
+    print(f"rows={args.rows} candidates/row={args.candidates} hydrate/row={args.hydrate}")
+    print(f"cold: {cold:.3f}s ({args.rows / cold:,.0f} rows/s)")
+    print(f"warm: {warm:.3f}s ({args.rows / warm:,.0f} rows/s)")
+    print(f"normalize_text cache: hits={info.hits} misses={info.misses} size={info.currsize}/{info.maxsize}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
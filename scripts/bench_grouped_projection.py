@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Mini-Benchmark: grouped Response-Projektion (`_grouped_api_result`) + JSON-Encoding.
+
+Baut einen synthetischen, grossen risk-mode Report (viele Intelligence-Entities,
+Field-Provenance-Einträge, Quellen und Source-Attribution-Gruppen) und misst
+Projektion und ``json.dumps`` getrennt für ``compact`` und ``verbose``.
+
+Usage (from repo root):
+
+  python3 scripts/bench_grouped_projection.py
+  python3 scripts/bench_grouped_projection.py --entities 2000 --iterations 50
+
+Offline; keine Upstream-Requests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.api import web_service
+
+
+def build_risk_report(*, entities: int, sources: int) -> dict[str, Any]:
+    source_names = [f"source_{idx:02d}" for idx in range(sources)]
+    poi_entities = [
+        {
+            "name": f"Betrieb {idx}",
+            "category": ("shop", "amenity", "office", "leisure")[idx % 4],
+            "distance_m": round(15.0 + idx * 1.7, 1),
+            "tags": {"opening_hours": "Mo-Fr 08:00-18:00", "status": "ok"},
+            "evidence": [{"source": source_names[idx % sources], "confidence": 0.8}],
+        }
+        for idx in range(entities)
+    ]
+    field_provenance = {
+        f"intelligence.metric_{idx}": {
+            "primary_source": source_names[idx % sources],
+            "sources": source_names[: 1 + idx % 3],
+            "present": bool(idx % 5),
+            "authority": "federal",
+            "notes": f"derived via pipeline step {idx}",
+        }
+        for idx in range(entities // 2)
+    }
+    return {
+        "query": "Bahnhofstrasse 1, 8001 Zürich",
+        "matched_address": "Bahnhofstrasse 1, 8001 Zürich",
+        "ids": {"egid": "123", "feature_id": "123_0"},
+        "coordinates": {"lat": 47.3769, "lon": 8.5417, "lv95_e": 2683000.0, "lv95_n": 1247000.0},
+        "administrative": {"gemeinde": "Zürich", "kanton": "ZH"},
+        "match": {"selected_score": 0.99, "candidate_count": 8, "status": "ok"},
+        "building": {
+            "baujahr": 1999,
+            "codes": {"gkat": 1020, "gstat": 1004},
+            "decoded": {"heizung": [{"label": "Wärmepumpe", "status": "ok"}]},
+        },
+        "energy": {
+            "raw_codes": {"gwaerzh1": 7410, "genh1": 7598},
+            "decoded_summary": {"heizung": ["Wärmepumpe"]},
+        },
+        "cross_source": {"plz_layer": {"plz": 8001, "status": "REAL"}},
+        "intelligence": {
+            "tenants_businesses": {"entities": poi_entities, "status": "ok"},
+            "environment_profile": {
+                "rings": [{"ring": ring, "counts": {"shop": entities // 3}} for ring in ("inner", "mid", "outer")]
+            },
+            "incidents": {"events": [{"title": f"Ereignis {idx}", "status": "closed"} for idx in range(entities // 4)]},
+        },
+        "confidence": {"score": 92, "max": 100, "level": "high"},
+        "executive_summary": {"verdict": "ok", "highlights": [f"Punkt {idx}" for idx in range(20)]},
+        "sources": {name: {"status": "ok", "records": idx} for idx, name in enumerate(source_names)},
+        "source_classification": {name: {"authority": "federal", "present": True} for name in source_names},
+        "source_attribution": {
+            "match": source_names[:2],
+            "building_energy": source_names[:4],
+            "postal_consistency": source_names[2:5],
+            "elevation_context": source_names[3:6],
+            "intelligence": source_names,
+        },
+        "field_provenance": field_provenance,
+        "personalization_status": {"state": "active", "signal_strength": 0.33},
+    }
+
+
+def _time(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=1500)
+    parser.add_argument("--sources", type=int, default=12)
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+
+    report = build_risk_report(entities=args.entities, sources=args.sources)
+    print(f"report: {len(json.dumps(report, ensure_ascii=False)) / 1024:.0f} KiB (entities={args.entities})")
+
+    for mode in ("compact", "verbose"):
+        projected = web_service._grouped_api_result(report, response_mode=mode)
+        project_s = _time(lambda: web_service._grouped_api_result(report, response_mode=mode), args.iterations)
+        dumps_s = _time(lambda: json.dumps(projected, ensure_ascii=False), args.iterations)
+        size_kib = len(json.dumps(projected, ensure_ascii=False)) / 1024
+        print(
+            f"{mode:8s} projection={project_s * 1000:7.2f}ms  json.dumps={dumps_s * 1000:7.2f}ms  "
+            f"body={size_kib:.0f} KiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
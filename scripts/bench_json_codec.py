@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Mini-Benchmark: JSON-Encoder (stdlib vs. orjson) auf Report-Payloads.
+
+Vergleicht ``src.shared.json_codec`` in allen drei Modi (wire/canonical/pretty)
+für beide Encoder auf
+- dem grouped Beispiel-Response aus ``docs/api/examples/current/`` und
+- grouped compact/verbose Projektionen eines grossen synthetischen risk-mode
+  Reports (siehe ``scripts/bench_grouped_projection.py``).
+
+Usage (from repo root):
+
+  python3 scripts/bench_json_codec.py
+  python3 scripts/bench_json_codec.py --entities 3000 --iterations 20
+
+Ohne installiertes ``orjson`` wird nur die Stdlib gemessen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts.bench_grouped_projection import build_risk_report
+from src.api import web_service
+from src.shared import json_codec
+
+_EXAMPLE_RESPONSE = REPO_ROOT / "docs" / "api" / "examples" / "current" / "analyze.response.grouped.success.json"
+
+
+def _time(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=1500)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    report = build_risk_report(entities=args.entities, sources=12)
+    payloads: dict[str, Any] = {
+        "example": json.loads(_EXAMPLE_RESPONSE.read_text(encoding="utf-8")),
+        "compact": {"ok": True, "result": web_service._grouped_api_result(report, response_mode="compact")},
+        "verbose": {"ok": True, "result": web_service._grouped_api_result(report, response_mode="verbose")},
+    }
+
+    codecs = ["stdlib"]
+    if json_codec._orjson is not None:
+        codecs.append("auto")
+
+    modes = {
+        "wire": json_codec.dumps_wire,
+        "canonical": json_codec.dumps_canonical,
+        "pretty": json_codec.dumps_pretty,
+    }
+
+    for codec in codecs:
+        os.environ[json_codec.JSON_CODEC_ENV] = codec
+        print(f"encoder={json_codec.native_encoder_name()}")
+        for name, payload in payloads.items():
+            size_kib = len(json_codec.dumps_wire(payload)) / 1024
+            timings = "  ".join(
+                f"{mode}={_time(lambda: fn(payload), args.iterations) * 1000:8.2f}ms" for mode, fn in modes.items()
+            )
+            print(f"  {name:8s} {size_kib:8.0f} KiB  {timings}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
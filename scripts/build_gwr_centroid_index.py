@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Baut den lokalen GWR-Gebäudezentroid-Index für Koordinaten-Snapping.
+
+Input ist der GWR-Eingangs-Export (housing-stat.ch, z. B. ``eingang_entree_entrata.csv``)
+mit mindestens den Spalten ``EGID``, ``EDID``, ``STRNAME``, ``DEINR``, ``DPLZ4``,
+``DPLZNAME``, ``DKODE``, ``DKODN`` (Gebäude-Fallback: ``GKODE``/``GKODN``,
+``GGDENAME``). Mehrere Dateien (z. B. pro Kanton) werden zusammengeführt.
+
+Usage:
+    python scripts/build_gwr_centroid_index.py \\
+        --output runtime/gwr/centroids.v1.idx data/gwr/*.csv
+
+Danach ``GWR_CENTROID_INDEX_PATH=runtime/gwr/centroids.v1.idx`` setzen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import sys
+from pathlib import Path
+from typing import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.api.building_centroid_index import (
+    DEFAULT_CELL_SIZE_M,
+    BuildingCentroid,
+    write_centroid_index,
+)
+
+
+def _first_value(row: dict[str, str], *keys: str) -> str:
+    for key in keys:
+        value = str(row.get(key) or "").strip()
+        if value:
+            return value
+    return ""
+
+
+def _parse_int(value: str) -> int | None:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_float(value: str) -> float | None:
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if math.isfinite(parsed) else None
+
+
+def iter_centroids_from_csv(path: Path, *, delimiter: str) -> Iterator[BuildingCentroid]:
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        reader = csv.DictReader(handle, delimiter=delimiter)
+        for raw_row in reader:
+            row = {str(k or "").strip().upper(): v for k, v in raw_row.items()}
+            egid = _parse_int(_first_value(row, "EGID"))
+            edid = _parse_int(_first_value(row, "EDID")) or 0
+            lv95_e = _parse_float(_first_value(row, "DKODE", "GKODE"))
+            lv95_n = _parse_float(_first_value(row, "DKODN", "GKODN"))
+            street = _first_value(row, "STRNAME")
+            house_number = _first_value(row, "DEINR")
+            postal_code = _first_value(row, "DPLZ4")[:4]
+            city = _first_value(row, "DPLZNAME", "GGDENAME")
+
+            if egid is None or egid < 0 or lv95_e is None or lv95_n is None:
+                continue
+            if not street or not postal_code:
+                continue
+
+            yield BuildingCentroid(
+                egid=egid,
+                edid=max(edid, 0),
+                lv95_e=lv95_e,
+                lv95_n=lv95_n,
+                street=f"{street} {house_number}".strip(),
+                postal_code=postal_code,
+                city=city,
+            )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs="+", type=Path, help="GWR-CSV-Exportdateien")
+    parser.add_argument("--output", required=True, type=Path, help="Zielpfad der Indexdatei")
+    parser.add_argument("--delimiter", default="\t", help="CSV-Trennzeichen (Default: Tab)")
+    parser.add_argument(
+        "--cell-size-m",
+        type=float,
+        default=DEFAULT_CELL_SIZE_M,
+        help=f"Grid-Zellgrösse in Metern (Default: {DEFAULT_CELL_SIZE_M:g})",
+    )
+    return parser
+
+
+def _run(argv: list[str]) -> int:
+    args = _build_parser().parse_args(argv)
+
+    def _all_rows() -> Iterator[BuildingCentroid]:
+        for path in args.inputs:
+            yield from iter_centroids_from_csv(path, delimiter=args.delimiter)
+
+    try:
+        count = write_centroid_index(args.output, _all_rows(), cell_size_m=args.cell_size_m)
+    except (OSError, ValueError) as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
+        return 1
+
+    print(f"[OK] {count} centroids → {args.output}")
+    return 0
+
+
+def main() -> int:
+    return _run(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -49,6 +49,7 @@ API_ALLOWED_PREFIX_ROUTES: Tuple[str, ...] = (
     "/compliance/",
     "/auth/",
     "/results/",
+    "/gui/assets/",
 )
 
 UI_ALLOWED_EXACT_ROUTES: Set[str] = {
@@ -65,6 +66,7 @@ UI_ALLOWED_PREFIX_ROUTES: Tuple[str, ...] = (
     "/results/",
     "/jobs/",
     "/auth/",
+    "/gui/assets/",
 )
 
 
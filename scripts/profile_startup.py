@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Import-Zeit-Profiler und Startup-Benchmark für API- und UI-Service.
+
+Zwei Kommandos:
+
+- ``importtime``: führt ``python -X importtime -c "import <module>"`` in einem
+  frischen Prozess aus und listet die teuersten Module (self/cumulative).
+- ``bench``: misst die Import-Zeit der Service-Module über mehrere frische
+  Prozesse (Median, nach einem Warm-up-Lauf mit Bytecode-Cache in einem
+  temporären ``PYTHONPYCACHEPREFIX`` — wie im Container mit vorkompilierten
+  ``.pyc``) und vergleicht sie mit einem Budget. Zusätzlich wird
+  geprüft, dass lazy geladene Module (Report-Engine, GUI-Template) nicht
+  wieder beim Import mitgeladen werden. Exit-Code 1 bei Regression.
+
+Usage (from repo root):
+
+  python3 scripts/profile_startup.py importtime
+  python3 scripts/profile_startup.py importtime --module src.ui.service --top 40
+  python3 scripts/profile_startup.py bench --runs 7 --budget-ms 200
+
+Hinweis: ``importtime`` nutzt die Umgebung unverändert; ohne Bytecode-Cache
+(``PYTHONDONTWRITEBYTECODE=1``) dominiert dort das Kompilieren der Quellen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_BENCH_MODULES = ("src.api.web_service", "src.ui.service")
+DEFAULT_BUDGET_MS = 200.0
+LAZY_MODULES = {
+    "src.api.web_service": ("src.api.address_intel", "src.shared.gui_mvp"),
+}
+
+_BENCH_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed_ms = (time.perf_counter() - started) * 1000.0
+print(json.dumps({{"elapsed_ms": elapsed_ms, "loaded": sorted(sys.modules)}}))
+"""
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parst die ``-X importtime``-Ausgabe (``self [us] | cumulative | name``)."""
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        raw_self, raw_cumulative, raw_name = parts
+        try:
+            self_us = int(raw_self.strip())
+            cumulative_us = int(raw_cumulative.strip())
+        except ValueError:
+            continue  # Header-Zeile
+        stripped_name = raw_name.rstrip()
+        name = stripped_name.lstrip()
+        depth = (len(stripped_name) - len(name) - 1) // 2
+        timings.append(ImportTiming(module=name, self_us=self_us, cumulative_us=cumulative_us, depth=max(0, depth)))
+    return timings
+
+
+def _child_env(*, pycache_prefix: str | None = None) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH", "")]))
+    if pycache_prefix is not None:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+    return env
+
+
+def run_importtime(module: str) -> list[ImportTiming]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_import(module: str, *, pycache_prefix: str | None = None) -> tuple[float, set[str]]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _BENCH_SNIPPET.format(module=module)],
+        cwd=REPO_ROOT,
+        env=_child_env(pycache_prefix=pycache_prefix),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    payload = json.loads(completed.stdout.strip().splitlines()[-1])
+    return float(payload["elapsed_ms"]), set(payload["loaded"])
+
+
+def _cmd_importtime(args: argparse.Namespace) -> int:
+    timings = run_importtime(args.module)
+    key = (lambda t: t.self_us) if args.sort == "self" else (lambda t: t.cumulative_us)
+    ranked = sorted(timings, key=key, reverse=True)[: args.top]
+    if args.json:
+        print(json.dumps([t.__dict__ for t in ranked], indent=2))
+        return 0
+
+    total = next((t.cumulative_us for t in timings if t.module == args.module), 0)
+    print(f"import {args.module}: {total / 1000:.1f} ms cumulative ({len(timings)} modules)")
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    for timing in ranked:
+        print(f"{timing.self_us / 1000:9.1f} {timing.cumulative_us / 1000:9.1f}  {timing.module}")
+    return 0
+
+
+def _bench_row(module: str, samples: list[float], loaded: set[str], *, budget_ms: float) -> dict[str, object]:
+    median_ms = statistics.median(samples)
+    return {
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(min(samples), 1),
+        "budget_ms": budget_ms,
+        "over_budget": median_ms > budget_ms,
+        "eager_lazy_modules": sorted(set(LAZY_MODULES.get(module, ())) & loaded),
+    }
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    failed = False
+    report: dict[str, dict[str, object]] = {}
+    with tempfile.TemporaryDirectory(prefix="startup-bench-pyc-") as pycache_prefix:
+        for module in args.module or DEFAULT_BENCH_MODULES:
+            measure_import(module, pycache_prefix=pycache_prefix)  # Warm-up: schreibt .pyc
+            samples: list[float] = []
+            loaded: set[str] = set()
+            for _ in range(args.runs):
+                elapsed_ms, loaded = measure_import(module, pycache_prefix=pycache_prefix)
+                samples.append(elapsed_ms)
+            report[module] = _bench_row(module, samples, loaded, budget_ms=args.budget_ms)
+            failed = failed or bool(report[module]["over_budget"] or report[module]["eager_lazy_modules"])
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for module, row in report.items():
+            status = "FAIL" if row["over_budget"] or row["eager_lazy_modules"] else "ok"
+            print(
+                f"[{status}] {module}: median={row['median_ms']} ms min={row['min_ms']} ms "
+                f"budget={row['budget_ms']} ms"
+            )
+            if row["eager_lazy_modules"]:
+                print(f"       eagerly imported (should be lazy): {', '.join(row['eager_lazy_modules'])}")
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    importtime = sub.add_parser("importtime", help="per-module import cost")
+    importtime.add_argument("--module", default="src.api.web_service")
+    importtime.add_argument("--top", type=int, default=25)
+    importtime.add_argument("--sort", choices=("self", "cumulative"), default="cumulative")
+    importtime.add_argument("--json", action="store_true")
+    importtime.set_defaults(func=_cmd_importtime)
+
+    bench = sub.add_parser("bench", help="startup benchmark with budget")
+    bench.add_argument("--module", action="append", help="module to import (repeatable)")
+    bench.add_argument("--runs", type=int, default=5)
+    bench.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("STARTUP_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS)),
+    )
+    bench.add_argument("--json", action="store_true")
+    bench.set_defaults(func=_cmd_bench)
+
+    args = parser.parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
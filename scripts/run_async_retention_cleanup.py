@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Periodischer Retention-Cleanup für Async-Job-Ergebnis- und Eventdaten."""
+"""Periodischer Retention-Cleanup für Async-Job-Ergebnis- und Eventdaten.
+
+Arbeitet auf dem per ``ASYNC_STORE_BACKEND`` konfigurierten Store: File-Store
+(``--store-file``), SQLite oder Postgres (Zeitbereichs-Deletes in Batches).
+Mit ``ASYNC_RESULT_BLOB_DIR`` werden anschliessend nicht mehr referenzierte
+Result-Blobs gelöscht (``blobs`` im Output).
+"""
 
 from __future__ import annotations
 
@@ -15,7 +21,9 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from src.api.async_jobs import AsyncJobStore
+from src.api.async_store_factory import build_async_job_store
 from src.api.duration_parsing import parse_duration_seconds
+from src.shared.result_blob_store import BLOB_GC_MIN_AGE_SECONDS, blob_store_from_env
 
 
 DEFAULT_RESULTS_TTL_SECONDS = 7 * 24 * 3600
@@ -34,7 +42,7 @@ def _build_parser(*, default_results_ttl: float, default_events_ttl: float) -> a
     parser = argparse.ArgumentParser(
         description=(
             "Räumt veraltete Async-Job-Result-/Event-Daten für terminale Jobs aus dem "
-            "File-Store auf."
+            "konfigurierten Async-Store (ASYNC_STORE_BACKEND, Default: File-Store) auf."
         )
     )
     parser.add_argument(
@@ -72,6 +80,15 @@ def _build_parser(*, default_results_ttl: float, default_events_ttl: float) -> a
         action="store_true",
         help="Retention für job_events deaktivieren (keine Löschung).",
     )
+    parser.add_argument(
+        "--blob-min-age-seconds",
+        type=str,
+        default=BLOB_GC_MIN_AGE_SECONDS,
+        help=(
+            "Unreferenzierte Result-Blobs erst ab diesem Alter löschen (Sekunden oder Duration). "
+            f"Default: {int(BLOB_GC_MIN_AGE_SECONDS)}"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -119,17 +136,29 @@ def _run(argv: list[str]) -> int:
             )
         )
 
+        blob_min_age_seconds = parse_duration_seconds(
+            args.blob_min_age_seconds,
+            field_name="blob_min_age_seconds",
+        )
+
+        backend = os.getenv("ASYNC_STORE_BACKEND", "file").strip().lower() or "file"
         store_file = Path(args.store_file)
-        store = AsyncJobStore(store_file=store_file)
+        store = (
+            AsyncJobStore(store_file=store_file, blob_store=blob_store_from_env())
+            if backend == "file"
+            else build_async_job_store()
+        )
         cleanup_summary = store.cleanup_retention(
             results_ttl_seconds=results_ttl_seconds,
             events_ttl_seconds=events_ttl_seconds,
             dry_run=bool(args.dry_run),
+            blob_min_age_seconds=blob_min_age_seconds,
         )
 
         payload: dict[str, Any] = {
             "runner": "run_async_retention_cleanup.py",
-            "store_file": str(store_file),
+            "store_backend": backend,
+            "store_file": str(store_file) if backend == "file" else None,
             "results_ttl_seconds": results_ttl_seconds,
             "events_ttl_seconds": events_ttl_seconds,
             **cleanup_summary,
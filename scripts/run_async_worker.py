@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Dedizierter Async-Worker-Node (ohne HTTP-Server).
+
+Claimt offene Analyze-Jobs aus Postgres (``ASYNC_WORKER_QUEUE=db``,
+``SELECT ... FOR UPDATE SKIP LOCKED`` mit Lease + Heartbeat) und verarbeitet sie
+mit derselben Pipeline wie der API-Node. Beliebig viele Instanzen können
+parallel laufen; API-Nodes mit ``ASYNC_WORKER_EMBEDDED=0`` nehmen dann nur noch
+Jobs an.
+
+Usage:
+    ASYNC_STORE_BACKEND=db ASYNC_DB_URL=postgresql://... python scripts/run_async_worker.py
+    python scripts/run_async_worker.py --workers 8 --stats-interval 60
+
+Beendet sich sauber bei SIGTERM/SIGINT; laufende Jobs ohne Abschluss werden
+nach Ablauf ihrer Lease von anderen Nodes übernommen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import sys
+import threading
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.api.async_store_factory import build_async_job_store  # noqa: E402
+from src.api.async_worker_runtime import AsyncJobRuntime  # noqa: E402
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Dedizierter Async-Worker (DB-Claims mit Lease).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker-Threads (Default: ASYNC_WORKER_POOL_SIZE)")
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=0.0,
+        help="Runtime-Stats alle N Sekunden als JSON-Zeile auf stdout (0 = aus)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    # Lazy-Import: zieht die komplette Report-Pipeline nach.
+    from src.api.web_service import _resolve_async_analysis_runner  # noqa: PLC0415
+
+    try:
+        runtime = AsyncJobRuntime(
+            store=build_async_job_store(),
+            workers=args.workers,
+            analysis_runner=_resolve_async_analysis_runner(),
+            queue_mode="db",
+        )
+    except RuntimeError as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
+        return 1
+
+    stop_requested = threading.Event()
+
+    def _request_stop(signum, _frame) -> None:
+        stop_requested.set()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    runtime.start()
+    print(f"[INFO] async worker started ({json.dumps(runtime.stats(), sort_keys=True)})", flush=True)
+    while not stop_requested.wait(args.stats_interval if args.stats_interval > 0 else None):
+        print(json.dumps(runtime.stats(), sort_keys=True), flush=True)
+    runtime.stop(timeout=10.0)
+    print("[INFO] async worker stopped", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
 import importlib.util
 import json
@@ -30,6 +31,7 @@ import os
 import random
 import re
 import sys
+import threading
 import time
 import unicodedata
 import urllib.error
@@ -40,7 +42,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 try:
     import cairo
@@ -50,6 +52,11 @@ except Exception:
     cairo = None  # type: ignore[assignment]
     CAIRO_AVAILABLE = False
 
+try:
+    from src.api.address_intel_errors import AddressIntelError
+except ModuleNotFoundError:  # pragma: no cover - fallback for direct script execution
+    from address_intel_errors import AddressIntelError  # type: ignore[no-redef]
+
 try:
     from src.api.suitability_light import evaluate_suitability_light
 except ModuleNotFoundError:
@@ -98,6 +105,27 @@ EXIT_BATCH_PARTIAL = 6
 SOURCE_POLICY_ORDER = ["official", "licensed", "community", "web", "local_mapping", "unknown"]
 SOURCE_POLICY_RANK = {name: idx for idx, name in enumerate(SOURCE_POLICY_ORDER)}
 INTELLIGENCE_MODES = ("basic", "extended", "risk")
+INTELLIGENCE_LAYERS = (
+    "tenants_businesses",
+    "incidents_timeline",
+    "environment_profile",
+    "environment_noise_risk",
+    "consistency_checks",
+    "executive_risk_summary",
+)
+# Selektierbare Report-Module (``build_report(modules=...)``); Entity-Felder
+# (query/ids/coordinates/administrative) sowie confidence/sources sind immer enthalten.
+REPORT_MODULES = (
+    "match",
+    "building",
+    "energy",
+    "address_registry",
+    "cross_source",
+    "intelligence",
+    "suitability_light",
+    "summary_compact",
+    "links",
+)
 AREA_MODES = ("address-report", "city-ranking")
 
 AREA_WEIGHT_KEYS = ("ruhe", "oev", "einkauf", "gruen", "sicherheit", "nachtaktivitaet")
@@ -260,10 +288,6 @@ _LAST_OSM_TILE_REQUEST_TS = 0.0
 _GWR_CODES_MODULE = None
 
 
-class AddressIntelError(RuntimeError):
-    """Basisklasse für domänenspezifische Fehler."""
-
-
 class NoAddressMatchError(AddressIntelError):
     """Keine brauchbare Adresse gefunden."""
 
@@ -420,6 +444,8 @@ class HttpClient:
     upstream_session_id: str = ""
     _cache: Dict[str, Tuple[float, Dict[str, Any]]] = field(default_factory=dict)
     _last_request_started_at: float = 0.0
+    # Ein Client wird von Batch- und Async-Stufen-Threads geteilt.
+    _interval_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def _disk_cache_file(self, url: str) -> Path:
         digest = hashlib.sha1(url.encode("utf-8", errors="ignore")).hexdigest()
@@ -696,15 +722,16 @@ class HttpClient:
 
     def _enforce_min_interval(self) -> None:
         interval = max(0.0, float(self.min_request_interval_seconds))
-        if interval <= 0:
-            self._last_request_started_at = time.time()
-            return
-        now = time.time()
-        wait = (self._last_request_started_at + interval) - now
+        # Startzeitpunkt unter dem Lock reservieren, ausserhalb schlafen:
+        # parallele Threads halten so den Abstand untereinander ein, ohne das
+        # Warten zu serialisieren.
+        with self._interval_lock:
+            now = time.time()
+            started_at = max(now, self._last_request_started_at + interval) if interval > 0 else now
+            self._last_request_started_at = started_at
+        wait = started_at - now
         if wait > 0:
             time.sleep(wait)
-            now = time.time()
-        self._last_request_started_at = now
 
     def _sleep_retry_after_or_backoff(self, attempt: int, retry_after_raw: Optional[str]) -> None:
         retry_after_seconds = self._parse_retry_after_seconds(retry_after_raw)
@@ -740,21 +767,46 @@ class HttpClient:
             return None
 
 
-def normalize_text(text: Optional[str]) -> str:
-    if not text:
-        return ""
-    text = strip_html(text)
+# Label-/Query-Normalisierung ist der CPU-Hotpath von Batch-Läufen: dieselben
+# Strassen-, Orts- und Trefferlabels werden pro Zeile mehrfach normalisiert.
+_NORMALIZE_TEXT_CACHE_SIZE = 16384
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_POSTAL_CODE_RE = re.compile(r"\b(\d{4})\b")
+_POSTAL_CODE_ONLY_RE = re.compile(r"\d{4}")
+_LEADING_POSTAL_CODE_RE = re.compile(r"^\d{4}\s*")
+_STREET_HOUSE_NUMBER_RE = re.compile(
+    r"^(?P<street>.+?)\s+(?P<number>\d+[a-zA-Z]?(?:[/-]\d+[a-zA-Z]?)?)\s*$"
+)
+_STREET_ABBREV_RE = re.compile(r"\bstr\.?\b")
+
+
+@functools.lru_cache(maxsize=_NORMALIZE_TEXT_CACHE_SIZE)
+def _normalize_text_cached(text: str) -> str:
+    text = _HTML_TAG_RE.sub("", text)
     text = unicodedata.normalize("NFKD", text)
     text = text.encode("ascii", "ignore").decode("ascii")
     text = text.lower().strip()
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text
 
 
+@functools.lru_cache(maxsize=_NORMALIZE_TEXT_CACHE_SIZE)
+def _tokenize_cached(text: str) -> Tuple[str, ...]:
+    return tuple(_TOKEN_RE.findall(_normalize_text_cached(text)))
+
+
+def normalize_text(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return _normalize_text_cached(text)
+
+
 def tokenize(text: str) -> List[str]:
     if not text:
         return []
-    return re.findall(r"[a-z0-9]+", normalize_text(text))
+    return list(_tokenize_cached(text))
 
 
 def normalize_address_query_input(query: str) -> str:
@@ -772,8 +824,8 @@ def _normalize_street_fragment(fragment: str) -> str:
     if not street:
         return ""
     # Provider-neutrale Vereinheitlichung typischer Abkürzungen.
-    street = re.sub(r"\bstr\.?\b", "strasse", street)
-    street = re.sub(r"\s+", " ", street).strip(" ,.-")
+    street = _STREET_ABBREV_RE.sub("strasse", street)
+    street = _WHITESPACE_RE.sub(" ", street).strip(" ,.-")
     return street
 
 
@@ -932,7 +984,7 @@ def clamp(value: float, low: float, high: float) -> float:
 def strip_html(s: Optional[str]) -> Optional[str]:
     if s is None:
         return None
-    return re.sub(r"<[^>]+>", "", s)
+    return _HTML_TAG_RE.sub("", s)
 
 
 def _hex_to_rgb_tuple(color_hex: str) -> Tuple[float, float, float]:
@@ -1119,21 +1171,18 @@ def parse_query_parts(query: str) -> QueryParts:
     norm = normalize_text(normalized_input)
     tokens = tokenize(norm)
 
-    postal_match = re.search(r"\b(\d{4})\b", norm)
+    postal_match = _POSTAL_CODE_RE.search(norm)
     postal_code = postal_match.group(1) if postal_match else None
 
     street = None
     house_number = None
     city = None
 
-    parts = [p.strip() for p in re.split(r",", normalized_input) if p.strip()]
+    parts = [p.strip() for p in normalized_input.split(",") if p.strip()]
     first = parts[0] if parts else normalized_input
     first_norm = normalize_text(first)
 
-    m = re.match(
-        r"^(?P<street>.+?)\s+(?P<number>\d+[a-zA-Z]?(?:[/-]\d+[a-zA-Z]?)?)\s*$",
-        first_norm,
-    )
+    m = _STREET_HOUSE_NUMBER_RE.match(first_norm)
     if m:
         street = _normalize_street_fragment(m.group("street")) or None
         house_number = m.group("number").lower()
@@ -1141,13 +1190,13 @@ def parse_query_parts(query: str) -> QueryParts:
         street = _normalize_street_fragment(first_norm) or None
 
     if postal_code:
-        m_city = re.search(rf"\b{postal_code}\b\s*([a-z0-9\-\.\s'/]+)$", norm)
+        m_city = _postal_city_re(postal_code).search(norm)
         if m_city:
             city = m_city.group(1).strip(" ,")
     if not city and len(parts) >= 2:
         second_norm = normalize_text(parts[-1])
-        if second_norm and not re.fullmatch(r"\d{4}", second_norm):
-            city = re.sub(r"^\d{4}\s*", "", second_norm).strip() or None
+        if second_norm and not _POSTAL_CODE_ONLY_RE.fullmatch(second_norm):
+            city = _LEADING_POSTAL_CODE_RE.sub("", second_norm).strip() or None
 
     return QueryParts(
         raw=query,
@@ -1160,6 +1209,16 @@ def parse_query_parts(query: str) -> QueryParts:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _postal_city_re(postal_code: str) -> "re.Pattern[str]":
+    return re.compile(rf"\b{postal_code}\b\s*([a-z0-9\-\.\s'/]+)$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _word_boundary_re(value: str) -> "re.Pattern[str]":
+    return re.compile(rf"\b{re.escape(value)}\b")
+
+
 def build_search_url(query: str, *, limit: int, origins: Optional[str] = "address") -> str:
     params: Dict[str, Any] = {
         "searchText": query,
@@ -1212,145 +1271,183 @@ def search_candidates(
     return [r.get("attrs") or {} for r in fb_results if isinstance(r, dict)]
 
 
-def score_candidate_pre(attrs: Dict[str, Any], query: QueryParts) -> Tuple[float, List[str]]:
-    score = 0.0
-    reasons: List[str] = []
+class AddressMatcher:
+    """Vorkompilierter Matcher für eine geparste Query.
 
-    label = strip_html(attrs.get("label") or "") or ""
-    detail = attrs.get("detail") or ""
-    haystack = f"{normalize_text(label)} {normalize_text(detail)}"
-
-    # Street
-    if query.street:
-        street_norm = normalize_text(query.street)
-        street_tokens = tokenize(street_norm)
-        if street_norm and street_norm in haystack:
-            score += 35
-            reasons.append("Strasse exakt im Treffertext")
-        elif street_tokens and all(t in haystack for t in street_tokens):
-            score += 18
-            reasons.append("Strassen-Tokens vollständig enthalten")
-        else:
-            score -= 20
-            reasons.append("Strasse nicht ausreichend enthalten")
-
-    # House number
-    if query.house_number:
-        if re.search(rf"\b{re.escape(query.house_number)}\b", haystack):
-            score += 14
-            reasons.append("Hausnummer passt")
-        else:
-            score -= 8
-            reasons.append("Hausnummer fehlt")
+    Normalisiert die Query-Bestandteile genau einmal (Strasse/Ort inkl.
+    Token-Sets, Hausnummer-/PLZ-Boundary-Regexes) und bewertet danach beliebig
+    viele Kandidaten. Kandidatenlabels laufen über den LRU-gecachten
+    ``normalize_text``-Pfad. Scores und Begründungen sind identisch zu
+    ``score_candidate_pre``/``score_candidate_detail``.
+    """
 
-    # Postal code
-    if query.postal_code:
-        if re.search(rf"\b{re.escape(query.postal_code)}\b", haystack):
-            score += 20
-            reasons.append("PLZ passt")
-        else:
-            score -= 8
-            reasons.append("PLZ fehlt")
+    __slots__ = (
+        "query",
+        "street_norm",
+        "street_tokens",
+        "city_norm",
+        "city_tokens",
+        "house_number_re",
+        "postal_code_re",
+    )
 
-    # City
-    if query.city:
-        city_norm = normalize_text(query.city)
-        city_tokens = tokenize(city_norm)
-        if city_norm and city_norm in haystack:
-            score += 15
-            reasons.append("Ort passt")
-        elif city_tokens and all(t in haystack for t in city_tokens):
-            score += 10
-            reasons.append("Orts-Tokens passen")
-        else:
-            score -= 6
-            reasons.append("Ort nicht erkannt")
+    def __init__(self, query: QueryParts):
+        self.query = query
+        self.street_norm = normalize_text(query.street) if query.street else ""
+        self.street_tokens: Tuple[str, ...] = tuple(tokenize(self.street_norm))
+        self.city_norm = normalize_text(query.city) if query.city else ""
+        self.city_tokens: Tuple[str, ...] = tuple(tokenize(self.city_norm))
+        self.house_number_re = _word_boundary_re(query.house_number) if query.house_number else None
+        self.postal_code_re = _word_boundary_re(query.postal_code) if query.postal_code else None
+
+    def score_pre(self, attrs: Dict[str, Any]) -> Tuple[float, List[str]]:
+        query = self.query
+        score = 0.0
+        reasons: List[str] = []
 
-    if attrs.get("origin") == "address":
-        score += 5
-        reasons.append("Origin=address")
+        label = strip_html(attrs.get("label") or "") or ""
+        detail = attrs.get("detail") or ""
+        label_norm = normalize_text(label)
+        haystack = f"{label_norm} {normalize_text(detail)}"
+
+        # Street
+        if query.street:
+            if self.street_norm and self.street_norm in haystack:
+                score += 35
+                reasons.append("Strasse exakt im Treffertext")
+            elif self.street_tokens and all(t in haystack for t in self.street_tokens):
+                score += 18
+                reasons.append("Strassen-Tokens vollständig enthalten")
+            else:
+                score -= 20
+                reasons.append("Strasse nicht ausreichend enthalten")
+
+        # House number
+        if self.house_number_re is not None:
+            if self.house_number_re.search(haystack):
+                score += 14
+                reasons.append("Hausnummer passt")
+            else:
+                score -= 8
+                reasons.append("Hausnummer fehlt")
+
+        # Postal code
+        if self.postal_code_re is not None:
+            if self.postal_code_re.search(haystack):
+                score += 20
+                reasons.append("PLZ passt")
+            else:
+                score -= 8
+                reasons.append("PLZ fehlt")
+
+        # City
+        if query.city:
+            if self.city_norm and self.city_norm in haystack:
+                score += 15
+                reasons.append("Ort passt")
+            elif self.city_tokens and all(t in haystack for t in self.city_tokens):
+                score += 10
+                reasons.append("Orts-Tokens passen")
+            else:
+                score -= 6
+                reasons.append("Ort nicht erkannt")
 
-    rank = attrs.get("rank")
-    if isinstance(rank, (int, float)):
-        rank_bonus = clamp(10 - float(rank), 0, 8)
-        score += rank_bonus
-        reasons.append(f"Search-Rank-Bonus {rank_bonus:.1f}")
+        if attrs.get("origin") == "address":
+            score += 5
+            reasons.append("Origin=address")
 
-    feature_id = str(attrs.get("featureId") or "")
-    if feature_id:
-        score += 5
-        reasons.append("Feature-ID vorhanden")
+        rank = attrs.get("rank")
+        if isinstance(rank, (int, float)):
+            rank_bonus = clamp(10 - float(rank), 0, 8)
+            score += rank_bonus
+            reasons.append(f"Search-Rank-Bonus {rank_bonus:.1f}")
 
-    if query.street and label:
-        if normalize_text(label).startswith(normalize_text(query.street)):
-            score += 6
-            reasons.append("Label startet mit Strasse")
+        feature_id = str(attrs.get("featureId") or "")
+        if feature_id:
+            score += 5
+            reasons.append("Feature-ID vorhanden")
 
-    return score, reasons
+        if query.street and label:
+            if label_norm.startswith(self.street_norm):
+                score += 6
+                reasons.append("Label startet mit Strasse")
 
+        return score, reasons
 
-def score_candidate_detail(
-    query: QueryParts,
-    address_attrs: Dict[str, Any],
-    gwr_attrs: Dict[str, Any],
-) -> Tuple[float, List[str]]:
-    score = 0.0
-    reasons: List[str] = []
+    def score_detail(
+        self,
+        address_attrs: Dict[str, Any],
+        gwr_attrs: Dict[str, Any],
+    ) -> Tuple[float, List[str]]:
+        query = self.query
+        score = 0.0
+        reasons: List[str] = []
 
-    gwr_street = normalize_text(gwr_attrs.get("strname_deinr") or "")
+        gwr_street = normalize_text(gwr_attrs.get("strname_deinr") or "")
 
-    if query.street and gwr_street:
-        street_norm = normalize_text(query.street)
-        if street_norm and street_norm in gwr_street:
-            score += 20
-            reasons.append("GWR-Strasse bestätigt")
-        elif all(t in gwr_street for t in tokenize(street_norm)):
-            score += 10
-            reasons.append("GWR-Strassen-Tokens bestätigt")
-        else:
-            score -= 8
-            reasons.append("GWR-Strasse weicht ab")
+        if query.street and gwr_street:
+            if self.street_norm and self.street_norm in gwr_street:
+                score += 20
+                reasons.append("GWR-Strasse bestätigt")
+            elif all(t in gwr_street for t in self.street_tokens):
+                score += 10
+                reasons.append("GWR-Strassen-Tokens bestätigt")
+            else:
+                score -= 8
+                reasons.append("GWR-Strasse weicht ab")
 
-    if query.house_number and gwr_street:
-        if re.search(rf"\b{re.escape(query.house_number)}\b", gwr_street):
-            score += 8
-            reasons.append("GWR-Hausnummer bestätigt")
-        else:
-            score -= 4
-            reasons.append("GWR-Hausnummer abweichend")
-
-    gwr_plz = str(gwr_attrs.get("plz_plz6") or "")[:4]
-    if query.postal_code and gwr_plz:
-        if gwr_plz == query.postal_code:
-            score += 12
-            reasons.append("GWR-PLZ bestätigt")
-        else:
-            score -= 7
-            reasons.append("GWR-PLZ abweichend")
-
-    if query.city:
-        city_norm = normalize_text(query.city)
-        gwr_city = normalize_text(gwr_attrs.get("dplzname") or gwr_attrs.get("ggdename") or "")
-        if city_norm and gwr_city:
-            if city_norm in gwr_city or gwr_city in city_norm:
+        if self.house_number_re is not None and gwr_street:
+            if self.house_number_re.search(gwr_street):
                 score += 8
-                reasons.append("GWR-Ort/Gemeinde bestätigt")
-            elif all(t in gwr_city for t in tokenize(city_norm)):
-                score += 5
-                reasons.append("GWR-Orts-Tokens bestätigt")
+                reasons.append("GWR-Hausnummer bestätigt")
             else:
                 score -= 4
-                reasons.append("GWR-Ort/Gemeinde abweichend")
+                reasons.append("GWR-Hausnummer abweichend")
+
+        gwr_plz = str(gwr_attrs.get("plz_plz6") or "")[:4]
+        if query.postal_code and gwr_plz:
+            if gwr_plz == query.postal_code:
+                score += 12
+                reasons.append("GWR-PLZ bestätigt")
+            else:
+                score -= 7
+                reasons.append("GWR-PLZ abweichend")
+
+        if query.city:
+            city_norm = self.city_norm
+            gwr_city = normalize_text(gwr_attrs.get("dplzname") or gwr_attrs.get("ggdename") or "")
+            if city_norm and gwr_city:
+                if city_norm in gwr_city or gwr_city in city_norm:
+                    score += 8
+                    reasons.append("GWR-Ort/Gemeinde bestätigt")
+                elif all(t in gwr_city for t in self.city_tokens):
+                    score += 5
+                    reasons.append("GWR-Orts-Tokens bestätigt")
+                else:
+                    score -= 4
+                    reasons.append("GWR-Ort/Gemeinde abweichend")
+
+        if address_attrs.get("adr_official") is True:
+            score += 5
+            reasons.append("Amtliche Adresse")
 
-    if address_attrs.get("adr_official") is True:
-        score += 5
-        reasons.append("Amtliche Adresse")
+        if gwr_attrs.get("gstat") == 1004:
+            score += 3
+            reasons.append("Gebäudestatus=Bestehend")
 
-    if gwr_attrs.get("gstat") == 1004:
-        score += 3
-        reasons.append("Gebäudestatus=Bestehend")
+        return score, reasons
 
-    return score, reasons
+
+def score_candidate_pre(attrs: Dict[str, Any], query: QueryParts) -> Tuple[float, List[str]]:
+    return AddressMatcher(query).score_pre(attrs)
+
+
+def score_candidate_detail(
+    query: QueryParts,
+    address_attrs: Dict[str, Any],
+    gwr_attrs: Dict[str, Any],
+) -> Tuple[float, List[str]]:
+    return AddressMatcher(query).score_detail(address_attrs, gwr_attrs)
 
 
 def mapserver_feature_url(layer: str, feature_id: str) -> str:
@@ -5642,6 +5739,70 @@ def build_executive_risk_summary(
     }
 
 
+_POI_INTELLIGENCE_LAYERS = frozenset({"tenants_businesses", "environment_profile", "environment_noise_risk"})
+_INTELLIGENCE_LAYER_INPUTS: Dict[str, FrozenSet[str]] = {
+    "consistency_checks": frozenset({"incidents_timeline"}),
+    "executive_risk_summary": frozenset(
+        {"tenants_businesses", "incidents_timeline", "environment_noise_risk", "consistency_checks"}
+    ),
+}
+
+
+def _expand_intelligence_layers(layers: Optional[FrozenSet[str]]) -> FrozenSet[str]:
+    if layers is None:
+        return frozenset(INTELLIGENCE_LAYERS)
+    expanded = set(layers)
+    pending = list(layers)
+    while pending:
+        for dependency in _INTELLIGENCE_LAYER_INPUTS.get(pending.pop(), ()):
+            if dependency not in expanded:
+                expanded.add(dependency)
+                pending.append(dependency)
+    return frozenset(expanded)
+
+
+def normalize_report_modules(modules: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """Validiert eine Modul-Auswahl für ``build_report``.
+
+    ``None`` bedeutet "alle Module". Erlaubt sind ``REPORT_MODULES`` sowie
+    einzelne Intelligence-Layer als ``intelligence.<layer>``.
+    """
+    if modules is None:
+        return None
+    if isinstance(modules, str):
+        raise ValueError("modules must be a list of module names")
+
+    selected = set()
+    for raw in modules:
+        name = str(raw or "").strip().lower()
+        top, _, layer = name.partition(".")
+        if top not in REPORT_MODULES or (layer and (top != "intelligence" or layer not in INTELLIGENCE_LAYERS)):
+            raise ValueError(f"unknown report module: {raw!r}")
+        selected.add(name)
+    if not selected:
+        raise ValueError("modules must not be empty")
+    if "intelligence" in selected:
+        selected = {name for name in selected if not name.startswith("intelligence.")}
+    return frozenset(selected)
+
+
+def _selected_intelligence_layers(modules: Optional[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    if modules is None or "intelligence" in modules or "summary_compact" in modules:
+        return None
+    return frozenset(name.partition(".")[2] for name in modules if name.startswith("intelligence."))
+
+
+def _field_path_selected(field_path: str, modules: Optional[FrozenSet[str]]) -> bool:
+    if modules is None:
+        return True
+    top, _, rest = field_path.partition(".")
+    if top not in REPORT_MODULES or top in modules:
+        return True
+    if top == "intelligence":
+        return f"intelligence.{rest.partition('.')[0]}" in modules
+    return False
+
+
 def build_intelligence_layers(
     *,
     mode: str,
@@ -5652,7 +5813,14 @@ def build_intelligence_layers(
     confidence: Dict[str, Any],
     plz_layer: Dict[str, Any],
     admin_boundary: Dict[str, Any],
+    layers: Optional[FrozenSet[str]] = None,
 ) -> Dict[str, Any]:
+    """Baut die Intelligence-Layer gemäss Mode.
+
+    ``layers`` (Default: alle) beschränkt Output und Upstream-Fetches auf die
+    angefragten Layer plus deren Inputs (siehe ``_INTELLIGENCE_LAYER_INPUTS``);
+    POI-/News-Abfragen entfallen, wenn kein Layer sie benötigt.
+    """
     mode = mode if mode in INTELLIGENCE_MODES else "basic"
     settings = intelligence_mode_settings(mode)
 
@@ -5661,9 +5829,18 @@ def build_intelligence_layers(
     environment_noise_risk: Dict[str, Any]
     environment_profile: Dict[str, Any]
 
+    computed_layers = _expand_intelligence_layers(layers)
+    external_enabled = bool(settings.get("enable_external"))
+    fetch_pois = external_enabled and bool(computed_layers & _POI_INTELLIGENCE_LAYERS)
+    fetch_news = external_enabled and "incidents_timeline" in computed_layers
+    if external_enabled:
+        disabled_status, disabled_label, disabled_snippet = "not_requested", "per modules-Option nicht angefordert", "modules option"
+    else:
+        disabled_status, disabled_label, disabled_snippet = "disabled_by_mode", "im basic-Modus deaktiviert", "Mode basic"
+
     poi_payload = {"source_url": None, "pois": []}
     poi_fallback: Dict[str, Any] = {}
-    if settings.get("enable_external"):
+    if fetch_pois:
         try:
             poi_payload, poi_fallback = fetch_osm_poi_overpass_adaptive(
                 client,
@@ -5836,58 +6013,21 @@ def build_intelligence_layers(
             except Exception:
                 pass
 
-        try:
-            incident_query = f'"{selected.label}" OR "{query.raw}"'
-            if settings.get("news_focus") == "address_and_incident":
-                incident_query += " (Brand OR Feuer OR Polizei OR Unfall OR Einbruch)"
-            news_payload = fetch_google_news_rss(
-                client,
-                sources,
-                query=incident_query,
-                limit=int(settings.get("incident_limit") or 6),
-            )
-            incidents_timeline = build_incidents_timeline_layer(
-                news_payload=news_payload,
-                address_query=query.raw,
-                max_items=int(settings.get("incident_limit") or 6),
-            )
-        except Exception as ex:
-            incidents_timeline = {
-                "status": "error",
-                "events": [],
-                "relevant_event_count": 0,
-                "statements": [
-                    statement(
-                        "Incident-Timeline konnte nicht geladen werden.",
-                        confidence=0.3,
-                        evidence=[
-                            evidence_item(
-                                source="google_news_rss",
-                                confidence=0.3,
-                                snippet=str(ex),
-                                field_path="intelligence.incidents_timeline",
-                            )
-                        ],
-                        field_path="intelligence.incidents_timeline",
-                    )
-                ],
-            }
     else:
-        sources.disable("osm_poi_overpass", "im basic-Modus deaktiviert")
-        sources.disable("google_news_rss", "im basic-Modus deaktiviert")
+        sources.disable("osm_poi_overpass", disabled_label)
         tenants_businesses = {
-            "status": "disabled_by_mode",
+            "status": disabled_status,
             "entities": [],
             "counts_by_category": {},
             "statements": [
                 statement(
-                    "Mieter-/Geschäftsindizien sind im basic-Modus deaktiviert.",
+                    f"Mieter-/Geschäftsindizien sind {disabled_label}.",
                     confidence=0.6,
                     evidence=[
                         evidence_item(
                             source="osm_poi_overpass",
                             confidence=0.6,
-                            snippet="Mode basic",
+                            snippet=disabled_snippet,
                             field_path="intelligence.tenants_businesses",
                         )
                     ],
@@ -5895,42 +6035,22 @@ def build_intelligence_layers(
                 )
             ],
         }
-        incidents_timeline = {
-            "status": "disabled_by_mode",
-            "events": [],
-            "relevant_event_count": 0,
-            "statements": [
-                statement(
-                    "Incident-Timeline ist im basic-Modus deaktiviert.",
-                    confidence=0.6,
-                    evidence=[
-                        evidence_item(
-                            source="google_news_rss",
-                            confidence=0.6,
-                            snippet="Mode basic",
-                            field_path="intelligence.incidents_timeline",
-                        )
-                    ],
-                    field_path="intelligence.incidents_timeline",
-                )
-            ],
-        }
         environment_noise_risk = {
-            "status": "disabled_by_mode",
+            "status": disabled_status,
             "score": 0,
             "level": "unknown",
             "traffic_light": "green",
-            "reasons": ["Noise-Risk-Layer im basic-Modus deaktiviert"],
+            "reasons": [f"Noise-Risk-Layer {disabled_label}"],
             "indicators": [],
             "statements": [
                 statement(
-                    "Umfeld-Lärmrisiko ist im basic-Modus deaktiviert.",
+                    f"Umfeld-Lärmrisiko ist {disabled_label}.",
                     confidence=0.6,
                     evidence=[
                         evidence_item(
                             source="osm_poi_overpass",
                             confidence=0.6,
-                            snippet="Mode basic",
+                            snippet=disabled_snippet,
                             field_path="intelligence.environment_noise_risk",
                         )
                     ],
@@ -5939,7 +6059,7 @@ def build_intelligence_layers(
             ],
         }
         environment_profile = {
-            "status": "disabled_by_mode",
+            "status": disabled_status,
             "model": {
                 "id": "radius-v1",
                 "mode": mode,
@@ -5964,13 +6084,13 @@ def build_intelligence_layers(
             "signals": [],
             "statements": [
                 statement(
-                    "Umfeldprofil ist im basic-Modus deaktiviert.",
+                    f"Umfeldprofil ist {disabled_label}.",
                     confidence=0.6,
                     evidence=[
                         evidence_item(
                             source="osm_poi_overpass",
                             confidence=0.6,
-                            snippet="Mode basic",
+                            snippet=disabled_snippet,
                             field_path="intelligence.environment_profile",
                         )
                     ],
@@ -5979,6 +6099,66 @@ def build_intelligence_layers(
             ],
         }
 
+    if fetch_news:
+        try:
+            incident_query = f'"{selected.label}" OR "{query.raw}"'
+            if settings.get("news_focus") == "address_and_incident":
+                incident_query += " (Brand OR Feuer OR Polizei OR Unfall OR Einbruch)"
+            news_payload = fetch_google_news_rss(
+                client,
+                sources,
+                query=incident_query,
+                limit=int(settings.get("incident_limit") or 6),
+            )
+            incidents_timeline = build_incidents_timeline_layer(
+                news_payload=news_payload,
+                address_query=query.raw,
+                max_items=int(settings.get("incident_limit") or 6),
+            )
+        except Exception as ex:
+            incidents_timeline = {
+                "status": "error",
+                "events": [],
+                "relevant_event_count": 0,
+                "statements": [
+                    statement(
+                        "Incident-Timeline konnte nicht geladen werden.",
+                        confidence=0.3,
+                        evidence=[
+                            evidence_item(
+                                source="google_news_rss",
+                                confidence=0.3,
+                                snippet=str(ex),
+                                field_path="intelligence.incidents_timeline",
+                            )
+                        ],
+                        field_path="intelligence.incidents_timeline",
+                    )
+                ],
+            }
+    else:
+        sources.disable("google_news_rss", disabled_label)
+        incidents_timeline = {
+            "status": disabled_status,
+            "events": [],
+            "relevant_event_count": 0,
+            "statements": [
+                statement(
+                    f"Incident-Timeline ist {disabled_label}.",
+                    confidence=0.6,
+                    evidence=[
+                        evidence_item(
+                            source="google_news_rss",
+                            confidence=0.6,
+                            snippet=disabled_snippet,
+                            field_path="intelligence.incidents_timeline",
+                        )
+                    ],
+                    field_path="intelligence.incidents_timeline",
+                )
+            ],
+        }
+
     consistency_checks = build_consistency_checks_layer(
         query=query,
         selected=selected,
@@ -5997,7 +6177,7 @@ def build_intelligence_layers(
         consistency_checks=consistency_checks,
     )
 
-    return {
+    out = {
         "mode": mode,
         "source_policy": {
             "priority": SOURCE_POLICY_ORDER,
@@ -6010,6 +6190,11 @@ def build_intelligence_layers(
         "consistency_checks": consistency_checks,
         "executive_risk_summary": executive_risk_summary,
     }
+    if layers is not None:
+        for layer in INTELLIGENCE_LAYERS:
+            if layer not in layers:
+                out.pop(layer, None)
+    return out
 
 
 def hydrate_candidates(
@@ -6025,6 +6210,7 @@ def hydrate_candidates(
 
     hydrated: List[CandidateEval] = []
     best_pre = sorted(candidates, key=lambda c: c.pre_score, reverse=True)
+    matcher = AddressMatcher(query)
 
     for cand in best_pre[: max(1, max_hydrated)]:
         try:
@@ -6045,7 +6231,7 @@ def hydrate_candidates(
                 optional=False,
             )
 
-            detail_score, detail_reasons = score_candidate_detail(query, addr, gwr)
+            detail_score, detail_reasons = matcher.score_detail(addr, gwr)
             cand.address_attrs = addr
             cand.gwr_attrs = gwr
             cand.detail_score = detail_score
@@ -6075,12 +6261,13 @@ def hydrate_candidates(
 
 def build_candidate_list(raw_results: List[Dict[str, Any]], query: QueryParts) -> List[CandidateEval]:
     out: List[CandidateEval] = []
+    matcher = AddressMatcher(query)
     for attrs in raw_results:
         feature_id = str(attrs.get("featureId") or "").strip()
         if not feature_id:
             continue
 
-        pre_score, pre_reasons = score_candidate_pre(attrs, query)
+        pre_score, pre_reasons = matcher.score_pre(attrs)
         out.append(
             CandidateEval(
                 feature_id=feature_id,
@@ -6415,7 +6602,11 @@ def get_nested(data: Dict[str, Any], dotted_path: str) -> Any:
     return cur
 
 
-def build_field_provenance(report: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def build_field_provenance(
+    report: Dict[str, Any],
+    *,
+    modules: Optional[FrozenSet[str]] = None,
+) -> Dict[str, Dict[str, Any]]:
     mapping = {
         "ids.egid": ["geoadmin_gwr"],
         "ids.egrid": ["geoadmin_gwr"],
@@ -6439,6 +6630,8 @@ def build_field_provenance(report: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     }
     out: Dict[str, Dict[str, Any]] = {}
     for field_path, source_names in mapping.items():
+        if not _field_path_selected(field_path, modules):
+            continue
         value = get_nested(report, field_path)
         out[field_path] = {
             "sources": source_names,
@@ -6486,9 +6679,28 @@ def build_report(
     trace_id: str = "",
     request_id: str = "",
     session_id: str = "",
+    modules: Optional[Iterable[str]] = None,
 ) -> Dict[str, Any]:
+    """Baut den Adress-Report.
+
+    ``modules`` (siehe ``normalize_report_modules``) beschränkt den Report auf
+    die angefragten Module; Upstream-Fetches und Layer, die keines davon
+    benötigt, werden übersprungen (Quelle ``disabled``). ``summary_compact``
+    fasst alle Module zusammen und benötigt daher alle Fetches.
+    """
     query = parse_query_parts(address_query)
     intelligence_mode = intelligence_mode if intelligence_mode in INTELLIGENCE_MODES else "basic"
+    module_selection = normalize_report_modules(modules)
+    requested_modules = (
+        frozenset(REPORT_MODULES)
+        if module_selection is None
+        else frozenset(name.partition(".")[0] for name in module_selection)
+    )
+
+    def needs(*consumers: str) -> bool:
+        return "summary_compact" in requested_modules or not requested_modules.isdisjoint(consumers)
+
+    not_requested = "per modules-Option nicht angefordert"
 
     client = client or HttpClient(
         timeout=timeout,
@@ -6528,21 +6740,35 @@ def build_report(
     addr = selected.address_attrs
 
     egid = str(gwr.get("egid") or gwr.get("bdg_egid") or "")
-    heating = fetch_heating_layer(client, sources, egid=egid) if egid else {}
+    heating = fetch_heating_layer(client, sources, egid=egid) if egid and needs("energy") else {}
     if not egid:
         sources.disable("bfs_heating_layer", "kein EGID vorhanden")
+    elif not needs("energy"):
+        sources.disable("bfs_heating_layer", not_requested)
 
     lv95_e = gwr.get("gkode")
     lv95_n = gwr.get("gkodn")
-    plz_layer = fetch_plz_layer_at_lv95(client, sources, lv95_e=lv95_e, lv95_n=lv95_n)
-    admin_boundary = fetch_swissboundaries_at_lv95(client, sources, lv95_e=lv95_e, lv95_n=lv95_n)
-    elevation = fetch_swisstopo_height(client, sources, lv95_e=lv95_e, lv95_n=lv95_n)
+    plz_layer: Dict[str, Any] = {}
+    admin_boundary: Dict[str, Any] = {}
+    if needs("cross_source", "suitability_light", "intelligence"):
+        plz_layer = fetch_plz_layer_at_lv95(client, sources, lv95_e=lv95_e, lv95_n=lv95_n)
+        admin_boundary = fetch_swissboundaries_at_lv95(client, sources, lv95_e=lv95_e, lv95_n=lv95_n)
+    else:
+        sources.disable("plz_layer_identify", not_requested)
+        sources.disable("swissboundaries_identify", not_requested)
+    elevation: Dict[str, Any] = {}
+    if needs("cross_source", "suitability_light"):
+        elevation = fetch_swisstopo_height(client, sources, lv95_e=lv95_e, lv95_n=lv95_n)
+    else:
+        sources.disable("swisstopo_height", not_requested)
 
     osm = {}
-    if include_osm:
-        osm = fetch_osm_reverse(client, sources, lat=selected.lat, lon=selected.lon, min_delay_s=osm_min_delay)
-    else:
+    if not include_osm:
         sources.disable("osm_reverse", "per Flag deaktiviert")
+    elif not needs("cross_source", "suitability_light"):
+        sources.disable("osm_reverse", not_requested)
+    else:
+        osm = fetch_osm_reverse(client, sources, lat=selected.lat, lon=selected.lon, min_delay_s=osm_min_delay)
 
     mod = load_gwr_codes(GWR_CODES_PATH)
     decoded = mod.summarize_building(gwr)
@@ -6568,29 +6794,40 @@ def build_report(
         osm=osm,
     )
 
-    suitability_light = evaluate_suitability_light(
-        elevation_m=elevation.get("height_m"),
-        has_road_access=bool((osm.get("address") or {}).get("road") or gwr.get("strname_deinr")),
-        confidence_score=confidence.get("score"),
-        building_status=decoded.get("status"),
-        has_plz=bool(plz_layer.get("plz") or gwr.get("plz_plz6")),
-        has_admin_boundary=bool(admin_boundary.get("gemname") or gwr.get("ggdename")),
-    )
-
-    candidate_preview_count = max(1, min(candidate_preview, len(candidates))) if candidates else 0
-    candidate_preview_data = [c.to_preview() for c in candidates[:candidate_preview_count]]
-    candidate_preview_data.sort(key=lambda x: x.get("score", 0), reverse=True)
+    suitability_light: Dict[str, Any] = {}
+    if needs("suitability_light"):
+        suitability_light = evaluate_suitability_light(
+            elevation_m=elevation.get("height_m"),
+            has_road_access=bool((osm.get("address") or {}).get("road") or gwr.get("strname_deinr")),
+            confidence_score=confidence.get("score"),
+            building_status=decoded.get("status"),
+            has_plz=bool(plz_layer.get("plz") or gwr.get("plz_plz6")),
+            has_admin_boundary=bool(admin_boundary.get("gemname") or gwr.get("ggdename")),
+        )
 
-    intelligence = build_intelligence_layers(
-        mode=intelligence_mode,
-        client=client,
-        sources=sources,
-        query=query,
-        selected=selected,
-        confidence=confidence,
-        plz_layer=plz_layer,
-        admin_boundary=admin_boundary,
-    )
+    candidate_preview_data: List[Dict[str, Any]] = []
+    if needs("match"):
+        candidate_preview_count = max(1, min(candidate_preview, len(candidates))) if candidates else 0
+        candidate_preview_data = [c.to_preview() for c in candidates[:candidate_preview_count]]
+        candidate_preview_data.sort(key=lambda x: x.get("score", 0), reverse=True)
+
+    intelligence: Dict[str, Any] = {}
+    intelligence_layers = _selected_intelligence_layers(module_selection)
+    if intelligence_layers is None or intelligence_layers:
+        intelligence = build_intelligence_layers(
+            mode=intelligence_mode,
+            client=client,
+            sources=sources,
+            query=query,
+            selected=selected,
+            confidence=confidence,
+            plz_layer=plz_layer,
+            admin_boundary=admin_boundary,
+            layers=intelligence_layers,
+        )
+    else:
+        sources.disable("osm_poi_overpass", not_requested)
+        sources.disable("google_news_rss", not_requested)
     executive_risk = intelligence.get("executive_risk_summary") or {}
     building_profile = build_building_core_profile(
         gwr=gwr,
@@ -6779,12 +7016,17 @@ def build_report(
         },
     }
 
-    report["field_provenance"] = build_field_provenance(report)
+    for module_name in REPORT_MODULES:
+        if module_name not in requested_modules:
+            report.pop(module_name, None)
+
+    report["field_provenance"] = build_field_provenance(report, modules=module_selection)
     report["executive_summary"] = build_executive_summary(report)
-    report["summary_compact"]["executive"] = report["executive_summary"]
-    report["summary_compact"]["intelligence"]["executive_risk"] = (
-        (report.get("intelligence") or {}).get("executive_risk_summary") or {}
-    )
+    if "summary_compact" in report:
+        report["summary_compact"]["executive"] = report["executive_summary"]
+        report["summary_compact"]["intelligence"]["executive_risk"] = (
+            (report.get("intelligence") or {}).get("executive_risk_summary") or {}
+        )
 
     return report
 
@@ -0,0 +1,11 @@
+"""Fehler-Basisklasse von ``address_intel`` ohne dessen Import-Kosten.
+
+``web_service`` und ``async_worker_runtime`` fangen ``AddressIntelError``,
+laden ``address_intel`` selbst aber erst beim ersten Report-Build.
+"""
+
+from __future__ import annotations
+
+
+class AddressIntelError(RuntimeError):
+    """Basisklasse für domänenspezifische Fehler."""
@@ -0,0 +1,155 @@
+"""Batch-Analyse: viele Queries als ein Async-Job (``POST /analyze/batch``).
+
+Ein Batch ist ein normaler Parent-Job im Job-Store; jede Query wird als
+Item verarbeitet und als Partial-Result des Jobs persistiert, die
+Zusammenfassung als Final-Result. Damit gelten Fairness, Cancel, Recovery und
+``GET /analyze/jobs/<id>/events`` unverändert auch für Batches.
+
+Dieses Modul ist unabhängig von der Report-Engine: ``iter_batch_results``
+ruft pro Query ``analyze_one(query)`` auf (in ``web_service``: ``build_report``
+mit einem gemeinsamen ``HttpClient`` pro Batch) und liefert die Items in
+Abschlussreihenfolge. Fehler eines Items brechen den Batch nicht ab; die Zeile
+entspricht ``normalize_error_row`` des CLI-Batch-Modus (``run_batch``).
+
+Env vars:
+- ANALYZE_BATCH_MAX_ITEMS: max. Queries pro Request (Default: 500)
+- ANALYZE_BATCH_SYNC_MAX_ITEMS: max. Queries für die gestreamte NDJSON-Antwort;
+  grössere Batches laufen immer async (Default: 50)
+- ANALYZE_BATCH_CONCURRENCY: parallel laufende Items pro Batch (Default: 4)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Collection, Iterator
+
+ANALYZE_BATCH_MAX_ITEMS_ENV = "ANALYZE_BATCH_MAX_ITEMS"
+ANALYZE_BATCH_SYNC_MAX_ITEMS_ENV = "ANALYZE_BATCH_SYNC_MAX_ITEMS"
+ANALYZE_BATCH_CONCURRENCY_ENV = "ANALYZE_BATCH_CONCURRENCY"
+DEFAULT_BATCH_MAX_ITEMS = 500
+# Der NDJSON-Stream hält einen Server-Thread bis zum letzten Item.
+DEFAULT_BATCH_SYNC_MAX_ITEMS = 50
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+def _read_positive_int_env(name: str, default: int) -> int:
+    raw_value = str(os.getenv(name, "")).strip()
+    try:
+        parsed = int(raw_value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def batch_max_items() -> int:
+    return _read_positive_int_env(ANALYZE_BATCH_MAX_ITEMS_ENV, DEFAULT_BATCH_MAX_ITEMS)
+
+
+def batch_sync_max_items() -> int:
+    return _read_positive_int_env(ANALYZE_BATCH_SYNC_MAX_ITEMS_ENV, DEFAULT_BATCH_SYNC_MAX_ITEMS)
+
+
+def batch_concurrency() -> int:
+    return _read_positive_int_env(ANALYZE_BATCH_CONCURRENCY_ENV, DEFAULT_BATCH_CONCURRENCY)
+
+
+def is_batch_request(payload: Any) -> bool:
+    """``True`` für gespeicherte Request-Payloads von ``POST /analyze/batch``."""
+    return isinstance(payload, dict) and isinstance(payload.get("queries"), list)
+
+
+def parse_batch_queries(payload: dict[str, Any], *, max_items: int | None = None) -> list[str]:
+    """Validiert ``queries`` (nicht-leere Strings); ``ValueError`` → ``400 bad_request``."""
+    raw_queries = payload.get("queries")
+    if not isinstance(raw_queries, list) or not raw_queries:
+        raise ValueError("queries must be a non-empty list of strings")
+    if max_items is not None and len(raw_queries) > max_items:
+        raise ValueError(f"queries must contain at most {max_items} items")
+    queries: list[str] = []
+    for index, raw_query in enumerate(raw_queries):
+        query = raw_query.strip() if isinstance(raw_query, str) else ""
+        if not query:
+            raise ValueError(f"queries[{index}] must be a non-empty string")
+        queries.append(query)
+    return queries
+
+
+def batch_item_error(index: int, query: str, ex: Exception) -> dict[str, Any]:
+    """Fehlerzeile eines Items (``normalize_error_row``, ``batch_meta.row`` = Position ab 1)."""
+    from src.api.address_intel import normalize_error_row  # noqa: PLC0415
+
+    return {"index": index, "ok": False, **normalize_error_row(query, index + 1, ex)}
+
+
+def iter_batch_results(
+    queries: list[str],
+    analyze_one: Callable[[str], dict[str, Any]],
+    *,
+    concurrency: int,
+    skip_indices: Collection[int] = (),
+) -> Iterator[dict[str, Any]]:
+    """Verarbeitet ``queries`` mit höchstens ``concurrency`` Items gleichzeitig.
+
+    Liefert pro Query eine Zeile in Abschlussreihenfolge (``index`` verweist
+    auf die Position in ``queries``). Neue Items werden erst gestartet, wenn
+    ein Slot frei wird; wird der Generator geschlossen (z. B. Cancel zwischen
+    zwei Items), startet kein weiteres Item mehr. ``skip_indices`` (bereits
+    persistierte Items eines wiederaufgenommenen Jobs) werden übersprungen.
+    """
+
+    def _run(index: int, query: str) -> dict[str, Any]:
+        try:
+            result = analyze_one(query)
+        except Exception as ex:
+            return batch_item_error(index, query, ex)
+        return {
+            "index": index,
+            "ok": True,
+            "query": query,
+            "batch_meta": {"row": index + 1, "status": "ok"},
+            "result": result,
+        }
+
+    skipped = frozenset(skip_indices)
+    pending = ((index, query) for index, query in enumerate(queries) if index not in skipped)
+    in_flight: set[Future[dict[str, Any]]] = set()
+    workers = max(1, min(int(concurrency), len(queries) - len(skipped)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyze-batch")
+    try:
+        for index, query in pending:
+            in_flight.add(executor.submit(_run, index, query))
+            if len(in_flight) >= workers:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_item = next(pending, None)
+                if next_item is not None:
+                    in_flight.add(executor.submit(_run, *next_item))
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def summarize_batch(total: int, rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Final-Result eines Batches: Zähler plus Status pro Item (nach ``index`` sortiert)."""
+    items = []
+    for row in sorted(rows, key=lambda item: int(item["index"])):
+        batch_meta = row.get("batch_meta") or {}
+        items.append(
+            {
+                "index": row["index"],
+                "query": row.get("query"),
+                "status": "ok" if row.get("ok") else "error",
+                "error_code": batch_meta.get("error_code"),
+            }
+        )
+    ok_count = sum(1 for item in items if item["status"] == "ok")
+    return {
+        "total": total,
+        "processed": len(items),
+        "ok": ok_count,
+        "error": len(items) - ok_count,
+        "items": items,
+    }
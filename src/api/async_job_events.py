@@ -0,0 +1,106 @@
+"""In-Process-Pub/Sub für Async-Job-Events (SSE / Long-Poll).
+
+``GET /analyze/jobs/<job_id>/events`` wartet auf neue Job-Events, statt dass
+Clients den Job-Status per Timer pollen. Die Job-Stores melden nach jedem
+Commit die geschriebenen Events (``add_event_listener``); ``JobEventHub.publish``
+weckt genau die Requests, die auf diesen Job warten.
+
+Ablauf pro Request:
+1. ``subscribe(job_id)`` — *vor* dem Lesen des Stores, damit ein Event
+   zwischen Store-Read und Warten nicht verloren geht.
+2. Events ``> since_event_seq`` aus dem Store lesen und senden.
+3. ``subscription.wait(after_seq, timeout)`` — kehrt zurück, sobald ein Event
+   mit höherer ``event_seq`` publiziert wurde, spätestens nach ``timeout``.
+
+Grenzen: Nur Writes dieses Prozesses wecken sofort. Writes anderer Prozesse
+(Pre-Fork mit SQLite) sieht ein Wartender spätestens nach dem Poll-Intervall,
+weil der Aufrufer ``wait`` mit diesem Timeout aufruft und danach den Store
+erneut liest. Mit ``ASYNC_WORKER_QUEUE=db`` speist ``web_service`` zusätzlich
+die Postgres-Notifications neuer Events (Kanal ``async_job_events``) per
+``publish`` ein.
+
+Die Anzahl gleichzeitig wartender Requests ist begrenzt (jeder hält einen
+Server-Thread); ist das Limit erreicht, wirft ``subscribe``
+``JobEventCapacityError``.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class JobEventCapacityError(RuntimeError):
+    """Maximale Anzahl gleichzeitig wartender Requests erreicht."""
+
+
+class _JobChannel:
+    __slots__ = ("condition", "last_seq", "subscribers")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self.condition = threading.Condition(lock)
+        self.last_seq = 0
+        self.subscribers = 0
+
+
+class JobEventSubscription:
+    """Wartet auf Events eines Jobs; nur innerhalb von ``JobEventHub.subscribe`` gültig."""
+
+    def __init__(self, hub: "JobEventHub", channel: _JobChannel) -> None:
+        self._hub = hub
+        self._channel = channel
+
+    def wait(self, *, after_seq: int, timeout: float) -> bool:
+        """``True``, sobald ein Event mit ``event_seq > after_seq`` publiziert wurde."""
+        channel = self._channel
+        with self._hub._lock:
+            return channel.condition.wait_for(lambda: channel.last_seq > after_seq, timeout=max(0.0, timeout))
+
+
+class JobEventHub:
+    """Thread-sicherer Hub: ein Kanal pro Job, nur solange jemand wartet."""
+
+    def __init__(self, *, max_subscribers: int) -> None:
+        self._lock = threading.Lock()
+        self._channels: dict[str, _JobChannel] = {}
+        self._max_subscribers = max(0, int(max_subscribers))
+        self._subscribers = 0
+
+    def publish(self, job_id: str, event_seq: int) -> None:
+        """Store-Listener: O(1) und nicht blockierend, auch ohne Wartende."""
+        with self._lock:
+            channel = self._channels.get(str(job_id))
+            if channel is None:
+                return
+            if event_seq > channel.last_seq:
+                channel.last_seq = int(event_seq)
+            channel.condition.notify_all()
+
+    @contextmanager
+    def subscribe(self, job_id: str) -> Iterator[JobEventSubscription]:
+        key = str(job_id)
+        with self._lock:
+            if self._subscribers >= self._max_subscribers:
+                raise JobEventCapacityError("too many concurrent job event subscribers")
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._channels[key] = _JobChannel(self._lock)
+            channel.subscribers += 1
+            self._subscribers += 1
+        try:
+            yield JobEventSubscription(self, channel)
+        finally:
+            with self._lock:
+                channel.subscribers -= 1
+                self._subscribers -= 1
+                if channel.subscribers == 0:
+                    self._channels.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": self._subscribers,
+                "channels": len(self._channels),
+                "max_subscribers": self._max_subscribers,
+            }
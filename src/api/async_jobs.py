@@ -1,7 +1,31 @@
 """Persistenter Async-Job-Store für Analyze-Langläufer.
 
-Der Store bleibt bewusst leichtgewichtig (JSON-Datei + atomische Writes), damit
-Async-Pfade ohne externe Infrastruktur testbar bleiben.
+Der Store bleibt bewusst leichtgewichtig (JSON-Dateien, keine externe
+Infrastruktur), damit Async-Pfade ohne DB testbar bleiben.
+
+Persistenzmodell:
+- Snapshot (``store_file``): kompletter State, atomisch via ``os.replace``.
+- Journal (``<store_file>.journal``): append-only JSONL; jede Mutation hängt
+  genau eine Zeile mit den geänderten Datensätzen an (O(Änderung) statt
+  O(Historie)). Jede Zeile trägt eine monotone ``seq``; der Snapshot merkt sich
+  die zuletzt enthaltene ``journal_seq``.
+- Beim Laden wird das Journal auf den Snapshot angewendet. Zeilen mit
+  ``seq <= journal_seq`` werden übersprungen (Crash zwischen Snapshot und
+  Journal-Truncate), unlesbare Zeilen (abgerissener Write beim Crash) ebenso.
+- Kompaktierung: nach ``compact_every`` Journal-Zeilen oder ``compact_max_bytes``
+  wird ein neuer Snapshot geschrieben und das Journal geleert.
+
+Env vars (via ``AsyncJobStore.from_env``):
+- ASYNC_JOBS_STORE_FILE: Snapshot-Pfad (Default ``runtime/async_jobs/store.v1.json``)
+- ASYNC_JOBS_JOURNAL_FSYNC: ``batch`` (Default; fsync spätestens nach dem
+  Intervall) | ``always`` (fsync pro Mutation) | ``off`` (nur OS-Page-Cache)
+- ASYNC_JOBS_JOURNAL_FSYNC_INTERVAL_MS: Batch-Fenster für fsync (Default 100)
+- ASYNC_JOBS_COMPACT_EVERY: Journal-Zeilen bis zur Kompaktierung (Default 1000)
+- ASYNC_JOBS_COMPACT_MAX_BYTES: Journal-Grösse bis zur Kompaktierung (Default 16 MiB)
+- ASYNC_RESULT_BLOB_DIR: Result-Payloads als content-adressierte, komprimierte
+  Blobs ablegen (``src/shared/result_blob_store.py``); Snapshot und Journal
+  enthalten dann nur noch die Referenz (``s3_key``, ``checksum_sha256``,
+  ``size_bytes``). Ohne die Variable bleiben Payloads inline (Default).
 """
 
 from __future__ import annotations
@@ -10,15 +34,32 @@ import hashlib
 import json
 import os
 import threading
+import time
 import uuid
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
+
+from src.shared.json_codec import dumps_canonical, dumps_wire
+from src.shared.result_blob_store import (
+    BLOB_GC_MIN_AGE_SECONDS,
+    LocalBlobStore,
+    blob_store_from_env,
+    collect_unreferenced_blobs,
+)
 
 
 _SCHEMA_VERSION = 5
 _DEFAULT_STORE_FILE = "runtime/async_jobs/store.v1.json"
+_JOURNAL_FSYNC_ENV = "ASYNC_JOBS_JOURNAL_FSYNC"
+_JOURNAL_FSYNC_INTERVAL_ENV = "ASYNC_JOBS_JOURNAL_FSYNC_INTERVAL_MS"
+_COMPACT_EVERY_ENV = "ASYNC_JOBS_COMPACT_EVERY"
+_COMPACT_MAX_BYTES_ENV = "ASYNC_JOBS_COMPACT_MAX_BYTES"
+_JOURNAL_FSYNC_MODES = ("batch", "always", "off")
+_DEFAULT_FSYNC_INTERVAL_SECONDS = 0.1
+_DEFAULT_COMPACT_EVERY = 1000
+_DEFAULT_COMPACT_MAX_BYTES = 16 * 1024 * 1024
 _TERMINAL_STATES = {"completed", "failed", "canceled"}
 _ALLOWED_TRANSITIONS = {
     "queued": {"running", "canceled"},
@@ -52,12 +93,7 @@ def _parse_iso_datetime(value: Any) -> datetime | None:
 
 
 def _canonical_payload_hash(payload: dict[str, Any]) -> str:
-    serialized = json.dumps(
-        payload,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
+    serialized = dumps_canonical(payload)
     return hashlib.sha256(serialized).hexdigest()
 
 
@@ -66,37 +102,151 @@ def _as_retry_hint(value: Any) -> str | None:
     return text or None
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "") or "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return default
+
+
+def journal_file_for(store_file: str | Path) -> Path:
+    """Pfad des Append-only-Journals zu einer Snapshot-Datei."""
+    path = Path(store_file)
+    return path.with_name(f"{path.name}.journal")
+
+
+def _apply_journal_op(state: dict[str, Any], op: list[Any]) -> None:
+    kind, key = str(op[0]), str(op[1])
+    value = op[2] if len(op) > 2 else None
+    if kind == "job":
+        state["jobs"][key] = value
+    elif kind == "result":
+        state["results"][key] = value
+    elif kind == "result_del":
+        state["results"].pop(key, None)
+    elif kind == "event":
+        state["events"].setdefault(key, []).append(value)
+    elif kind == "events":
+        state["events"][key] = value
+    elif kind == "notification":
+        state["notifications"][key] = value
+    else:
+        raise ValueError(f"unknown journal op: {kind}")
+
+
+def replay_journal(state: dict[str, Any], journal_file: str | Path) -> dict[str, int]:
+    """Wendet ein Journal in-place auf einen (migrierten) Snapshot-State an.
+
+    Übersprungen werden Zeilen, die bereits im Snapshot enthalten sind
+    (``seq <= state["journal_seq"]``), sowie unlesbare Zeilen — typischerweise
+    der abgerissene letzte Write eines abgestürzten Prozesses. Setzt
+    ``state["journal_seq"]`` auf die höchste angewendete Sequenz.
+    """
+    stats = {"applied": 0, "skipped": 0, "torn": 0, "bytes": 0}
+    path = Path(journal_file)
+    if not path.exists():
+        return stats
+
+    raw = path.read_bytes()
+    stats["bytes"] = len(raw)
+    last_seq = int(state.get("journal_seq", 0) or 0)
+    for line in raw.split(b"\n"):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            seq = int(record["seq"])
+            ops = record["ops"]
+        except (ValueError, TypeError, KeyError):
+            stats["torn"] += 1
+            continue
+        if seq <= last_seq:
+            stats["skipped"] += 1
+            continue
+        for op in ops:
+            _apply_journal_op(state, op)
+        last_seq = seq
+        stats["applied"] += 1
+    state["journal_seq"] = last_seq
+    return stats
+
+
 class AsyncJobStore:
     """File-backed Store für `jobs`, `job_events`, `job_results` und `notifications`."""
 
-    def __init__(self, *, store_file: str | Path):
+    def __init__(
+        self,
+        *,
+        store_file: str | Path,
+        journal_fsync: str = "batch",
+        fsync_interval_seconds: float = _DEFAULT_FSYNC_INTERVAL_SECONDS,
+        compact_every: int = _DEFAULT_COMPACT_EVERY,
+        compact_max_bytes: int = _DEFAULT_COMPACT_MAX_BYTES,
+        blob_store: LocalBlobStore | None = None,
+    ):
+        if journal_fsync not in _JOURNAL_FSYNC_MODES:
+            raise ValueError(f"journal_fsync must be one of {_JOURNAL_FSYNC_MODES}")
         self._store_file = Path(store_file)
+        self._journal_file = journal_file_for(self._store_file)
+        self._journal_fsync = journal_fsync
+        self._fsync_interval_seconds = max(0.0, float(fsync_interval_seconds))
+        self._compact_every = int(compact_every)
+        self._compact_max_bytes = int(compact_max_bytes)
+        self.blob_store = blob_store
         self._lock = threading.Lock()
+        self._event_listeners: list[Callable[[str, int], None]] = []
+        self._unpublished_events: list[tuple[str, int]] = []
+        self._journal_handle: Any = None
+        self._journal_seq = 0
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._pending_ops: list[list[Any]] = []
+        self._last_fsync = 0.0
+        self._fsync_timer: threading.Timer | None = None
         self._state = self._load_or_initialize_state()
 
     @classmethod
     def from_env(cls) -> "AsyncJobStore":
-        return cls(store_file=os.getenv("ASYNC_JOBS_STORE_FILE", _DEFAULT_STORE_FILE))
+        fsync_mode = str(os.getenv(_JOURNAL_FSYNC_ENV, "batch") or "batch").strip().lower()
+        return cls(
+            store_file=os.getenv("ASYNC_JOBS_STORE_FILE", _DEFAULT_STORE_FILE),
+            journal_fsync=fsync_mode if fsync_mode in _JOURNAL_FSYNC_MODES else "batch",
+            fsync_interval_seconds=_env_int(
+                _JOURNAL_FSYNC_INTERVAL_ENV, int(_DEFAULT_FSYNC_INTERVAL_SECONDS * 1000)
+            )
+            / 1000.0,
+            compact_every=_env_int(_COMPACT_EVERY_ENV, _DEFAULT_COMPACT_EVERY),
+            compact_max_bytes=_env_int(_COMPACT_MAX_BYTES_ENV, _DEFAULT_COMPACT_MAX_BYTES),
+            blob_store=blob_store_from_env(),
+        )
 
     def _load_or_initialize_state(self) -> dict[str, Any]:
-        if not self._store_file.exists():
+        raw = ""
+        if self._store_file.exists():
+            raw = self._store_file.read_text(encoding="utf-8").strip()
+
+        if raw:
+            loaded = json.loads(raw)
+            if not isinstance(loaded, dict):
+                raise ValueError("async jobs store must contain a JSON object")
+            needs_snapshot = int(loaded.get("schema_version", 0) or 0) != _SCHEMA_VERSION
+            state = self._migrate_state(loaded)
+        else:
+            needs_snapshot = True
             state = self._empty_state()
-            self._persist_state_atomic(state)
-            return state
-
-        raw = self._store_file.read_text(encoding="utf-8").strip()
-        if not raw:
-            state = self._empty_state()
-            self._persist_state_atomic(state)
-            return state
-
-        loaded = json.loads(raw)
-        if not isinstance(loaded, dict):
-            raise ValueError("async jobs store must contain a JSON object")
 
-        migrated = self._migrate_state(loaded)
-        self._persist_state_atomic(migrated)
-        return migrated
+        replay = replay_journal(state, self._journal_file)
+        self._journal_seq = int(state.get("journal_seq", 0) or 0)
+        self._journal_records = replay["applied"] + replay["skipped"] + replay["torn"]
+        self._journal_bytes = replay["bytes"]
+        # Nur schreiben, wenn nötig: weitere Leser (z. B. Skripte neben einem
+        # laufenden Service) dürfen das Journal des Schreibers nicht kürzen.
+        if needs_snapshot:
+            self._compact_locked(state)
+        return state
 
     @staticmethod
     def _empty_state() -> dict[str, Any]:
@@ -109,7 +259,9 @@ class AsyncJobStore:
         }
 
     def _migrate_state(self, state: dict[str, Any]) -> dict[str, Any]:
-        migrated = deepcopy(state)
+        # ``state`` ist frisch aus JSON geparst und gehört dem Store: in-place
+        # migrieren statt den (ggf. mehrere MB grossen) State zu kopieren.
+        migrated = state
 
         schema_version = int(migrated.get("schema_version", 0) or 0)
         if schema_version < 1:
@@ -155,6 +307,7 @@ class AsyncJobStore:
                 raw_job.setdefault("started_at", None)
                 raw_job.setdefault("finished_at", None)
                 raw_job.setdefault("updated_at", now)
+                raw_job.setdefault("reused_from_job_id", None)
 
         results = migrated["results"]
         if isinstance(results, dict):
@@ -170,7 +323,8 @@ class AsyncJobStore:
                 raw_result.setdefault("owner_org_id", None)
                 raw_result.setdefault("created_at", _utc_now_iso())
                 raw_result.setdefault("summary_json", {})
-                raw_result.setdefault("result_payload", {})
+                if not raw_result.get("s3_key"):
+                    raw_result.setdefault("result_payload", {})
                 job_id = str(raw_result.get("job_id") or "")
                 if not job_id:
                     continue
@@ -209,20 +363,125 @@ class AsyncJobStore:
         return migrated
 
     def _persist_state_atomic(self, state: dict[str, Any]) -> None:
+        """Schreibt einen Snapshot inkl. ``journal_seq`` (Journal bleibt unverändert)."""
         self._store_file.parent.mkdir(parents=True, exist_ok=True)
+        state["journal_seq"] = self._journal_seq
         tmp_path = self._store_file.with_name(
             f"{self._store_file.name}.{uuid.uuid4().hex}.tmp"
         )
-        tmp_path.write_text(
-            json.dumps(state, ensure_ascii=False, sort_keys=True, indent=2),
-            encoding="utf-8",
-        )
+        with open(tmp_path, "wb") as handle:
+            handle.write(dumps_wire(state))
+            if self._journal_fsync != "off":
+                handle.flush()
+                os.fsync(handle.fileno())
         try:
             os.replace(tmp_path, self._store_file)
         finally:
             if tmp_path.exists():
                 tmp_path.unlink(missing_ok=True)
 
+    def _compact_locked(self, state: dict[str, Any]) -> None:
+        self._persist_state_atomic(state)
+        # Crash zwischen Snapshot und Truncate ist unkritisch: Replay überspringt
+        # alle Zeilen mit seq <= journal_seq.
+        self._close_journal_locked()
+        if self._journal_file.exists():
+            with open(self._journal_file, "wb"):
+                pass
+        self._journal_records = 0
+        self._journal_bytes = 0
+
+    def _open_journal_locked(self) -> Any:
+        if self._journal_handle is None:
+            self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self._journal_file, "ab", buffering=0)
+            if handle.tell() > 0:
+                with open(self._journal_file, "rb") as reader:
+                    reader.seek(-1, os.SEEK_END)
+                    if reader.read(1) != b"\n":
+                        # Abgerissene letzte Zeile abschliessen; Replay ignoriert sie.
+                        handle.write(b"\n")
+            self._journal_handle = handle
+        return self._journal_handle
+
+    def _close_journal_locked(self) -> None:
+        if self._fsync_timer is not None:
+            self._fsync_timer.cancel()
+            self._fsync_timer = None
+        if self._journal_handle is not None:
+            if self._journal_fsync != "off":
+                os.fsync(self._journal_handle.fileno())
+            self._journal_handle.close()
+            self._journal_handle = None
+
+    def _fsync_journal_locked(self) -> None:
+        if self._journal_handle is None or self._journal_fsync == "off":
+            return
+        now = time.monotonic()
+        if self._journal_fsync == "always" or now - self._last_fsync >= self._fsync_interval_seconds:
+            os.fsync(self._journal_handle.fileno())
+            self._last_fsync = now
+            return
+        if self._fsync_timer is None:
+            # Group-Commit: ein Timer synct alle Writes des laufenden Fensters.
+            delay = self._fsync_interval_seconds - (now - self._last_fsync)
+            timer = threading.Timer(delay, self._flush_journal_timer)
+            timer.daemon = True
+            self._fsync_timer = timer
+            timer.start()
+
+    def _flush_journal_timer(self) -> None:
+        with self._lock:
+            self._fsync_timer = None
+            if self._journal_handle is not None:
+                os.fsync(self._journal_handle.fileno())
+                self._last_fsync = time.monotonic()
+
+    def _commit_locked(self) -> None:
+        """Hängt die seit dem letzten Commit gesammelten Ops als eine Journal-Zeile an."""
+        if not self._pending_ops:
+            return
+        self._journal_seq += 1
+        line = dumps_wire({"seq": self._journal_seq, "ops": self._pending_ops}) + b"\n"
+        self._pending_ops = []
+        handle = self._open_journal_locked()
+        handle.write(line)
+        self._journal_records += 1
+        self._journal_bytes += len(line)
+        self._publish_events_locked()
+        if (self._compact_every and self._journal_records >= self._compact_every) or (
+            self._compact_max_bytes and self._journal_bytes >= self._compact_max_bytes
+        ):
+            self._compact_locked(self._state)
+            return
+        self._fsync_journal_locked()
+
+    def compact(self) -> None:
+        """Schreibt sofort einen Snapshot und leert das Journal."""
+        with self._lock:
+            self._commit_locked()
+            self._compact_locked(self._state)
+
+    def close(self) -> None:
+        """Synct und schliesst das Journal (z. B. beim Shutdown)."""
+        with self._lock:
+            self._commit_locked()
+            self._close_journal_locked()
+
+    def add_event_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Registriert ``listener(job_id, event_seq)``; Aufruf nach jedem Commit mit neuen Events.
+
+        Listener laufen unter dem Store-Lock und dürfen weder blockieren noch
+        den Store aufrufen (z. B. ``JobEventHub.publish``).
+        """
+        self._event_listeners.append(listener)
+
+    def _publish_events_locked(self) -> None:
+        events, self._unpublished_events = self._unpublished_events, []
+        for job_id, event_seq in events:
+            for listener in self._event_listeners:
+                listener(job_id, event_seq)
+
     def _append_event_locked(
         self,
         *,
@@ -243,6 +502,8 @@ class AsyncJobStore:
             "payload_json": payload or {},
         }
         events_by_job.append(event)
+        self._pending_ops.append(["event", job_id, event])
+        self._unpublished_events.append((job_id, event_seq))
         return deepcopy(event)
 
     def _upsert_terminal_notification_locked(
@@ -295,6 +556,7 @@ class AsyncJobStore:
             },
         }
         notifications_by_id[notification_id] = record
+        self._pending_ops.append(["notification", notification_id, record])
         return deepcopy(record)
 
     @staticmethod
@@ -339,6 +601,7 @@ class AsyncJobStore:
             "started_at": None,
             "finished_at": None,
             "updated_at": now,
+            "reused_from_job_id": None,
         }
 
     def create_job(
@@ -351,7 +614,14 @@ class AsyncJobStore:
         org_id: str = "default-org",
         owner_user_id: str | None = None,
         owner_org_id: str | None = None,
+        reused_from: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        """Legt einen Job an (`queued`).
+
+        Mit `reused_from` (Treffer von `find_reusable_job`) entsteht der Job
+        direkt als `completed` und verweist auf das finale Result des Quell-Jobs;
+        die Pipeline läuft nicht erneut.
+        """
         with self._lock:
             job_id = str(uuid.uuid4())
             correlation_id = str(uuid.uuid4())
@@ -366,15 +636,73 @@ class AsyncJobStore:
                 owner_user_id=owner_user_id,
                 owner_org_id=resolved_owner_org_id,
             )
+            if reused_from is not None:
+                job.update(
+                    status="completed",
+                    progress_percent=100,
+                    result_id=reused_from.get("result_id"),
+                    reused_from_job_id=str(reused_from.get("job_id") or ""),
+                    started_at=job["queued_at"],
+                    finished_at=job["queued_at"],
+                )
             self._state["jobs"][job_id] = job
+            self._pending_ops.append(["job", job_id, job])
             self._append_event_locked(
                 job_id=job_id,
                 event_type="job.queued",
                 payload={"request_id": request_id, "status": "queued"},
             )
-            self._persist_state_atomic(self._state)
+            if reused_from is not None:
+                self._append_event_locked(
+                    job_id=job_id,
+                    event_type="job.completed",
+                    payload={
+                        "status": "completed",
+                        "progress_percent": 100,
+                        "result_id": job["result_id"],
+                        "reused_from_job_id": job["reused_from_job_id"],
+                    },
+                )
+                self._upsert_terminal_notification_locked(job=job, terminal_status="completed")
+            self._commit_locked()
             return deepcopy(job)
 
+    def find_reusable_job(
+        self,
+        *,
+        org_id: str,
+        request_payload: dict[str, Any],
+        max_age_seconds: float,
+        owner_user_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Jüngster `completed`-Job mit gleichem Payload-Hash im Frischefenster.
+
+        Berücksichtigt nur selbst gerechnete Jobs (kein `reused_from_job_id`),
+        deren finales Result noch existiert; mit `owner_user_id` zusätzlich nur
+        Jobs desselben Users (Result-Sichtbarkeit im Auth-Modus).
+        """
+        payload_hash = _canonical_payload_hash(request_payload)
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=float(max_age_seconds))
+        with self._lock:
+            best: dict[str, Any] | None = None
+            best_finished: datetime | None = None
+            for job in self._state["jobs"].values():
+                if (
+                    job.get("status") != "completed"
+                    or job.get("reused_from_job_id")
+                    or job.get("request_payload_hash") != payload_hash
+                    or str(job.get("org_id") or "") != str(org_id)
+                    or (owner_user_id and job.get("owner_user_id") != owner_user_id)
+                    or job.get("result_id") not in self._state["results"]
+                ):
+                    continue
+                finished = _parse_iso_datetime(job.get("finished_at"))
+                if finished is None or finished < cutoff:
+                    continue
+                if best_finished is None or finished > best_finished:
+                    best, best_finished = job, finished
+            return deepcopy(best) if best is not None else None
+
     def transition_job(
         self,
         *,
@@ -466,7 +794,8 @@ class AsyncJobStore:
                 actor_type=actor_type,
                 payload=payload,
             )
-            self._persist_state_atomic(self._state)
+            self._pending_ops.append(["job", job_id, job])
+            self._commit_locked()
             return deepcopy(job)
 
     def request_cancel(
@@ -535,7 +864,9 @@ class AsyncJobStore:
                 )
                 cancel_applied = True
 
-            self._persist_state_atomic(self._state)
+            if self._pending_ops:
+                self._pending_ops.append(["job", job_id, job])
+            self._commit_locked()
             return {
                 "job": deepcopy(job),
                 "cancel_requested": True,
@@ -585,7 +916,8 @@ class AsyncJobStore:
                     "cancel_requested_at": job.get("cancel_requested_at"),
                 },
             )
-            self._persist_state_atomic(self._state)
+            self._pending_ops.append(["job", job_id, job])
+            self._commit_locked()
             return deepcopy(job)
 
     def list_job_ids(self, *, statuses: Iterable[str] | None = None) -> list[str]:
@@ -611,6 +943,9 @@ class AsyncJobStore:
         result_kind: str = "final",
         schema_version: str = "v1",
     ) -> dict[str, Any]:
+        # Blob ausserhalb des Locks schreiben (Kompression + fsync); identische
+        # Payloads landen im selben Blob.
+        blob_ref = self.blob_store.put_json(result_payload) if self.blob_store is not None else None
         with self._lock:
             job = self._state["jobs"].get(job_id)
             if job is None:
@@ -651,7 +986,6 @@ class AsyncJobStore:
                 "result_kind": normalized_kind,
                 "result_seq": next_seq,
                 "schema_version": schema_version,
-                "result_payload": deepcopy(result_payload),
                 "summary_json": {
                     "status": str(job.get("status", "queued")),
                     "query": str(job.get("query", "")),
@@ -659,8 +993,13 @@ class AsyncJobStore:
                 },
                 "created_at": _utc_now_iso(),
             }
+            if blob_ref is not None:
+                result_record.update(blob_ref)
+            else:
+                result_record["result_payload"] = deepcopy(result_payload)
             self._state["results"][result_id] = result_record
-            self._persist_state_atomic(self._state)
+            self._pending_ops.append(["result", result_id, result_record])
+            self._commit_locked()
             return deepcopy(result_record)
 
     def get_job(self, job_id: str) -> dict[str, Any] | None:
@@ -673,19 +1012,23 @@ class AsyncJobStore:
             record = self._state["results"].get(result_id)
             return deepcopy(record) if record is not None else None
 
-    def list_results(self, job_id: str) -> list[dict[str, Any]]:
+    def list_results(self, job_id: str, *, after_seq: int = 0) -> list[dict[str, Any]]:
         with self._lock:
             rows = [
                 deepcopy(row)
                 for row in self._state["results"].values()
-                if isinstance(row, dict) and str(row.get("job_id")) == str(job_id)
+                if isinstance(row, dict)
+                and str(row.get("job_id")) == str(job_id)
+                and (after_seq <= 0 or int(row.get("result_seq", 0) or 0) > after_seq)
             ]
             rows.sort(key=lambda row: int(row.get("result_seq", 0) or 0))
             return rows
 
-    def list_events(self, job_id: str) -> list[dict[str, Any]]:
+    def list_events(self, job_id: str, *, after_seq: int = 0) -> list[dict[str, Any]]:
         with self._lock:
             events = self._state["events"].get(job_id, [])
+            if after_seq > 0:
+                events = [event for event in events if int(event.get("event_seq", 0) or 0) > after_seq]
             return deepcopy(events)
 
     def list_notifications(
@@ -735,6 +1078,7 @@ class AsyncJobStore:
         events_ttl_seconds: float | int | None,
         dry_run: bool = False,
         now: datetime | None = None,
+        blob_min_age_seconds: float = BLOB_GC_MIN_AGE_SECONDS,
     ) -> dict[str, Any]:
         """Räumt veraltete `job_results`/`job_events` für terminale Jobs auf.
 
@@ -742,6 +1086,9 @@ class AsyncJobStore:
         - Nur Jobs in terminalen Zuständen (`completed|failed|canceled`) werden bereinigt.
         - Einträge ohne gültigen Timestamp bleiben erhalten (sicherheitsorientiert).
         - Optionaler Dry-Run liefert Metriken ohne Persistenz.
+
+        Mit Blob-Store werden danach Blobs gelöscht, die kein Result mehr
+        referenziert (``collect_unreferenced_blobs``, Summary unter ``blobs``).
         """
 
         with self._lock:
@@ -840,14 +1187,26 @@ class AsyncJobStore:
 
                 if not dry_run and len(kept_events) != len(raw_events):
                     events_state[job_id] = kept_events
+                    self._pending_ops.append(["events", str(job_id), kept_events])
 
             if not dry_run:
                 for result_id in result_delete_ids:
                     results_state.pop(result_id, None)
-                if result_delete_ids or events_delete_count:
-                    self._persist_state_atomic(self._state)
+                    self._pending_ops.append(["result_del", result_id])
+                self._commit_locked()
+
+            # Beim Dry-Run zählen die zu löschenden Results nicht als Referenz,
+            # damit die Blob-Zahlen denen eines echten Laufs entsprechen.
+            referenced_blob_keys: set[str] = set()
+            if self.blob_store is not None:
+                deleted_result_ids = set(result_delete_ids)
+                referenced_blob_keys = {
+                    str(row.get("s3_key"))
+                    for result_id, row in results_state.items()
+                    if isinstance(row, dict) and row.get("s3_key") and str(result_id) not in deleted_result_ids
+                }
 
-            return {
+            summary: dict[str, Any] = {
                 "now": now_dt.isoformat(),
                 "dry_run": bool(dry_run),
                 "terminal_job_count": len(terminal_job_ids),
@@ -873,3 +1232,17 @@ class AsyncJobStore:
                     "cutoff": events_cutoff.isoformat() if events_cutoff else None,
                 },
             }
+
+        # Blob-GC ausserhalb des Locks: Blobs, die nach dem Snapshot wieder
+        # referenziert werden, schützt die Mindestalter-Grenze.
+        summary["blobs"] = (
+            collect_unreferenced_blobs(
+                self.blob_store,
+                referenced_blob_keys.intersection,
+                dry_run=dry_run,
+                min_age_seconds=blob_min_age_seconds,
+            )
+            if self.blob_store is not None
+            else None
+        )
+        return summary
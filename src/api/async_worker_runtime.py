@@ -1,21 +1,53 @@
 """Leichtgewichtiger Async-Worker für Analyze-Jobs.
 
-Queue-/Dispatcher-light: ein Hintergrundthread verarbeitet Jobs seriell und
-schreibt deterministische Partial-/Final-Snapshots in den AsyncJobStore.
+Queue-/Dispatcher-light: ein Pool von Hintergrundthreads verarbeitet Jobs und
+schreibt pro Pipeline-Stufe ein Partial-Result, zum Schluss das Final-Result in
+den AsyncJobStore. Die Stufen liefert ein injizierter ``analysis_runner``
+(API: echte ``build_report``-Pipeline); ohne Runner laufen deterministische Stubs.
+
+Fairness: Jobs werden pro Tenant (``org_id`` bzw. ``owner_user_id``) in eigene
+FIFO-Queues gelegt und reihum (Round-Robin) an freie Worker vergeben; pro
+Tenant laufen höchstens ``per_tenant_concurrency`` Jobs gleichzeitig. Ein
+Burst eines Tenants belegt damit nie alle Worker.
+
+Multi-Node (``ASYNC_WORKER_QUEUE=db``, DB- oder SQLite-Store): statt der
+prozesslokalen Queue claimen die Worker offene Jobs per
+``SELECT ... FOR UPDATE SKIP LOCKED`` mit Lease aus Postgres (SQLite:
+``BEGIN IMMEDIATE``, z. B. für Pre-Fork-Worker auf einem Host). Ein
+Koordinator-Thread erneuert die Leases per Heartbeat, gibt abgelaufene Leases
+anderer Nodes wieder frei und weckt die Worker über ``LISTEN async_jobs``
+(Fallback: Polling im Heartbeat-Intervall). Jeder Job läuft damit auf genau
+einem Node, auch wenn er auf einem anderen angenommen wurde; Jobs, die öfter
+als ``ASYNC_WORKER_MAX_CLAIMS`` geclaimt wurden (Worker-Absturz), werden als
+``lease_expired`` abgebrochen.
+
+Env vars:
+- ASYNC_WORKER_POOL_SIZE: Anzahl Worker-Threads (Default: 4)
+- ASYNC_WORKER_PER_TENANT_CONCURRENCY: max. parallele Jobs pro Tenant (Default: 2)
+- ASYNC_WORKER_FAIRNESS_KEY: ``org`` (Default) | ``user``
+- ASYNC_WORKER_QUEUE: ``local`` (Default) | ``db``
+- ASYNC_WORKER_LEASE_SECONDS: Lease-Dauer im ``db``-Modus (Default: 30; Heartbeat alle 1/3)
+- ASYNC_WORKER_MAX_CLAIMS: max. Claims pro Job im ``db``-Modus (Default: 3)
 """
 
 from __future__ import annotations
 
+import logging
 import os
+import socket
 import threading
 import time
-from collections import deque
-from copy import deepcopy
-from typing import Any
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
 
-from src.api.address_intel import AddressIntelError
+from src.api.address_intel_errors import AddressIntelError
 from src.api.async_jobs import AsyncJobStore
 
+logger = logging.getLogger(__name__)
+
 
 def _read_stage_delay_seconds() -> float:
     raw_value = str(os.getenv("ASYNC_WORKER_STAGE_DELAY_MS", "150")).strip()
@@ -27,6 +59,56 @@ def _read_stage_delay_seconds() -> float:
     return float(parsed_ms) / 1000.0
 
 
+ASYNC_WORKER_POOL_SIZE_ENV = "ASYNC_WORKER_POOL_SIZE"
+ASYNC_WORKER_PER_TENANT_CONCURRENCY_ENV = "ASYNC_WORKER_PER_TENANT_CONCURRENCY"
+ASYNC_WORKER_FAIRNESS_KEY_ENV = "ASYNC_WORKER_FAIRNESS_KEY"
+ASYNC_WORKER_QUEUE_ENV = "ASYNC_WORKER_QUEUE"
+ASYNC_WORKER_LEASE_SECONDS_ENV = "ASYNC_WORKER_LEASE_SECONDS"
+ASYNC_WORKER_MAX_CLAIMS_ENV = "ASYNC_WORKER_MAX_CLAIMS"
+DEFAULT_WORKER_POOL_SIZE = 4
+DEFAULT_PER_TENANT_CONCURRENCY = 2
+DEFAULT_LEASE_SECONDS = 30
+DEFAULT_MAX_CLAIMS = 3
+_QUEUE_MODES = {"local", "db"}
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "canceled"})
+_FAIRNESS_KEYS = {"org": "org_id", "user": "owner_user_id"}
+_DEFAULT_TENANT = "default"
+_TENANT_STATS_MAX_ENTRIES = 1024
+
+
+def _read_positive_int_env(name: str, default: int) -> int:
+    raw_value = str(os.getenv(name, "")).strip()
+    try:
+        parsed = int(raw_value)
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _read_fairness_key() -> str:
+    raw_value = str(os.getenv(ASYNC_WORKER_FAIRNESS_KEY_ENV, "org")).strip().lower()
+    return raw_value if raw_value in _FAIRNESS_KEYS else "org"
+
+
+def _read_queue_mode() -> str:
+    raw_value = str(os.getenv(ASYNC_WORKER_QUEUE_ENV, "local")).strip().lower()
+    return raw_value if raw_value in _QUEUE_MODES else "local"
+
+
+def _wait_ms_since(iso_timestamp: Any) -> float:
+    try:
+        queued_at = datetime.fromisoformat(str(iso_timestamp))
+    except ValueError:
+        return 0.0
+    if queued_at.tzinfo is None:
+        queued_at = queued_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (datetime.now(timezone.utc) - queued_at).total_seconds() * 1000.0)
+
+
+def _default_node_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
 def _fault_injection_enabled() -> bool:
     return str(os.getenv("ENABLE_E2E_FAULT_INJECTION", "0")).strip().lower() in {
         "1",
@@ -134,72 +216,448 @@ def _classify_failure(exc: Exception) -> tuple[str, bool, str]:
     return "internal", True, "retry_with_backoff"
 
 
-class AsyncJobRuntime:
-    """Single-worker Runtime für asynchrone Analyze-Jobs."""
+@dataclass(frozen=True)
+class AnalysisStage:
+    """Ergebnis einer Pipeline-Stufe; ``final`` markiert den vollständigen Report."""
+
+    name: str
+    payload: dict[str, Any]
+    progress_percent: int
+    final: bool = False
+
+
+# ``runner(job)`` liefert die Stufen eines Jobs lazy; zwischen zwei Stufen prüft
+# der Worker Cancel-Requests und persistiert jede Stufe als Partial-/Final-Result.
+AnalysisRunner = Callable[[dict[str, Any]], Iterator[AnalysisStage]]
+
+
+class _TenantStats:
+    __slots__ = ("enqueued_total", "started_total", "wait_ms_total", "max_wait_ms", "last_wait_ms")
+
+    def __init__(self) -> None:
+        self.enqueued_total = 0
+        self.started_total = 0
+        self.wait_ms_total = 0.0
+        self.max_wait_ms = 0.0
+        self.last_wait_ms = 0.0
+
+    def record_start(self, wait_ms: float) -> None:
+        self.started_total += 1
+        self.wait_ms_total += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        self.last_wait_ms = wait_ms
 
-    def __init__(self, *, store: AsyncJobStore, stage_delay_seconds: float | None = None):
+
+class AsyncJobRuntime:
+    """Multi-Worker Runtime für asynchrone Analyze-Jobs mit Fair-Queuing pro Tenant."""
+
+    def __init__(
+        self,
+        *,
+        store: AsyncJobStore,
+        stage_delay_seconds: float | None = None,
+        workers: int | None = None,
+        per_tenant_concurrency: int | None = None,
+        fairness_key: str | None = None,
+        analysis_runner: AnalysisRunner | None = None,
+        queue_mode: str | None = None,
+        lease_seconds: float | None = None,
+        max_claims: int | None = None,
+        node_id: str | None = None,
+    ):
         self._store = store
+        # Ohne Runner: deterministische Stub-Pipeline (Tests/E2E ohne Upstreams).
+        self._analysis_runner = analysis_runner
         self._stage_delay_seconds = (
             _read_stage_delay_seconds()
             if stage_delay_seconds is None
             else max(0.0, float(stage_delay_seconds))
         )
-        self._queue: deque[str] = deque()
-        self._queued_ids: set[str] = set()
+        self._workers = max(
+            1,
+            int(workers) if workers is not None else _read_positive_int_env(ASYNC_WORKER_POOL_SIZE_ENV, DEFAULT_WORKER_POOL_SIZE),
+        )
+        self._per_tenant_concurrency = max(
+            1,
+            int(per_tenant_concurrency)
+            if per_tenant_concurrency is not None
+            else _read_positive_int_env(ASYNC_WORKER_PER_TENANT_CONCURRENCY_ENV, DEFAULT_PER_TENANT_CONCURRENCY),
+        )
+        resolved_fairness_key = str(fairness_key or _read_fairness_key()).strip().lower()
+        self._fairness_key = resolved_fairness_key if resolved_fairness_key in _FAIRNESS_KEYS else "org"
+
+        # Tenant -> FIFO (job_id, enqueued_at); ``_ready`` ist der Round-Robin-Ring
+        # aller Tenants mit wartenden Jobs.
+        self._tenant_queues: dict[str, deque[tuple[str, float]]] = {}
+        self._ready: deque[str] = deque()
+        self._queued_ids: dict[str, str] = {}
+        self._running_ids: dict[str, str] = {}
+        self._requeue_ids: set[str] = set()
+        self._running_per_tenant: dict[str, int] = {}
+        self._tenant_stats: OrderedDict[str, _TenantStats] = OrderedDict()
         self._condition = threading.Condition()
         self._stop_event = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._threads: list[threading.Thread] = []
+
+        resolved_queue_mode = str(queue_mode or _read_queue_mode()).strip().lower()
+        if resolved_queue_mode not in _QUEUE_MODES:
+            raise ValueError(f"unknown async worker queue mode: {queue_mode!r}")
+        if resolved_queue_mode == "db" and not callable(getattr(store, "claim_jobs", None)):
+            raise RuntimeError(
+                "ASYNC_WORKER_QUEUE=db requires ASYNC_STORE_BACKEND=db or sqlite (store without claim_jobs)"
+            )
+        self._queue_mode = resolved_queue_mode
+        self._lease_seconds = (
+            float(lease_seconds)
+            if lease_seconds is not None
+            else float(_read_positive_int_env(ASYNC_WORKER_LEASE_SECONDS_ENV, DEFAULT_LEASE_SECONDS))
+        )
+        self._max_claims = max(
+            1,
+            int(max_claims) if max_claims is not None else _read_positive_int_env(ASYNC_WORKER_MAX_CLAIMS_ENV, DEFAULT_MAX_CLAIMS),
+        )
+        self._node_id = str(node_id or _default_node_id())
+        # db-Modus: geleaste Jobs dieses Nodes, verlorene Leases und ein
+        # Wake-Zähler gegen verpasste Notifications zwischen Claim und Wait.
+        self._leased_ids: set[str] = set()
+        self._lost_lease_ids: set[str] = set()
+        self._wake_seq = 0
+
+    @property
+    def queue_mode(self) -> str:
+        return self._queue_mode
 
     def start(self) -> None:
         with self._condition:
-            if self._thread is not None and self._thread.is_alive():
+            if any(thread.is_alive() for thread in self._threads):
                 return
             self._stop_event.clear()
-            self._thread = threading.Thread(
-                target=self._run,
-                name="async-job-worker",
-                daemon=True,
-            )
-            self._thread.start()
+            target = self._run_claiming if self._queue_mode == "db" else self._run
+            self._threads = [
+                threading.Thread(
+                    target=target,
+                    name=f"async-job-worker-{index}",
+                    daemon=True,
+                )
+                for index in range(self._workers)
+            ]
+            if self._queue_mode == "db":
+                self._threads.append(
+                    threading.Thread(target=self._coordinate_leases, name="async-job-lease-coordinator", daemon=True)
+                )
+            for thread in self._threads:
+                thread.start()
 
     def stop(self, *, timeout: float = 2.0) -> None:
         self._stop_event.set()
         with self._condition:
             self._condition.notify_all()
-        thread = self._thread
-        if thread is not None:
-            thread.join(timeout=max(0.0, timeout))
+        deadline = time.monotonic() + max(0.0, timeout)
+        for thread in self._threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
 
-    def enqueue(self, job_id: str) -> None:
+    def enqueue(self, job_id: str, *, job: dict[str, Any] | None = None) -> None:
+        """Reiht einen Job ein; ``job`` (falls bekannt) spart den Store-Lookup für den Tenant."""
         normalized_job_id = str(job_id or "").strip()
         if not normalized_job_id:
             return
+        if self._queue_mode == "db":
+            # Der Job liegt bereits in Postgres; nur lokale Worker wecken
+            # (andere Nodes weckt der NOTIFY-Trigger).
+            self._wake()
+            return
+        tenant = self._resolve_tenant(normalized_job_id, job)
         with self._condition:
             if normalized_job_id in self._queued_ids:
                 return
-            self._queue.append(normalized_job_id)
-            self._queued_ids.add(normalized_job_id)
-            self._condition.notify_all()
+            if normalized_job_id in self._running_ids:
+                # Läuft bereits (z. B. Cancel-Request): nach Abschluss erneut prüfen,
+                # nie zwei Worker auf demselben Job.
+                self._requeue_ids.add(normalized_job_id)
+                return
+            self._push_locked(normalized_job_id, tenant)
+            self._condition.notify()
 
     def enqueue_pending_jobs(self) -> None:
+        if self._queue_mode == "db":
+            # Offene Jobs sind ohnehin claimbar; Claims verhindern doppelte Aufnahme.
+            self._wake()
+            return
         pending_ids = self._store.list_job_ids(statuses={"queued", "running", "partial"})
         for job_id in pending_ids:
             self.enqueue(job_id)
 
+    def stats(self) -> dict[str, Any]:
+        """Queue-Tiefe, laufende Jobs und Wartezeiten pro Tenant."""
+        now = time.monotonic()
+        with self._condition:
+            tenants: dict[str, Any] = {}
+            for tenant, tenant_stats in self._tenant_stats.items():
+                queue = self._tenant_queues.get(tenant)
+                oldest_wait_ms = (now - queue[0][1]) * 1000.0 if queue else 0.0
+                tenants[tenant] = {
+                    "queue_depth": len(queue) if queue else 0,
+                    "running": self._running_per_tenant.get(tenant, 0),
+                    "enqueued_total": tenant_stats.enqueued_total,
+                    "started_total": tenant_stats.started_total,
+                    "oldest_wait_ms": round(oldest_wait_ms, 1),
+                    "avg_wait_ms": round(tenant_stats.wait_ms_total / tenant_stats.started_total, 1)
+                    if tenant_stats.started_total
+                    else 0.0,
+                    "max_wait_ms": round(tenant_stats.max_wait_ms, 1),
+                    "last_wait_ms": round(tenant_stats.last_wait_ms, 1),
+                }
+            return {
+                "queue_mode": self._queue_mode,
+                "workers": self._workers,
+                "busy_workers": len(self._running_ids),
+                "per_tenant_concurrency": self._per_tenant_concurrency,
+                "fairness_key": self._fairness_key,
+                "queue_depth": len(self._queued_ids),
+                "tenants": tenants,
+                **(
+                    {"node_id": self._node_id, "leased": len(self._leased_ids), "lease_seconds": self._lease_seconds}
+                    if self._queue_mode == "db"
+                    else {}
+                ),
+            }
+
+    def _resolve_tenant(self, job_id: str, job: dict[str, Any] | None) -> str:
+        if job is None:
+            try:
+                job = self._store.get_job(job_id)
+            except Exception:
+                job = None
+        if not isinstance(job, dict):
+            return _DEFAULT_TENANT
+        field = _FAIRNESS_KEYS[self._fairness_key]
+        tenant = str(job.get(field) or "").strip()
+        if not tenant and field != "org_id":
+            tenant = str(job.get("org_id") or "").strip()
+        return tenant or _DEFAULT_TENANT
+
+    def _tenant_stats_locked(self, tenant: str) -> _TenantStats:
+        tenant_stats = self._tenant_stats.get(tenant)
+        if tenant_stats is None:
+            tenant_stats = _TenantStats()
+            self._tenant_stats[tenant] = tenant_stats
+            if len(self._tenant_stats) > _TENANT_STATS_MAX_ENTRIES:
+                for candidate in list(self._tenant_stats):
+                    if candidate not in self._tenant_queues and not self._running_per_tenant.get(candidate):
+                        del self._tenant_stats[candidate]
+                        break
+        else:
+            self._tenant_stats.move_to_end(tenant)
+        return tenant_stats
+
+    def _push_locked(self, job_id: str, tenant: str) -> None:
+        queue = self._tenant_queues.get(tenant)
+        if queue is None:
+            queue = deque()
+            self._tenant_queues[tenant] = queue
+            self._ready.append(tenant)
+        queue.append((job_id, time.monotonic()))
+        self._queued_ids[job_id] = tenant
+        self._tenant_stats_locked(tenant).enqueued_total += 1
+
+    def _pop_next_locked(self) -> tuple[str, str] | None:
+        """Nächster Job im Round-Robin über Tenants unterhalb ihres Concurrency-Caps."""
+        for _ in range(len(self._ready)):
+            tenant = self._ready.popleft()
+            if self._running_per_tenant.get(tenant, 0) >= self._per_tenant_concurrency:
+                self._ready.append(tenant)
+                continue
+            queue = self._tenant_queues[tenant]
+            job_id, enqueued_at = queue.popleft()
+            if queue:
+                self._ready.append(tenant)
+            else:
+                del self._tenant_queues[tenant]
+            del self._queued_ids[job_id]
+            self._running_ids[job_id] = tenant
+            self._running_per_tenant[tenant] = self._running_per_tenant.get(tenant, 0) + 1
+            self._tenant_stats_locked(tenant).record_start((time.monotonic() - enqueued_at) * 1000.0)
+            return job_id, tenant
+        return None
+
+    def _finish_locked(self, job_id: str, tenant: str) -> None:
+        self._running_ids.pop(job_id, None)
+        remaining = self._running_per_tenant.get(tenant, 1) - 1
+        if remaining > 0:
+            self._running_per_tenant[tenant] = remaining
+        else:
+            self._running_per_tenant.pop(tenant, None)
+        if job_id in self._requeue_ids:
+            self._requeue_ids.discard(job_id)
+            self._push_locked(job_id, tenant)
+        # Freier Slot (global und ggf. für den Tenant) → wartende Worker wecken.
+        self._condition.notify_all()
+
     def _run(self) -> None:
         while not self._stop_event.is_set():
             with self._condition:
-                if not self._queue:
+                picked = self._pop_next_locked()
+                if picked is None:
                     self._condition.wait(timeout=0.5)
                     continue
-                job_id = self._queue.popleft()
-                self._queued_ids.discard(job_id)
+            job_id, tenant = picked
 
             try:
                 self._process_one(job_id)
             except Exception:
                 # Worker darf den Prozess nicht crashen; Fehlerpfad wird pro Job persistiert.
+                pass
+            finally:
+                with self._condition:
+                    self._finish_locked(job_id, tenant)
+
+    # ------------------------------------------------------------------
+    # db-Modus: Claims mit Lease
+    # ------------------------------------------------------------------
+
+    def _wake(self) -> None:
+        with self._condition:
+            self._wake_seq += 1
+            self._condition.notify_all()
+
+    def _claim_next(self) -> dict[str, Any] | None:
+        try:
+            claimed = self._store.claim_jobs(worker_id=self._node_id, limit=1, lease_seconds=self._lease_seconds)
+        except Exception:
+            logger.warning("async worker: claim failed", exc_info=True)
+            return None
+        return claimed[0] if claimed else None
+
+    def _run_claiming(self) -> None:
+        while not self._stop_event.is_set():
+            with self._condition:
+                seen_wake_seq = self._wake_seq
+            job = self._claim_next()
+            if job is None:
+                with self._condition:
+                    if self._wake_seq == seen_wake_seq and not self._stop_event.is_set():
+                        self._condition.wait(timeout=self._lease_seconds)
+                continue
+
+            job_id = str(job.get("job_id") or "")
+            tenant = self._resolve_tenant(job_id, job)
+            with self._condition:
+                self._leased_ids.add(job_id)
+                self._running_ids[job_id] = tenant
+                self._running_per_tenant[tenant] = self._running_per_tenant.get(tenant, 0) + 1
+                self._tenant_stats_locked(tenant).record_start(_wait_ms_since(job.get("queued_at")))
+            try:
+                if int(job.get("claim_count") or 0) > self._max_claims:
+                    self._fail_abandoned(job_id, claim_count=int(job["claim_count"]))
+                else:
+                    self._process_one(job_id)
+            except Exception:
+                pass
+            finally:
+                with self._condition:
+                    self._leased_ids.discard(job_id)
+                    lease_lost = job_id in self._lost_lease_ids
+                    self._lost_lease_ids.discard(job_id)
+                    self._finish_locked(job_id, tenant)
+                if not lease_lost:
+                    try:
+                        self._store.release_lease(job_id=job_id, worker_id=self._node_id)
+                    except Exception:
+                        # Lease läuft ab und wird von requeue_expired_leases freigegeben.
+                        logger.warning("async worker: releasing lease for %s failed", job_id, exc_info=True)
+
+    def _coordinate_leases(self) -> None:
+        """Heartbeat + Requeue abgelaufener Leases; weckt Worker per LISTEN/NOTIFY."""
+        interval = max(0.05, self._lease_seconds / 3.0)
+        # Kurze LISTEN-Waits halten stop() reaktiv; der Heartbeat läuft weiter im Intervall.
+        listen_timeout = min(interval, 0.5)
+        listener: Any = None
+        next_heartbeat = 0.0
+        try:
+            while not self._stop_event.is_set():
+                if listener is None and callable(getattr(self._store, "open_job_listener", None)):
+                    try:
+                        listener = self._store.open_job_listener()
+                    except Exception:
+                        logger.warning("async worker: LISTEN unavailable, falling back to polling", exc_info=True)
+                        listener = False
+                woken = False
+                if listener:
+                    try:
+                        woken = bool(listener.wait(listen_timeout))
+                    except Exception:
+                        logger.warning("async worker: LISTEN connection lost", exc_info=True)
+                        listener.close()
+                        listener = None
+                else:
+                    self._stop_event.wait(interval)
+                    woken = True
+
+                now = time.monotonic()
+                if now >= next_heartbeat:
+                    next_heartbeat = now + interval
+                    self._renew_leases()
+                    try:
+                        woken = self._store.requeue_expired_leases() > 0 or woken
+                    except Exception:
+                        logger.warning("async worker: requeue of expired leases failed", exc_info=True)
+                    if listener is False:
+                        # Erneuter LISTEN-Versuch im nächsten Heartbeat.
+                        listener = None
+                if woken:
+                    self._wake()
+        finally:
+            if listener:
+                listener.close()
+
+    def _renew_leases(self) -> None:
+        with self._condition:
+            leased_ids = list(self._leased_ids)
+        for job_id in leased_ids:
+            try:
+                renewed = self._store.renew_lease(
+                    job_id=job_id, worker_id=self._node_id, lease_seconds=self._lease_seconds
+                )
+            except Exception:
+                logger.warning("async worker: heartbeat for %s failed", job_id, exc_info=True)
                 continue
+            if not renewed:
+                with self._condition:
+                    if job_id in self._leased_ids:
+                        self._lost_lease_ids.add(job_id)
+
+    def _lease_fence(self) -> dict[str, Any]:
+        """db-Modus: Worker-Writes nur, solange der Node die Lease hält (Fencing im Store)."""
+        return {"lease_owner": self._node_id} if self._queue_mode == "db" else {}
+
+    def _lease_lost(self, job_id: str) -> bool:
+        if self._queue_mode != "db":
+            return False
+        with self._condition:
+            return job_id in self._lost_lease_ids
+
+    def _fail_abandoned(self, job_id: str, *, claim_count: int) -> None:
+        """Job hat wiederholt Worker verloren (Absturz/Timeout): nicht endlos neu starten."""
+        job = self._store.get_job(job_id)
+        if job is None or str(job.get("status") or "") in _TERMINAL_STATUSES:
+            return
+        try:
+            if str(job.get("status") or "queued") == "queued":
+                self._store.transition_job(
+                    job_id=job_id, to_status="running", actor_type="worker", **self._lease_fence()
+                )
+            self._store.transition_job(
+                job_id=job_id,
+                to_status="failed",
+                error_code="lease_expired",
+                error_message=f"job lease expired {claim_count - 1} times; worker lost",
+                retryable=True,
+                retry_hint="retry_with_backoff",
+                actor_type="worker",
+                **self._lease_fence(),
+            )
+        except ValueError:
+            return
 
     def _consume_cancel_request_compat(self, *, job_id: str) -> dict[str, Any] | None:
         """Read/consume cancel requests across store variants.
@@ -247,6 +705,35 @@ class AsyncJobRuntime:
             return False
         return str(job.get("status") or "") == "canceled"
 
+    def _stub_analysis_stages(self, job: dict[str, Any]) -> Iterator[AnalysisStage]:
+        """Deterministische Stub-Pipeline (zwei Partials + Final) ohne Upstream-Calls."""
+        query = str(job.get("query") or "")
+        intelligence_mode = str(job.get("intelligence_mode") or "basic")
+        total_stages = 2
+        resume_progress = int(job.get("progress_percent", 0) or 0) if job.get("status") == "partial" else 0
+        for stage_index in range(1, total_stages + 1):
+            progress_percent = 35 if stage_index == 1 else 70
+            if progress_percent <= resume_progress:
+                continue
+            if self._stage_delay_seconds > 0:
+                time.sleep(self._stage_delay_seconds)
+            yield AnalysisStage(
+                name=f"stub_{stage_index}",
+                payload=_build_async_partial_result_stub(
+                    query=query,
+                    intelligence_mode=intelligence_mode,
+                    stage_index=stage_index,
+                    total_stages=total_stages,
+                ),
+                progress_percent=progress_percent,
+            )
+        yield AnalysisStage(
+            name="final",
+            payload=_build_async_final_result_stub(query=query, intelligence_mode=intelligence_mode),
+            progress_percent=100,
+            final=True,
+        )
+
     def _process_one(self, job_id: str) -> None:
         job = self._store.get_job(job_id)
         if job is None:
@@ -260,6 +747,10 @@ class AsyncJobRuntime:
         if self._is_canceled_terminal(canceled_job):
             return
 
+        # Wiederaufgenommener Job (Worker-Absturz, abgelaufene Lease): die
+        # Runner überspringen bereits persistierte Stufen; der Fortschritt
+        # fällt nie unter den gespeicherten Stand (Store prüft Monotonie).
+        resume_progress = int(job.get("progress_percent", 0) or 0) if status == "partial" else 0
         try:
             if status == "queued":
                 self._store.transition_job(
@@ -267,6 +758,7 @@ class AsyncJobRuntime:
                     to_status="running",
                     progress_percent=max(5, int(job.get("progress_percent", 0) or 0)),
                     actor_type="worker",
+                    **self._lease_fence(),
                 )
 
             job = self._store.get_job(job_id) or {}
@@ -274,61 +766,41 @@ class AsyncJobRuntime:
             if status not in {"running", "partial"}:
                 return
 
-            query = str(job.get("query") or "")
-            intelligence_mode = str(job.get("intelligence_mode") or "basic")
-
-            self._maybe_raise_fault_injection(query)
-
-            total_stages = 2
-            for stage_index in range(1, total_stages + 1):
-                canceled_job = self._consume_cancel_request_compat(job_id=job_id)
-                if self._is_canceled_terminal(canceled_job):
-                    return
+            self._maybe_raise_fault_injection(str(job.get("query") or ""))
 
-                if self._stage_delay_seconds > 0:
-                    time.sleep(self._stage_delay_seconds)
-
-                partial_payload = _build_async_partial_result_stub(
-                    query=query,
-                    intelligence_mode=intelligence_mode,
-                    stage_index=stage_index,
-                    total_stages=total_stages,
-                )
-                partial_result = self._store.create_result(
-                    job_id=job_id,
-                    result_payload=partial_payload,
-                    result_kind="partial",
-                )
-
-                progress_percent = 35 if stage_index == 1 else 70
-                self._store.transition_job(
-                    job_id=job_id,
-                    to_status="partial",
-                    progress_percent=progress_percent,
-                    result_id=str(partial_result.get("result_id") or ""),
-                    actor_type="worker",
-                )
-
-            canceled_job = self._consume_cancel_request_compat(job_id=job_id)
-            if self._is_canceled_terminal(canceled_job):
-                return
-
-            final_payload = _build_async_final_result_stub(
-                query=query,
-                intelligence_mode=intelligence_mode,
-            )
-            final_result = self._store.create_result(
-                job_id=job_id,
-                result_payload=final_payload,
-                result_kind="final",
-            )
-            self._store.transition_job(
-                job_id=job_id,
-                to_status="completed",
-                progress_percent=100,
-                result_id=str(final_result.get("result_id") or ""),
-                actor_type="worker",
-            )
+            runner = self._analysis_runner or self._stub_analysis_stages
+            stages = runner(job)
+            try:
+                for stage in stages:
+                    # Cancel zwischen den Stufen: bereits berechnete Stufe wird verworfen.
+                    canceled_job = self._consume_cancel_request_compat(job_id=job_id)
+                    if self._is_canceled_terminal(canceled_job):
+                        return
+                    # db-Modus: Lease verloren → ein anderer Node hat den Job übernommen.
+                    if self._lease_lost(job_id):
+                        return
+
+                    result = self._store.create_result(
+                        job_id=job_id,
+                        result_payload=stage.payload,
+                        result_kind="final" if stage.final else "partial",
+                        **self._lease_fence(),
+                    )
+                    self._store.transition_job(
+                        job_id=job_id,
+                        to_status="completed" if stage.final else "partial",
+                        progress_percent=100 if stage.final else max(stage.progress_percent, resume_progress),
+                        result_id=str(result.get("result_id") or ""),
+                        actor_type="worker",
+                        **self._lease_fence(),
+                    )
+                    if stage.final:
+                        return
+            finally:
+                close = getattr(stages, "close", None)
+                if callable(close):
+                    close()
+            raise RuntimeError("analysis pipeline ended without final stage")
         except Exception as exc:
             current = self._store.get_job(job_id)
             if current is None:
@@ -349,9 +821,10 @@ class AsyncJobRuntime:
                     retryable=retryable,
                     retry_hint=retry_hint,
                     actor_type="worker",
+                    **self._lease_fence(),
                 )
             except ValueError:
-                # Race mit Cancel/Terminal-Übergang: nichts weiter tun.
+                # Race mit Cancel/Terminal-Übergang oder verlorene Lease: nichts weiter tun.
                 return
 
     @staticmethod
@@ -369,6 +842,8 @@ class AsyncJobRuntime:
 
 
 __all__ = [
+    "AnalysisRunner",
+    "AnalysisStage",
     "AsyncJobRuntime",
     "_build_async_partial_result_stub",
     "_build_async_final_result_stub",
@@ -0,0 +1,355 @@
+"""Local GWR building-centroid index for coordinate snapping.
+
+Map clicks (``coordinates`` input on ``POST /analyze``) are normally resolved
+via two upstream calls: ``geodesy.geo.admin.ch`` (WGS84 → LV95) and the GWR
+``identify`` MapServer endpoint. When a prebuilt centroid index is configured,
+both steps run in-process instead:
+
+- WGS84 → LV95 uses the official swisstopo approximation formula (~1 m
+  accuracy, well below the snap distance).
+- Nearest-building lookup runs against a memory-mapped grid index of GWR
+  entrance/building centroids (EGID, EDID, LV95 coordinates, street, PLZ,
+  locality).
+
+The identify call stays the fallback when no index is configured, the index
+cannot be opened, or no centroid lies within the snap distance.
+
+Index file layout (little endian, all sections 8-byte aligned)::
+
+    header   magic "GWRCIDX1", version, cell_size_m, record_count,
+             cell_count, label_bytes
+    cells    cell_keys[int64], cell_starts[uint32], cell_counts[uint32]
+    records  egids[uint32], edids[uint32], eastings[float64],
+             northings[float64], label_offsets[uint32], label_lengths[uint32]
+    labels   UTF-8 "street<US>postal_code<US>city" blobs
+
+Records are sorted by grid cell so every cell maps to one contiguous record
+range; lookups only touch the cells intersecting the search radius.
+
+Env vars:
+- GWR_CENTROID_INDEX_PATH: path to an index file built with
+  ``scripts/build_gwr_centroid_index.py`` (unset = disabled)
+"""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+
+GWR_CENTROID_INDEX_PATH_ENV = "GWR_CENTROID_INDEX_PATH"
+DEFAULT_CELL_SIZE_M = 100.0
+
+_MAGIC = b"GWRCIDX1"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sIdIII")
+_LABEL_SEPARATOR = "\x1f"
+
+
+class CentroidIndexError(ValueError):
+    """Raised when an index file is missing, truncated or malformed."""
+
+
+@dataclass(frozen=True)
+class BuildingCentroid:
+    egid: int
+    edid: int
+    lv95_e: float
+    lv95_n: float
+    street: str
+    postal_code: str
+    city: str
+
+    @property
+    def feature_id(self) -> str:
+        # Same shape as the identify endpoint's featureId (``<EGID>_<EDID>``).
+        return f"{self.egid}_{self.edid}"
+
+
+def wgs84_to_lv95_approx(*, lat: float, lon: float) -> tuple[float, float]:
+    """WGS84 (lat, lon) → LV95 (easting, northing), swisstopo approximation."""
+    phi = (lat * 3600.0 - 169028.66) / 10000.0
+    lam = (lon * 3600.0 - 26782.5) / 10000.0
+
+    easting = (
+        2600072.37
+        + 211455.93 * lam
+        - 10938.51 * lam * phi
+        - 0.36 * lam * phi**2
+        - 44.54 * lam**3
+    )
+    northing = (
+        1200147.07
+        + 308807.95 * phi
+        + 3745.25 * lam**2
+        + 76.63 * phi**2
+        - 194.56 * lam**2 * phi
+        + 119.79 * phi**3
+    )
+    return easting, northing
+
+
+def _cell_coord(value: float, cell_size_m: float) -> int:
+    return int(math.floor(value / cell_size_m))
+
+
+def _cell_key(cell_e: int, cell_n: int) -> int:
+    return (cell_e << 32) | (cell_n & 0xFFFFFFFF)
+
+
+def _align8(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _section_sizes(record_count: int, cell_count: int) -> list[tuple[str, int]]:
+    return [
+        ("q", cell_count),
+        ("I", cell_count),
+        ("I", cell_count),
+        ("I", record_count),
+        ("I", record_count),
+        ("d", record_count),
+        ("d", record_count),
+        ("I", record_count),
+        ("I", record_count),
+    ]
+
+
+def write_centroid_index(
+    path: str | Path,
+    centroids: Iterable[BuildingCentroid],
+    *,
+    cell_size_m: float = DEFAULT_CELL_SIZE_M,
+) -> int:
+    """Write ``centroids`` as an index file; returns the record count."""
+    if not math.isfinite(cell_size_m) or cell_size_m <= 0:
+        raise ValueError("cell_size_m must be a positive finite number")
+
+    keyed: list[tuple[int, BuildingCentroid]] = []
+    for centroid in centroids:
+        if not (math.isfinite(centroid.lv95_e) and math.isfinite(centroid.lv95_n)):
+            continue
+        key = _cell_key(
+            _cell_coord(centroid.lv95_e, cell_size_m),
+            _cell_coord(centroid.lv95_n, cell_size_m),
+        )
+        keyed.append((key, centroid))
+    keyed.sort(key=lambda row: (row[0], row[1].egid, row[1].edid))
+
+    cell_keys: list[int] = []
+    cell_starts: list[int] = []
+    cell_counts: list[int] = []
+    labels = bytearray()
+    label_offsets: list[int] = []
+    label_lengths: list[int] = []
+
+    for position, (key, centroid) in enumerate(keyed):
+        if not cell_keys or cell_keys[-1] != key:
+            cell_keys.append(key)
+            cell_starts.append(position)
+            cell_counts.append(0)
+        cell_counts[-1] += 1
+
+        encoded = _LABEL_SEPARATOR.join(
+            (centroid.street, centroid.postal_code, centroid.city)
+        ).encode("utf-8")
+        label_offsets.append(len(labels))
+        label_lengths.append(len(encoded))
+        labels.extend(encoded)
+
+    columns = [
+        cell_keys,
+        cell_starts,
+        cell_counts,
+        [c.egid for _, c in keyed],
+        [c.edid for _, c in keyed],
+        [float(c.lv95_e) for _, c in keyed],
+        [float(c.lv95_n) for _, c in keyed],
+        label_offsets,
+        label_lengths,
+    ]
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_suffix(target.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        header = _HEADER.pack(
+            _MAGIC, _FORMAT_VERSION, float(cell_size_m), len(keyed), len(cell_keys), len(labels)
+        )
+        handle.write(header + b"\0" * (_align8(len(header)) - len(header)))
+        for (fmt, count), values in zip(_section_sizes(len(keyed), len(cell_keys)), columns):
+            blob = struct.pack(f"<{count}{fmt}", *values)
+            handle.write(blob + b"\0" * (_align8(len(blob)) - len(blob)))
+        handle.write(bytes(labels))
+    os.replace(tmp_path, target)
+    return len(keyed)
+
+
+class BuildingCentroidIndex:
+    """Read-only, memory-mapped view of an index file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        try:
+            with self.path.open("rb") as handle:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise CentroidIndexError(f"cannot open centroid index {self.path}: {exc}") from exc
+
+        try:
+            self._map_sections()
+        except CentroidIndexError:
+            self._mmap.close()
+            raise
+
+    def _map_sections(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise CentroidIndexError(f"centroid index {self.path} is truncated")
+        magic, version, cell_size_m, record_count, cell_count, label_bytes = _HEADER.unpack_from(
+            self._mmap, 0
+        )
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise CentroidIndexError(f"centroid index {self.path} has an unsupported format")
+
+        layout: list[tuple[str, int, int]] = []
+        offset = _align8(_HEADER.size)
+        for fmt, count in _section_sizes(record_count, cell_count):
+            size = struct.calcsize(fmt) * count
+            layout.append((fmt, offset, size))
+            offset += _align8(size)
+        if offset + label_bytes > len(self._mmap):
+            raise CentroidIndexError(f"centroid index {self.path} is truncated")
+
+        view = self._view = memoryview(self._mmap)
+        sections = [view[start : start + size].cast(fmt) for fmt, start, size in layout]
+        (
+            self._cell_keys,
+            self._cell_starts,
+            self._cell_counts,
+            self._egids,
+            self._edids,
+            self._eastings,
+            self._northings,
+            self._label_offsets,
+            self._label_lengths,
+        ) = sections
+        self._labels = view[offset : offset + label_bytes]
+        self.cell_size_m = float(cell_size_m)
+        self._record_count = int(record_count)
+
+    def __len__(self) -> int:
+        return self._record_count
+
+    def close(self) -> None:
+        for name in (
+            "_cell_keys",
+            "_cell_starts",
+            "_cell_counts",
+            "_egids",
+            "_edids",
+            "_eastings",
+            "_northings",
+            "_label_offsets",
+            "_label_lengths",
+            "_labels",
+            "_view",
+        ):
+            getattr(self, name).release()
+        self._mmap.close()
+
+    def _record(self, position: int) -> BuildingCentroid:
+        start = self._label_offsets[position]
+        raw = bytes(self._labels[start : start + self._label_lengths[position]])
+        street, postal_code, city = (raw.decode("utf-8").split(_LABEL_SEPARATOR) + ["", "", ""])[:3]
+        return BuildingCentroid(
+            egid=int(self._egids[position]),
+            edid=int(self._edids[position]),
+            lv95_e=float(self._eastings[position]),
+            lv95_n=float(self._northings[position]),
+            street=street,
+            postal_code=postal_code,
+            city=city,
+        )
+
+    def nearest(
+        self,
+        *,
+        lv95_e: float,
+        lv95_n: float,
+        max_distance_m: float,
+    ) -> tuple[float, BuildingCentroid] | None:
+        """Nearest centroid within ``max_distance_m`` (ties: lowest EGID/EDID)."""
+        if self._record_count == 0 or not (max_distance_m >= 0):
+            return None
+
+        center_e = _cell_coord(lv95_e, self.cell_size_m)
+        center_n = _cell_coord(lv95_n, self.cell_size_m)
+        ring = int(math.ceil(max_distance_m / self.cell_size_m))
+        cell_count = len(self._cell_keys)
+
+        best_distance = math.inf
+        best_key = (0, 0)
+        best_position = -1
+        for cell_e in range(center_e - ring, center_e + ring + 1):
+            for cell_n in range(center_n - ring, center_n + ring + 1):
+                key = _cell_key(cell_e, cell_n)
+                idx = bisect_left(self._cell_keys, key)
+                if idx >= cell_count or self._cell_keys[idx] != key:
+                    continue
+                start = self._cell_starts[idx]
+                for position in range(start, start + self._cell_counts[idx]):
+                    distance = math.hypot(
+                        self._eastings[position] - lv95_e,
+                        self._northings[position] - lv95_n,
+                    )
+                    if distance > best_distance:
+                        continue
+                    # Records are ordered by cell, not by EGID: compare the IDs.
+                    record_key = (self._egids[position], self._edids[position])
+                    if distance < best_distance or record_key < best_key:
+                        best_distance = distance
+                        best_key = record_key
+                        best_position = position
+
+        if best_position < 0 or best_distance > max_distance_m:
+            return None
+        return best_distance, self._record(best_position)
+
+
+_INDEX_LOCK = threading.Lock()
+_INDEX_CACHE: dict[str, BuildingCentroidIndex | None] = {}
+
+
+def get_centroid_index_from_env() -> BuildingCentroidIndex | None:
+    """Return the configured index (opened once per path), or ``None``.
+
+    A missing or broken file is remembered as ``None`` so callers fall back to
+    the identify endpoint without retrying the open on every request.
+    """
+    raw_path = str(os.getenv(GWR_CENTROID_INDEX_PATH_ENV, "")).strip()
+    if not raw_path:
+        return None
+
+    with _INDEX_LOCK:
+        if raw_path not in _INDEX_CACHE:
+            try:
+                _INDEX_CACHE[raw_path] = BuildingCentroidIndex(raw_path)
+            except CentroidIndexError:
+                _INDEX_CACHE[raw_path] = None
+        return _INDEX_CACHE[raw_path]
+
+
+def reset_centroid_index_cache() -> None:
+    """Close and forget all opened indexes (tests / hot reload)."""
+    with _INDEX_LOCK:
+        for index in _INDEX_CACHE.values():
+            if index is not None:
+                index.close()
+        _INDEX_CACHE.clear()
@@ -0,0 +1,219 @@
+"""Pre-Fork-Supervisor für den API-Service (mehrere Prozesse, ein Port).
+
+Der Elternprozess forkt ``processes`` Worker und überwacht sie; jeder Worker
+bindet seinen eigenen Listening-Socket mit ``SO_REUSEPORT`` auf denselben Port,
+der Kernel verteilt eingehende Verbindungen. Damit laufen GIL-gebundene Pfade
+(Report-Projektion, JSON-Encoding, JWT-Verifikation) parallel auf allen vCPUs.
+
+- Der Elternprozess startet selbst keine Threads und bedient keine Requests;
+  prozesslokaler Zustand (Caches, Async-Runtime, Session-Store) entsteht erst
+  im Worker.
+- Beendete/abgestürzte Worker werden mit Backoff neu gestartet; bei einer
+  Crash-Loop (zu viele Restarts im Zeitfenster) fährt der Supervisor alle
+  Worker herunter und endet mit Exit-Code 1.
+- SIGTERM/SIGINT am Supervisor → SIGTERM an alle Worker, nach Ablauf der
+  Grace-Periode SIGKILL.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import time
+from collections import deque
+from typing import Any, Callable
+
+DEFAULT_RESTART_BACKOFF_SECONDS = 1.0
+DEFAULT_MAX_RESTARTS = 10
+DEFAULT_RESTART_WINDOW_SECONDS = 60.0
+DEFAULT_SHUTDOWN_GRACE_SECONDS = 10.0
+_POLL_INTERVAL_SECONDS = 0.2
+
+
+def prefork_supported() -> bool:
+    return hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")
+
+
+def available_cpu_count() -> int:
+    """vCPUs, die dem Prozess zugeteilt sind (Affinity vor ``cpu_count``)."""
+    sched_getaffinity = getattr(os, "sched_getaffinity", None)
+    if callable(sched_getaffinity):
+        try:
+            return max(1, len(sched_getaffinity(0)))
+        except OSError:
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+class PreforkSupervisor:
+    """Forkt ``processes`` Worker (``run_worker(worker_index, generation)``) und hält sie am Leben.
+
+    ``generation`` ist ``0`` beim initialen Start eines Slots und zählt mit jedem
+    Restart dieses Slots hoch.
+    """
+
+    def __init__(
+        self,
+        *,
+        processes: int,
+        run_worker: Callable[[int, int], None],
+        restart_backoff_seconds: float = DEFAULT_RESTART_BACKOFF_SECONDS,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        restart_window_seconds: float = DEFAULT_RESTART_WINDOW_SECONDS,
+        shutdown_grace_seconds: float = DEFAULT_SHUTDOWN_GRACE_SECONDS,
+        on_event: Callable[[str, dict[str, Any]], None] | None = None,
+    ) -> None:
+        if processes < 1:
+            raise ValueError("processes must be >= 1")
+        if not prefork_supported():
+            raise RuntimeError("pre-fork mode requires os.fork and SO_REUSEPORT")
+        self.processes = processes
+        self._run_worker = run_worker
+        self._restart_backoff_seconds = max(0.0, float(restart_backoff_seconds))
+        self._max_restarts = max(0, int(max_restarts))
+        self._restart_window_seconds = max(0.0, float(restart_window_seconds))
+        self._shutdown_grace_seconds = max(0.0, float(shutdown_grace_seconds))
+        self._on_event = on_event
+
+        self._children: dict[int, tuple[int, int]] = {}  # pid -> (worker_index, generation)
+        self._generations = [0] * processes
+        self._pending_restarts: dict[int, float] = {}  # worker_index -> not before (monotonic)
+        self._restart_times: deque[float] = deque()
+        self._stop_requested = False
+        self._exit_code = 0
+
+    # --- Lifecycle ----------------------------------------------------------
+
+    def request_stop(self) -> None:
+        self._stop_requested = True
+
+    def run(self, *, install_signal_handlers: bool = True) -> int:
+        previous_handlers: dict[int, Any] = {}
+        if install_signal_handlers:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                previous_handlers[signum] = signal.signal(signum, self._handle_stop_signal)
+        try:
+            for worker_index in range(self.processes):
+                self._spawn(worker_index)
+            while not self._stop_requested:
+                self._reap_children()
+                self._spawn_due_restarts()
+                time.sleep(_POLL_INTERVAL_SECONDS)
+        finally:
+            self._shutdown_children()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+        return self._exit_code
+
+    def _handle_stop_signal(self, signum: int, _frame: Any) -> None:
+        self._emit("stop_requested", signal=signal.Signals(signum).name)
+        self.request_stop()
+
+    # --- Worker-Verwaltung --------------------------------------------------
+
+    def _spawn(self, worker_index: int) -> None:
+        generation = self._generations[worker_index]
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - läuft im Kindprozess
+            self._run_child(worker_index, generation)
+        self._children[pid] = (worker_index, generation)
+        self._emit("worker_started", worker_index=worker_index, generation=generation, pid=pid)
+
+    def _run_child(self, worker_index: int, generation: int) -> None:  # pragma: no cover - Kindprozess
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, _raise_system_exit)
+            self._run_worker(worker_index, generation)
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 0
+        except BaseException:
+            import traceback
+
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap_children(self) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            worker = self._children.pop(pid, None)
+            if worker is None:
+                continue
+            worker_index, generation = worker
+            exit_code = os.waitstatus_to_exitcode(status)
+            self._emit(
+                "worker_exited",
+                worker_index=worker_index,
+                generation=generation,
+                pid=pid,
+                exit_code=exit_code,
+            )
+            if not self._stop_requested:
+                self._schedule_restart(worker_index)
+
+    def _schedule_restart(self, worker_index: int) -> None:
+        now = time.monotonic()
+        while self._restart_times and now - self._restart_times[0] > self._restart_window_seconds:
+            self._restart_times.popleft()
+        if len(self._restart_times) >= self._max_restarts:
+            self._emit("crash_loop", worker_index=worker_index, restarts=len(self._restart_times))
+            self._exit_code = 1
+            self.request_stop()
+            return
+        self._restart_times.append(now)
+        self._generations[worker_index] += 1
+        self._pending_restarts[worker_index] = now + self._restart_backoff_seconds
+
+    def _spawn_due_restarts(self) -> None:
+        now = time.monotonic()
+        for worker_index, not_before in list(self._pending_restarts.items()):
+            if now >= not_before and not self._stop_requested:
+                del self._pending_restarts[worker_index]
+                self._spawn(worker_index)
+
+    def _shutdown_children(self) -> None:
+        self._pending_restarts.clear()
+        for pid in list(self._children):
+            _signal_quietly(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self._shutdown_grace_seconds
+        while self._children and time.monotonic() < deadline:
+            self._reap_children()
+            if self._children:
+                time.sleep(_POLL_INTERVAL_SECONDS / 4)
+
+        for pid in list(self._children):
+            _signal_quietly(pid, signal.SIGKILL)
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            self._children.pop(pid, None)
+
+    def _emit(self, event: str, **fields: Any) -> None:
+        if self._on_event is None:
+            return
+        try:
+            self._on_event(event, fields)
+        except Exception:
+            return
+
+
+def _raise_system_exit(_signum: int, _frame: Any) -> None:  # pragma: no cover - Kindprozess
+    raise SystemExit(0)
+
+
+def _signal_quietly(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        return
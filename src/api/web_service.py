@@ -9,22 +9,29 @@ Endpoints:
 - GET /api/v1/dictionaries
 - GET /api/v1/dictionaries/<domain>
 - GET /analyze/jobs/<job_id>
+- GET /analyze/jobs/<job_id>/events?since_event_seq=<n> (Long-Poll; SSE mit Accept: text/event-stream)
 - GET /analyze/jobs/<job_id>/notifications
 - GET /analyze/results/<result_id>
 - GET /debug/trace?request_id=<id> (dev-only)
 - POST /analyze {"query": "...", "intelligence_mode": "basic|extended|risk"}
+- POST /analyze/batch {"queries": ["...", ...]} (NDJSON-Stream; mit async_mode 202 + Job)
 - POST /analyze/jobs/<job_id>/cancel
 - POST /compliance/corrections/<document_id>  (Korrektur-Workflow; korrekturgrund Pflichtfeld)
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
+import contextlib
 import hashlib
 import hmac
+import itertools
 import json
 import math
 import os
 import re
+import socket
 import ssl
 import threading
 import time
@@ -37,14 +44,25 @@ from pathlib import Path
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from html import escape
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 from urllib.parse import parse_qs, urlencode, urlsplit
 from urllib.request import urlopen
 
-from src.api.address_intel import AddressIntelError, build_report
+from src.api.address_intel_errors import AddressIntelError
+from src.api.analyze_batch import (
+    batch_concurrency,
+    batch_max_items,
+    batch_sync_max_items,
+    is_batch_request,
+    iter_batch_results,
+    parse_batch_queries,
+    summarize_batch,
+)
+from src.api.async_job_events import JobEventCapacityError, JobEventHub
 from src.api.async_jobs import AsyncJobStore
-from src.api.async_worker_runtime import AsyncJobRuntime
+from src.api.async_worker_runtime import ASYNC_WORKER_QUEUE_ENV, AnalysisRunner, AnalysisStage, AsyncJobRuntime
 from src.api.async_store_factory import build_async_job_store
+from src.api.building_centroid_index import get_centroid_index_from_env, wgs84_to_lv95_approx
 from src.api.debug_trace import (
     build_trace_timeline,
     normalize_lookback_seconds,
@@ -52,7 +70,12 @@ from src.api.debug_trace import (
     normalize_request_id,
 )
 from src.api.oidc_jwt import JwksCache, JwtValidationError, OidcJwtConfig, OidcJwtValidator
-from src.shared.gui_mvp import render_gui_mvp_html
+from src.api.prefork_server import PreforkSupervisor, available_cpu_count, prefork_supported
+from src.api.worker_pool_server import WorkerPoolHTTPServer
+from src.shared.http_compression import compression_enabled, encode_response_body, merge_vary, stream_encoder
+from src.shared.http_keepalive import KeepAliveHandlerMixin
+from src.shared.json_codec import dumps_canonical, dumps_wire
+from src.shared.result_blob_store import blob_reference, load_result_payload, verified_chunks
 from src.shared.ui_pages import build_result_tabs_page_html, normalize_result_id
 from src.shared.structured_logging import build_event, emit_event
 from src.gwr_codes import DWST, GENH, GKAT, GKLAS, GSTAT, GWAERZH, GWAERZW
@@ -361,10 +384,14 @@ def _health_details_app_check() -> dict[str, str]:
 
 def _health_details_database_check() -> dict[str, str]:
     backend = str(os.getenv("ASYNC_STORE_BACKEND", "file") or "file").strip().lower() or "file"
-    if backend != "db":
+    if backend not in {"db", "sqlite"}:
         return {"status": "degraded", "reason": f"async_store_backend={backend}"}
 
-    connect_fn = getattr(_ASYNC_JOB_STORE, "_connect", None)
+    try:
+        store = _async_job_store()
+    except Exception:
+        return {"status": "down", "reason": "db_store_unavailable"}
+    connect_fn = getattr(store, "_connect", None)
     if not callable(connect_fn):
         return {"status": "down", "reason": "db_store_connect_unavailable"}
 
@@ -439,10 +466,33 @@ def _apply_health_details_simulation(
         checks[check_name] = {"status": raw_status, "reason": reason}
 
 
+def _public_async_runtime_stats(stats: dict[str, Any]) -> dict[str, Any]:
+    """Runtime-Stats für den öffentlichen Health-Endpoint ohne Werte pro Tenant.
+
+    ``/health/details`` ist ohne Auth erreichbar; Tenant-Keys (``org_id`` bzw.
+    ``user_id``) und Queue-Tiefen pro Tenant erscheinen daher nur aggregiert.
+    """
+
+    public_stats = dict(stats)
+    tenants = stats.get("tenants")
+    if isinstance(tenants, dict):
+        depths = [int(tenant_stats.get("queue_depth") or 0) for tenant_stats in tenants.values()]
+        waits = [float(tenant_stats.get("oldest_wait_ms") or 0.0) for tenant_stats in tenants.values()]
+        public_stats["tenants"] = {
+            "count": len(tenants),
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "oldest_wait_ms_max": max(waits, default=0.0),
+        }
+    return public_stats
+
+
 def _build_health_details_payload(
     *,
     request_id: str,
     query_params: dict[str, list[str]],
+    server_stats: dict[str, Any] | None = None,
+    async_runtime_stats: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     checks: dict[str, dict[str, str]] = {
         "app": _health_details_app_check(),
@@ -451,7 +501,7 @@ def _build_health_details_payload(
     }
     _apply_health_details_simulation(checks, query_params=query_params)
 
-    return {
+    payload: dict[str, Any] = {
         "ok": True,
         "service": "geo-ranking-ch",
         "status": _health_details_overall_status(checks),
@@ -459,6 +509,11 @@ def _build_health_details_payload(
         "checks": checks,
         "request_id": request_id,
     }
+    if server_stats is not None:
+        payload["server"] = server_stats
+    if async_runtime_stats is not None:
+        payload["async_runtime"] = _public_async_runtime_stats(async_runtime_stats)
+    return payload
 
 
 _CORS_ALLOW_ORIGINS_ENV = "CORS_ALLOW_ORIGINS"
@@ -589,6 +644,9 @@ _PREFERENCE_PRESETS: dict[str, dict[str, Any]] = {
 }
 
 _DICTIONARY_CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=3600"
+# Spiegeln ``GUI_*_CACHE_CONTROL`` aus ``src.shared.gui_mvp`` (dort lazy geladen).
+_GUI_SHELL_CACHE_CONTROL = "private, no-cache"
+_GUI_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
 _DICTIONARY_GLOBAL_VERSION = os.getenv("DICTIONARY_VERSION", "2026-02-27")
 _DICTIONARY_DOMAIN_VERSIONS = {
     "building": "gwr-building-v1",
@@ -636,10 +694,95 @@ _UI_AUTH_PROXY_HEADER_VALUE = "1"
 
 _PROTECTED_GUI_ROUTES = frozenset({"/", "/gui", "/history", _HISTORY_UI_SUCCESSOR_PATH})
 
-_ASYNC_JOB_STORE = build_async_job_store()
-_ASYNC_JOB_RUNTIME = AsyncJobRuntime(store=_ASYNC_JOB_STORE)
+# Store + Runtime werden erst bei erster Nutzung gebaut: der file-Store lädt
+# sonst beim Import den kompletten JSON-State (Cold-Start, Tools, Tests).
+_ASYNC_JOB_STORE: Any = None
+_ASYNC_JOB_EVENT_HUB: JobEventHub | None = None
+_ASYNC_JOB_RUNTIME: AsyncJobRuntime | None = None
+_ASYNC_JOB_SINGLETON_LOCK = threading.Lock()
 _ASYNC_RUNTIME_START_LOCK = threading.Lock()
 _ASYNC_RUNTIME_STARTED = False
+# Mit ASYNC_WORKER_QUEUE=db kann der API-Node die Verarbeitung dedizierten
+# Worker-Nodes (scripts/run_async_worker.py) überlassen.
+_ASYNC_WORKER_EMBEDDED_ENV = "ASYNC_WORKER_EMBEDDED"
+
+# Results sind nach dem Schreiben unveränderlich: serialisierte
+# /analyze/results-Bodies werden prozesslokal gecacht (LRU + TTL, die TTL
+# begrenzt Staleness nach Retention-Cleanup).
+_ASYNC_RESULT_CACHE_MAX_ENTRIES_ENV = "ASYNC_RESULT_CACHE_MAX_ENTRIES"
+_ASYNC_RESULT_CACHE_TTL_ENV = "ASYNC_RESULT_CACHE_TTL_SECONDS"
+_ASYNC_RESULT_CACHE_DEFAULT_MAX_ENTRIES = 256
+_ASYNC_RESULT_CACHE_DEFAULT_TTL_SECONDS = 300.0
+# Lesegrösse beim Streamen von Result-Payloads aus dem Blob-Store.
+_ASYNC_RESULT_STREAM_CHUNK_BYTES = 64 * 1024
+_ASYNC_RESULT_IMMUTABLE_CACHE_CONTROL = "private, max-age=86400, immutable"
+_ASYNC_REVALIDATE_CACHE_CONTROL = "private, no-cache"
+_ASYNC_TERMINAL_JOB_STATES = frozenset({"completed", "failed", "canceled"})
+
+# Opt-in Result-Reuse: identische Async-Requests (gleicher Payload-Hash, Org und
+# Owner) innerhalb des Frischefensters verweisen auf das vorhandene finale
+# Result statt die Pipeline erneut zu rechnen. 0/leer = aus.
+_ASYNC_RESULT_REUSE_MAX_AGE_ENV = "ASYNC_RESULT_REUSE_MAX_AGE_SECONDS"
+
+# GET /analyze/jobs/<id>/events (Long-Poll / SSE): Wartende werden über den
+# JobEventHub geweckt; das Poll-Intervall deckt Writes anderer Prozesse/Nodes
+# ab, MAX_WAITERS begrenzt die dafür gehaltenen Server-Threads. Mit
+# ASYNC_WORKER_QUEUE=db speist zusätzlich ein LISTEN-Thread die Events anderer
+# Nodes in den Hub ein (_start_async_job_event_feed).
+_ASYNC_JOB_EVENTS_POLL_ENV = "ASYNC_JOB_EVENTS_POLL_SECONDS"
+_ASYNC_JOB_EVENTS_MAX_WAITERS_ENV = "ASYNC_JOB_EVENTS_MAX_WAITERS"
+_ASYNC_JOB_EVENTS_DEFAULT_POLL_SECONDS = 2.0
+_ASYNC_JOB_EVENTS_DEFAULT_MAX_WAITERS = 64
+_ASYNC_JOB_EVENTS_DEFAULT_TIMEOUT_SECONDS = 25.0
+_ASYNC_JOB_EVENTS_MAX_TIMEOUT_SECONDS = 60.0
+# Ein SSE-Stream endet spätestens nach dieser Dauer; EventSource verbindet
+# sich mit Last-Event-ID neu und setzt nahtlos fort.
+_ASYNC_JOB_EVENTS_SSE_MAX_SECONDS = 300.0
+_ASYNC_JOB_EVENTS_SSE_HEARTBEAT_SECONDS = 15.0
+_ASYNC_JOB_EVENTS_SSE_RETRY_MS = 3000
+_ASYNC_JOB_EVENT_FEED: threading.Thread | None = None
+
+_ASYNC_RESULT_CACHE: "OrderedDict[tuple[str, str], dict[str, Any]]" = OrderedDict()
+_ASYNC_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _async_job_store() -> Any:
+    global _ASYNC_JOB_STORE
+    store = _ASYNC_JOB_STORE
+    if store is None:
+        hub = _async_job_event_hub()
+        with _ASYNC_JOB_SINGLETON_LOCK:
+            if _ASYNC_JOB_STORE is None:
+                built = build_async_job_store()
+                add_event_listener = getattr(built, "add_event_listener", None)
+                if callable(add_event_listener):
+                    add_event_listener(hub.publish)
+                _ASYNC_JOB_STORE = built
+            store = _ASYNC_JOB_STORE
+    return store
+
+
+def _async_job_event_hub() -> JobEventHub:
+    global _ASYNC_JOB_EVENT_HUB
+    hub = _ASYNC_JOB_EVENT_HUB
+    if hub is None:
+        with _ASYNC_JOB_SINGLETON_LOCK:
+            if _ASYNC_JOB_EVENT_HUB is None:
+                _ASYNC_JOB_EVENT_HUB = JobEventHub(max_subscribers=_async_job_events_max_waiters())
+            hub = _ASYNC_JOB_EVENT_HUB
+    return hub
+
+
+def _async_job_runtime() -> AsyncJobRuntime:
+    global _ASYNC_JOB_RUNTIME
+    runtime = _ASYNC_JOB_RUNTIME
+    if runtime is None:
+        store = _async_job_store()
+        with _ASYNC_JOB_SINGLETON_LOCK:
+            if _ASYNC_JOB_RUNTIME is None:
+                _ASYNC_JOB_RUNTIME = AsyncJobRuntime(store=store, analysis_runner=_resolve_async_analysis_runner())
+            runtime = _ASYNC_JOB_RUNTIME
+    return runtime
 
 
 def _ensure_async_runtime_started() -> None:
@@ -650,11 +793,314 @@ def _ensure_async_runtime_started() -> None:
     with _ASYNC_RUNTIME_START_LOCK:
         if _ASYNC_RUNTIME_STARTED:
             return
-        _ASYNC_JOB_RUNTIME.start()
-        _ASYNC_JOB_RUNTIME.enqueue_pending_jobs()
+        runtime = _async_job_runtime()
+        if runtime.queue_mode == "db":
+            _start_async_job_event_feed(_async_job_store(), _async_job_event_hub())
+        if runtime.queue_mode == "db" and not _async_worker_embedded():
+            _ASYNC_RUNTIME_STARTED = True
+            return
+        runtime.start()
+        runtime.enqueue_pending_jobs()
         _ASYNC_RUNTIME_STARTED = True
 
 
+def _start_async_job_event_feed(store: Any, hub: JobEventHub) -> None:
+    """Startet den LISTEN-Thread für Job-Events anderer Nodes (einmal pro Prozess).
+
+    Mit ``ASYNC_WORKER_QUEUE=db`` schreiben Worker anderer Nodes die Events,
+    bei ``ASYNC_WORKER_EMBEDDED=0`` sogar ausschliesslich; ohne Feed weckt der
+    Hub Wartende dann erst nach dem Poll-Intervall. Stores ohne
+    ``open_job_event_listener`` (SQLite, File) bleiben beim Polling.
+    """
+    global _ASYNC_JOB_EVENT_FEED
+    if _ASYNC_JOB_EVENT_FEED is not None or not callable(getattr(store, "open_job_event_listener", None)):
+        return
+    _ASYNC_JOB_EVENT_FEED = threading.Thread(
+        target=_run_async_job_event_feed,
+        args=(store, hub),
+        name="async-job-event-feed",
+        daemon=True,
+    )
+    _ASYNC_JOB_EVENT_FEED.start()
+
+
+def _run_async_job_event_feed(store: Any, hub: JobEventHub, stop: threading.Event | None = None) -> None:
+    """Publiziert NOTIFY-Payloads ``job_id:event_seq`` in den Hub; reconnectet nach Fehlern."""
+    stop_event = stop or threading.Event()
+    retry_seconds = _async_job_events_poll_seconds()
+    while not stop_event.is_set():
+        try:
+            listener = store.open_job_event_listener()
+        except Exception as exc:
+            _emit_structured_log(
+                event="api.async_job_events.feed_unavailable",
+                level="warn",
+                component="api.web_service",
+                direction="internal",
+                status="retry",
+                error=str(exc),
+            )
+            stop_event.wait(retry_seconds)
+            continue
+        try:
+            while not stop_event.is_set():
+                for payload in listener.wait(retry_seconds):
+                    job_id, _, event_seq = str(payload).rpartition(":")
+                    if job_id and event_seq.isdigit():
+                        hub.publish(job_id, int(event_seq))
+        except Exception as exc:
+            _emit_structured_log(
+                event="api.async_job_events.feed_lost",
+                level="warn",
+                component="api.web_service",
+                direction="internal",
+                status="retry",
+                error=str(exc),
+            )
+            stop_event.wait(retry_seconds)
+        finally:
+            listener.close()
+
+
+def _async_worker_embedded() -> bool:
+    raw_value = str(os.getenv(_ASYNC_WORKER_EMBEDDED_ENV, "1")).strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+_ASYNC_WORKER_ANALYSIS_ENV = "ASYNC_WORKER_ANALYSIS"
+
+# Kumulative Stufen der Async-Analyse; jede Stufe baut den Report mit allen
+# Modulen bis hierher (Upstream-Antworten früherer Stufen kommen aus dem Cache
+# des gemeinsamen HttpClient). Die letzte Stufe liefert den vollständigen Report.
+_ASYNC_ANALYSIS_STAGES: tuple[tuple[str, frozenset[str]], ...] = (
+    ("resolution", frozenset({"match", "address_registry", "links"})),
+    ("building_energy", frozenset({"building", "energy"})),
+    ("cross_source", frozenset({"cross_source", "suitability_light"})),
+    ("intelligence", frozenset({"intelligence", "summary_compact"})),
+)
+
+
+def _resolve_async_analysis_runner() -> AnalysisRunner | None:
+    """``report`` (Default): echte Pipeline; ``stub``: deterministische Stubs ohne Upstreams."""
+    raw_value = str(os.getenv(_ASYNC_WORKER_ANALYSIS_ENV, "report")).strip().lower()
+    return None if raw_value == "stub" else _run_async_analysis_stages
+
+
+def _async_analysis_stage_plan(
+    requested_modules: frozenset[str] | None,
+) -> list[tuple[str, frozenset[str] | None]]:
+    """Stufenplan für eine Modul-Auswahl; Stufen ohne neue Module entfallen.
+
+    Die letzte Stufe nutzt immer exakt die angefragte Auswahl (``None`` = alle
+    Module) und wird als Final-Result persistiert.
+    """
+    plan: list[tuple[str, frozenset[str] | None]] = []
+    cumulative: set[str] = set()
+    previous: frozenset[str] = frozenset()
+    for stage_name, stage_modules in _ASYNC_ANALYSIS_STAGES[:-1]:
+        cumulative |= stage_modules
+        effective = frozenset(cumulative if requested_modules is None else cumulative & requested_modules)
+        if not effective or effective == previous:
+            continue
+        if effective == requested_modules:
+            break
+        plan.append((stage_name, effective))
+        previous = effective
+    final_name = _ASYNC_ANALYSIS_STAGES[-1][0]
+    if requested_modules is not None and not any(name.startswith(final_name) for name in requested_modules):
+        final_name = "final"
+    plan.append((final_name, requested_modules))
+    return plan
+
+
+def _async_job_request_payload(job: dict[str, Any]) -> dict[str, Any]:
+    """Gespeicherter Request-Payload eines Jobs: inline (``request_payload_json``) oder als Blob (``request_payload_ref``)."""
+    request_payload = job.get("request_payload_json")
+    if isinstance(request_payload, dict) and request_payload:
+        return request_payload
+    payload_ref = str(job.get("request_payload_ref") or "")
+    blob_store = getattr(_async_job_store(), "blob_store", None)
+    if not payload_ref or blob_store is None:
+        return {}
+    try:
+        loaded = blob_store.read_json(payload_ref)
+    except (KeyError, ValueError):
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def _run_async_analysis_stages(job: dict[str, Any]) -> Iterator[AnalysisStage]:
+    """Führt ``build_report`` gestaffelt aus und liefert pro Stufe ein grouped Result.
+
+    Options/Preferences kommen aus dem gespeicherten Request-Payload (sofern der
+    Store ihn hält); Deep-Mode-Enrichment läuft nur auf dem finalen Report.
+    Batch-Jobs (``POST /analyze/batch``) laufen über ``_run_async_batch_stages``.
+
+    Die Zwischenstufen teilen sich ``timeout`` als Gesamtbudget: ist es
+    aufgebraucht, entfallen die übrigen Zwischenstufen und der Job springt
+    direkt zur finalen Stufe. Ein Job dauert so höchstens etwa das Budget plus
+    einen synchronen Request, statt den Timeout pro Stufe erneut auszuschöpfen.
+    """
+    from src.api.address_intel import HttpClient  # noqa: PLC0415
+
+    request_payload = _async_job_request_payload(job)
+    if is_batch_request(request_payload):
+        yield from _run_async_batch_stages(job, request_payload)
+        return
+    options = _extract_request_options(request_payload)
+    response_mode = _extract_response_mode(options)
+    preferences_supplied = request_payload.get("preferences") is not None
+    preferences_profile = _extract_preferences(request_payload)
+    timeout = _resolve_analyze_timeout(request_payload)
+    query = str(job.get("query") or "")
+    mode = str(job.get("intelligence_mode") or "basic")
+    trace_id = str(job.get("correlation_id") or job.get("job_id") or "")
+
+    client = HttpClient(timeout=timeout, retries=2, backoff_seconds=0.6)
+    plan = _async_analysis_stage_plan(_extract_report_modules(options))
+    # Wiederaufgenommener Job: bereits persistierte Zwischenstufen nicht neu rechnen.
+    resume_progress = int(job.get("progress_percent") or 0) if job.get("status") == "partial" else 0
+    stage_deadline = time.monotonic() + timeout
+    for stage_index, (stage_name, stage_modules) in enumerate(plan, start=1):
+        final = stage_index == len(plan)
+        progress_percent = 100 if final else min(95, int(round(stage_index * 100.0 / len(plan))))
+        if not final and (progress_percent <= resume_progress or time.monotonic() >= stage_deadline):
+            continue
+        report = build_report(
+            query,
+            include_osm=True,
+            candidate_limit=8,
+            candidate_preview=3,
+            timeout=timeout,
+            retries=2,
+            backoff_seconds=0.6,
+            intelligence_mode=mode,
+            client=client,
+            trace_id=trace_id,
+            request_id=trace_id,
+            modules=stage_modules,
+        )
+        _apply_personalized_suitability_scores(
+            report,
+            preferences_profile,
+            preferences_supplied=preferences_supplied,
+        )
+        if final:
+            _apply_deep_mode_runtime_status(
+                report,
+                options=options,
+                intelligence_mode=mode,
+                timeout_seconds=timeout,
+                request_id=trace_id,
+            )
+            _apply_open_meteo_deep_enrichment(
+                report,
+                options=options,
+                intelligence_mode=mode,
+                timeout_seconds=timeout,
+                request_id=trace_id,
+            )
+        grouped_result = _grouped_api_result(report, response_mode=response_mode)
+        grouped_result["data"]["modules"]["runtime"] = {
+            "status": "completed" if final else "partial",
+            "intelligence_mode": mode,
+            "stage": stage_name,
+            "stage_index": stage_index,
+            "total_stages": len(plan),
+            "progress_percent": progress_percent,
+        }
+        yield AnalysisStage(
+            name=stage_name,
+            payload={"ok": True, "result": grouped_result},
+            progress_percent=progress_percent,
+            final=final,
+        )
+
+
+def _run_async_batch_stages(job: dict[str, Any], request_payload: dict[str, Any]) -> Iterator[AnalysisStage]:
+    """Ein Partial-Result pro Batch-Item (Abschlussreihenfolge), zum Schluss die Zusammenfassung.
+
+    Alle Items teilen einen ``HttpClient`` (Upstream-Cache, Throttling); pro
+    Batch laufen höchstens ``ANALYZE_BATCH_CONCURRENCY`` Items gleichzeitig.
+    """
+    from src.api.address_intel import HttpClient  # noqa: PLC0415
+
+    queries = parse_batch_queries(request_payload)
+    options = _extract_request_options(request_payload)
+    response_mode = _extract_response_mode(options)
+    report_modules = _extract_report_modules(options)
+    preferences_supplied = request_payload.get("preferences") is not None
+    preferences_profile = _extract_preferences(request_payload)
+    timeout = _resolve_analyze_timeout(request_payload)
+    mode = str(job.get("intelligence_mode") or "basic")
+    trace_id = str(job.get("correlation_id") or job.get("job_id") or "")
+
+    client = HttpClient(timeout=timeout, retries=2, backoff_seconds=0.6)
+
+    def _analyze_one(query: str) -> dict[str, Any]:
+        report = build_report(
+            query,
+            include_osm=True,
+            candidate_limit=8,
+            candidate_preview=3,
+            timeout=timeout,
+            retries=2,
+            backoff_seconds=0.6,
+            intelligence_mode=mode,
+            client=client,
+            trace_id=trace_id,
+            request_id=trace_id,
+            modules=report_modules,
+        )
+        _apply_personalized_suitability_scores(
+            report,
+            preferences_profile,
+            preferences_supplied=preferences_supplied,
+        )
+        _apply_deep_mode_runtime_status(
+            report,
+            options=options,
+            intelligence_mode=mode,
+            timeout_seconds=timeout,
+            request_id=trace_id,
+        )
+        _apply_open_meteo_deep_enrichment(
+            report,
+            options=options,
+            intelligence_mode=mode,
+            timeout_seconds=timeout,
+            request_id=trace_id,
+        )
+        return _grouped_api_result(report, response_mode=response_mode)
+
+    rows: list[dict[str, Any]] = []
+    if job.get("status") == "partial":
+        # Wiederaufgenommener Batch: persistierte Items übernehmen, nur den Rest rechnen.
+        store = _async_job_store()
+        blob_store = getattr(store, "blob_store", None)
+        for result in store.list_results(str(job.get("job_id") or "")):
+            item = load_result_payload(result, blob_store).get("batch_item")
+            if isinstance(item, dict):
+                rows.append({key: item.get(key) for key in ("index", "query", "ok", "batch_meta")})
+    skip_indices = {row["index"] for row in rows}
+    for row in iter_batch_results(
+        queries, _analyze_one, concurrency=batch_concurrency(), skip_indices=skip_indices
+    ):
+        # Für die Zusammenfassung nur die Item-Metadaten behalten, nicht die Reports.
+        rows.append({key: row.get(key) for key in ("index", "query", "ok", "batch_meta")})
+        yield AnalysisStage(
+            name=f"item_{row['index']}",
+            payload={"ok": True, "batch_item": row},
+            progress_percent=max(5, min(95, int(len(rows) * 100 / len(queries)))),
+        )
+    yield AnalysisStage(
+        name="batch_summary",
+        payload={"ok": True, "batch": summarize_batch(len(queries), rows)},
+        progress_percent=100,
+        final=True,
+    )
+
+
 def _env_flag_enabled(name: str, *, default: bool = False) -> bool:
     raw_value = str(os.getenv(name, "")).strip().lower()
     if not raw_value:
@@ -682,26 +1128,40 @@ def _normalize_dictionary_table(table: dict[int, str]) -> dict[str, str]:
 
 
 def _stable_etag(payload: dict[str, Any], *, prefix: str) -> str:
-    serialized = json.dumps(
-        payload,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
+    serialized = dumps_canonical(payload)
     digest = hashlib.sha256(serialized).hexdigest()[:16]
     return f'"{prefix}-{digest}"'
 
 
+_ETAG_ENCODING_SUFFIXES = ("gzip", "br")
+
+
+def _etag_for_encoding(etag: str, encoding: str) -> str:
+    """ETag der komprimierten Repräsentation: ``"<tag>-<encoding>"`` (RFC 9110 §8.8.3)."""
+    value = str(etag).strip()
+    if not value.endswith('"') or len(value) < 2:
+        return value
+    return f'{value[:-1]}-{encoding}"'
+
+
 def _normalize_etag_for_compare(tag: Any) -> str:
     value = str(tag).strip()
     if value.lower().startswith("w/"):
         value = value[2:].strip()
+    for encoding in _ETAG_ENCODING_SUFFIXES:
+        suffix = f'-{encoding}"'
+        if value.endswith(suffix):
+            return value[: -len(suffix)] + '"'
     return value
 
 
-def _if_none_match_matches(header_value: Any, current_etag: str) -> bool:
+def _if_none_match_etag(header_value: Any, current_etag: str, *, wildcard: bool = True) -> str | None:
+    """Passender ETag aus ``If-None-Match`` (auch Encoding-Varianten) oder ``None``.
+
+    Für ``*`` wird ``current_etag`` zurückgegeben, sofern ``wildcard`` gesetzt ist.
+    """
     if not header_value:
-        return False
+        return None
 
     normalized_current = _normalize_etag_for_compare(current_etag)
     for raw_part in str(header_value).split(","):
@@ -709,10 +1169,16 @@ def _if_none_match_matches(header_value: Any, current_etag: str) -> bool:
         if not candidate:
             continue
         if candidate == "*":
-            return True
+            if wildcard:
+                return current_etag
+            continue
         if _normalize_etag_for_compare(candidate) == normalized_current:
-            return True
-    return False
+            return candidate
+    return None
+
+
+def _if_none_match_matches(header_value: Any, current_etag: str, *, wildcard: bool = True) -> bool:
+    return _if_none_match_etag(header_value, current_etag, wildcard=wildcard) is not None
 
 
 def _is_external_direct_login_path(request_path: str) -> bool:
@@ -956,6 +1422,33 @@ def _build_dictionary_payloads() -> tuple[dict[str, Any], dict[str, dict[str, An
 _DICTIONARY_INDEX_PAYLOAD, _DICTIONARY_DOMAIN_PAYLOADS = _build_dictionary_payloads()
 
 
+# ``address_intel`` (Report-Engine) und ``gui_mvp`` (GUI-Template) sind die
+# grössten Module im Import-Graph; sie werden erst beim ersten Report-Build bzw.
+# GUI-Aufruf geladen. Die Wrapper bleiben als Modul-Attribute patchbar.
+def build_report(*args: Any, **kwargs: Any) -> dict[str, Any]:
+    from src.api.address_intel import build_report as _build_report  # noqa: PLC0415
+
+    return _build_report(*args, **kwargs)
+
+
+def normalize_report_modules(modules: Any) -> frozenset[str] | None:
+    from src.api.address_intel import normalize_report_modules as _normalize_report_modules  # noqa: PLC0415
+
+    return _normalize_report_modules(modules)
+
+
+def _render_gui_mvp_shell(*, app_version: str) -> Any:
+    from src.shared.gui_mvp import render_gui_mvp_shell  # noqa: PLC0415
+
+    return render_gui_mvp_shell(app_version=app_version)
+
+
+def _get_gui_asset(name: str) -> Any:
+    from src.shared.gui_mvp import get_gui_asset  # noqa: PLC0415
+
+    return get_gui_asset(name)
+
+
 def _emit_structured_log(
     *,
     event: str,
@@ -1176,36 +1669,40 @@ def _derived_from_projection(field_provenance: Any) -> dict[str, Any]:
             if key == "sources" and isinstance(value, list) and not value:
                 continue
 
-            entry[key] = deepcopy(value)
+            entry[key] = value
         if entry:
             out[str(field_path)] = entry
     return out
 
 
 def _build_status_block(report: dict[str, Any]) -> dict[str, Any]:
+    """Projiziert die Status-/Quellen-Metadaten des Reports.
+
+    Die Teilbäume werden nicht kopiert, sondern mit ``report`` geteilt (siehe
+    ``_grouped_api_result``).
+    """
     quality: dict[str, Any] = {}
     confidence = report.get("confidence")
     executive_summary = report.get("executive_summary")
     if confidence is not None:
-        quality["confidence"] = deepcopy(confidence)
+        quality["confidence"] = confidence
     if executive_summary is not None:
-        quality["executive_summary"] = deepcopy(executive_summary)
+        quality["executive_summary"] = executive_summary
 
-    source_health = deepcopy(report.get("sources") or {})
+    source_health = report.get("sources") or {}
 
     source_meta: dict[str, Any] = {}
     source_classification = report.get("source_classification")
     source_attribution = report.get("source_attribution")
     field_provenance = report.get("field_provenance")
     if source_classification:
-        source_meta["source_classification"] = deepcopy(source_classification)
+        source_meta["source_classification"] = source_classification
     if source_attribution:
-        source_meta["source_attribution"] = deepcopy(source_attribution)
+        source_meta["source_attribution"] = source_attribution
     if field_provenance:
-        field_provenance_copy = deepcopy(field_provenance)
-        source_meta["field_provenance"] = field_provenance_copy
+        source_meta["field_provenance"] = field_provenance
 
-        derived_from = _derived_from_projection(field_provenance_copy)
+        derived_from = _derived_from_projection(field_provenance)
         if derived_from:
             source_meta["derived_from"] = derived_from
 
@@ -1218,15 +1715,15 @@ def _build_status_block(report: dict[str, Any]) -> dict[str, Any]:
 
     personalization_status = report.get("personalization_status")
     if isinstance(personalization_status, dict):
-        status_block["personalization"] = deepcopy(personalization_status)
+        status_block["personalization"] = personalization_status
 
     capabilities_status = report.get("capabilities_status")
     if isinstance(capabilities_status, dict) and capabilities_status:
-        status_block["capabilities"] = deepcopy(capabilities_status)
+        status_block["capabilities"] = capabilities_status
 
     entitlements_status = report.get("entitlements_status")
     if isinstance(entitlements_status, dict) and entitlements_status:
-        status_block["entitlements"] = deepcopy(entitlements_status)
+        status_block["entitlements"] = entitlements_status
 
     return status_block
 
@@ -1260,9 +1757,9 @@ def _compact_projection_for_group(
             selected_score = module_payload.get("selected_score")
             candidate_count = module_payload.get("candidate_count")
             if selected_score is not None:
-                projection["selected_score"] = deepcopy(selected_score)
+                projection["selected_score"] = selected_score
             if candidate_count is not None:
-                projection["candidate_count"] = deepcopy(candidate_count)
+                projection["candidate_count"] = candidate_count
 
         if group_name == "intelligence" and isinstance(module_payload, dict):
             tenants_businesses = module_payload.get("tenants_businesses")
@@ -1298,7 +1795,7 @@ def _build_by_source_payload(
             continue
 
         if response_mode == "verbose":
-            grouped_data = {key: deepcopy(modules[key]) for key in module_keys}
+            grouped_data = {key: modules[key] for key in module_keys}
             if len(grouped_data) == 1:
                 group_value: Any = next(iter(grouped_data.values()))
             else:
@@ -1314,7 +1811,7 @@ def _build_by_source_payload(
             if not isinstance(source_name, str) or not source_name.strip():
                 continue
             entry = ensure_source(source_name)
-            entry["data"][group_name] = deepcopy(group_value)
+            entry["data"][group_name] = group_value
 
     for source_name in source_health.keys():
         if isinstance(source_name, str) and source_name.strip():
@@ -1353,10 +1850,12 @@ def _normalize_code_mapping(payload: Any) -> dict[str, str]:
 
 
 def _to_code_first_modules(modules: dict[str, Any]) -> dict[str, Any]:
-    projected = deepcopy(modules)
+    """Code-first-Projektion (copy-on-write: nur ``building``/``energy`` werden flach kopiert)."""
+    projected = dict(modules)
 
     building = projected.get("building")
     if isinstance(building, dict):
+        building = projected["building"] = dict(building)
         building.pop("decoded", None)
         normalized_building_codes = _normalize_code_mapping(building.get("codes"))
         if normalized_building_codes:
@@ -1366,6 +1865,7 @@ def _to_code_first_modules(modules: dict[str, Any]) -> dict[str, Any]:
 
     energy = projected.get("energy")
     if isinstance(energy, dict):
+        energy = projected["energy"] = dict(energy)
         raw_codes = energy.pop("raw_codes", None)
         existing_codes = _normalize_code_mapping(energy.get("codes"))
         raw_codes_normalized = _normalize_code_mapping(raw_codes)
@@ -1384,11 +1884,18 @@ def _grouped_api_result(
     *,
     response_mode: str = "compact",
 ) -> dict[str, Any]:
+    """Projiziert einen ``build_report``-Report auf das grouped Response-Schema.
+
+    Single-Pass ohne Deep-Copies: ``_strip_status_fields`` baut die Daten-
+    Container ohnehin neu auf, alle übrigen Teilbäume (Status-Block,
+    ``by_source``-Slices) werden geteilt. Report und Projektion sind danach als
+    read-only zu behandeln; ``json.dumps`` liefert byte-identische Ausgabe.
+    """
     normalized_response_mode = response_mode if response_mode in _RESPONSE_MODES else "compact"
 
     status = _build_status_block(report)
 
-    cleaned = _strip_status_fields(deepcopy(report))
+    cleaned = _strip_status_fields(report)
     if not isinstance(cleaned, dict):
         cleaned = {}
     for key in _TOP_LEVEL_STATUS_KEYS:
@@ -1895,6 +2402,39 @@ def _identify_gwr_candidates(
     return candidates
 
 
+def _resolve_query_from_centroid_index(*, lat: float, lon: float) -> tuple[str, dict[str, Any]] | None:
+    """In-process snap via the local GWR centroid index (``None`` → identify fallback)."""
+    index = get_centroid_index_from_env()
+    if index is None:
+        return None
+
+    click_lv95_e, click_lv95_n = wgs84_to_lv95_approx(lat=lat, lon=lon)
+    hit = index.nearest(
+        lv95_e=click_lv95_e,
+        lv95_n=click_lv95_n,
+        max_distance_m=_COORDINATE_MAX_SNAP_DISTANCE_M,
+    )
+    if hit is None:
+        return None
+
+    distance_m, centroid = hit
+    if not centroid.street or not centroid.postal_code:
+        return None
+
+    resolved_query = f"{centroid.street}, {centroid.postal_code} {centroid.city}".strip()
+    return resolved_query, {
+        "provider": "ch.bfs.gebaeude_wohnungs_register",
+        "resolver": "local_centroid_index",
+        "feature_id": centroid.feature_id,
+        "distance_m": round(distance_m, 2),
+        "resolved_query": resolved_query,
+        "clickpoint_wgs84": {
+            "lat": round(lat, 6),
+            "lon": round(lon, 6),
+        },
+    }
+
+
 def _resolve_query_from_coordinates(
     *,
     lat: float,
@@ -1902,6 +2442,10 @@ def _resolve_query_from_coordinates(
     timeout_seconds: float = 8.0,
     upstream_log_emitter: Callable[..., None] | None = None,
 ) -> tuple[str, dict[str, Any]]:
+    local_resolution = _resolve_query_from_centroid_index(lat=lat, lon=lon)
+    if local_resolution is not None:
+        return local_resolution
+
     click_lv95_e, click_lv95_n = _wgs84_to_lv95(
         lat=lat,
         lon=lon,
@@ -1942,6 +2486,7 @@ def _resolve_query_from_coordinates(
 
     return resolved_query, {
         "provider": "ch.bfs.gebaeude_wohnungs_register",
+        "resolver": "gwr_identify",
         "feature_id": best.get("feature_id"),
         "distance_m": None if not math.isfinite(best_distance_m) else round(best_distance_m, 2),
         "resolved_query": resolved_query,
@@ -2191,6 +2736,34 @@ def _extract_response_mode(options: dict[str, Any]) -> str:
     return mode
 
 
+def _extract_report_modules(options: dict[str, Any]) -> frozenset[str] | None:
+    """Liest die optionale Modul-Auswahl (`options.modules`, Default: alle Module)."""
+    raw_modules = options.get("modules")
+    if raw_modules is None:
+        return None
+    if not isinstance(raw_modules, list) or not all(isinstance(item, str) for item in raw_modules):
+        raise ValueError("options.modules must be a list of strings when provided")
+    try:
+        return normalize_report_modules(raw_modules)
+    except ValueError as exc:
+        raise ValueError(f"options.modules is invalid: {exc}") from exc
+
+
+def _resolve_analyze_timeout(data: dict[str, Any]) -> float:
+    """Effektiver Analyze-Timeout: ``timeout_seconds`` (Default per Env), gekappt auf das Maximum."""
+    default_timeout = _as_positive_finite_number(
+        os.getenv("ANALYZE_DEFAULT_TIMEOUT_SECONDS", "15"),
+        "ANALYZE_DEFAULT_TIMEOUT_SECONDS",
+    )
+    max_timeout = _as_positive_finite_number(
+        os.getenv("ANALYZE_MAX_TIMEOUT_SECONDS", "45"),
+        "ANALYZE_MAX_TIMEOUT_SECONDS",
+    )
+    req_timeout_raw = data.get("timeout_seconds", default_timeout)
+    timeout = _as_positive_finite_number(req_timeout_raw, "timeout_seconds")
+    return min(timeout, max_timeout)
+
+
 def _reject_legacy_options(options: dict[str, Any]) -> None:
     """Lehnt explizite Legacy-Flags im öffentlichen Request-Surface ab."""
     if "include_labels" in options:
@@ -2272,6 +2845,32 @@ def _resolve_notification_limit(raw_value: str | None) -> int:
     return min(parsed, 200)
 
 
+def _resolve_job_events_since(raw_value: str | None) -> int:
+    normalized = str(raw_value or "").strip()
+    if not normalized:
+        return 0
+    try:
+        parsed = int(normalized)
+    except ValueError as exc:
+        raise ValueError("since_event_seq must be an integer >= 0") from exc
+    if parsed < 0:
+        raise ValueError("since_event_seq must be an integer >= 0")
+    return parsed
+
+
+def _resolve_job_events_timeout(raw_value: str | None) -> float:
+    normalized = str(raw_value or "").strip()
+    if not normalized:
+        return _ASYNC_JOB_EVENTS_DEFAULT_TIMEOUT_SECONDS
+    try:
+        parsed = float(normalized)
+    except ValueError as exc:
+        raise ValueError("timeout must be a number >= 0") from exc
+    if not math.isfinite(parsed) or parsed < 0:
+        raise ValueError("timeout must be a number >= 0")
+    return min(parsed, _ASYNC_JOB_EVENTS_MAX_TIMEOUT_SECONDS)
+
+
 def _resolve_history_limit(raw_value: str | None) -> int:
     normalized = str(raw_value or "").strip()
     if not normalized:
@@ -2298,6 +2897,167 @@ def _resolve_history_offset(raw_value: str | None) -> int:
     return parsed
 
 
+def _encode_history_cursor(sort_key: tuple[str, ...]) -> str:
+    """Opaker Keyset-Cursor (Sortierschlüssel der letzten Zeile einer Seite)."""
+    raw = json.dumps([str(part) for part in sort_key], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_history_cursor(
+    raw_value: str | None, *, size: int, timestamp_first: bool = False
+) -> tuple[str, ...] | None:
+    """Dekodiert einen Keyset-Cursor; ``ValueError`` bei manipulierten Werten.
+
+    ``timestamp_first``: das erste Element wird als ISO-8601-Zeitstempel
+    geprüft, bevor es als Parameter in die Store-Query geht (Postgres würde
+    einen ungültigen Wert sonst erst beim Cast ablehnen → 500 statt 400).
+    """
+    normalized = str(raw_value or "").strip()
+    if not normalized:
+        return None
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(normalized + "=" * (-len(normalized) % 4)))
+    except (ValueError, binascii.Error) as exc:
+        raise ValueError("cursor is invalid") from exc
+    if not isinstance(decoded, list) or len(decoded) != size or not all(isinstance(part, str) for part in decoded):
+        raise ValueError("cursor is invalid")
+    if timestamp_first:
+        try:
+            datetime.fromisoformat(decoded[0])
+        except ValueError as exc:
+            raise ValueError("cursor is invalid") from exc
+    return tuple(decoded)
+
+
+def _async_result_cache_max_entries() -> int:
+    raw = str(os.getenv(_ASYNC_RESULT_CACHE_MAX_ENTRIES_ENV, "")).strip()
+    if not raw:
+        return _ASYNC_RESULT_CACHE_DEFAULT_MAX_ENTRIES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return _ASYNC_RESULT_CACHE_DEFAULT_MAX_ENTRIES
+
+
+def _async_result_cache_ttl_seconds() -> float:
+    raw = str(os.getenv(_ASYNC_RESULT_CACHE_TTL_ENV, "")).strip()
+    if not raw:
+        return _ASYNC_RESULT_CACHE_DEFAULT_TTL_SECONDS
+    try:
+        parsed = float(raw)
+    except ValueError:
+        return _ASYNC_RESULT_CACHE_DEFAULT_TTL_SECONDS
+    return parsed if math.isfinite(parsed) and parsed > 0 else 0.0
+
+
+def _async_result_reuse_max_age_seconds() -> float:
+    raw = str(os.getenv(_ASYNC_RESULT_REUSE_MAX_AGE_ENV, "")).strip()
+    if not raw:
+        return 0.0
+    try:
+        parsed = float(raw)
+    except ValueError:
+        return 0.0
+    return parsed if math.isfinite(parsed) and parsed > 0 else 0.0
+
+
+def _async_job_events_poll_seconds() -> float:
+    raw = str(os.getenv(_ASYNC_JOB_EVENTS_POLL_ENV, "")).strip()
+    if not raw:
+        return _ASYNC_JOB_EVENTS_DEFAULT_POLL_SECONDS
+    try:
+        parsed = float(raw)
+    except ValueError:
+        return _ASYNC_JOB_EVENTS_DEFAULT_POLL_SECONDS
+    return parsed if math.isfinite(parsed) and parsed > 0 else _ASYNC_JOB_EVENTS_DEFAULT_POLL_SECONDS
+
+
+def _async_job_events_max_waiters() -> int:
+    """Limit gleichzeitig wartender ``/events``-Requests pro Prozess.
+
+    Im ``API_SERVER_MODE=pool`` belegt jeder Wartende einen der festen Worker:
+    ohne ``ASYNC_JOB_EVENTS_MAX_WAITERS`` gilt dort die Hälfte des Pools, ein
+    expliziter Wert wird auf ``API_WORKER_POOL_SIZE - 1`` begrenzt, damit
+    immer ein Worker für andere Requests frei bleibt.
+    """
+    raw = str(os.getenv(_ASYNC_JOB_EVENTS_MAX_WAITERS_ENV, "")).strip()
+    configured: int | None = None
+    if raw:
+        try:
+            configured = max(0, int(raw))
+        except ValueError:
+            configured = None
+    try:
+        settings = _resolve_server_settings()
+    except ValueError:
+        settings = {"mode": "threading"}
+    if settings["mode"] != "pool":
+        return configured if configured is not None else _ASYNC_JOB_EVENTS_DEFAULT_MAX_WAITERS
+    workers = int(settings["workers"])
+    if configured is None:
+        return workers // 2
+    return min(configured, max(0, workers - 1))
+
+
+def _async_result_cache_get(key: tuple[str, str]) -> dict[str, Any] | None:
+    ttl_seconds = _async_result_cache_ttl_seconds()
+    if ttl_seconds <= 0:
+        return None
+
+    now = time.monotonic()
+    with _ASYNC_RESULT_CACHE_LOCK:
+        entry = _ASYNC_RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        if now - float(entry["cached_at"]) > ttl_seconds:
+            del _ASYNC_RESULT_CACHE[key]
+            return None
+        _ASYNC_RESULT_CACHE.move_to_end(key)
+        return entry
+
+
+def _async_result_cache_put(key: tuple[str, str], entry: dict[str, Any]) -> None:
+    max_entries = _async_result_cache_max_entries()
+    if max_entries <= 0 or _async_result_cache_ttl_seconds() <= 0:
+        return
+
+    with _ASYNC_RESULT_CACHE_LOCK:
+        _ASYNC_RESULT_CACHE[key] = {**entry, "cached_at": time.monotonic()}
+        _ASYNC_RESULT_CACHE.move_to_end(key)
+        while len(_ASYNC_RESULT_CACHE) > max_entries:
+            _ASYNC_RESULT_CACHE.popitem(last=False)
+
+
+def _async_result_cache_clear() -> None:
+    with _ASYNC_RESULT_CACHE_LOCK:
+        _ASYNC_RESULT_CACHE.clear()
+
+
+def _async_result_etag(*, result_id: str, projection_mode: str, selected_result_id: str) -> str:
+    """Starker ETag für eine Result-Projektion (Results selbst sind unveränderlich)."""
+    digest = hashlib.sha256(f"{result_id}|{projection_mode}|{selected_result_id}".encode("utf-8")).hexdigest()[:16]
+    return f'"result-{digest}"'
+
+
+def _async_result_projection_is_immutable(*, projection_mode: str, job_record: dict[str, Any]) -> bool:
+    """``requested`` ist immer stabil; ``latest`` erst, wenn der Job terminal ist."""
+    if projection_mode == "requested":
+        return True
+    return str(job_record.get("status") or "") in _ASYNC_TERMINAL_JOB_STATES
+
+
+def _sse_event_frame(event: dict[str, Any]) -> bytes:
+    """SSE-Frame für ein Job-Event; ``id`` ist die ``event_seq`` (→ ``Last-Event-ID`` beim Reconnect)."""
+    event_type = re.sub(r"[^A-Za-z0-9_.-]", "_", str(event.get("event_type") or "message"))
+    event_seq = int(event.get("event_seq", 0) or 0)
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_seq, event_type.encode("ascii"), dumps_wire(event))
+
+
+def _json_body_with_request_id(body_prefix: bytes, request_id: str) -> bytes:
+    """Hängt ``request_id`` an einen gecachten, offenen JSON-Objekt-Prefix an."""
+    return body_prefix + b',"request_id":' + dumps_wire(request_id) + b"}"
+
+
 def _select_async_result_snapshot(
     *,
     requested_result: dict[str, Any],
@@ -2347,9 +3107,10 @@ def _project_async_job_status(job: dict[str, Any], *, include_events: bool = Fal
         "canceled_at": job.get("canceled_at"),
         "canceled_by": job.get("canceled_by"),
         "cancel_reason": job.get("cancel_reason"),
+        "reused_from_job_id": job.get("reused_from_job_id"),
     }
     if include_events:
-        projected["events"] = _ASYNC_JOB_STORE.list_events(str(job.get("job_id") or ""))
+        projected["events"] = _async_job_store().list_events(str(job.get("job_id") or ""))
     return projected
 
 
@@ -3423,7 +4184,7 @@ def _normalize_error_payload(payload: dict[str, Any], *, status: int) -> dict[st
     return normalized
 
 
-class Handler(BaseHTTPRequestHandler):
+class Handler(KeepAliveHandlerMixin, BaseHTTPRequestHandler):
     server_version = "geo-ranking-ch/0.1"
 
     def _normalized_path(self) -> str:
@@ -3482,6 +4243,21 @@ class Handler(BaseHTTPRequestHandler):
         token = _extract_bearer_token(self.headers.get("Authorization", ""))
         return _resolve_phase1_auth_user(token)
 
+    @staticmethod
+    def _async_result_visible(
+        visibility: dict[str, Any],
+        *,
+        auth_user: _Phase1AuthUser | None,
+        request_org_id: str,
+        org_guarded_store: bool,
+    ) -> bool:
+        """Sichtbarkeitsregel der Store-Pfade, angewendet auf gecachte Result-Metadaten."""
+        if org_guarded_store:
+            return str(visibility.get("result_org_id") or "") == str(request_org_id)
+        if auth_user is not None:
+            return Handler._job_visible_for_auth_user(visibility, auth_user)
+        return Handler._job_visible_for_org(visibility, request_org_id)
+
     @staticmethod
     def _job_visible_for_org(job_record: dict[str, Any], request_org_id: str) -> bool:
         job_org_id = _normalize_async_org_id(job_record.get("org_id"))
@@ -3560,7 +4336,7 @@ class Handler(BaseHTTPRequestHandler):
                 job_part = path.removeprefix("/analyze/jobs/").strip("/")
                 job_id = job_part.split("/", 1)[0].strip()
                 if job_id:
-                    job_record = _ASYNC_JOB_STORE.get_job(job_id)
+                    job_record = _async_job_store().get_job(job_id)
                     if isinstance(job_record, dict):
                         return str(job_record.get("correlation_id") or "")
 
@@ -3568,11 +4344,11 @@ class Handler(BaseHTTPRequestHandler):
                 result_part = path.removeprefix("/analyze/results/").strip("/")
                 result_id = result_part.split("/", 1)[0].strip()
                 if result_id:
-                    result_record = _ASYNC_JOB_STORE.get_result(result_id)
+                    result_record = _async_job_store().get_result(result_id)
                     if isinstance(result_record, dict):
                         job_id = str(result_record.get("job_id") or "").strip()
                         if job_id:
-                            job_record = _ASYNC_JOB_STORE.get_job(job_id)
+                            job_record = _async_job_store().get_job(job_id)
                             if isinstance(job_record, dict):
                                 return str(job_record.get("correlation_id") or "")
         except Exception:
@@ -3636,6 +4412,23 @@ class Handler(BaseHTTPRequestHandler):
         self._response_status_code = int(code)
         super().send_response(code, message)
 
+    def _encode_body_for_client(self, body: bytes, *, static: bool = False) -> tuple[bytes, dict[str, str]]:
+        """gzip/br gemäss ``Accept-Encoding`` (``static``: gecachte Max-Level-Variante)."""
+        return encode_response_body(body, self.headers.get("Accept-Encoding"), static=static)
+
+    @staticmethod
+    def _merge_encoding_headers(headers: dict[str, str], encoding_headers: dict[str, str]) -> None:
+        for key, value in encoding_headers.items():
+            if key == "Vary":
+                headers["Vary"] = merge_vary(headers.get("Vary"), value)
+            else:
+                headers[key] = value
+        # Komprimierte Bodies sind eigene Repräsentationen und brauchen einen
+        # eigenen starken ETag.
+        encoding = encoding_headers.get("Content-Encoding")
+        if encoding and headers.get("ETag"):
+            headers["ETag"] = _etag_for_encoding(headers["ETag"], encoding)
+
     def _send_json(
         self,
         payload: dict[str, Any],
@@ -3646,7 +4439,23 @@ class Handler(BaseHTTPRequestHandler):
     ) -> None:
         normalized_payload = _normalize_error_payload(payload, status=status)
         self._capture_response_error(payload=normalized_payload, status=status)
-        body = json.dumps(normalized_payload, ensure_ascii=False).encode("utf-8")
+        self._send_json_bytes(
+            dumps_wire(normalized_payload),
+            status,
+            request_id=request_id,
+            extra_headers=extra_headers,
+        )
+
+    def _send_json_bytes(
+        self,
+        body: bytes,
+        status: int = 200,
+        *,
+        request_id: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> None:
+        """Sendet einen bereits serialisierten JSON-Body (z. B. aus dem Result-Cache)."""
+        body, encoding_headers = self._encode_body_for_client(body)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
@@ -3658,6 +4467,7 @@ class Handler(BaseHTTPRequestHandler):
             merged_headers.update(cors_headers)
         if extra_headers:
             merged_headers.update(extra_headers)
+        self._merge_encoding_headers(merged_headers, encoding_headers)
 
         for key, value in merged_headers.items():
             self.send_header(key, value)
@@ -3670,32 +4480,437 @@ class Handler(BaseHTTPRequestHandler):
 
         self.wfile.write(body)
 
-    def _send_html(
+    def _send_json_stream(
         self,
-        body_text: str,
-        status: int = 200,
         *,
+        head: bytes,
+        chunks: Iterable[bytes],
+        chunks_size: int,
+        tail: bytes,
         request_id: str | None = None,
         extra_headers: dict[str, str] | None = None,
     ) -> None:
-        self._capture_response_error(payload=None, status=status)
-        body = body_text.encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
+        """Sendet ``head`` + ``chunks`` + ``tail``, ohne den Body im Speicher zusammenzusetzen.
+
+        Unkomprimiert ist die Länge bekannt (``Content-Length``); komprimiert
+        wird chunkweise encodiert und mit ``Transfer-Encoding: chunked``
+        (HTTP/1.1) bzw. per Verbindungsende (HTTP/1.0) begrenzt.
+        """
+        encoder, encoding_headers = stream_encoder(
+            self.headers.get("Accept-Encoding"), len(head) + chunks_size + len(tail)
+        )
+        chunked = encoder is not None and self.request_version == "HTTP/1.1"
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if encoder is None:
+            self.send_header("Content-Length", str(len(head) + chunks_size + len(tail)))
+        elif chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.close_connection = True
         self._set_request_id_headers(request_id)
+
+        merged_headers: dict[str, str] = {}
+        cors_headers = getattr(self, "_cors_response_headers", None)
+        if isinstance(cors_headers, dict):
+            merged_headers.update(cors_headers)
         if extra_headers:
-            for key, value in extra_headers.items():
-                self.send_header(key, value)
+            merged_headers.update(extra_headers)
+        self._merge_encoding_headers(merged_headers, encoding_headers)
+
+        for key, value in merged_headers.items():
+            self.send_header(key, value)
         self.end_headers()
+        self._finish_request_lifecycle()
 
-        # Emit the lifecycle end event as early as possible (after status/headers are set)
-        # to avoid timing races where callers observe the HTTP response before the
+        def _emit(data: bytes) -> None:
+            if not data:
+                return
+            if chunked:
+                self.wfile.write(b"%x\r\n" % len(data) + data + b"\r\n")
+            else:
+                self.wfile.write(data)
+
+        for part in itertools.chain((head,), chunks, (tail,)):
+            _emit(encoder.compress(part) if encoder is not None else part)
+        if encoder is not None:
+            _emit(encoder.flush())
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def _send_async_result_blob(
+        self,
+        *,
+        body_prefix: bytes,
+        payload_blob: dict[str, Any],
+        request_id: str,
+        extra_headers: dict[str, str],
+    ) -> None:
+        """Result-Response mit Payload direkt aus dem Blob-Store (siehe ``result_blob_store``)."""
+        blob_store = getattr(_async_job_store(), "blob_store", None)
+        if blob_store is None:
+            raise RuntimeError("result payload is stored as blob, but no blob store is configured")
+        size_bytes = int(payload_blob["size_bytes"])
+        # Vor den Headern öffnen: ein fehlender Blob wird noch als Fehler-Response gemeldet.
+        with blob_store.open(payload_blob["key"]) as handle:
+            try:
+                self._send_json_stream(
+                    head=body_prefix,
+                    chunks=verified_chunks(
+                        handle,
+                        payload_blob["key"],
+                        size_bytes=size_bytes,
+                        chunk_size=_ASYNC_RESULT_STREAM_CHUNK_BYTES,
+                    ),
+                    chunks_size=size_bytes,
+                    tail=b',"request_id":' + dumps_wire(request_id) + b"}",
+                    request_id=request_id,
+                    extra_headers=extra_headers,
+                )
+            except ValueError as exc:
+                # Header sind bereits gesendet: Verbindung ohne vollständigen
+                # Body schliessen, damit der Client den Abbruch erkennt.
+                self.close_connection = True
+                _emit_structured_log(
+                    event="api.async_result.blob_corrupt",
+                    level="error",
+                    request_id=request_id,
+                    component="api.web_service",
+                    direction="internal",
+                    status="aborted",
+                    blob_key=payload_blob["key"],
+                    error_message=str(exc),
+                )
+
+    def _send_job_events_long_poll(
+        self,
+        *,
+        job_id: str,
+        since_event_seq: int,
+        timeout_seconds: float,
+        request_id: str,
+    ) -> None:
+        """Antwortet, sobald Events ``> since_event_seq`` vorliegen, der Job terminal ist oder ``timeout`` abläuft."""
+        poll_seconds = _async_job_events_poll_seconds()
+        deadline = time.monotonic() + timeout_seconds
+        # Subscribe vor dem Store-Read: ein Commit dazwischen weckt den Wait sofort.
+        with _async_job_event_hub().subscribe(job_id) as subscription:
+            while True:
+                job_record = _async_job_store().get_job(job_id)
+                if job_record is None:
+                    self._send_not_found(request_id=request_id, message="unknown job_id")
+                    return
+                events = _async_job_store().list_events(job_id, after_seq=since_event_seq)
+                terminal = str(job_record.get("status") or "") in _ASYNC_TERMINAL_JOB_STATES
+                remaining = deadline - time.monotonic()
+                if events or terminal or remaining <= 0:
+                    break
+                subscription.wait(after_seq=since_event_seq, timeout=min(poll_seconds, remaining))
+
+        last_event_seq = max([since_event_seq, *(int(event.get("event_seq", 0) or 0) for event in events)])
+        self._send_json(
+            {
+                "ok": True,
+                "job_id": job_id,
+                "correlation_id": job_record.get("correlation_id"),
+                "job": _project_async_job_status(job_record),
+                "events": events,
+                "last_event_seq": last_event_seq,
+                "timed_out": not events and not terminal,
+                "request_id": request_id,
+            },
+            request_id=request_id,
+            extra_headers={"Cache-Control": "no-store"},
+        )
+
+    def _send_job_events_sse(self, *, job_id: str, since_event_seq: int, request_id: str) -> None:
+        """Server-Sent Events: ein Frame pro Job-Event, ``event: end`` nach dem terminalen Status.
+
+        Die Response ist nicht geframt (Verbindung endet mit dem Stream). Ein
+        Stream läuft höchstens ``_ASYNC_JOB_EVENTS_SSE_MAX_SECONDS``; der
+        Browser verbindet sich danach mit ``Last-Event-ID`` neu.
+        """
+        poll_seconds = _async_job_events_poll_seconds()
+        # Kapazitätsfehler werfen vor den Headern und werden vom Aufrufer als 503 beantwortet.
+        with _async_job_event_hub().subscribe(job_id) as subscription:
+            self._capture_response_error(payload=None, status=200)
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Cache-Control", "no-store")
+            # nginx & Co. sollen den Stream nicht puffern.
+            self.send_header("X-Accel-Buffering", "no")
+            self._set_request_id_headers(request_id)
+            cors_headers = getattr(self, "_cors_response_headers", None)
+            if isinstance(cors_headers, dict):
+                for key, value in cors_headers.items():
+                    self.send_header(key, value)
+            self.end_headers()
+            self._finish_request_lifecycle()
+
+            started_at = time.monotonic()
+            last_write = started_at
+            last_event_seq = since_event_seq
+            try:
+                self.wfile.write(b"retry: %d\n\n" % _ASYNC_JOB_EVENTS_SSE_RETRY_MS)
+                self.wfile.flush()
+                while True:
+                    job_record = _async_job_store().get_job(job_id)
+                    events = (
+                        _async_job_store().list_events(job_id, after_seq=last_event_seq)
+                        if job_record is not None
+                        else []
+                    )
+                    now = time.monotonic()
+                    if events:
+                        self.wfile.write(b"".join(_sse_event_frame(event) for event in events))
+                        self.wfile.flush()
+                        last_event_seq = max(int(event.get("event_seq", 0) or 0) for event in events)
+                        last_write = now
+                    status = str((job_record or {}).get("status") or "")
+                    if job_record is None or status in _ASYNC_TERMINAL_JOB_STATES:
+                        end_payload = {"job_id": job_id, "status": status or None, "last_event_seq": last_event_seq}
+                        self.wfile.write(b"event: end\ndata: " + dumps_wire(end_payload) + b"\n\n")
+                        self.wfile.flush()
+                        return
+                    if now - started_at >= _ASYNC_JOB_EVENTS_SSE_MAX_SECONDS:
+                        return
+                    if now - last_write >= _ASYNC_JOB_EVENTS_SSE_HEARTBEAT_SECONDS:
+                        self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+                        last_write = now
+                    subscription.wait(
+                        after_seq=last_event_seq,
+                        timeout=min(
+                            poll_seconds,
+                            _ASYNC_JOB_EVENTS_SSE_HEARTBEAT_SECONDS - (now - last_write),
+                            _ASYNC_JOB_EVENTS_SSE_MAX_SECONDS - (now - started_at),
+                        ),
+                    )
+            except (BrokenPipeError, ConnectionResetError):
+                # Client hat den Stream geschlossen (Tab zu, Navigation) — Normalbetrieb.
+                self.close_connection = True
+
+    def _handle_analyze_batch(
+        self,
+        data: dict[str, Any],
+        *,
+        request_id: str,
+        phase1_user: _Phase1AuthUser | None,
+        oidc_claims: dict[str, Any] | None,
+    ) -> None:
+        """``POST /analyze/batch``: legt den Parent-Job an und übergibt ihn der Async-Runtime.
+
+        Default: die Response streamt die Items als NDJSON, sobald der Worker sie
+        persistiert (``_send_batch_ndjson``). Mit ``options.async_mode.requested``
+        oder mehr als ``ANALYZE_BATCH_SYNC_MAX_ITEMS`` Queries kommt sofort ``202``
+        mit dem Job; Items dann über die Async-APIs. Der Stream belegt einen
+        Server-Thread, bis das letzte Item fertig ist.
+        Validierungsfehler (``ValueError``) beantwortet ``do_POST`` mit ``400``.
+        """
+        queries = parse_batch_queries(data, max_items=batch_max_items())
+        mode = str(data.get("intelligence_mode", "basic")).strip().lower() or "basic"
+        if mode not in SUPPORTED_INTELLIGENCE_MODES:
+            raise ValueError(f"intelligence_mode must be one of {sorted(SUPPORTED_INTELLIGENCE_MODES)}")
+        # Options früh validieren; der Worker liest sie aus dem gespeicherten Payload.
+        request_options = _extract_request_options(data)
+        _reject_legacy_options(request_options)
+        _extract_response_mode(request_options)
+        _extract_report_modules(request_options)
+        _extract_preferences(data)
+        _resolve_analyze_timeout(data)
+        async_mode_requested = _extract_async_mode_request(request_options)
+        if len(queries) > batch_sync_max_items():
+            async_mode_requested = True
+
+        store = _async_job_store()
+        request_org_id = self._request_org_id()
+        if _PHASE1_AUTH_ENABLED and phase1_user is not None:
+            request_org_id = phase1_user.org_id
+        _ensure_async_runtime_started()
+        created_job = store.create_job(
+            request_payload=data,
+            request_id=request_id,
+            query=f"batch ({len(queries)} queries)",
+            intelligence_mode=mode,
+            org_id=request_org_id,
+            owner_user_id=_resolve_request_owner_user_id(phase1_user=phase1_user, oidc_claims=oidc_claims),
+            owner_org_id=phase1_user.org_id if phase1_user else request_org_id,
+        )
+        created_job_id = str(created_job.get("job_id") or "")
+        _async_job_runtime().enqueue(created_job_id, job=created_job)
+        self._request_lifecycle_correlation_id = str(created_job.get("correlation_id") or "")
+
+        if async_mode_requested:
+            self._send_json(
+                {
+                    "ok": True,
+                    "accepted": True,
+                    "correlation_id": created_job.get("correlation_id"),
+                    "job": _project_async_job_status(created_job, include_events=True),
+                    "batch": {"total": len(queries)},
+                    "request_id": request_id,
+                },
+                status=HTTPStatus.ACCEPTED,
+                request_id=request_id,
+                extra_headers={"Cache-Control": "no-store"},
+            )
+            return
+        self._send_batch_ndjson(job=created_job, total=len(queries), request_id=request_id)
+
+    def _send_batch_ndjson(self, *, job: dict[str, Any], total: int, request_id: str) -> None:
+        """Streamt einen Batch-Job als NDJSON, eine Zeile pro persistiertem Result.
+
+        Zeilen: ``{"type": "batch", ...}`` (Job-ID, Anzahl), ``{"type": "item", ...}``
+        pro Item in Abschlussreihenfolge (mit ``result_id`` des Partial-Results) und
+        ``{"type": "summary", ...}`` mit dem terminalen Status. Ein
+        Verbindungsabbruch bricht den Job nicht ab; die Items bleiben über
+        ``GET /analyze/jobs/<job_id>`` bzw. ``/analyze/results/<id>`` abrufbar.
+        """
+        job_id = str(job.get("job_id") or "")
+        store = _async_job_store()
+        blob_store = getattr(store, "blob_store", None)
+        poll_seconds = _async_job_events_poll_seconds()
+        chunked = self.request_version == "HTTP/1.1"
+
+        self._capture_response_error(payload=None, status=200)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("X-Accel-Buffering", "no")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.close_connection = True
+        self._set_request_id_headers(request_id)
+        cors_headers = getattr(self, "_cors_response_headers", None)
+        if isinstance(cors_headers, dict):
+            for key, value in cors_headers.items():
+                self.send_header(key, value)
+        self.end_headers()
+        self._finish_request_lifecycle()
+
+        def _write_line(payload: dict[str, Any]) -> None:
+            line = dumps_wire(payload) + b"\n"
+            self.wfile.write(b"%x\r\n" % len(line) + line + b"\r\n" if chunked else line)
+            self.wfile.flush()
+
+        try:
+            _write_line(
+                {
+                    "type": "batch",
+                    "job_id": job_id,
+                    "correlation_id": job.get("correlation_id"),
+                    "total": total,
+                    "request_id": request_id,
+                }
+            )
+            with contextlib.ExitStack() as stack:
+                try:
+                    subscription = stack.enter_context(_async_job_event_hub().subscribe(job_id))
+                except JobEventCapacityError:
+                    # Hub voll: ohne Wakeups im Poll-Intervall weiterstreamen.
+                    subscription = None
+                last_event_seq = 0
+                last_result_seq = 0
+                summary_sent = False
+                while True:
+                    job_record = store.get_job(job_id) or {}
+                    for event in store.list_events(job_id, after_seq=last_event_seq):
+                        last_event_seq = max(last_event_seq, int(event.get("event_seq", 0) or 0))
+                    for result in store.list_results(job_id, after_seq=last_result_seq):
+                        last_result_seq = max(last_result_seq, int(result.get("result_seq", 0) or 0))
+                        payload = load_result_payload(result, blob_store)
+                        if isinstance(payload.get("batch_item"), dict):
+                            _write_line({"type": "item", "result_id": result.get("result_id"), **payload["batch_item"]})
+                        elif isinstance(payload.get("batch"), dict):
+                            _write_line(
+                                {
+                                    "type": "summary",
+                                    "job_id": job_id,
+                                    "status": "completed",
+                                    "result_id": result.get("result_id"),
+                                    **payload["batch"],
+                                }
+                            )
+                            summary_sent = True
+                    status = str(job_record.get("status") or "")
+                    if not job_record or status in _ASYNC_TERMINAL_JOB_STATES:
+                        if not summary_sent:
+                            _write_line(
+                                {
+                                    "type": "summary",
+                                    "job_id": job_id,
+                                    "status": status or None,
+                                    "error_code": job_record.get("error_code"),
+                                    "error_message": job_record.get("error_message"),
+                                }
+                            )
+                        break
+                    if subscription is None:
+                        time.sleep(poll_seconds)
+                    else:
+                        subscription.wait(after_seq=last_event_seq, timeout=poll_seconds)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _send_html(
+        self,
+        body_text: str,
+        status: int = 200,
+        *,
+        request_id: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+        static: bool = False,
+    ) -> None:
+        self._capture_response_error(payload=None, status=status)
+        body, encoding_headers = self._encode_body_for_client(body_text.encode("utf-8"), static=static)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self._set_request_id_headers(request_id)
+        merged_headers = dict(extra_headers or {})
+        self._merge_encoding_headers(merged_headers, encoding_headers)
+        for key, value in merged_headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        # Emit the lifecycle end event as early as possible (after status/headers are set)
+        # to avoid timing races where callers observe the HTTP response before the
         # corresponding structured log event is captured.
         self._finish_request_lifecycle()
 
         self.wfile.write(body)
 
+    def _send_static(
+        self,
+        body: bytes,
+        *,
+        content_type: str,
+        request_id: str,
+        etag: str,
+        cache_control: str,
+    ) -> None:
+        """Statische In-Memory-Inhalte (GUI-Shell/-Assets) mit ETag-Revalidierung."""
+        if _if_none_match_matches(self.headers.get("If-None-Match"), etag):
+            self._send_not_modified(request_id=request_id, etag=etag, cache_control=cache_control)
+            return
+
+        self._capture_response_error(payload=None, status=200)
+        body, encoding_headers = self._encode_body_for_client(body, static=True)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self._set_request_id_headers(request_id)
+        merged_headers = {"Cache-Control": cache_control, "ETag": etag}
+        self._merge_encoding_headers(merged_headers, encoding_headers)
+        for key, value in merged_headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self._finish_request_lifecycle()
+        self.wfile.write(body)
+
     def _send_not_modified(
         self,
         *,
@@ -3705,9 +4920,20 @@ class Handler(BaseHTTPRequestHandler):
     ) -> None:
         self._capture_response_error(payload=None, status=int(HTTPStatus.NOT_MODIFIED))
         self.send_response(HTTPStatus.NOT_MODIFIED)
-        self.send_header("ETag", etag)
+        # Der 304 bestätigt die Repräsentation, die der Client im Cache hat.
+        self.send_header("ETag", _if_none_match_etag(self.headers.get("If-None-Match"), etag) or etag)
         self.send_header("Cache-Control", cache_control)
         self._set_request_id_headers(request_id)
+        # Gleiche Vary-/CORS-Header wie die 200-Response, damit Caches und
+        # Browser den 304 der richtigen Variante zuordnen.
+        merged_headers: dict[str, str] = {}
+        cors_headers = getattr(self, "_cors_response_headers", None)
+        if isinstance(cors_headers, dict):
+            merged_headers.update(cors_headers)
+        if compression_enabled():
+            merged_headers["Vary"] = merge_vary(merged_headers.get("Vary"), "Accept-Encoding")
+        for key, value in merged_headers.items():
+            self.send_header(key, value)
         self.end_headers()
 
     def _send_dictionary_payload(
@@ -4187,10 +5413,27 @@ class Handler(BaseHTTPRequestHandler):
                 return
 
             if request_path in ("/", "/gui"):
-                self._send_html(
-                    render_gui_mvp_html(app_version=os.getenv("APP_VERSION", "dev")),
+                shell = _render_gui_mvp_shell(app_version=os.getenv("APP_VERSION", "dev"))
+                self._send_static(
+                    shell.html.encode("utf-8"),
+                    content_type="text/html; charset=utf-8",
                     request_id=request_id,
-                    extra_headers={"Cache-Control": "no-store"},
+                    etag=shell.etag,
+                    cache_control=_GUI_SHELL_CACHE_CONTROL,
+                )
+                return
+
+            if request_path.startswith("/gui/assets/"):
+                asset = _get_gui_asset(request_path[len("/gui/assets/") :])
+                if asset is None:
+                    self._send_not_found(request_id=request_id)
+                    return
+                self._send_static(
+                    asset.body,
+                    content_type=asset.content_type,
+                    request_id=request_id,
+                    etag=asset.etag,
+                    cache_control=_GUI_ASSET_CACHE_CONTROL,
                 )
                 return
 
@@ -4294,9 +5537,13 @@ class Handler(BaseHTTPRequestHandler):
                 return
             if request_path == "/health/details":
                 query_params = parse_qs(urlsplit(self.path).query, keep_blank_values=False)
+                server_stats_fn = getattr(self.server, "stats", None)
                 payload = _build_health_details_payload(
                     request_id=request_id,
                     query_params=query_params,
+                    server_stats=server_stats_fn() if callable(server_stats_fn) else None,
+                    # Nur wenn die Runtime schon existiert; Health baut sie nicht auf.
+                    async_runtime_stats=_ASYNC_JOB_RUNTIME.stats() if _ASYNC_JOB_RUNTIME is not None else None,
                 )
                 _emit_structured_log(
                     event="api.health.details.response",
@@ -4405,6 +5652,9 @@ class Handler(BaseHTTPRequestHandler):
                     request_org_id = auth_user.org_id if auth_user else self._request_org_id()
                     limit = _resolve_history_limit(query_params.get("limit", [""])[0])
                     offset = _resolve_history_offset(query_params.get("offset", [""])[0])
+                    raw_cursor = query_params.get("cursor", [""])[0]
+                    if raw_cursor and offset:
+                        raise ValueError("cursor and offset are mutually exclusive")
                 except ValueError as exc:
                     self._send_json(
                         {
@@ -4422,10 +5672,30 @@ class Handler(BaseHTTPRequestHandler):
                     return
 
                 # ------------------------------------------------------------------
-                # DB-store path: efficient per-user paginated query with org guard
+                # DB-/SQLite-store path: efficient per-user paginated query with org guard
                 # ------------------------------------------------------------------
                 from src.shared.async_job_store_db import DbAsyncJobStore as _DbStore  # noqa: PLC0415
-                if isinstance(_ASYNC_JOB_STORE, _DbStore):
+                from src.shared.async_job_store_sqlite import SqliteAsyncJobStore as _SqliteStore  # noqa: PLC0415
+                if isinstance(_async_job_store(), (_DbStore, _SqliteStore)):
+                    # Keyset-Cursor: (queued_at, job_id) der letzten Zeile der Vorseite.
+                    try:
+                        before = _decode_history_cursor(raw_cursor, size=2, timestamp_first=True)
+                    except ValueError as exc:
+                        self._send_json(
+                            {
+                                "ok": False,
+                                "error": "bad_request",
+                                "message": str(exc),
+                                "details": _validation_error_details(str(exc)),
+                                "deprecation": history_deprecation_payload,
+                                "request_id": request_id,
+                            },
+                            status=HTTPStatus.BAD_REQUEST,
+                            request_id=request_id,
+                            extra_headers=history_route_headers,
+                        )
+                        return
+
                     # Resolve user_id for OIDC (sub) or phase1 auth
                     db_user_id: str | None = None
                     if oidc_claims:
@@ -4434,23 +5704,34 @@ class Handler(BaseHTTPRequestHandler):
                         db_user_id = str(auth_user.user_id or "").strip() or None
 
                     if db_user_id:
-                        db_jobs = _ASYNC_JOB_STORE.list_jobs_for_user(
+                        db_jobs = _async_job_store().list_jobs_for_user(
                             db_user_id,
                             org_id=request_org_id,
-                            limit=limit,
+                            limit=limit + 1,
                             offset=offset,
+                            before=before,
                         )
-                        total = _ASYNC_JOB_STORE.count_jobs_for_user(
+                        total = _async_job_store().count_jobs_for_user(
                             db_user_id,
                             org_id=request_org_id,
                         )
                     else:
-                        db_jobs = _ASYNC_JOB_STORE.list_jobs_for_org(
+                        db_jobs = _async_job_store().list_jobs_for_org(
                             request_org_id,
-                            limit=limit,
+                            limit=limit + 1,
                             offset=offset,
+                            before=before,
+                        )
+                        total = _async_job_store().count_jobs_for_org(request_org_id)
+
+                    # Eine Zeile mehr gelesen: existiert sie, gibt es eine Folgeseite.
+                    db_next_cursor: str | None = None
+                    if len(db_jobs) > limit:
+                        db_jobs = db_jobs[:limit]
+                        last_job = db_jobs[-1]
+                        db_next_cursor = _encode_history_cursor(
+                            (str(last_job.get("queued_at") or ""), str(last_job.get("job_id") or ""))
                         )
-                        total = _ASYNC_JOB_STORE.count_jobs_for_org(request_org_id)
 
                     db_history_rows: list[dict[str, Any]] = []
                     for job_record in db_jobs:
@@ -4478,6 +5759,7 @@ class Handler(BaseHTTPRequestHandler):
                             "total": total,
                             "limit": limit,
                             "offset": offset,
+                            "next_cursor": db_next_cursor,
                             "deprecation": history_deprecation_payload,
                             "request_id": request_id,
                         },
@@ -4490,8 +5772,8 @@ class Handler(BaseHTTPRequestHandler):
                 # File-store path (legacy): iterate all jobs + in-memory filter
                 # ------------------------------------------------------------------
                 history_rows: list[dict[str, Any]] = []
-                for job_id in _ASYNC_JOB_STORE.list_job_ids():
-                    job_record = _ASYNC_JOB_STORE.get_job(job_id)
+                for job_id in _async_job_store().list_job_ids():
+                    job_record = _async_job_store().get_job(job_id)
                     if job_record is None:
                         continue
                     if auth_user is not None:
@@ -4500,7 +5782,7 @@ class Handler(BaseHTTPRequestHandler):
                     elif not self._job_visible_for_org(job_record, request_org_id):
                         continue
 
-                    results = _ASYNC_JOB_STORE.list_results(job_id)
+                    results = _async_job_store().list_results(job_id)
                     if not results:
                         continue
 
@@ -4523,22 +5805,52 @@ class Handler(BaseHTTPRequestHandler):
                         }
                     )
 
-                history_rows.sort(
-                    key=lambda row: (
+                def _history_sort_key(row: dict[str, Any]) -> tuple[str, str, str]:
+                    return (
                         str(row.get("created_at") or ""),
                         str(row.get("result_id") or ""),
                         str(row.get("job_id") or ""),
-                    ),
-                    reverse=True,
+                    )
+
+                history_rows.sort(key=_history_sort_key, reverse=True)
+
+                try:
+                    before_key = _decode_history_cursor(raw_cursor, size=3)
+                except ValueError as exc:
+                    self._send_json(
+                        {
+                            "ok": False,
+                            "error": "bad_request",
+                            "message": str(exc),
+                            "details": _validation_error_details(str(exc)),
+                            "deprecation": history_deprecation_payload,
+                            "request_id": request_id,
+                        },
+                        status=HTTPStatus.BAD_REQUEST,
+                        request_id=request_id,
+                        extra_headers=history_route_headers,
+                    )
+                    return
+                remaining_rows = (
+                    [row for row in history_rows if _history_sort_key(row) < before_key]
+                    if before_key is not None
+                    else history_rows[offset:]
+                )
+                page_rows = remaining_rows[:limit]
+                next_cursor = (
+                    _encode_history_cursor(_history_sort_key(page_rows[-1]))
+                    if len(remaining_rows) > limit
+                    else None
                 )
 
                 self._send_json(
                     {
                         "ok": True,
-                        "history": history_rows[offset : offset + limit],
+                        "history": page_rows,
                         "total": len(history_rows),
                         "limit": limit,
                         "offset": offset,
+                        "next_cursor": next_cursor,
                         "deprecation": history_deprecation_payload,
                         "request_id": request_id,
                     },
@@ -4546,6 +5858,90 @@ class Handler(BaseHTTPRequestHandler):
                     extra_headers=history_route_headers,
                 )
                 return
+            if request_path.startswith("/analyze/jobs/") and request_path.endswith("/events"):
+                job_id = (
+                    request_path.removeprefix("/analyze/jobs/")
+                    .removesuffix("/events")
+                    .strip("/")
+                )
+                if not job_id or "/" in job_id:
+                    self._send_not_found(request_id=request_id)
+                    return
+
+                query_params = parse_qs(urlsplit(self.path).query, keep_blank_values=False)
+                wants_sse = "text/event-stream" in str(self.headers.get("Accept") or "").lower()
+
+                provided_token = _extract_bearer_token(self.headers.get("Authorization", ""))
+                auth_user = _resolve_phase1_auth_user(provided_token) if _PHASE1_AUTH_ENABLED else None
+                oidc_claims = _validate_oidc_bearer_token(provided_token) if _OIDC_AUTH_ENABLED else None
+                if (_PHASE1_AUTH_ENABLED or _OIDC_AUTH_ENABLED) and auth_user is None and oidc_claims is None:
+                    self._send_json(
+                        {
+                            "ok": False,
+                            "error": "unauthorized",
+                            "message": "missing or invalid bearer token",
+                            "request_id": request_id,
+                        },
+                        status=HTTPStatus.UNAUTHORIZED,
+                        request_id=request_id,
+                        extra_headers={"Cache-Control": "no-store"},
+                    )
+                    return
+
+                try:
+                    request_org_id = auth_user.org_id if auth_user else self._request_org_id()
+                    since_event_seq = _resolve_job_events_since(query_params.get("since_event_seq", [""])[0])
+                    if wants_sse and self.headers.get("Last-Event-ID"):
+                        # EventSource-Reconnect: Last-Event-ID hat Vorrang vor der Start-URL.
+                        since_event_seq = _resolve_job_events_since(self.headers.get("Last-Event-ID"))
+                    timeout_seconds = _resolve_job_events_timeout(query_params.get("timeout", [""])[0])
+                except ValueError as exc:
+                    self._send_error(
+                        request_id=request_id,
+                        status=HTTPStatus.BAD_REQUEST,
+                        error="bad_request",
+                        message=str(exc),
+                        details=_validation_error_details(str(exc)),
+                        extra_headers={"Cache-Control": "no-store"},
+                    )
+                    return
+
+                job_record = _async_job_store().get_job(job_id)
+                if job_record is None:
+                    self._send_not_found(request_id=request_id, message="unknown job_id")
+                    return
+                if auth_user is not None:
+                    if not self._job_visible_for_auth_user(job_record, auth_user):
+                        self._send_not_found(request_id=request_id, message="unknown job_id")
+                        return
+                elif not self._job_visible_for_org(job_record, request_org_id):
+                    self._send_not_found(request_id=request_id, message="unknown job_id")
+                    return
+
+                try:
+                    if wants_sse:
+                        self._send_job_events_sse(
+                            job_id=job_id, since_event_seq=since_event_seq, request_id=request_id
+                        )
+                    else:
+                        self._send_job_events_long_poll(
+                            job_id=job_id,
+                            since_event_seq=since_event_seq,
+                            timeout_seconds=timeout_seconds,
+                            request_id=request_id,
+                        )
+                except JobEventCapacityError:
+                    self._send_error(
+                        request_id=request_id,
+                        status=HTTPStatus.SERVICE_UNAVAILABLE,
+                        error="server_overloaded",
+                        message="too many open job event streams; poll GET /analyze/jobs/<job_id> instead",
+                        extra_headers={
+                            "Cache-Control": "no-store",
+                            "Retry-After": str(max(1, math.ceil(_async_job_events_poll_seconds()))),
+                        },
+                    )
+                return
             if request_path.startswith("/analyze/jobs/") and request_path.endswith("/notifications"):
                 job_id = (
                     request_path.removeprefix("/analyze/jobs/")
@@ -4590,7 +5986,7 @@ class Handler(BaseHTTPRequestHandler):
                     )
                     return
 
-                job_record = _ASYNC_JOB_STORE.get_job(job_id)
+                job_record = _async_job_store().get_job(job_id)
                 if job_record is None:
                     self._send_not_found(request_id=request_id, message="unknown job_id")
                     return
@@ -4602,7 +5998,7 @@ class Handler(BaseHTTPRequestHandler):
                     self._send_not_found(request_id=request_id, message="unknown job_id")
                     return
 
-                notifications = _ASYNC_JOB_STORE.list_notifications(job_id, channel=channel)
+                notifications = _async_job_store().list_notifications(job_id, channel=channel)
                 self._send_json(
                     {
                         "ok": True,
@@ -4653,7 +6049,7 @@ class Handler(BaseHTTPRequestHandler):
                     )
                     return
 
-                job_record = _ASYNC_JOB_STORE.get_job(job_id)
+                job_record = _async_job_store().get_job(job_id)
                 if job_record is None:
                     self._send_not_found(request_id=request_id, message="unknown job_id")
                     return
@@ -4665,15 +6061,23 @@ class Handler(BaseHTTPRequestHandler):
                     self._send_not_found(request_id=request_id, message="unknown job_id")
                     return
 
+                job_payload = {
+                    "ok": True,
+                    "correlation_id": job_record.get("correlation_id"),
+                    "job": _project_async_job_status(job_record, include_events=True),
+                }
+                job_etag = _stable_etag(job_payload, prefix="job")
+                if _if_none_match_matches(self.headers.get("If-None-Match"), job_etag):
+                    self._send_not_modified(
+                        request_id=request_id,
+                        etag=job_etag,
+                        cache_control=_ASYNC_REVALIDATE_CACHE_CONTROL,
+                    )
+                    return
                 self._send_json(
-                    {
-                        "ok": True,
-                        "correlation_id": job_record.get("correlation_id"),
-                        "job": _project_async_job_status(job_record, include_events=True),
-                        "request_id": request_id,
-                    },
+                    {**job_payload, "request_id": request_id},
                     request_id=request_id,
-                    extra_headers={"Cache-Control": "no-store"},
+                    extra_headers={"Cache-Control": _ASYNC_REVALIDATE_CACHE_CONTROL, "ETag": job_etag},
                 )
                 return
             if request_path.startswith("/analyze/results/"):
@@ -4717,23 +6121,63 @@ class Handler(BaseHTTPRequestHandler):
 
                 # DB-store path: use org-guarded result fetch (tenant guard at DB level)
                 from src.shared.async_job_store_db import DbAsyncJobStore as _DbStore2  # noqa: PLC0415
-                if isinstance(_ASYNC_JOB_STORE, _DbStore2):
-                    requested_result = _ASYNC_JOB_STORE.get_result_with_org_guard(
+                org_guarded_store = isinstance(_async_job_store(), _DbStore2)
+
+                # Cache-Hit: ETag-Vergleich bzw. Body ohne Store-Zugriff; die
+                # Sichtbarkeit wird gegen die gecachten Owner-/Org-Felder geprüft.
+                cache_key = (result_id, projection_mode)
+                cached_entry = _async_result_cache_get(cache_key)
+                if cached_entry is not None and self._async_result_visible(
+                    cached_entry["visibility"],
+                    auth_user=auth_user,
+                    request_org_id=request_org_id,
+                    org_guarded_store=org_guarded_store,
+                ):
+                    self._request_lifecycle_correlation_id = str(cached_entry.get("correlation_id") or "")
+                    if _if_none_match_matches(self.headers.get("If-None-Match"), cached_entry["etag"]):
+                        self._send_not_modified(
+                            request_id=request_id,
+                            etag=cached_entry["etag"],
+                            cache_control=_ASYNC_RESULT_IMMUTABLE_CACHE_CONTROL,
+                        )
+                        return
+                    self._capture_response_error(payload=None, status=HTTPStatus.OK)
+                    cached_headers = {
+                        "Cache-Control": _ASYNC_RESULT_IMMUTABLE_CACHE_CONTROL,
+                        "ETag": cached_entry["etag"],
+                    }
+                    if cached_entry.get("payload_blob") is not None:
+                        self._send_async_result_blob(
+                            body_prefix=cached_entry["body_prefix"],
+                            payload_blob=cached_entry["payload_blob"],
+                            request_id=request_id,
+                            extra_headers=cached_headers,
+                        )
+                        return
+                    self._send_json_bytes(
+                        _json_body_with_request_id(cached_entry["body_prefix"], request_id),
+                        request_id=request_id,
+                        extra_headers=cached_headers,
+                    )
+                    return
+
+                if org_guarded_store:
+                    requested_result = _async_job_store().get_result_with_org_guard(
                         result_id, org_id=request_org_id
                     )
                 else:
-                    requested_result = _ASYNC_JOB_STORE.get_result(result_id)
+                    requested_result = _async_job_store().get_result(result_id)
 
                 if requested_result is None:
                     self._send_not_found(request_id=request_id, message="unknown result_id")
                     return
 
                 job_id = str(requested_result.get("job_id") or "")
-                job_record = _ASYNC_JOB_STORE.get_job(job_id) if job_id else None
+                job_record = _async_job_store().get_job(job_id) if job_id else None
                 if job_record is None:
                     self._send_not_found(request_id=request_id, message="unknown result_id")
                     return
-                if not isinstance(_ASYNC_JOB_STORE, _DbStore2):
+                if not org_guarded_store:
                     # File-store: enforce org guard in application layer
                     if auth_user is not None:
                         if not self._job_visible_for_auth_user(job_record, auth_user):
@@ -4743,28 +6187,94 @@ class Handler(BaseHTTPRequestHandler):
                         self._send_not_found(request_id=request_id, message="unknown result_id")
                         return
 
-                all_results_for_job = _ASYNC_JOB_STORE.list_results(job_id)
+                # ``view=requested`` zeigt immer das adressierte, unveränderliche
+                # Result: nach der Sichtbarkeitsprüfung reicht ein exakter
+                # ETag-Treffer für den 304, ohne die Results des Jobs zu laden.
+                if projection_mode == "requested":
+                    requested_etag = _async_result_etag(
+                        result_id=result_id,
+                        projection_mode=projection_mode,
+                        selected_result_id=result_id,
+                    )
+                    if _if_none_match_matches(self.headers.get("If-None-Match"), requested_etag, wildcard=False):
+                        self._send_not_modified(
+                            request_id=request_id,
+                            etag=requested_etag,
+                            cache_control=_ASYNC_RESULT_IMMUTABLE_CACHE_CONTROL,
+                        )
+                        return
+
+                all_results_for_job = _async_job_store().list_results(job_id)
                 selected_result = _select_async_result_snapshot(
                     requested_result=requested_result,
                     all_results_for_job=all_results_for_job,
                     projection_mode=projection_mode,
                 )
 
-                self._send_json(
-                    {
-                        "ok": True,
-                        "result_id": selected_result.get("result_id"),
-                        "job_id": selected_result.get("job_id"),
-                        "correlation_id": job_record.get("correlation_id"),
-                        "result_kind": selected_result.get("result_kind"),
-                        "requested_result_id": requested_result.get("result_id"),
-                        "requested_result_kind": requested_result.get("result_kind"),
-                        "projection_mode": projection_mode,
-                        "result": selected_result.get("result_payload", {}),
-                        "request_id": request_id,
-                    },
+                etag = _async_result_etag(
+                    result_id=result_id,
+                    projection_mode=projection_mode,
+                    selected_result_id=str(selected_result.get("result_id") or ""),
+                )
+                immutable = _async_result_projection_is_immutable(
+                    projection_mode=projection_mode,
+                    job_record=job_record,
+                )
+                cache_control = _ASYNC_RESULT_IMMUTABLE_CACHE_CONTROL if immutable else _ASYNC_REVALIDATE_CACHE_CONTROL
+                if _if_none_match_matches(self.headers.get("If-None-Match"), etag):
+                    self._send_not_modified(request_id=request_id, etag=etag, cache_control=cache_control)
+                    return
+
+                envelope = {
+                    "ok": True,
+                    "result_id": selected_result.get("result_id"),
+                    "job_id": selected_result.get("job_id"),
+                    "correlation_id": job_record.get("correlation_id"),
+                    "result_kind": selected_result.get("result_kind"),
+                    "requested_result_id": requested_result.get("result_id"),
+                    "requested_result_kind": requested_result.get("result_kind"),
+                    "projection_mode": projection_mode,
+                }
+                # Blob-Payloads werden nicht geladen, sondern beim Senden aus dem
+                # Blob-Store gestreamt; Prefix und Cache-Eintrag bleiben klein.
+                blob_key = blob_reference(selected_result, getattr(_async_job_store(), "blob_store", None))
+                payload_blob = None
+                if blob_key is not None:
+                    payload_blob = {"key": blob_key, "size_bytes": int(selected_result.get("size_bytes") or 0)}
+                    body_prefix = dumps_wire(envelope)[:-1] + b',"result":'
+                else:
+                    envelope["result"] = selected_result.get("result_payload", {})
+                    body_prefix = dumps_wire(envelope)[:-1]
+                if immutable:
+                    _async_result_cache_put(
+                        cache_key,
+                        {
+                            "etag": etag,
+                            "body_prefix": body_prefix,
+                            "payload_blob": payload_blob,
+                            "correlation_id": job_record.get("correlation_id"),
+                            "visibility": {
+                                "org_id": job_record.get("org_id"),
+                                "owner_user_id": job_record.get("owner_user_id"),
+                                "owner_org_id": job_record.get("owner_org_id"),
+                                "result_org_id": requested_result.get("org_id"),
+                            },
+                        },
+                    )
+
+                self._capture_response_error(payload=None, status=HTTPStatus.OK)
+                if payload_blob is not None:
+                    self._send_async_result_blob(
+                        body_prefix=body_prefix,
+                        payload_blob=payload_blob,
+                        request_id=request_id,
+                        extra_headers={"Cache-Control": cache_control, "ETag": etag},
+                    )
+                    return
+                self._send_json_bytes(
+                    _json_body_with_request_id(body_prefix, request_id),
                     request_id=request_id,
-                    extra_headers={"Cache-Control": "no-store"},
+                    extra_headers={"Cache-Control": cache_control, "ETag": etag},
                 )
                 return
             if request_path == "/api/v1/dictionaries":
@@ -4931,7 +6441,13 @@ class Handler(BaseHTTPRequestHandler):
                 and request_path.endswith("/cancel")
             )
             is_correction_route = request_path.startswith("/compliance/corrections/")
-            if request_path != "/analyze" and not is_cancel_route and not is_correction_route:
+            is_batch_route = request_path == "/analyze/batch"
+            if (
+                request_path != "/analyze"
+                and not is_batch_route
+                and not is_cancel_route
+                and not is_correction_route
+            ):
                 self._send_json(
                     {"ok": False, "error": "not_found", "request_id": request_id},
                     status=HTTPStatus.NOT_FOUND,
@@ -5014,13 +6530,13 @@ class Handler(BaseHTTPRequestHandler):
                     if not sync_history_job_id:
                         return
                     try:
-                        result_record = _ASYNC_JOB_STORE.create_result(
+                        result_record = _async_job_store().create_result(
                             job_id=sync_history_job_id,
                             result_payload=grouped_result_payload,
                             result_kind="final",
                         )
                         result_id = str(result_record.get("result_id") or "")
-                        _ASYNC_JOB_STORE.transition_job(
+                        _async_job_store().transition_job(
                             job_id=sync_history_job_id,
                             to_status="completed",
                             progress_percent=100,
@@ -5034,7 +6550,7 @@ class Handler(BaseHTTPRequestHandler):
                     if not sync_history_job_id:
                         return
                     try:
-                        _ASYNC_JOB_STORE.transition_job(
+                        _async_job_store().transition_job(
                             job_id=sync_history_job_id,
                             to_status="failed",
                             progress_percent=5,
@@ -5096,7 +6612,7 @@ class Handler(BaseHTTPRequestHandler):
                     _ensure_async_runtime_started()
 
                     try:
-                        cancel_outcome = _ASYNC_JOB_STORE.request_cancel(
+                        cancel_outcome = _async_job_store().request_cancel(
                             job_id=job_id,
                             canceled_by=canceled_by,
                             cancel_reason=cancel_reason,
@@ -5115,12 +6631,12 @@ class Handler(BaseHTTPRequestHandler):
                         )
                         return
 
-                    current_job = _ASYNC_JOB_STORE.get_job(job_id) or cancel_outcome.get("job") or {}
+                    current_job = _async_job_store().get_job(job_id) or cancel_outcome.get("job") or {}
                     current_status = str(current_job.get("status") or "")
                     accepted = current_status in {"running", "partial", "queued", "canceled"}
 
                     if current_status in {"running", "partial"}:
-                        _ASYNC_JOB_RUNTIME.enqueue(job_id)
+                        _async_job_runtime().enqueue(job_id, job=current_job)
 
                     status_code = HTTPStatus.ACCEPTED if current_status in {"running", "partial"} else HTTPStatus.OK
                     self._send_json(
@@ -5137,6 +6653,15 @@ class Handler(BaseHTTPRequestHandler):
                     )
                     return
 
+                if is_batch_route:
+                    self._handle_analyze_batch(
+                        data,
+                        request_id=request_id,
+                        phase1_user=phase1_user,
+                        oidc_claims=oidc_claims,
+                    )
+                    return
+
                 def _emit_upstream_for_request(*, event: str, level: str = "info", **fields: Any) -> None:
                     _emit_structured_log(
                         event=event,
@@ -5166,6 +6691,7 @@ class Handler(BaseHTTPRequestHandler):
                 request_options = _extract_request_options(data)
                 _reject_legacy_options(request_options)
                 response_mode = _extract_response_mode(request_options)
+                report_modules = _extract_report_modules(request_options)
 
                 async_mode_requested = _extract_async_mode_request(request_options)
 
@@ -5174,44 +6700,46 @@ class Handler(BaseHTTPRequestHandler):
                 preferences_supplied = "preferences" in data and data.get("preferences") is not None
                 preferences_profile = _extract_preferences(data)
 
-                default_timeout = _as_positive_finite_number(
-                    os.getenv("ANALYZE_DEFAULT_TIMEOUT_SECONDS", "15"),
-                    "ANALYZE_DEFAULT_TIMEOUT_SECONDS",
-                )
-                max_timeout = _as_positive_finite_number(
-                    os.getenv("ANALYZE_MAX_TIMEOUT_SECONDS", "45"),
-                    "ANALYZE_MAX_TIMEOUT_SECONDS",
-                )
-                req_timeout_raw = data.get("timeout_seconds", default_timeout)
-                timeout = _as_positive_finite_number(req_timeout_raw, "timeout_seconds")
-                timeout = min(timeout, max_timeout)
+                timeout = _resolve_analyze_timeout(data)
 
                 if async_mode_requested:
                     request_org_id = self._request_org_id()
                     if _PHASE1_AUTH_ENABLED and phase1_user is not None:
                         request_org_id = phase1_user.org_id
                     _ensure_async_runtime_started()
-                    created_job = _ASYNC_JOB_STORE.create_job(
+                    request_owner_user_id = _resolve_request_owner_user_id(
+                        phase1_user=phase1_user,
+                        oidc_claims=oidc_claims,
+                    )
+                    reused_from: dict[str, Any] | None = None
+                    reuse_max_age = _async_result_reuse_max_age_seconds()
+                    if reuse_max_age > 0:
+                        reused_from = _async_job_store().find_reusable_job(
+                            org_id=request_org_id,
+                            request_payload=data,
+                            max_age_seconds=reuse_max_age,
+                            owner_user_id=request_owner_user_id,
+                        )
+                    created_job = _async_job_store().create_job(
                         request_payload=data,
                         request_id=request_id,
                         query=query,
                         intelligence_mode=mode,
                         org_id=request_org_id,
-                        owner_user_id=_resolve_request_owner_user_id(
-                            phase1_user=phase1_user,
-                            oidc_claims=oidc_claims,
-                        ),
+                        owner_user_id=request_owner_user_id,
                         owner_org_id=phase1_user.org_id if phase1_user else request_org_id,
+                        reused_from=reused_from,
                     )
                     created_job_id = str(created_job.get("job_id") or "")
-                    if created_job_id:
-                        _ASYNC_JOB_RUNTIME.enqueue(created_job_id)
+                    if created_job_id and reused_from is None:
+                        _async_job_runtime().enqueue(created_job_id, job=created_job)
 
                     self._request_lifecycle_correlation_id = str(created_job.get("correlation_id") or "")
                     self._send_json(
                         {
                             "ok": True,
                             "accepted": True,
+                            "result_reused": reused_from is not None,
                             "correlation_id": created_job.get("correlation_id"),
                             "job": _project_async_job_status(created_job, include_events=True),
                             "request_id": request_id,
@@ -5238,7 +6766,7 @@ class Handler(BaseHTTPRequestHandler):
                             request_org_id = "default-org"
 
                     try:
-                        created_job = _ASYNC_JOB_STORE.create_job(
+                        created_job = _async_job_store().create_job(
                             request_payload=data,
                             request_id=request_id,
                             query=query,
@@ -5252,7 +6780,7 @@ class Handler(BaseHTTPRequestHandler):
                         )
                         sync_history_job_id = str(created_job.get("job_id") or "") or None
                         if sync_history_job_id:
-                            _ASYNC_JOB_STORE.transition_job(
+                            _async_job_store().transition_job(
                                 job_id=sync_history_job_id,
                                 to_status="running",
                                 progress_percent=5,
@@ -5265,13 +6793,13 @@ class Handler(BaseHTTPRequestHandler):
                     if not sync_history_job_id:
                         return
                     try:
-                        result_record = _ASYNC_JOB_STORE.create_result(
+                        result_record = _async_job_store().create_result(
                             job_id=sync_history_job_id,
                             result_payload=grouped_result_payload,
                             result_kind="final",
                         )
                         result_id = str(result_record.get("result_id") or "")
-                        _ASYNC_JOB_STORE.transition_job(
+                        _async_job_store().transition_job(
                             job_id=sync_history_job_id,
                             to_status="completed",
                             progress_percent=100,
@@ -5285,7 +6813,7 @@ class Handler(BaseHTTPRequestHandler):
                     if not sync_history_job_id:
                         return
                     try:
-                        _ASYNC_JOB_STORE.transition_job(
+                        _async_job_store().transition_job(
                             job_id=sync_history_job_id,
                             to_status="failed",
                             progress_percent=5,
@@ -5414,6 +6942,7 @@ class Handler(BaseHTTPRequestHandler):
                     trace_id=request_id,
                     request_id=request_id,
                     session_id=session_id,
+                    modules=report_modules,
                 )
                 _apply_personalized_suitability_scores(
                     report,
@@ -5514,7 +7043,8 @@ class Handler(BaseHTTPRequestHandler):
                 request_path.startswith("/analyze/jobs/")
                 and request_path.endswith("/cancel")
             )
-            if request_path not in {"/analyze", "/analyze/history", "/debug/trace"} and not is_cancel_route:
+            preflight_routes = {"/analyze", "/analyze/batch", "/analyze/history", "/debug/trace"}
+            if request_path not in preflight_routes and not is_cancel_route:
                 self._send_json(
                     {"ok": False, "error": "not_found", "request_id": request_id},
                     status=HTTPStatus.NOT_FOUND,
@@ -5654,7 +7184,7 @@ def _build_https_redirect_location(
     return f"https://{authority}{normalized_path}"
 
 
-class RedirectToHttpsHandler(BaseHTTPRequestHandler):
+class RedirectToHttpsHandler(KeepAliveHandlerMixin, BaseHTTPRequestHandler):
     server_version = "geo-ranking-ch-redirect/0.1"
 
     def _send_redirect(self) -> None:
@@ -5716,12 +7246,178 @@ def _start_http_redirect_server(
     return redirect_server
 
 
-def main() -> None:
-    host = os.getenv("HOST", "0.0.0.0")
-    port = _resolve_port()
-    tls_settings = _resolve_tls_settings()
+_API_SERVER_MODE_ENV = "API_SERVER_MODE"
+_API_WORKER_POOL_SIZE_ENV = "API_WORKER_POOL_SIZE"
+_API_WORKER_QUEUE_SIZE_ENV = "API_WORKER_QUEUE_SIZE"
+_API_PRIORITY_WORKERS_ENV = "API_PRIORITY_WORKERS"
+_API_SHED_RETRY_AFTER_ENV = "API_SHED_RETRY_AFTER_SECONDS"
+_API_SERVER_MODES = {"threading", "pool"}
+_LOAD_SHED_LOG_INTERVAL_SECONDS = 5.0
+_LOAD_SHED_LOG_LOCK = threading.Lock()
+_LOAD_SHED_LOG_STATE = {"last_emitted": 0.0, "suppressed": 0}
+
+
+def _read_positive_int_env(name: str, default: int) -> int:
+    raw = str(os.getenv(name, "")).strip()
+    if not raw:
+        return default
+    try:
+        parsed = int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be a positive integer") from exc
+    if parsed < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    return parsed
+
+
+def _resolve_server_settings() -> dict[str, Any]:
+    """Liest Server-Modus + Worker-Pool-Konfiguration aus ENV.
+
+    - API_SERVER_MODE: ``threading`` (Default, ein Thread pro Verbindung) |
+      ``pool`` (feste Worker-Anzahl, begrenzte Queue, Load-Shedding)
+    - API_WORKER_POOL_SIZE (Default 16), API_WORKER_QUEUE_SIZE (Default 64)
+    - API_PRIORITY_WORKERS (Default 2): eigene Worker für Health/Version
+    - API_SHED_RETRY_AFTER_SECONDS (Default 1)
+    """
+
+    mode = str(os.getenv(_API_SERVER_MODE_ENV, "threading")).strip().lower() or "threading"
+    if mode not in _API_SERVER_MODES:
+        raise ValueError(f"{_API_SERVER_MODE_ENV} must be one of: {', '.join(sorted(_API_SERVER_MODES))}")
+    return {
+        "mode": mode,
+        "workers": _read_positive_int_env(_API_WORKER_POOL_SIZE_ENV, 16),
+        "queue_size": _read_positive_int_env(_API_WORKER_QUEUE_SIZE_ENV, 64),
+        "priority_workers": _read_positive_int_env(_API_PRIORITY_WORKERS_ENV, 2),
+        "retry_after_seconds": _read_positive_int_env(_API_SHED_RETRY_AFTER_ENV, 1),
+    }
+
+
+def _log_load_shed(lane: str, stats: dict[str, Any]) -> None:
+    # Unter Überlast nicht pro abgewiesener Verbindung loggen.
+    now = time.monotonic()
+    with _LOAD_SHED_LOG_LOCK:
+        if now - _LOAD_SHED_LOG_STATE["last_emitted"] < _LOAD_SHED_LOG_INTERVAL_SECONDS:
+            _LOAD_SHED_LOG_STATE["suppressed"] += 1
+            return
+        suppressed = int(_LOAD_SHED_LOG_STATE["suppressed"])
+        _LOAD_SHED_LOG_STATE["last_emitted"] = now
+        _LOAD_SHED_LOG_STATE["suppressed"] = 0
+
+    lane_stats = (stats.get("lanes") or {}).get(lane) or {}
+    _emit_structured_log(
+        event="api.server.load_shed",
+        level="warn",
+        component="api.web_service",
+        direction="internal",
+        status="rejected",
+        lane=lane,
+        queue_depth=lane_stats.get("queue_depth"),
+        queue_capacity=lane_stats.get("queue_capacity"),
+        rejected_total=stats.get("rejected_total"),
+        suppressed_events=suppressed,
+    )
+
+
+def _build_api_http_server(
+    host: str,
+    port: int,
+    *,
+    reuse_port: bool = False,
+) -> ThreadingHTTPServer | WorkerPoolHTTPServer:
+    settings = _resolve_server_settings()
+    httpd: ThreadingHTTPServer | WorkerPoolHTTPServer
+    if settings["mode"] != "pool":
+        httpd = ThreadingHTTPServer((host, port), Handler, bind_and_activate=False)
+    else:
+        httpd = WorkerPoolHTTPServer(
+            (host, port),
+            Handler,
+            workers=settings["workers"],
+            queue_size=settings["queue_size"],
+            priority_workers=settings["priority_workers"],
+            retry_after_seconds=settings["retry_after_seconds"],
+            on_shed=_log_load_shed,
+            bind_and_activate=False,
+        )
+    try:
+        if reuse_port:
+            httpd.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        httpd.server_bind()
+        httpd.server_activate()
+    except BaseException:
+        httpd.server_close()
+        raise
+    return httpd
+
 
-    httpd = ThreadingHTTPServer((host, port), Handler)
+_API_SERVER_PROCESSES_ENV = "API_SERVER_PROCESSES"
+
+
+def _resolve_server_process_count() -> int:
+    """Liest ``API_SERVER_PROCESSES`` (Default ``1``; ``auto`` = zugeteilte vCPUs)."""
+
+    raw = str(os.getenv(_API_SERVER_PROCESSES_ENV, "")).strip().lower()
+    if not raw:
+        return 1
+    if raw == "auto":
+        return available_cpu_count()
+    return _read_positive_int_env(_API_SERVER_PROCESSES_ENV, 1)
+
+
+def _ensure_prefork_compatible() -> None:
+    """Pre-Fork nur mit prozessübergreifend geteiltem Zustand zulassen.
+
+    Der file-basierte Async-Store hält den Zustand im Prozess-Speicher (mehrere
+    Prozesse würden sich gegenseitig überschreiben), der BFF-Session-Store ist
+    in-memory (Login-Callback könnte in einem anderen Prozess landen). SQLite
+    (WAL) teilt den Zustand über die Datei und ist daher zulässig.
+
+    Die Worker-Prozesse claimen Jobs per Lease aus dem Store
+    (``ASYNC_WORKER_QUEUE=db``, Default im Pre-Fork): Jobs eines abgestürzten
+    Workers übernimmt nach Ablauf der Lease ein anderer, ohne dass zwei
+    Prozesse denselben Job bearbeiten. Die prozesslokale Queue würde solche
+    Jobs verlieren und ist daher nicht zulässig.
+    """
+
+    if not prefork_supported():
+        raise ValueError(f"{_API_SERVER_PROCESSES_ENV}>1 requires os.fork and SO_REUSEPORT")
+    from src.shared.async_job_store_db import DbAsyncJobStore  # noqa: PLC0415
+    from src.shared.async_job_store_sqlite import SqliteAsyncJobStore  # noqa: PLC0415
+
+    if not isinstance(_async_job_store(), (DbAsyncJobStore, SqliteAsyncJobStore)):
+        raise ValueError(f"{_API_SERVER_PROCESSES_ENV}>1 requires ASYNC_STORE_BACKEND=db or sqlite")
+    if is_bff_oidc_enabled():
+        raise ValueError(
+            f"{_API_SERVER_PROCESSES_ENV}>1 is not supported with BFF OIDC (in-memory session store)"
+        )
+    queue_mode = str(os.getenv(ASYNC_WORKER_QUEUE_ENV, "") or "").strip().lower()
+    if queue_mode not in {"", "db"}:
+        raise ValueError(f"{_API_SERVER_PROCESSES_ENV}>1 requires {ASYNC_WORKER_QUEUE_ENV}=db (lease claims)")
+    # Vor dem Fork setzen: alle Worker-Prozesse erben den Claim-Modus.
+    os.environ[ASYNC_WORKER_QUEUE_ENV] = "db"
+
+
+def _log_prefork_event(event: str, fields: dict[str, Any]) -> None:
+    level = "warn" if event in {"worker_exited", "crash_loop"} else "info"
+    _emit_structured_log(
+        event=f"service.prefork.{event}",
+        level=level,
+        component="api.web_service",
+        direction="internal",
+        status=event,
+        **fields,
+    )
+
+
+def _serve_api(
+    *,
+    host: str,
+    port: int,
+    tls_settings: dict[str, Any] | None,
+    reuse_port: bool = False,
+    worker_index: int = 0,
+) -> None:
+    httpd = _build_api_http_server(host, port, reuse_port=reuse_port)
     scheme = "http"
 
     if tls_settings:
@@ -5732,7 +7428,8 @@ def main() -> None:
         httpd.socket = tls_context.wrap_socket(httpd.socket, server_side=True)
         scheme = "https"
 
-        if tls_settings.get("redirect_enabled"):
+        # Bei Pre-Fork bindet nur Worker 0 den Redirect-Listener (kein SO_REUSEPORT).
+        if tls_settings.get("redirect_enabled") and worker_index == 0:
             redirect_server = _start_http_redirect_server(
                 host=host,
                 http_port=int(tls_settings["redirect_http_port"]),
@@ -5763,9 +7460,65 @@ def main() -> None:
         direction="internal",
         status="listening",
         listen_url=f"{scheme}://{host}:{port}",
+        server_mode="pool" if isinstance(httpd, WorkerPoolHTTPServer) else "threading",
+        worker_index=worker_index,
+        pid=os.getpid(),
     )
     print(f"geo-ranking-ch web service listening on {scheme}://{host}:{port}")
-    httpd.serve_forever()
+    try:
+        httpd.serve_forever()
+    finally:
+        httpd.server_close()
+
+
+def _run_prefork_worker(
+    worker_index: int,
+    generation: int,
+    *,
+    host: str,
+    port: int,
+    tls_settings: dict[str, Any] | None,
+) -> None:
+    # Jeder Worker (auch ein nach Absturz neu gestarteter, ``generation`` > 0)
+    # claimt offene Jobs per Lease; Doppelbearbeitung verhindert der Store.
+    _serve_api(
+        host=host,
+        port=port,
+        tls_settings=tls_settings,
+        reuse_port=True,
+        worker_index=worker_index,
+    )
+
+
+def main() -> None:
+    host = os.getenv("HOST", "0.0.0.0")
+    port = _resolve_port()
+    tls_settings = _resolve_tls_settings()
+    processes = _resolve_server_process_count()
+
+    if processes <= 1:
+        _serve_api(host=host, port=port, tls_settings=tls_settings)
+        return
+
+    _ensure_prefork_compatible()
+    # Lazy geladene Module vor dem Fork importieren: die Worker teilen sich die
+    # Seiten copy-on-write, statt je einzeln beim ersten Request zu importieren.
+    import src.api.address_intel  # noqa: F401,PLC0415
+    import src.shared.gui_mvp  # noqa: F401,PLC0415
+
+    print(f"geo-ranking-ch web service pre-forking {processes} worker processes on port {port}")
+    supervisor = PreforkSupervisor(
+        processes=processes,
+        run_worker=lambda worker_index, generation: _run_prefork_worker(
+            worker_index,
+            generation,
+            host=host,
+            port=port,
+            tls_settings=tls_settings,
+        ),
+        on_event=_log_prefork_event,
+    )
+    raise SystemExit(supervisor.run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,349 @@
+"""HTTP-Server mit fester Worker-Anzahl, begrenzter Queue und Load-Shedding.
+
+Alternative zu ``ThreadingHTTPServer`` (ein Thread pro Verbindung) für
+Lastspitzen: Der Accept-Thread verteilt Verbindungen auf zwei Lanes
+
+- ``priority``: leichte Routen (Health/Version) mit eigenen Workern, damit
+  Probes nie hinter ``/analyze`` warten,
+- ``normal``: alle übrigen Routen.
+
+Ist die Queue einer Lane voll, wird die Verbindung sofort mit ``503`` +
+``Retry-After`` beantwortet und geschlossen (kein unbegrenztes Thread-/
+Speicherwachstum).
+
+Die Lane wird über ``MSG_PEEK`` auf der Request-Line bestimmt, ohne Bytes zu
+konsumieren. Der Accept-Thread peekt nur nicht-blockierend; Verbindungen, deren
+Request-Line noch nicht da ist, übernimmt ein Classifier-Thread (ein Selector
+für alle), der höchstens ``classify_timeout_seconds`` auf Bytes wartet und sie
+danach der ``normal``-Lane gibt. Langsame Clients blockieren so weder Accepts
+noch andere Verbindungen. TLS-Sockets (``SSLSocket``) unterstützen kein Peek;
+dort landen alle Verbindungen in der ``normal``-Lane.
+
+Keep-Alive ist abgeschaltet (``supports_keepalive = False``): Die Lane gilt
+pro Verbindung, und eine idle Verbindung würde einen der begrenzten Worker
+bis zum Idle-Timeout belegen.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import re
+import select
+import selectors
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from http.server import HTTPServer
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+DEFAULT_PRIORITY_PATHS = frozenset({"/health", "/healthz", "/health/details", "/version"})
+
+_PEEK_BYTES = 2048
+_SHED_SEND_TIMEOUT_SECONDS = 1.0
+_REQUEST_LINE_RE = re.compile(rb"^[A-Z]+ (\S+) HTTP/\d\.\d\r?$")
+
+
+def _normalize_route(target: str) -> str:
+    path = urlsplit(target).path or "/"
+    path = re.sub(r"/{2,}", "/", path)
+    if path != "/":
+        path = path.rstrip("/") or "/"
+    return path
+
+
+class WorkerPoolHTTPServer(HTTPServer):
+    """``HTTPServer`` mit Worker-Pool, begrenzten Lane-Queues und Load-Shedding."""
+
+    # Ausgewertet von ``KeepAliveHandlerMixin``: jede Response mit ``Connection: close``.
+    supports_keepalive = False
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: Any,
+        *,
+        workers: int = 16,
+        queue_size: int = 64,
+        priority_workers: int = 2,
+        priority_queue_size: int = 16,
+        priority_paths: frozenset[str] = DEFAULT_PRIORITY_PATHS,
+        retry_after_seconds: int = 1,
+        classify_timeout_seconds: float = 0.05,
+        on_shed: Callable[[str, dict[str, Any]], None] | None = None,
+        bind_and_activate: bool = True,
+    ) -> None:
+        if workers < 1 or priority_workers < 1:
+            raise ValueError("workers and priority_workers must be >= 1")
+        if queue_size < 1 or priority_queue_size < 1:
+            raise ValueError("queue sizes must be >= 1")
+
+        super().__init__(server_address, handler_class, bind_and_activate)
+        self.priority_paths = frozenset(priority_paths)
+        self.retry_after_seconds = max(1, int(retry_after_seconds))
+        self.classify_timeout_seconds = max(0.0, float(classify_timeout_seconds))
+        self.on_shed = on_shed
+
+        # Die Queues selbst sind unbegrenzt; begrenzt wird über ``_in_flight``
+        # (Worker + Queue-Plätze), damit ein Worker, der gerade erst aus
+        # ``get()`` aufwacht, keinen Platz belegt.
+        self._queues: dict[str, queue.Queue] = {"normal": queue.Queue(), "priority": queue.Queue()}
+        self._queue_capacity = {"normal": queue_size, "priority": priority_queue_size}
+        self._worker_counts = {"normal": workers, "priority": priority_workers}
+        self._stats_lock = threading.Lock()
+        self._in_flight = {"normal": 0, "priority": 0}
+        self._busy = {"normal": 0, "priority": 0}
+        self._accepted_total = {"normal": 0, "priority": 0}
+        self._shed_total = {"normal": 0, "priority": 0}
+
+        # Verbindungen ohne Request-Line beim Accept: an den Classifier-Thread.
+        self._max_classify_pending = queue_size + priority_queue_size
+        self._classify_lock = threading.Lock()
+        self._classify_new: deque[tuple[Any, Any, float]] = deque()
+        self._classify_pending = 0
+        self._classify_stop = False
+        self._classify_wake_r, self._classify_wake_w = socket.socketpair()
+        self._classify_wake_r.setblocking(False)
+        self._classify_wake_w.setblocking(False)
+
+        self._threads: list[threading.Thread] = []
+        for lane, count in self._worker_counts.items():
+            for idx in range(count):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    args=(lane,),
+                    name=f"api-{lane}-worker-{idx}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        self._classifier_thread = threading.Thread(
+            target=self._classifier_loop,
+            name="api-pool-classifier",
+            daemon=True,
+        )
+        self._classifier_thread.start()
+
+    # --- Dispatch -----------------------------------------------------------
+
+    def classify_request(self, request: socket.socket) -> str | None:
+        """Lane anhand der (gepeekten) Request-Line; ``None``, solange keine Bytes da sind.
+
+        Blockiert nie: ``select`` mit Timeout 0.
+        """
+        if isinstance(request, ssl.SSLSocket):
+            return "normal"
+        try:
+            ready, _, _ = select.select([request], [], [], 0)
+            if not ready:
+                return None
+            head = request.recv(_PEEK_BYTES, socket.MSG_PEEK)
+        except (OSError, ValueError):
+            return "normal"
+
+        match = _REQUEST_LINE_RE.match(head.split(b"\n", 1)[0])
+        if match is None:
+            return "normal"
+        route = _normalize_route(match.group(1).decode("latin-1"))
+        return "priority" if route in self.priority_paths else "normal"
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        lane = self.classify_request(request)
+        if lane is None:
+            deadline = time.monotonic() + self.classify_timeout_seconds
+            with self._classify_lock:
+                parked = self._classify_pending < self._max_classify_pending and not self._classify_stop
+                if parked:
+                    self._classify_pending += 1
+                    self._classify_new.append((request, client_address, deadline))
+            if parked:
+                self._wake_classifier()
+                return
+            lane = "normal"
+        self._dispatch(request, client_address, lane)
+
+    def _dispatch(self, request: Any, client_address: Any, lane: str) -> None:
+        with self._stats_lock:
+            admitted = self._in_flight[lane] < self._worker_counts[lane] + self._queue_capacity[lane]
+            if admitted:
+                # Vor der Übergabe zählen: der Worker kann antworten, bevor put zurückkehrt.
+                self._in_flight[lane] += 1
+                self._accepted_total[lane] += 1
+        if not admitted:
+            self._shed(request, lane)
+            return
+        self._queues[lane].put_nowait((request, client_address))
+
+    def _wake_classifier(self) -> None:
+        try:
+            self._classify_wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Wake-Puffer voll: der Classifier ist ohnehin schon geweckt.
+
+    def _classifier_loop(self) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(self._classify_wake_r, selectors.EVENT_READ, None)
+        try:
+            while True:
+                with self._classify_lock:
+                    stop = self._classify_stop
+                    new_items = list(self._classify_new)
+                    self._classify_new.clear()
+                for request, client_address, deadline in new_items:
+                    try:
+                        selector.register(request, selectors.EVENT_READ, (client_address, deadline))
+                    except (OSError, ValueError):
+                        self._release_classified(request, client_address, "normal")
+                if stop:
+                    for key in list(selector.get_map().values()):
+                        if key.data is not None:
+                            selector.unregister(key.fileobj)
+                            self._release_classified(key.fileobj, None, None)
+                    return
+
+                parked = [key for key in selector.get_map().values() if key.data is not None]
+                timeout = None
+                if parked:
+                    timeout = max(0.0, min(key.data[1] for key in parked) - time.monotonic())
+                for key, _ in selector.select(timeout):
+                    if key.data is None:
+                        try:
+                            while self._classify_wake_r.recv(512):
+                                pass
+                        except (BlockingIOError, OSError):
+                            pass
+                        continue
+                    selector.unregister(key.fileobj)
+                    self._release_classified(key.fileobj, key.data[0], self.classify_request(key.fileobj) or "normal")
+
+                now = time.monotonic()
+                for key in list(selector.get_map().values()):
+                    if key.data is not None and key.data[1] <= now:
+                        selector.unregister(key.fileobj)
+                        self._release_classified(key.fileobj, key.data[0], "normal")
+        finally:
+            selector.close()
+
+    def _release_classified(self, request: Any, client_address: Any, lane: str | None) -> None:
+        with self._classify_lock:
+            self._classify_pending -= 1
+        if lane is None:
+            self.shutdown_request(request)
+            return
+        self._dispatch(request, client_address, lane)
+
+    def _worker_loop(self, lane: str) -> None:
+        work_queue = self._queues[lane]
+        while True:
+            item = work_queue.get()
+            if item is None:
+                return
+            request, client_address = item
+            with self._stats_lock:
+                self._busy[lane] += 1
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                with self._stats_lock:
+                    self._busy[lane] -= 1
+                    self._in_flight[lane] -= 1
+
+    # --- Load-Shedding ------------------------------------------------------
+
+    def _shed(self, request: Any, lane: str) -> None:
+        body = json.dumps(
+            {
+                "ok": False,
+                "error": "server_overloaded",
+                "message": "server is at capacity, retry later",
+                "retry_after_seconds": self.retry_after_seconds,
+            }
+        ).encode("utf-8")
+        head = (
+            "HTTP/1.1 503 Service Unavailable\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Retry-After: {self.retry_after_seconds}\r\n"
+            "Cache-Control: no-store\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        ).encode("ascii")
+        with self._stats_lock:
+            self._shed_total[lane] += 1
+        if self.on_shed is not None:
+            try:
+                self.on_shed(lane, self.stats())
+            except Exception:
+                pass
+
+        try:
+            request.settimeout(_SHED_SEND_TIMEOUT_SECONDS)
+            self._drain_pending_input(request)
+            request.sendall(head + body)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    @staticmethod
+    def _drain_pending_input(request: Any) -> None:
+        # Bereits empfangene Request-Bytes lesen, damit close() keinen RST
+        # auslöst, bevor der Client die 503-Antwort gelesen hat.
+        if isinstance(request, ssl.SSLSocket):
+            return
+        try:
+            while select.select([request], [], [], 0)[0]:
+                if not request.recv(_PEEK_BYTES):
+                    return
+        except (OSError, ValueError):
+            return
+
+    # --- Metriken / Lifecycle ------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            lanes = {
+                lane: {
+                    "workers": self._worker_counts[lane],
+                    "busy_workers": self._busy[lane],
+                    "queue_depth": self._queues[lane].qsize(),
+                    "queue_capacity": self._queue_capacity[lane],
+                    "accepted_total": self._accepted_total[lane],
+                    "rejected_total": self._shed_total[lane],
+                }
+                for lane in ("normal", "priority")
+            }
+        with self._classify_lock:
+            classify_pending = self._classify_pending
+        return {
+            "mode": "pool",
+            "lanes": lanes,
+            "classify_pending": classify_pending,
+            "rejected_total": sum(lane["rejected_total"] for lane in lanes.values()),
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._classify_lock:
+            self._classify_stop = True
+        self._wake_classifier()
+        self._classifier_thread.join(timeout=2.0)
+        # Nach dem Stop geparkte Verbindungen (Race mit process_request) schliessen.
+        with self._classify_lock:
+            leftovers = list(self._classify_new)
+            self._classify_new.clear()
+        for request, _client_address, _deadline in leftovers:
+            self.shutdown_request(request)
+        self._classify_wake_r.close()
+        self._classify_wake_w.close()
+        for lane, count in self._worker_counts.items():
+            for _ in range(count):
+                self._queues[lane].put(None)
+        for thread in self._threads:
+            thread.join(timeout=2.0)
@@ -2,7 +2,24 @@
 
 Provides the same public interface as ``AsyncJobStore`` (file-backed) in
 ``src/api/async_jobs.py``, but persists data in the Postgres schema defined
-by migrations 002 + 003.
+by migrations 002 + 003, extended by:
+
+- 004: per-job ``last_event_seq`` / ``last_result_seq`` counters, so sequence
+  numbers are allocated on the job row instead of by scanning the job's history;
+- 006: keyset indexes ``(org_id, [user_id,] queued_at DESC, job_id DESC)`` and
+  the trigger-maintained ``job_counts`` table for history pages and totals;
+- 007: ``timestamptz`` instead of ISO text for the job/event/result timestamps,
+  plus BRIN indexes for retention range deletes;
+- 008: ``reused_from_job_id`` and the ``(org_id, request_payload_hash,
+  finished_at)`` lookup index behind ``find_reusable_job``;
+- 011: ``request_payload_json`` holding the request payload when no blob
+  store is configured.
+
+Timestamps cross the store boundary as ISO-8601 UTC strings in both
+directions: parameters are bound as strings (Postgres casts them for
+``timestamptz`` columns and compares them verbatim for the pre-007 ``text``
+columns) and ``datetime`` values read back are rendered by ``_row_to_dict``.
+The store therefore runs against the schema before and after migration 007.
 
 Usage (production)::
 
@@ -30,6 +47,25 @@ Pattern B is used automatically when ASYNC_DB_URL and DATABASE_URL are both abse
 DB_HOST is present.  The resulting URL is built in-process; the password is consumed only
 at connection time and is never logged or stored.
 
+Multi-node claiming (migration 005): ``claim_jobs`` leases open jobs with
+``SELECT ... FOR UPDATE SKIP LOCKED``; workers renew the lease by heartbeat
+(``renew_lease``) and release it when done. Expired leases make a job
+claimable again (``requeue_expired_leases`` additionally announces them).
+``open_job_listener`` returns a dedicated ``LISTEN async_jobs`` connection that
+wakes idle workers on new queued jobs instead of polling;
+``open_job_event_listener`` listens for new job events (migration 010), which
+API nodes feed into their ``/analyze/jobs/<id>/events`` hub.
+
+Connection pool (``src/shared/db_pool.py``): connections are reused across calls;
+size, max lifetime, idle health check and acquire timeout via ``ASYNC_DB_POOL_*``.
+
+Result payloads (``src/shared/result_blob_store.py``): with ``ASYNC_RESULT_BLOB_DIR``
+set, ``create_result`` stores the full payload as a content-addressed blob and
+fills the ``s3_*`` / ``checksum_sha256`` / ``size_bytes`` columns; without it
+only ``summary_json`` is kept, as before.  ``cleanup_retention`` deletes blobs
+referenced by neither ``job_results.s3_key`` nor ``jobs.request_payload_ref``
+(lookups use the partial indexes of migration 009).
+
 Issue: #839 (ASYNC-DB-0.wp2)
 Issue: #867 (DEV-WIRE-0: ECS secrets wiring — component env var support)
 """
@@ -40,12 +76,21 @@ import hashlib
 import json
 import logging
 import os
-import threading
+import select
 import uuid
 from copy import deepcopy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Iterable
 
+from src.shared.db_pool import ConnectionPool, pool_settings_from_env
+from src.shared.json_codec import dumps_canonical
+from src.shared.result_blob_store import (
+    BLOB_GC_MIN_AGE_SECONDS,
+    LocalBlobStore,
+    blob_store_from_env,
+    collect_unreferenced_blobs,
+)
+
 logger = logging.getLogger(__name__)
 
 _TERMINAL_STATES = frozenset({"completed", "failed", "canceled"})
@@ -57,6 +102,18 @@ _ALLOWED_TRANSITIONS: dict[str, frozenset[str]] = {
     "failed":    frozenset(),
     "canceled":  frozenset(),
 }
+_OPEN_STATES_SQL = "('queued', 'running', 'partial')"
+_TERMINAL_STATES_SQL = "('completed', 'failed', 'canceled')"
+
+# Rows per DELETE in cleanup_retention; each batch commits on its own so a
+# retention run never holds locks on millions of rows at once.
+RETENTION_DELETE_BATCH_SIZE = 5000
+
+# NOTIFY channel fed by the triggers of migration 005 (payload: job_id).
+JOB_NOTIFY_CHANNEL = "async_jobs"
+# NOTIFY channel fed by the job_events trigger of migration 010
+# (payload: ``job_id:event_seq``).
+JOB_EVENTS_NOTIFY_CHANNEL = "async_job_events"
 
 
 # ---------------------------------------------------------------------------
@@ -68,19 +125,84 @@ def _utc_now_iso() -> str:
 
 
 def _canonical_payload_hash(payload: dict[str, Any]) -> str:
-    serialized = json.dumps(
-        payload,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
+    serialized = dumps_canonical(payload)
     return hashlib.sha256(serialized).hexdigest()
 
 
+def _to_wire_timestamp(value: datetime) -> str:
+    """Render a timestamptz value like ``_utc_now_iso`` (UTC, ``+00:00``)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
 def _row_to_dict(cursor: Any, row: tuple[Any, ...]) -> dict[str, Any]:
     """Convert a cursor row tuple to a dict using column descriptions."""
     cols = [desc[0] for desc in cursor.description]
-    return dict(zip(cols, row))
+    # timestamptz columns leave the store as UTC ISO strings, independent of
+    # the session time zone, so the wire format matches the text-era schema.
+    return {
+        col: _to_wire_timestamp(value) if isinstance(value, datetime) else value
+        for col, value in zip(cols, row)
+    }
+
+
+def _lease_fence(lease_owner: str | None) -> tuple[str, tuple[str, ...]]:
+    """WHERE fragment restricting a worker write to jobs it still holds the lease on."""
+    if lease_owner is None:
+        return "", ()
+    return " AND lease_owner = %s", (str(lease_owner),)
+
+
+def _append_history_page(
+    sql: str,
+    params: list[Any],
+    *,
+    limit: int,
+    offset: int,
+    before: tuple[str, str] | None,
+) -> tuple[str, list[Any]]:
+    """Newest-first page: keyset on ``(queued_at, job_id)`` or LIMIT/OFFSET."""
+    if before is not None:
+        sql += " AND (queued_at, job_id) < (%s, %s)"
+        params = [*params, str(before[0]), str(before[1])]
+        offset = 0
+    sql += " ORDER BY queued_at DESC, job_id DESC LIMIT %s OFFSET %s"
+    return sql, [*params, int(limit), int(offset)]
+
+
+class JobNotificationListener:
+    """Dedicated autocommit connection listening on one NOTIFY channel.
+
+    Not pooled: a LISTEN session must stay open and idle between waits. One
+    listener per process and channel is enough; on ``JOB_NOTIFY_CHANNEL`` it
+    only wakes workers, the actual claim goes through
+    ``DbAsyncJobStore.claim_jobs``.
+    """
+
+    def __init__(self, conn: Any, *, channel: str = JOB_NOTIFY_CHANNEL) -> None:
+        self._conn = conn
+        self._conn.autocommit = True
+        cur = self._conn.cursor()
+        cur.execute(f"LISTEN {channel}")
+        cur.close()
+
+    def wait(self, timeout: float) -> list[str]:
+        """Block up to ``timeout`` seconds; return the payloads of received notifications."""
+        if not self._conn.notifies:
+            readable, _, _ = select.select([self._conn], [], [], max(0.0, float(timeout)))
+            if not readable:
+                return []
+        self._conn.poll()
+        job_ids = [str(notify.payload) for notify in self._conn.notifies]
+        del self._conn.notifies[:]
+        return job_ids
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -90,13 +212,24 @@ def _row_to_dict(cursor: Any, row: tuple[Any, ...]) -> dict[str, Any]:
 class DbAsyncJobStore:
     """Postgres-backed job store.
 
-    Thread-safe: a threading.Lock serialises write operations; reads use
-    separate short-lived connections from the factory.
+    Thread-safe without a process-wide lock: every call borrows a pooled
+    connection; read-modify-write paths lock the job row with
+    ``SELECT ... FOR UPDATE``, so concurrent transitions of the same job are
+    serialised by Postgres while different jobs proceed in parallel.
     """
 
-    def __init__(self, *, conn_factory: Callable[[], Any]) -> None:
+    def __init__(
+        self,
+        *,
+        conn_factory: Callable[[], Any],
+        pool: ConnectionPool | None = None,
+        blob_store: LocalBlobStore | None = None,
+        **pool_settings: Any,
+    ) -> None:
         self._conn_factory = conn_factory
-        self._lock = threading.Lock()
+        self._pool = pool if pool is not None else ConnectionPool(conn_factory, **pool_settings)
+        self.blob_store = blob_store
+        self._event_listeners: list[Callable[[str, int], None]] = []
 
     # ------------------------------------------------------------------
     # Factory
@@ -161,15 +294,31 @@ class DbAsyncJobStore:
             conn.autocommit = False
             return conn
 
-        return cls(conn_factory=_factory)
+        return cls(conn_factory=_factory, blob_store=blob_store_from_env(), **pool_settings_from_env())
 
     # ------------------------------------------------------------------
     # Internal connection helpers
     # ------------------------------------------------------------------
 
     def _connect(self) -> Any:
+        """Open a dedicated (unpooled) connection, e.g. for health probes."""
         return self._conn_factory()
 
+    def add_event_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Register ``listener(job_id, event_seq)``, called after each commit that wrote events.
+
+        Only writes made through this store instance are reported; events
+        written by other nodes are not.  Listeners must not block.
+        """
+        self._event_listeners.append(listener)
+
+    def _publish_event(self, job_id: str, event_seq: int) -> None:
+        for listener in self._event_listeners:
+            listener(job_id, event_seq)
+
+    def close(self) -> None:
+        self._pool.close()
+
     # ------------------------------------------------------------------
     # create_job
     # ------------------------------------------------------------------
@@ -184,48 +333,69 @@ class DbAsyncJobStore:
         org_id: str = "default-org",
         owner_user_id: str | None = None,
         owner_org_id: str | None = None,
+        reused_from: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Insert a new queued job and its initial event; return the job dict."""
+        """Insert a new queued job and its initial event; return the job dict.
+
+        With ``reused_from`` (a ``find_reusable_job`` hit) the job is inserted as
+        ``completed`` with a ``job.completed`` event and points at the source
+        job's final result; the NOTIFY trigger only fires for queued jobs, so no
+        worker claims it.
+        """
         job_id = str(uuid.uuid4())
         resolved_org_id = str(org_id or "default-org")
         resolved_owner_org = owner_org_id if owner_org_id is not None else resolved_org_id
         resolved_user_id = str(owner_user_id) if owner_user_id else None
         payload_hash = _canonical_payload_hash(request_payload)
+        # Workers read options and batch queries from the stored payload: as a
+        # blob with a blob store, otherwise inline (migration 011).
+        payload_ref = self.blob_store.put_json(request_payload)["s3_key"] if self.blob_store is not None else None
+        payload_json = None if payload_ref is not None else dict(request_payload)
         now = _utc_now_iso()
 
-        with self._lock:
-            conn = self._connect()
-            try:
-                cur = conn.cursor()
-                cur.execute(
-                    """
+        events = [(str(uuid.uuid4()), "job.queued", 1)]
+        if reused_from is not None:
+            status, progress, finished_at = "completed", 100, now
+            result_id, source_job_id = reused_from.get("result_id"), str(reused_from.get("job_id") or "")
+            events.append((str(uuid.uuid4()), "job.completed", 2))
+        else:
+            status, progress, finished_at, result_id, source_job_id = "queued", 0, None, None, None
+
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            # Job row + its events in one round-trip.
+            cur.execute(
+                f"""
+                WITH inserted AS (
                     INSERT INTO jobs (
                         job_id, org_id, user_id, status,
                         request_payload_hash, query, intelligence_mode,
                         progress_percent, partial_count, error_count,
-                        queued_at, updated_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        job_id, resolved_org_id, resolved_user_id, "queued",
-                        payload_hash, str(query or ""), str(intelligence_mode or "basic"),
-                        0, 0, 0,
-                        now, now,
-                    ),
-                )
-                self._insert_event(
-                    cur,
-                    job_id=job_id,
-                    event_type="job.queued",
-                    event_seq=1,
-                    occurred_at=now,
+                        result_id, reused_from_job_id,
+                        queued_at, started_at, finished_at, updated_at, last_event_seq,
+                        request_payload_ref, request_payload_json
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    RETURNING job_id
                 )
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+                INSERT INTO job_events (event_id, job_id, event_type, event_seq, occurred_at)
+                SELECT e.event_id, inserted.job_id, e.event_type, e.event_seq, %s
+                FROM inserted CROSS JOIN (VALUES {", ".join("(%s, %s, %s)" for _ in events)})
+                    AS e(event_id, event_type, event_seq)
+                """,  # noqa: S608
+                (
+                    job_id, resolved_org_id, resolved_user_id, status,
+                    payload_hash, str(query or ""), str(intelligence_mode or "basic"),
+                    progress, 0, 0,
+                    result_id, source_job_id,
+                    now, finished_at, finished_at, now, len(events),
+                    payload_ref,
+                    json.dumps(payload_json, ensure_ascii=False) if payload_json is not None else None,
+                    now,
+                    *(value for event in events for value in event),
+                ),
+            )
+            conn.commit()
+        self._publish_event(job_id, len(events))
 
         return {
             "job_id": job_id,
@@ -233,22 +403,55 @@ class DbAsyncJobStore:
             "owner_org_id": resolved_owner_org,
             "user_id": resolved_user_id,
             "owner_user_id": resolved_user_id,
-            "status": "queued",
+            "status": status,
             "request_payload_hash": payload_hash,
+            "request_payload_ref": payload_ref,
+            "request_payload_json": payload_json,
             "query": query,
             "intelligence_mode": intelligence_mode,
-            "progress_percent": 0,
+            "progress_percent": progress,
             "partial_count": 0,
             "error_count": 0,
-            "result_id": None,
+            "result_id": result_id,
             "error_code": None,
             "error_message": None,
             "queued_at": now,
-            "started_at": None,
-            "finished_at": None,
+            "started_at": finished_at,
+            "finished_at": finished_at,
             "updated_at": now,
+            "reused_from_job_id": source_job_id,
         }
 
+    def find_reusable_job(
+        self,
+        *,
+        org_id: str,
+        request_payload: dict[str, Any],
+        max_age_seconds: float,
+        owner_user_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Newest completed job with the same payload hash inside the freshness window.
+
+        Served by ``jobs_reuse_lookup_idx`` (migration 008). Only jobs that ran
+        the pipeline themselves and whose final result still exists qualify;
+        ``owner_user_id`` restricts the match to that user's jobs.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=float(max_age_seconds))
+        sql = (
+            "SELECT * FROM jobs WHERE org_id = %s AND request_payload_hash = %s"
+            " AND status = 'completed' AND reused_from_job_id IS NULL AND finished_at >= %s"
+            " AND EXISTS (SELECT 1 FROM job_results r WHERE r.result_id = jobs.result_id)"
+        )
+        params: list[Any] = [str(org_id), _canonical_payload_hash(request_payload), cutoff.isoformat()]
+        if owner_user_id:
+            sql += " AND user_id = %s"
+            params.append(str(owner_user_id))
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(sql + " ORDER BY finished_at DESC LIMIT 1", params)
+            row = cur.fetchone()
+            return _row_to_dict(cur, row) if row else None
+
     # ------------------------------------------------------------------
     # transition_job
     # ------------------------------------------------------------------
@@ -267,93 +470,99 @@ class DbAsyncJobStore:
         canceled_by: str | None = None,
         cancel_reason: str | None = None,
         actor_type: str = "system",
+        lease_owner: str | None = None,
     ) -> dict[str, Any]:
-        """Transition a job's status; insert event; return updated job dict."""
-        with self._lock:
-            conn = self._connect()
-            try:
-                cur = conn.cursor()
-
-                # Fetch current row (org_id guard always present)
-                cur.execute(
-                    "SELECT * FROM jobs WHERE job_id = %s",
-                    (str(job_id),),
-                )
-                row = cur.fetchone()
-                if row is None:
-                    raise KeyError(f"unknown job_id: {job_id}")
-                job = _row_to_dict(cur, row)
-
-                current_status = str(job.get("status", "queued"))
-                allowed = _ALLOWED_TRANSITIONS.get(current_status, frozenset())
-                if to_status not in allowed:
-                    raise ValueError(
-                        f"invalid transition from {current_status!r} to {to_status!r}"
-                    )
+        """Transition a job's status; insert event; return updated job dict.
 
-                now = _utc_now_iso()
-                updates: dict[str, Any] = {"status": to_status, "updated_at": now}
-
-                if progress_percent is not None:
-                    if not isinstance(progress_percent, int):
-                        raise ValueError("progress_percent must be int")
-                    if not 0 <= progress_percent <= 100:
-                        raise ValueError("progress_percent must be within 0..100")
-                    existing_progress = int(job.get("progress_percent") or 0)
-                    if progress_percent < existing_progress:
-                        raise ValueError("progress_percent must be monotonic")
-                    updates["progress_percent"] = progress_percent
-
-                if to_status == "running" and not job.get("started_at"):
-                    updates["started_at"] = now
-
-                if to_status == "partial":
-                    updates["partial_count"] = int(job.get("partial_count") or 0) + 1
-
-                if to_status in _TERMINAL_STATES:
-                    updates["finished_at"] = now
-
-                if to_status == "failed":
-                    updates["error_count"] = int(job.get("error_count") or 0) + 1
-                    updates["error_code"] = str(error_code or "runtime_error")
-                    updates["error_message"] = str(error_message or "async job failed")
-
-                if result_id is not None:
-                    updates["result_id"] = str(result_id)
+        ``lease_owner`` fences claim-mode workers: the transition fails with
+        ``ValueError`` unless the job is still leased to that worker.
+        """
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
 
-                # Build SET clause
-                set_clause = ", ".join(f"{k} = %s" for k in updates)
-                params = list(updates.values()) + [str(job_id)]
-                cur.execute(
-                    f"UPDATE jobs SET {set_clause} WHERE job_id = %s",  # noqa: S608
-                    params,
+            # Fetch + row-lock the job: concurrent transitions of the same
+            # job wait here until this transaction commits.
+            lease_clause, lease_params = _lease_fence(lease_owner)
+            cur.execute(
+                f"SELECT * FROM jobs WHERE job_id = %s{lease_clause} FOR UPDATE",  # noqa: S608
+                (str(job_id), *lease_params),
+            )
+            row = cur.fetchone()
+            if row is None:
+                if lease_owner is not None:
+                    raise ValueError(f"job lease not held by {lease_owner}: {job_id}")
+                raise KeyError(f"unknown job_id: {job_id}")
+            job = _row_to_dict(cur, row)
+
+            current_status = str(job.get("status", "queued"))
+            allowed = _ALLOWED_TRANSITIONS.get(current_status, frozenset())
+            if to_status not in allowed:
+                raise ValueError(
+                    f"invalid transition from {current_status!r} to {to_status!r}"
                 )
 
-                # Event sequence: count existing events + 1
-                cur.execute(
-                    "SELECT COUNT(*) FROM job_events WHERE job_id = %s",
-                    (str(job_id),),
-                )
-                count_row = cur.fetchone()
-                next_seq = (int(count_row[0]) if count_row else 0) + 1
-
-                self._insert_event(
-                    cur,
-                    job_id=str(job_id),
-                    event_type=f"job.{to_status}",
-                    event_seq=next_seq,
-                    occurred_at=now,
+            now = _utc_now_iso()
+            updates: dict[str, Any] = {"status": to_status, "updated_at": now}
+
+            if progress_percent is not None:
+                if not isinstance(progress_percent, int):
+                    raise ValueError("progress_percent must be int")
+                if not 0 <= progress_percent <= 100:
+                    raise ValueError("progress_percent must be within 0..100")
+                existing_progress = int(job.get("progress_percent") or 0)
+                if progress_percent < existing_progress:
+                    raise ValueError("progress_percent must be monotonic")
+                updates["progress_percent"] = progress_percent
+
+            if to_status == "running" and not job.get("started_at"):
+                updates["started_at"] = now
+
+            if to_status == "partial":
+                updates["partial_count"] = int(job.get("partial_count") or 0) + 1
+
+            if to_status in _TERMINAL_STATES:
+                updates["finished_at"] = now
+
+            if to_status == "failed":
+                updates["error_count"] = int(job.get("error_count") or 0) + 1
+                updates["error_code"] = str(error_code or "runtime_error")
+                updates["error_message"] = str(error_message or "async job failed")
+
+            if result_id is not None:
+                updates["result_id"] = str(result_id)
+
+            # Status change + event in one round-trip: the UPDATE bumps the
+            # job's event counter and the INSERT uses the returned value.
+            set_clause = ", ".join(f"{k} = %s" for k in updates)
+            params = list(updates.values()) + [
+                str(job_id),
+                str(uuid.uuid4()),
+                f"job.{to_status}",
+                now,
+            ]
+            cur.execute(
+                f"""
+                WITH updated AS (
+                    UPDATE jobs SET {set_clause}, last_event_seq = last_event_seq + 1
+                    WHERE job_id = %s
+                    RETURNING job_id, last_event_seq
                 )
-                conn.commit()
+                INSERT INTO job_events (event_id, job_id, event_type, event_seq, occurred_at)
+                SELECT %s, job_id, %s, last_event_seq, %s FROM updated
+                RETURNING event_seq
+                """,  # noqa: S608
+                params,
+            )
+            seq_row = cur.fetchone()
+            conn.commit()
+            if seq_row:
+                self._publish_event(str(job_id), int(seq_row[0]))
 
-                # Return merged state
-                merged = {**job, **updates}
-                return deepcopy(merged)
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+            # Return merged state
+            merged = {**job, **updates}
+            if seq_row:
+                merged["last_event_seq"] = seq_row[0]
+            return deepcopy(merged)
 
     # ------------------------------------------------------------------
     # request_cancel / consume_cancel_request
@@ -369,24 +578,17 @@ class DbAsyncJobStore:
     ) -> dict[str, Any]:
         """Mark job as cancel-requested (non-terminal)."""
         now = _utc_now_iso()
-        with self._lock:
-            conn = self._connect()
-            try:
-                cur = conn.cursor()
-                sql = "UPDATE jobs SET cancel_requested_at = %s, updated_at = %s WHERE job_id = %s"
-                params: list[Any] = [now, now, str(job_id)]
-                if org_id:
-                    sql += " AND org_id = %s"
-                    params.append(str(org_id))
-                cur.execute(sql, params)
-                if cur.rowcount == 0:
-                    raise KeyError(f"unknown or unauthorized job_id: {job_id}")
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            sql = "UPDATE jobs SET cancel_requested_at = %s, updated_at = %s WHERE job_id = %s"
+            params: list[Any] = [now, now, str(job_id)]
+            if org_id:
+                sql += " AND org_id = %s"
+                params.append(str(org_id))
+            cur.execute(sql, params)
+            if cur.rowcount == 0:
+                raise KeyError(f"unknown or unauthorized job_id: {job_id}")
+            conn.commit()
 
         job = self.get_job(job_id)
         if job is None:
@@ -395,30 +597,123 @@ class DbAsyncJobStore:
 
     def consume_cancel_request(self, *, job_id: str) -> bool:
         """Clear cancel_requested_at; return True if it was set."""
-        with self._lock:
-            conn = self._connect()
-            try:
-                cur = conn.cursor()
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT cancel_requested_at FROM jobs WHERE job_id = %s FOR UPDATE",
+                (str(job_id),),
+            )
+            row = cur.fetchone()
+            if row is None:
+                return False
+            was_set = bool(row[0])
+            if was_set:
                 cur.execute(
-                    "SELECT cancel_requested_at FROM jobs WHERE job_id = %s",
-                    (str(job_id),),
+                    "UPDATE jobs SET cancel_requested_at = NULL, updated_at = %s WHERE job_id = %s",
+                    (_utc_now_iso(), str(job_id)),
                 )
-                row = cur.fetchone()
-                if row is None:
-                    return False
-                was_set = bool(row[0])
-                if was_set:
-                    cur.execute(
-                        "UPDATE jobs SET cancel_requested_at = NULL, updated_at = %s WHERE job_id = %s",
-                        (_utc_now_iso(), str(job_id)),
-                    )
-                    conn.commit()
-                return was_set
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+                conn.commit()
+            return was_set
+
+    # ------------------------------------------------------------------
+    # Multi-node claiming (leases)
+    # ------------------------------------------------------------------
+
+    def claim_jobs(
+        self,
+        *,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = 30.0,
+    ) -> list[dict[str, Any]]:
+        """Lease up to ``limit`` open jobs for ``worker_id``; return the claimed jobs.
+
+        Rows locked by a concurrent claim are skipped instead of waited for, so
+        several nodes can claim in parallel without handing out a job twice.
+        Open jobs without a lease or with an expired lease are claimable.
+        """
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"""
+                WITH candidates AS (
+                    SELECT job_id FROM jobs
+                    WHERE status IN {_OPEN_STATES_SQL}
+                      AND (lease_expires_at IS NULL OR lease_expires_at < now())
+                    ORDER BY queued_at
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE jobs
+                SET lease_owner = %s,
+                    lease_expires_at = now() + %s * interval '1 second',
+                    claim_count = claim_count + 1
+                FROM candidates
+                WHERE jobs.job_id = candidates.job_id
+                RETURNING jobs.*
+                """,  # noqa: S608
+                (max(1, int(limit)), str(worker_id), float(lease_seconds)),
+            )
+            rows = cur.fetchall()
+            claimed = [_row_to_dict(cur, row) for row in rows]
+            conn.commit()
+            return claimed
+
+    def renew_lease(self, *, job_id: str, worker_id: str, lease_seconds: float = 30.0) -> bool:
+        """Heartbeat: extend the lease; False if ``worker_id`` no longer holds it."""
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                UPDATE jobs SET lease_expires_at = now() + %s * interval '1 second'
+                WHERE job_id = %s AND lease_owner = %s
+                """,
+                (float(lease_seconds), str(job_id), str(worker_id)),
+            )
+            renewed = cur.rowcount > 0
+            conn.commit()
+            return renewed
+
+    def release_lease(self, *, job_id: str, worker_id: str) -> bool:
+        """Drop the lease held by ``worker_id``; open jobs become claimable again."""
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                UPDATE jobs SET lease_owner = NULL, lease_expires_at = NULL
+                WHERE job_id = %s AND lease_owner = %s
+                """,
+                (str(job_id), str(worker_id)),
+            )
+            released = cur.rowcount > 0
+            conn.commit()
+            return released
+
+    def requeue_expired_leases(self) -> int:
+        """Clear expired leases (crashed/stalled workers); return the number of jobs.
+
+        Clearing the owner fires the NOTIFY trigger for open jobs, so idle
+        workers on every node pick them up right away.
+        """
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                UPDATE jobs SET lease_owner = NULL, lease_expires_at = NULL
+                WHERE lease_owner IS NOT NULL AND lease_expires_at < now()
+                """
+            )
+            requeued = max(0, int(cur.rowcount or 0))
+            conn.commit()
+            return requeued
+
+    def open_job_listener(self) -> JobNotificationListener:
+        """Open a dedicated LISTEN connection for job wake-ups."""
+        return JobNotificationListener(self._connect())
+
+    def open_job_event_listener(self) -> JobNotificationListener:
+        """Open a dedicated LISTEN connection for job events (payload ``job_id:event_seq``)."""
+        return JobNotificationListener(self._connect(), channel=JOB_EVENTS_NOTIFY_CHANNEL)
 
     # ------------------------------------------------------------------
     # list_job_ids
@@ -431,8 +726,7 @@ class DbAsyncJobStore:
         org_id: str | None = None,
     ) -> list[str]:
         """Return job_ids optionally filtered by status and/or org_id."""
-        conn = self._connect()
-        try:
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             sql = "SELECT job_id FROM jobs WHERE 1=1"
             params: list[Any] = []
@@ -448,8 +742,6 @@ class DbAsyncJobStore:
                 params.extend(status_list)
             cur.execute(sql, params)
             return [row[0] for row in cur.fetchall()]
-        finally:
-            conn.close()
 
     # ------------------------------------------------------------------
     # create_result
@@ -469,69 +761,79 @@ class DbAsyncJobStore:
         checksum_sha256: str | None = None,
         content_type: str = "application/json",
         size_bytes: int | None = None,
+        lease_owner: str | None = None,
     ) -> dict[str, Any]:
-        """Insert a job result; return the result record."""
+        """Insert a job result; return the result record.
+
+        With a blob store and no explicit ``s3_key`` the full payload is
+        written to the blob store first and the row references it.
+        ``lease_owner`` fences claim-mode workers as in ``transition_job``.
+        """
         normalized_kind = str(result_kind or "").strip().lower()
         if normalized_kind not in {"partial", "final"}:
             raise ValueError("result_kind must be 'partial' or 'final'")
 
+        if self.blob_store is not None and s3_key is None:
+            blob_ref = self.blob_store.put_json(result_payload)
+            s3_bucket = blob_ref["s3_bucket"]
+            s3_key = blob_ref["s3_key"]
+            checksum_sha256 = blob_ref["checksum_sha256"]
+            size_bytes = blob_ref["size_bytes"]
+
         result_id = str(uuid.uuid4())
         now = _utc_now_iso()
         summary = json.dumps(result_payload.get("summary") or {}, ensure_ascii=False)
 
-        with self._lock:
-            conn = self._connect()
-            try:
-                cur = conn.cursor()
-
-                # Validate job exists
-                cur.execute("SELECT org_id, user_id FROM jobs WHERE job_id = %s", (str(job_id),))
-                job_row = cur.fetchone()
-                if job_row is None:
-                    raise KeyError(f"unknown job_id: {job_id}")
-
-                resolved_org_id = str(org_id or job_row[0] or "")
-                resolved_user_id = str(user_id or job_row[1] or "") or None
-
-                # Guard: no duplicate final result
-                if normalized_kind == "final":
-                    cur.execute(
-                        "SELECT 1 FROM job_results WHERE job_id = %s AND result_kind = 'final' AND org_id = %s",
-                        (str(job_id), resolved_org_id),
-                    )
-                    if cur.fetchone():
-                        raise ValueError("final result already exists for job")
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
 
-                # Next sequence number
+            # Validate job exists and allocate result_seq from the job's counter;
+            # the UPDATE row lock serialises allocation per job.
+            lease_clause, lease_params = _lease_fence(lease_owner)
+            cur.execute(
+                f"""
+                UPDATE jobs SET last_result_seq = last_result_seq + 1
+                WHERE job_id = %s{lease_clause}
+                RETURNING org_id, user_id, last_result_seq
+                """,  # noqa: S608
+                (str(job_id), *lease_params),
+            )
+            job_row = cur.fetchone()
+            if job_row is None:
+                if lease_owner is not None:
+                    raise ValueError(f"job lease not held by {lease_owner}: {job_id}")
+                raise KeyError(f"unknown job_id: {job_id}")
+            next_seq = int(job_row[2])
+
+            resolved_org_id = str(org_id or job_row[0] or "")
+            resolved_user_id = str(user_id or job_row[1] or "") or None
+
+            # Guard: no duplicate final result
+            if normalized_kind == "final":
                 cur.execute(
-                    "SELECT COALESCE(MAX(result_seq), 0) FROM job_results WHERE job_id = %s AND org_id = %s",
+                    "SELECT 1 FROM job_results WHERE job_id = %s AND result_kind = 'final' AND org_id = %s",
                     (str(job_id), resolved_org_id),
                 )
-                max_seq_row = cur.fetchone()
-                next_seq = int(max_seq_row[0] if max_seq_row else 0) + 1
+                if cur.fetchone():
+                    raise ValueError("final result already exists for job")
 
-                cur.execute(
-                    """
-                    INSERT INTO job_results (
-                        result_id, job_id, org_id, user_id,
-                        result_kind, result_seq, schema_version,
-                        s3_bucket, s3_key, checksum_sha256, content_type, size_bytes,
-                        summary_json, created_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        result_id, str(job_id), resolved_org_id, resolved_user_id,
-                        normalized_kind, next_seq, str(schema_version or "v1"),
-                        s3_bucket, s3_key, checksum_sha256, content_type, size_bytes,
-                        summary, now,
-                    ),
-                )
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
-            finally:
-                conn.close()
+            cur.execute(
+                """
+                INSERT INTO job_results (
+                    result_id, job_id, org_id, user_id,
+                    result_kind, result_seq, schema_version,
+                    s3_bucket, s3_key, checksum_sha256, content_type, size_bytes,
+                    summary_json, created_at
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    result_id, str(job_id), resolved_org_id, resolved_user_id,
+                    normalized_kind, next_seq, str(schema_version or "v1"),
+                    s3_bucket, s3_key, checksum_sha256, content_type, size_bytes,
+                    summary, now,
+                ),
+            )
+            conn.commit()
 
         return {
             "result_id": result_id,
@@ -555,24 +857,19 @@ class DbAsyncJobStore:
     # ------------------------------------------------------------------
 
     def get_job(self, job_id: str) -> dict[str, Any] | None:
-        conn = self._connect()
-        try:
+        """Job row as dict; includes ``request_payload_json`` (migration 011) when stored inline."""
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             cur.execute("SELECT * FROM jobs WHERE job_id = %s", (str(job_id),))
             row = cur.fetchone()
             return _row_to_dict(cur, row) if row else None
-        finally:
-            conn.close()
 
     def get_result(self, result_id: str) -> dict[str, Any] | None:
-        conn = self._connect()
-        try:
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             cur.execute("SELECT * FROM job_results WHERE result_id = %s", (str(result_id),))
             row = cur.fetchone()
             return _row_to_dict(cur, row) if row else None
-        finally:
-            conn.close()
 
     def get_result_with_org_guard(
         self,
@@ -581,8 +878,7 @@ class DbAsyncJobStore:
         org_id: str,
     ) -> dict[str, Any] | None:
         """Fetch result only if org_id matches (tenant guard)."""
-        conn = self._connect()
-        try:
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT * FROM job_results WHERE result_id = %s AND org_id = %s",
@@ -590,36 +886,28 @@ class DbAsyncJobStore:
             )
             row = cur.fetchone()
             return _row_to_dict(cur, row) if row else None
-        finally:
-            conn.close()
 
     # ------------------------------------------------------------------
     # list_results / list_events
     # ------------------------------------------------------------------
 
-    def list_results(self, job_id: str) -> list[dict[str, Any]]:
-        conn = self._connect()
-        try:
+    def list_results(self, job_id: str, *, after_seq: int = 0) -> list[dict[str, Any]]:
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             cur.execute(
-                "SELECT * FROM job_results WHERE job_id = %s ORDER BY result_seq ASC",
-                (str(job_id),),
+                "SELECT * FROM job_results WHERE job_id = %s AND result_seq > %s ORDER BY result_seq ASC",
+                (str(job_id), int(after_seq)),
             )
             return [_row_to_dict(cur, row) for row in cur.fetchall()]
-        finally:
-            conn.close()
 
-    def list_events(self, job_id: str) -> list[dict[str, Any]]:
-        conn = self._connect()
-        try:
+    def list_events(self, job_id: str, *, after_seq: int = 0) -> list[dict[str, Any]]:
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             cur.execute(
-                "SELECT * FROM job_events WHERE job_id = %s ORDER BY event_seq ASC",
-                (str(job_id),),
+                "SELECT * FROM job_events WHERE job_id = %s AND event_seq > %s ORDER BY event_seq ASC",
+                (str(job_id), int(after_seq)),
             )
             return [_row_to_dict(cur, row) for row in cur.fetchall()]
-        finally:
-            conn.close()
 
     # ------------------------------------------------------------------
     # list_jobs_for_org / list_jobs_for_user  (DB-only, not in file store)
@@ -632,10 +920,14 @@ class DbAsyncJobStore:
         limit: int = 20,
         offset: int = 0,
         status: str | None = None,
+        before: tuple[str, str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Return jobs for an org, newest first (paginated)."""
-        conn = self._connect()
-        try:
+        """Return jobs for an org, newest first (paginated).
+
+        ``before=(queued_at, job_id)`` continues after the last row of the
+        previous page (keyset; ``offset`` is ignored).
+        """
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             sql = (
                 "SELECT * FROM jobs WHERE org_id = %s"
@@ -644,28 +936,30 @@ class DbAsyncJobStore:
             if status:
                 sql += " AND status = %s"
                 params.append(str(status))
-            sql += " ORDER BY queued_at DESC LIMIT %s OFFSET %s"
-            params += [int(limit), int(offset)]
+            sql, params = _append_history_page(sql, params, limit=limit, offset=offset, before=before)
             cur.execute(sql, params)
             return [_row_to_dict(cur, row) for row in cur.fetchall()]
-        finally:
-            conn.close()
 
     def count_jobs_for_org(self, org_id: str, *, status: str | None = None) -> int:
-        """Return total job count for an org (for pagination metadata)."""
-        conn = self._connect()
-        try:
+        """Return total job count for an org (for pagination metadata).
+
+        Unfiltered totals are read from the trigger-maintained ``job_counts``
+        table (migration 006); a status filter falls back to ``COUNT(*)``.
+        """
+        with self._pool.connection() as conn:
             cur = conn.cursor()
-            sql = "SELECT COUNT(*) FROM jobs WHERE org_id = %s"
-            params: list[Any] = [str(org_id)]
             if status:
-                sql += " AND status = %s"
-                params.append(str(status))
-            cur.execute(sql, params)
+                cur.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE org_id = %s AND status = %s",
+                    (str(org_id), str(status)),
+                )
+            else:
+                cur.execute(
+                    "SELECT COALESCE(SUM(job_count), 0) FROM job_counts WHERE org_id = %s",
+                    (str(org_id),),
+                )
             row = cur.fetchone()
             return int(row[0]) if row else 0
-        finally:
-            conn.close()
 
     def list_jobs_for_user(
         self,
@@ -675,25 +969,23 @@ class DbAsyncJobStore:
         limit: int = 20,
         offset: int = 0,
         status: str | None = None,
+        before: tuple[str, str] | None = None,
     ) -> list[dict[str, Any]]:
         """Return jobs for a specific user within an org (paginated).
 
         Both user_id AND org_id are required — this enforces the tenant boundary.
+        ``before`` works as in ``list_jobs_for_org``.
         """
-        conn = self._connect()
-        try:
+        with self._pool.connection() as conn:
             cur = conn.cursor()
             sql = "SELECT * FROM jobs WHERE user_id = %s AND org_id = %s"
             params: list[Any] = [str(user_id), str(org_id)]
             if status:
                 sql += " AND status = %s"
                 params.append(str(status))
-            sql += " ORDER BY queued_at DESC LIMIT %s OFFSET %s"
-            params += [int(limit), int(offset)]
+            sql, params = _append_history_page(sql, params, limit=limit, offset=offset, before=before)
             cur.execute(sql, params)
             return [_row_to_dict(cur, row) for row in cur.fetchall()]
-        finally:
-            conn.close()
 
     def count_jobs_for_user(
         self,
@@ -702,39 +994,174 @@ class DbAsyncJobStore:
         org_id: str,
         status: str | None = None,
     ) -> int:
-        """Return total job count for a user within an org."""
-        conn = self._connect()
-        try:
+        """Return total job count for a user within an org (``job_counts`` unless filtered)."""
+        with self._pool.connection() as conn:
             cur = conn.cursor()
-            sql = "SELECT COUNT(*) FROM jobs WHERE user_id = %s AND org_id = %s"
-            params: list[Any] = [str(user_id), str(org_id)]
             if status:
-                sql += " AND status = %s"
-                params.append(str(status))
-            cur.execute(sql, params)
+                cur.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE user_id = %s AND org_id = %s AND status = %s",
+                    (str(user_id), str(org_id), str(status)),
+                )
+            else:
+                cur.execute(
+                    "SELECT job_count FROM job_counts WHERE user_id = %s AND org_id = %s",
+                    (str(user_id), str(org_id)),
+                )
             row = cur.fetchone()
             return int(row[0]) if row else 0
-        finally:
-            conn.close()
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Retention cleanup
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _insert_event(
-        cur: Any,
+    def _normalize_ttl_seconds(value: float | int | None, *, field_name: str) -> float | None:
+        if value is None:
+            return None
+        try:
+            parsed = float(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{field_name} must be a numeric value") from exc
+        if parsed < 0:
+            raise ValueError(f"{field_name} must be >= 0")
+        return parsed
+
+    def cleanup_retention(
+        self,
         *,
-        job_id: str,
-        event_type: str,
-        event_seq: int,
-        occurred_at: str,
-    ) -> None:
-        event_id = str(uuid.uuid4())
-        cur.execute(
-            """
-            INSERT INTO job_events (event_id, job_id, event_type, event_seq, occurred_at)
-            VALUES (%s, %s, %s, %s, %s)
-            """,
-            (event_id, str(job_id), str(event_type), int(event_seq), str(occurred_at)),
+        results_ttl_seconds: float | int | None,
+        events_ttl_seconds: float | int | None,
+        dry_run: bool = False,
+        now: datetime | None = None,
+        batch_size: int = RETENTION_DELETE_BATCH_SIZE,
+        blob_min_age_seconds: float = BLOB_GC_MIN_AGE_SECONDS,
+    ) -> dict[str, Any]:
+        """Delete expired results/events of terminal jobs (same summary as the file store).
+
+        The cutoff is a range predicate on ``created_at`` / ``occurred_at``
+        (BRIN-indexed since migration 007); deletes run in batches of
+        ``batch_size`` rows, each in its own transaction.
+
+        All counts are exact ints.  A real run deletes first and counts the
+        remaining results/events afterwards (``total = remaining +
+        delete_count``), so the batched deletes never wait for a full-table
+        ``COUNT(*)`` over those tables; the
+        planner estimate taken before the run (``pg_class.reltuples``) is
+        reported separately as ``estimated_total`` / ``estimated_job_count``.
+        ``created_at`` / ``occurred_at`` are NOT NULL, so no row is ever
+        skipped for a missing timestamp.
+
+        With a blob store, blobs referenced by neither ``job_results.s3_key``
+        nor ``jobs.request_payload_ref`` are collected afterwards (summary
+        under ``blobs``); a dry run counts the results it would delete as
+        unreferenced.
+        """
+        now_dt = now or datetime.now(timezone.utc)
+        if now_dt.tzinfo is None:
+            now_dt = now_dt.replace(tzinfo=timezone.utc)
+        now_dt = now_dt.astimezone(timezone.utc)
+
+        results_ttl = self._normalize_ttl_seconds(results_ttl_seconds, field_name="results_ttl_seconds")
+        events_ttl = self._normalize_ttl_seconds(events_ttl_seconds, field_name="events_ttl_seconds")
+        results_cutoff = now_dt - timedelta(seconds=results_ttl) if results_ttl is not None else None
+        events_cutoff = now_dt - timedelta(seconds=events_ttl) if events_ttl is not None else None
+
+        terminal = f"SELECT job_id FROM jobs WHERE status IN {_TERMINAL_STATES_SQL}"
+        estimates: dict[str, int] = {}
+        with self._pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"SELECT COUNT(*), COUNT(*) FILTER (WHERE status IN {_TERMINAL_STATES_SQL}) FROM jobs"  # noqa: S608
+            )
+            job_total, terminal_jobs = cur.fetchone()
+            if not dry_run:
+                cur.execute(
+                    "SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class "
+                    "WHERE relname IN ('jobs', 'job_results', 'job_events') AND relkind = 'r'"
+                )
+                estimates = {str(name): int(count) for name, count in cur.fetchall()}
+
+        def _delete_expired(table: str, expired: str, cutoff: datetime) -> int:
+            delete_count = 0
+            while True:
+                with self._pool.connection() as conn:
+                    cur = conn.cursor()
+                    cur.execute(
+                        f"DELETE FROM {table} WHERE ctid IN "  # noqa: S608
+                        f"(SELECT ctid FROM {table} WHERE {expired} LIMIT %s)",
+                        (cutoff.isoformat(), int(batch_size)),
+                    )
+                    deleted = int(cur.rowcount or 0)
+                    conn.commit()
+                delete_count += deleted
+                if deleted < batch_size:
+                    return delete_count
+
+        def _table_stats(table: str, ts_column: str, cutoff: datetime | None) -> dict[str, Any]:
+            expired = f"{ts_column} <= %s AND job_id IN ({terminal})"
+            delete_count = 0
+            if cutoff is not None and not dry_run:
+                delete_count = _delete_expired(table, expired, cutoff)
+            with self._pool.connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    f"SELECT COUNT(*), COUNT(*) FILTER (WHERE job_id IN ({terminal})) FROM {table}"  # noqa: S608
+                )
+                remaining, remaining_terminal = cur.fetchone()
+                if cutoff is not None and dry_run:
+                    cur.execute(f"SELECT COUNT(*) FROM {table} WHERE {expired}", (cutoff.isoformat(),))  # noqa: S608
+                    delete_count = int(cur.fetchone()[0])
+            # In a real run the deleted rows are gone from ``remaining``.
+            deleted_rows = 0 if dry_run else delete_count
+            stats: dict[str, Any] = {
+                "total": int(remaining) + deleted_rows,
+                "eligible_terminal": int(remaining_terminal) + deleted_rows,
+                "delete_count": int(delete_count),
+                "kept_count": int(remaining) + deleted_rows - int(delete_count),
+                "skipped_missing_timestamp": 0,
+                "cutoff": cutoff.isoformat() if cutoff else None,
+            }
+            if not dry_run:
+                stats["estimated_total"] = estimates.get(table, 0)
+            return stats
+
+        results_summary = _table_stats("job_results", "created_at", results_cutoff)
+        events_summary = _table_stats("job_events", "occurred_at", events_cutoff)
+
+        # A dry run must not count the results it would delete as references.
+        expired_sql = ""
+        expired_params: tuple[str, ...] = ()
+        if dry_run and results_cutoff is not None:
+            expired_sql = f" AND NOT (created_at <= %s AND job_id IN ({terminal}))"
+            expired_params = (results_cutoff.isoformat(),)
+
+        def _referenced(keys: list[str]) -> set[str]:
+            with self._pool.connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    f"SELECT s3_key FROM job_results WHERE s3_key = ANY(%s){expired_sql} "  # noqa: S608
+                    "UNION SELECT request_payload_ref FROM jobs WHERE request_payload_ref = ANY(%s)",
+                    (keys, *expired_params, keys),
+                )
+                return {str(row[0]) for row in cur.fetchall()}
+
+        blobs_summary = (
+            collect_unreferenced_blobs(
+                self.blob_store, _referenced, dry_run=dry_run, min_age_seconds=blob_min_age_seconds
+            )
+            if self.blob_store is not None
+            else None
         )
+
+        return {
+            "now": now_dt.isoformat(),
+            "dry_run": bool(dry_run),
+            "counts": "exact",
+            "terminal_job_count": int(terminal_jobs),
+            "active_job_count": max(0, int(job_total) - int(terminal_jobs)),
+            **({} if dry_run else {"estimated_job_count": estimates.get("jobs", 0)}),
+            "ttl_seconds": {"results": results_ttl, "events": events_ttl},
+            "results": results_summary,
+            "events": events_summary,
+            "blobs": blobs_summary,
+        }
@@ -0,0 +1,1295 @@
+"""SQLite-backed AsyncJobStore — embedded backend on stdlib ``sqlite3``.
+
+Provides the same public interface and record shapes as ``AsyncJobStore``
+(file-backed) in ``src/api/async_jobs.py`` plus the history queries of
+``DbAsyncJobStore`` (``list_jobs_for_org`` / ``list_jobs_for_user`` and their
+counts).  Intended for single-node and edge deployments and CI load tests that
+need indexed queries without running Postgres.
+
+Schema: tables, columns and indexes of migrations 002 + 003 (``jobs``,
+``job_events``, ``job_results``) plus the history keyset indexes of 006 and
+the result-reuse column/index of 008 and the blob reference index of 009,
+translated to SQLite, plus the claim leases of 005 (without the NOTIFY
+triggers).  Columns the file
+store carries but Postgres does not (request/result payloads, cancel and retry
+metadata, event payloads) and the ``notifications`` table are added on top;
+the Postgres columns keep their names and meaning (``user_id`` is the job
+owner).
+
+Concurrency: the database runs in WAL mode, so readers never block the writer
+and vice versa.  Each thread reads through its own connection; writes go
+through one connection per process, serialised by a lock and ``BEGIN
+IMMEDIATE`` (several processes may share the file, e.g. pre-fork workers).
+
+Usage::
+
+    from src.shared.async_job_store_sqlite import SqliteAsyncJobStore
+    store = SqliteAsyncJobStore.from_env()
+
+Environment variables:
+    ASYNC_SQLITE_PATH           database file (default: runtime/async_jobs/store.sqlite3)
+    ASYNC_SQLITE_BUSY_TIMEOUT_MS  wait for locks held by other processes (default: 5000)
+    ASYNC_RESULT_BLOB_DIR       store result payloads as content-addressed blobs
+                                (``src/shared/result_blob_store.py``) instead of inline
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from src.shared.json_codec import dumps_canonical
+from src.shared.result_blob_store import (
+    BLOB_GC_MIN_AGE_SECONDS,
+    LocalBlobStore,
+    blob_store_from_env,
+    collect_unreferenced_blobs,
+)
+
+_DEFAULT_DB_PATH = "runtime/async_jobs/store.sqlite3"
+_DEFAULT_BUSY_TIMEOUT_MS = 5000
+_SCHEMA_VERSION = 5
+
+_TERMINAL_STATES = frozenset({"completed", "failed", "canceled"})
+_ALLOWED_TRANSITIONS: dict[str, frozenset[str]] = {
+    "queued":    frozenset({"running", "canceled"}),
+    "running":   frozenset({"partial", "completed", "failed", "canceled"}),
+    "partial":   frozenset({"partial", "completed", "failed", "canceled"}),
+    "completed": frozenset(),
+    "failed":    frozenset(),
+    "canceled":  frozenset(),
+}
+
+# Migrations 002 + 003 translated to SQLite; ``-- ext`` marks columns/tables
+# that only exist here (file-store parity).
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id   text PRIMARY KEY,
+    org_id   text NOT NULL,
+    status   text NOT NULL CHECK (status IN ('queued', 'running', 'partial', 'completed', 'failed', 'canceled')),
+
+    request_payload_hash text NOT NULL,
+    request_payload_ref  text,
+
+    query            text,
+    intelligence_mode text,
+
+    progress_percent integer NOT NULL DEFAULT 0
+        CHECK (progress_percent BETWEEN 0 AND 100),
+    partial_count    integer NOT NULL DEFAULT 0,
+    error_count      integer NOT NULL DEFAULT 0,
+
+    result_id      text,
+    error_code     text,
+    error_message  text,
+
+    queued_at  text NOT NULL,
+    started_at text,
+    finished_at text,
+    updated_at text NOT NULL,
+
+    user_id text,
+    reused_from_job_id text,
+
+    lease_owner      text,
+    lease_expires_at text,
+    claim_count      integer NOT NULL DEFAULT 0,
+
+    correlation_id       text,  -- ext
+    owner_org_id         text,  -- ext
+    request_payload_json text,  -- ext
+    retryable            integer,  -- ext
+    retry_hint           text,  -- ext
+    cancel_requested_at  text,  -- ext
+    canceled_at          text,  -- ext
+    canceled_by          text,  -- ext
+    cancel_reason        text   -- ext
+);
+
+CREATE INDEX IF NOT EXISTS jobs_org_id_idx    ON jobs(org_id);
+CREATE INDEX IF NOT EXISTS jobs_status_idx    ON jobs(status);
+CREATE INDEX IF NOT EXISTS jobs_queued_at_idx ON jobs(queued_at);
+CREATE INDEX IF NOT EXISTS jobs_user_id_idx   ON jobs(user_id);
+CREATE INDEX IF NOT EXISTS jobs_claimable_idx ON jobs(queued_at)
+    WHERE status IN ('queued', 'running', 'partial');
+CREATE INDEX IF NOT EXISTS jobs_org_user_idx  ON jobs(org_id, user_id);
+CREATE INDEX IF NOT EXISTS jobs_org_user_queued_idx ON jobs(org_id, user_id, queued_at DESC, job_id DESC);
+CREATE INDEX IF NOT EXISTS jobs_org_queued_idx      ON jobs(org_id, queued_at DESC, job_id DESC);
+CREATE INDEX IF NOT EXISTS jobs_reuse_lookup_idx    ON jobs(org_id, request_payload_hash, finished_at DESC)
+    WHERE status = 'completed' AND reused_from_job_id IS NULL;
+
+CREATE TABLE IF NOT EXISTS job_events (
+    event_id  text PRIMARY KEY,
+    job_id    text NOT NULL,
+    event_type text NOT NULL,
+    event_seq  integer NOT NULL,
+    occurred_at text NOT NULL,
+
+    actor_type   text,  -- ext
+    payload_json text   -- ext
+);
+
+CREATE INDEX IF NOT EXISTS job_events_job_id_idx ON job_events(job_id);
+
+CREATE TABLE IF NOT EXISTS job_results (
+    result_id       text        PRIMARY KEY,
+    job_id          text        NOT NULL REFERENCES jobs(job_id) ON DELETE CASCADE,
+    org_id          text        NOT NULL,
+    user_id         text,
+    result_kind     text        NOT NULL CHECK (result_kind IN ('partial', 'final')),
+    result_seq      integer     NOT NULL,
+    schema_version  text        NOT NULL,
+
+    s3_bucket       text,
+    s3_key          text,
+    checksum_sha256 text,
+    content_type    text        NOT NULL DEFAULT 'application/json',
+    size_bytes      bigint,
+
+    summary_json    text,
+
+    created_at      text        NOT NULL,
+
+    result_payload_json text,  -- ext
+
+    CONSTRAINT job_results_job_seq_unique UNIQUE (job_id, result_seq)
+);
+
+CREATE INDEX IF NOT EXISTS job_results_org_id_idx     ON job_results(org_id);
+CREATE INDEX IF NOT EXISTS job_results_job_id_idx     ON job_results(job_id);
+CREATE INDEX IF NOT EXISTS job_results_user_id_idx    ON job_results(user_id);
+CREATE INDEX IF NOT EXISTS job_results_created_at_idx ON job_results(created_at);
+CREATE INDEX IF NOT EXISTS job_results_s3_key_idx     ON job_results(s3_key) WHERE s3_key IS NOT NULL;
+
+-- ext: in-app notifications (file-store parity)
+CREATE TABLE IF NOT EXISTS notifications (
+    notification_id text PRIMARY KEY,
+    job_id          text NOT NULL,
+    channel         text NOT NULL,
+    template_key    text NOT NULL,
+    delivery_status text NOT NULL,
+    attempt_count   integer NOT NULL DEFAULT 0,
+    last_error      text,
+    dedupe_key      text NOT NULL UNIQUE,
+    scheduled_at    text NOT NULL,
+    sent_at         text,
+    created_at      text NOT NULL,
+    payload_json    text
+);
+
+CREATE INDEX IF NOT EXISTS notifications_job_id_idx ON notifications(job_id);
+"""
+
+
+# Columns added after a schema version shipped: ``CREATE TABLE IF NOT EXISTS``
+# leaves existing tables alone, so older databases get them via ALTER TABLE.
+_ADDED_COLUMNS: dict[str, dict[str, str]] = {
+    "jobs": {
+        "reused_from_job_id": "text",
+        "lease_owner": "text",
+        "lease_expires_at": "text",
+        "claim_count": "integer NOT NULL DEFAULT 0",
+    },
+}
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _lease_deadline_iso(seconds: float = 0.0) -> str:
+    # Fixed microsecond precision keeps lease timestamps comparable as text.
+    deadline = datetime.now(timezone.utc) + timedelta(seconds=float(seconds))
+    return deadline.isoformat(timespec="microseconds")
+
+
+def _canonical_payload_hash(payload: dict[str, Any]) -> str:
+    serialized = dumps_canonical(payload)
+    return hashlib.sha256(serialized).hexdigest()
+
+
+def _as_retry_hint(value: Any) -> str | None:
+    text = str(value or "").strip()
+    return text or None
+
+
+def _dump_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _load_json(raw: Any, default: Any) -> Any:
+    if raw is None or raw == "":
+        return default
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+def _append_history_page(
+    sql: str,
+    params: list[Any],
+    *,
+    limit: int,
+    offset: int,
+    before: tuple[str, str] | None,
+) -> tuple[str, list[Any]]:
+    """Newest-first page: keyset on ``(queued_at, job_id)`` or LIMIT/OFFSET."""
+    if before is not None:
+        sql += " AND (queued_at, job_id) < (?, ?)"
+        params = [*params, str(before[0]), str(before[1])]
+        offset = 0
+    sql += " ORDER BY queued_at DESC, job_id DESC LIMIT ? OFFSET ?"
+    return sql, [*params, int(limit), int(offset)]
+
+
+def _job_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    """Map a ``jobs`` row to the file-store job record shape."""
+    retryable = row["retryable"]
+    return {
+        "job_id": row["job_id"],
+        "correlation_id": row["correlation_id"] or row["job_id"],
+        "org_id": row["org_id"],
+        "owner_user_id": row["user_id"],
+        "owner_org_id": row["owner_org_id"] if row["owner_org_id"] is not None else row["org_id"],
+        "status": row["status"],
+        "request_payload_hash": row["request_payload_hash"],
+        "request_payload_ref": row["request_payload_ref"],
+        "request_payload_json": _load_json(row["request_payload_json"], {}),
+        "query": row["query"] or "",
+        "intelligence_mode": row["intelligence_mode"] or "basic",
+        "progress_percent": int(row["progress_percent"] or 0),
+        "partial_count": int(row["partial_count"] or 0),
+        "error_count": int(row["error_count"] or 0),
+        "result_id": row["result_id"],
+        "error_code": row["error_code"],
+        "error_message": row["error_message"],
+        "retryable": None if retryable is None else bool(retryable),
+        "retry_hint": row["retry_hint"],
+        "cancel_requested_at": row["cancel_requested_at"],
+        "canceled_at": row["canceled_at"],
+        "canceled_by": row["canceled_by"],
+        "cancel_reason": row["cancel_reason"],
+        "queued_at": row["queued_at"],
+        "started_at": row["started_at"],
+        "finished_at": row["finished_at"],
+        "updated_at": row["updated_at"],
+        "reused_from_job_id": row["reused_from_job_id"],
+    }
+
+
+def _result_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    result = {
+        "result_id": row["result_id"],
+        "job_id": row["job_id"],
+        "owner_user_id": row["user_id"],
+        "owner_org_id": row["org_id"],
+        "result_kind": row["result_kind"],
+        "result_seq": int(row["result_seq"]),
+        "schema_version": row["schema_version"],
+        "summary_json": _load_json(row["summary_json"], {}),
+        "created_at": row["created_at"],
+    }
+    if row["s3_key"] is not None and row["result_payload_json"] is None:
+        # Payload lives in the blob store; readers load it lazily.
+        result.update(
+            s3_bucket=row["s3_bucket"],
+            s3_key=row["s3_key"],
+            checksum_sha256=row["checksum_sha256"],
+            size_bytes=row["size_bytes"],
+        )
+    else:
+        result["result_payload"] = _load_json(row["result_payload_json"], {})
+    return result
+
+
+def _event_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "event_id": row["event_id"],
+        "job_id": row["job_id"],
+        "event_type": row["event_type"],
+        "event_seq": int(row["event_seq"]),
+        "occurred_at": row["occurred_at"],
+        "actor_type": row["actor_type"] or "system",
+        "payload_json": _load_json(row["payload_json"], {}),
+    }
+
+
+def _notification_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "notification_id": row["notification_id"],
+        "job_id": row["job_id"],
+        "channel": row["channel"],
+        "template_key": row["template_key"],
+        "delivery_status": row["delivery_status"],
+        "attempt_count": int(row["attempt_count"] or 0),
+        "last_error": row["last_error"],
+        "dedupe_key": row["dedupe_key"],
+        "scheduled_at": row["scheduled_at"],
+        "sent_at": row["sent_at"],
+        "created_at": row["created_at"],
+        "payload_json": _load_json(row["payload_json"], {}),
+    }
+
+
+# Job fields written back by transition/cancel paths (record key -> column).
+_JOB_UPDATE_COLUMNS = {
+    "status": "status",
+    "progress_percent": "progress_percent",
+    "partial_count": "partial_count",
+    "error_count": "error_count",
+    "result_id": "result_id",
+    "error_code": "error_code",
+    "error_message": "error_message",
+    "retryable": "retryable",
+    "retry_hint": "retry_hint",
+    "cancel_requested_at": "cancel_requested_at",
+    "canceled_at": "canceled_at",
+    "canceled_by": "canceled_by",
+    "cancel_reason": "cancel_reason",
+    "started_at": "started_at",
+    "finished_at": "finished_at",
+    "updated_at": "updated_at",
+}
+
+
+# ---------------------------------------------------------------------------
+# SqliteAsyncJobStore
+# ---------------------------------------------------------------------------
+
+class SqliteAsyncJobStore:
+    """SQLite-backed job store (WAL mode).
+
+    Thread-safe: a threading.Lock serialises write transactions within the
+    process; reads use a per-thread connection and see the last committed
+    state without blocking writers.
+    """
+
+    def __init__(
+        self,
+        *,
+        db_path: str | Path,
+        busy_timeout_ms: int = _DEFAULT_BUSY_TIMEOUT_MS,
+        blob_store: LocalBlobStore | None = None,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self.blob_store = blob_store
+        self._event_listeners: list[Callable[[str, int], None]] = []
+        self._unpublished_events: list[tuple[str, int]] = []
+        self._busy_timeout_seconds = max(0, int(busy_timeout_ms)) / 1000.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pid = os.getpid()
+        self._writer = self._connect()
+        self._initialize_schema()
+
+    @classmethod
+    def from_env(cls) -> "SqliteAsyncJobStore":
+        raw_timeout = str(os.getenv("ASYNC_SQLITE_BUSY_TIMEOUT_MS", "") or "").strip()
+        try:
+            busy_timeout_ms = int(raw_timeout) if raw_timeout else _DEFAULT_BUSY_TIMEOUT_MS
+        except ValueError:
+            busy_timeout_ms = _DEFAULT_BUSY_TIMEOUT_MS
+        return cls(
+            db_path=os.getenv("ASYNC_SQLITE_PATH", _DEFAULT_DB_PATH),
+            busy_timeout_ms=busy_timeout_ms,
+            blob_store=blob_store_from_env(),
+        )
+
+    # ------------------------------------------------------------------
+    # Internal connection helpers
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=self._busy_timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def _ensure_process_locked(self) -> None:
+        # SQLite connections must not be used across fork() (pre-fork
+        # workers): open fresh ones in the child process.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._local = threading.local()
+            self._writer = self._connect()
+
+    def _reader(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            with self._lock:
+                self._ensure_process_locked()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._ensure_process_locked()
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            self._unpublished_events = []
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                self._unpublished_events = []
+                raise
+            conn.execute("COMMIT")
+            events, self._unpublished_events = self._unpublished_events, []
+            for job_id, event_seq in events:
+                for listener in self._event_listeners:
+                    listener(job_id, event_seq)
+
+    def add_event_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Register ``listener(job_id, event_seq)``, called after each commit that wrote events.
+
+        Only writes of this process are reported.  Listeners run under the
+        write lock and must neither block nor call back into the store.
+        """
+        self._event_listeners.append(listener)
+
+    def _initialize_schema(self) -> None:
+        with self._write() as conn:
+            version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+            if version < _SCHEMA_VERSION:
+                # Existing tables first, so new indexes can reference new columns.
+                for table, columns in _ADDED_COLUMNS.items():
+                    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                    for column, column_type in columns.items():
+                        if existing and column not in existing:
+                            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                for statement in _SCHEMA_SQL.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._writer.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Internal write helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fetch_job(conn: sqlite3.Connection, job_id: str) -> dict[str, Any] | None:
+        row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (str(job_id),)).fetchone()
+        return _job_from_row(row) if row is not None else None
+
+    @staticmethod
+    def _check_lease(conn: sqlite3.Connection, job_id: str, lease_owner: str | None) -> None:
+        if lease_owner is None:
+            return
+        held = conn.execute(
+            "SELECT 1 FROM jobs WHERE job_id = ? AND lease_owner = ?", (str(job_id), str(lease_owner))
+        ).fetchone()
+        if held is None:
+            raise ValueError(f"job lease not held by {lease_owner}: {job_id}")
+
+    @staticmethod
+    def _update_job(conn: sqlite3.Connection, job: dict[str, Any]) -> None:
+        values = []
+        for key in _JOB_UPDATE_COLUMNS:
+            value = job.get(key)
+            if key == "retryable" and value is not None:
+                value = int(bool(value))
+            values.append(value)
+        set_clause = ", ".join(f"{column} = ?" for column in _JOB_UPDATE_COLUMNS.values())
+        conn.execute(
+            f"UPDATE jobs SET {set_clause} WHERE job_id = ?",  # noqa: S608
+            [*values, str(job["job_id"])],
+        )
+
+    def _insert_event(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        job_id: str,
+        event_type: str,
+        actor_type: str = "system",
+        payload: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        row = conn.execute(
+            "SELECT COALESCE(MAX(event_seq), 0) FROM job_events WHERE job_id = ?",
+            (str(job_id),),
+        ).fetchone()
+        event = {
+            "event_id": str(uuid.uuid4()),
+            "job_id": str(job_id),
+            "event_type": event_type,
+            "event_seq": int(row[0]) + 1,
+            "occurred_at": _utc_now_iso(),
+            "actor_type": actor_type,
+            "payload_json": payload or {},
+        }
+        conn.execute(
+            """
+            INSERT INTO job_events (event_id, job_id, event_type, event_seq, occurred_at, actor_type, payload_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                event["event_id"], event["job_id"], event_type, event["event_seq"],
+                event["occurred_at"], actor_type, _dump_json(event["payload_json"]),
+            ),
+        )
+        self._unpublished_events.append((event["job_id"], event["event_seq"]))
+        return event
+
+    @staticmethod
+    def _insert_terminal_notification(
+        conn: sqlite3.Connection,
+        *,
+        job: dict[str, Any],
+        terminal_status: str,
+    ) -> None:
+        job_id = str(job["job_id"])
+        channel = "in_app"
+        template_key = f"async.job.{terminal_status}"
+        now = _utc_now_iso()
+        payload = {
+            "job_id": job_id,
+            "status": terminal_status,
+            "result_id": job.get("result_id"),
+            "progress_percent": int(job.get("progress_percent", 0) or 0),
+            "error_code": job.get("error_code"),
+            "retry_hint": job.get("retry_hint"),
+            "finished_at": job.get("finished_at"),
+        }
+        conn.execute(
+            """
+            INSERT INTO notifications (
+                notification_id, job_id, channel, template_key, delivery_status,
+                attempt_count, last_error, dedupe_key, scheduled_at, sent_at,
+                created_at, payload_json
+            ) VALUES (?, ?, ?, ?, 'pending', 0, NULL, ?, ?, NULL, ?, ?)
+            ON CONFLICT (dedupe_key) DO NOTHING
+            """,
+            (
+                str(uuid.uuid4()), job_id, channel, template_key,
+                f"{job_id}:{channel}:{template_key}", now, now, _dump_json(payload),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # create_job / transition_job
+    # ------------------------------------------------------------------
+
+    def create_job(
+        self,
+        *,
+        request_payload: dict[str, Any],
+        request_id: str,
+        query: str,
+        intelligence_mode: str,
+        org_id: str = "default-org",
+        owner_user_id: str | None = None,
+        owner_org_id: str | None = None,
+        reused_from: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Insert a new queued job and its initial event; return the job dict.
+
+        With ``reused_from`` (a ``find_reusable_job`` hit) the job is inserted as
+        ``completed`` and points at the source job's final result.
+        """
+        job_id = str(uuid.uuid4())
+        correlation_id = str(uuid.uuid4())
+        resolved_owner_org_id = owner_org_id if owner_org_id is not None else org_id
+        now = _utc_now_iso()
+        if reused_from is not None:
+            status, progress, finished_at = "completed", 100, now
+            result_id, source_job_id = reused_from.get("result_id"), str(reused_from.get("job_id") or "")
+        else:
+            status, progress, finished_at, result_id, source_job_id = "queued", 0, None, None, None
+
+        with self._write() as conn:
+            conn.execute(
+                """
+                INSERT INTO jobs (
+                    job_id, org_id, user_id, owner_org_id, correlation_id, status,
+                    request_payload_hash, request_payload_ref, request_payload_json,
+                    query, intelligence_mode, progress_percent, partial_count, error_count,
+                    result_id, reused_from_job_id, queued_at, started_at, finished_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, 0, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id, org_id, owner_user_id, resolved_owner_org_id, correlation_id, status,
+                    _canonical_payload_hash(request_payload), f"inline:{job_id}",
+                    _dump_json(request_payload), query, intelligence_mode, progress,
+                    result_id, source_job_id, now, finished_at, finished_at, now,
+                ),
+            )
+            self._insert_event(
+                conn,
+                job_id=job_id,
+                event_type="job.queued",
+                payload={"request_id": request_id, "status": "queued"},
+            )
+            job = self._fetch_job(conn, job_id) or {}
+            if reused_from is not None:
+                self._insert_terminal_notification(conn, job=job, terminal_status="completed")
+                self._insert_event(
+                    conn,
+                    job_id=job_id,
+                    event_type="job.completed",
+                    payload={
+                        "status": "completed",
+                        "progress_percent": 100,
+                        "result_id": result_id,
+                        "reused_from_job_id": source_job_id,
+                    },
+                )
+        return job
+
+    def find_reusable_job(
+        self,
+        *,
+        org_id: str,
+        request_payload: dict[str, Any],
+        max_age_seconds: float,
+        owner_user_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Newest completed job with the same payload hash inside the freshness window.
+
+        Only jobs that ran the pipeline themselves and whose final result still
+        exists qualify; ``owner_user_id`` restricts the match to that user's jobs.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=float(max_age_seconds))
+        sql = (
+            "SELECT * FROM jobs WHERE org_id = ? AND request_payload_hash = ?"
+            " AND status = 'completed' AND reused_from_job_id IS NULL AND finished_at >= ?"
+            " AND EXISTS (SELECT 1 FROM job_results r WHERE r.result_id = jobs.result_id)"
+        )
+        params: list[Any] = [str(org_id), _canonical_payload_hash(request_payload), cutoff.isoformat()]
+        if owner_user_id:
+            sql += " AND user_id = ?"
+            params.append(str(owner_user_id))
+        row = self._reader().execute(sql + " ORDER BY finished_at DESC LIMIT 1", params).fetchone()
+        return _job_from_row(row) if row is not None else None
+
+    def transition_job(
+        self,
+        *,
+        job_id: str,
+        to_status: str,
+        progress_percent: int | None = None,
+        result_id: str | None = None,
+        error_code: str | None = None,
+        error_message: str | None = None,
+        retryable: bool | None = None,
+        retry_hint: str | None = None,
+        canceled_by: str | None = None,
+        cancel_reason: str | None = None,
+        actor_type: str = "system",
+        lease_owner: str | None = None,
+    ) -> dict[str, Any]:
+        """Transition a job's status; insert event (+ terminal notification); return the job.
+
+        ``lease_owner`` fences claim-mode workers: the transition fails with
+        ``ValueError`` unless the job is still leased to that worker.
+        """
+        with self._write() as conn:
+            job = self._fetch_job(conn, job_id)
+            if job is None:
+                raise KeyError(f"unknown job_id: {job_id}")
+            self._check_lease(conn, job_id, lease_owner)
+
+            current_status = str(job.get("status", "queued"))
+            if to_status not in _ALLOWED_TRANSITIONS.get(current_status, frozenset()):
+                raise ValueError(f"invalid transition from {current_status} to {to_status}")
+
+            if progress_percent is not None:
+                if not isinstance(progress_percent, int):
+                    raise ValueError("progress_percent must be int")
+                if progress_percent < 0 or progress_percent > 100:
+                    raise ValueError("progress_percent must be within 0..100")
+                if progress_percent < int(job.get("progress_percent", 0) or 0):
+                    raise ValueError("progress_percent must be monotonic")
+                job["progress_percent"] = progress_percent
+
+            now = _utc_now_iso()
+            if to_status == "running" and not job.get("started_at"):
+                job["started_at"] = now
+            if to_status == "partial":
+                job["partial_count"] = int(job.get("partial_count", 0) or 0) + 1
+            if to_status in _TERMINAL_STATES:
+                job["finished_at"] = now
+
+            if to_status == "failed":
+                job["error_count"] = int(job.get("error_count", 0) or 0) + 1
+                job["error_code"] = str(error_code or "runtime_error")
+                job["error_message"] = str(error_message or "async job failed")
+                job["retryable"] = bool(True if retryable is None else retryable)
+                job["retry_hint"] = _as_retry_hint(retry_hint) or "retry_with_backoff"
+            elif to_status != "partial":
+                job["error_code"] = None
+                job["error_message"] = None
+                job["retryable"] = None
+                job["retry_hint"] = None
+
+            if to_status == "canceled":
+                job["canceled_at"] = now
+                job["canceled_by"] = str(canceled_by or job.get("canceled_by") or "user")
+                job["cancel_reason"] = str(cancel_reason or job.get("cancel_reason") or "cancel_requested")
+
+            if result_id is not None:
+                job["result_id"] = result_id
+
+            job["status"] = to_status
+            job["updated_at"] = now
+            self._update_job(conn, job)
+
+            if to_status in {"completed", "failed"}:
+                self._insert_terminal_notification(conn, job=job, terminal_status=to_status)
+
+            self._insert_event(
+                conn,
+                job_id=str(job_id),
+                event_type=f"job.{to_status}",
+                actor_type=actor_type,
+                payload={
+                    "status": to_status,
+                    "progress_percent": job.get("progress_percent", 0),
+                    "result_id": job.get("result_id"),
+                    "error_code": job.get("error_code"),
+                    "retry_hint": job.get("retry_hint"),
+                    "cancel_requested_at": job.get("cancel_requested_at"),
+                },
+            )
+            return job
+
+    # ------------------------------------------------------------------
+    # request_cancel / consume_cancel_request
+    # ------------------------------------------------------------------
+
+    def request_cancel(
+        self,
+        *,
+        job_id: str,
+        canceled_by: str = "user",
+        cancel_reason: str = "cancel_requested",
+        actor_type: str = "user",
+    ) -> dict[str, Any]:
+        """Idempotent cancel request (same semantics as the file store)."""
+        with self._write() as conn:
+            job = self._fetch_job(conn, job_id)
+            if job is None:
+                raise KeyError(f"unknown job_id: {job_id}")
+
+            status = str(job.get("status") or "queued")
+            if status in _TERMINAL_STATES:
+                return {
+                    "job": job,
+                    "cancel_requested": bool(job.get("cancel_requested_at")),
+                    "cancel_applied": status == "canceled",
+                    "terminal": True,
+                }
+
+            now = _utc_now_iso()
+            if not job.get("cancel_requested_at"):
+                job["cancel_requested_at"] = now
+                job["canceled_by"] = str(canceled_by or "user")
+                job["cancel_reason"] = str(cancel_reason or "cancel_requested")
+                job["updated_at"] = now
+                self._insert_event(
+                    conn,
+                    job_id=str(job_id),
+                    event_type="job.cancel_requested",
+                    actor_type=actor_type,
+                    payload={
+                        "status": status,
+                        "cancel_requested_at": now,
+                        "canceled_by": job.get("canceled_by"),
+                        "cancel_reason": job.get("cancel_reason"),
+                    },
+                )
+
+            cancel_applied = False
+            if status == "queued":
+                job["status"] = "canceled"
+                job["finished_at"] = now
+                job["canceled_at"] = now
+                job["updated_at"] = now
+                self._insert_event(
+                    conn,
+                    job_id=str(job_id),
+                    event_type="job.canceled",
+                    actor_type=actor_type,
+                    payload={
+                        "status": "canceled",
+                        "progress_percent": job.get("progress_percent", 0),
+                        "cancel_requested_at": job.get("cancel_requested_at"),
+                    },
+                )
+                cancel_applied = True
+
+            self._update_job(conn, job)
+            return {
+                "job": job,
+                "cancel_requested": True,
+                "cancel_applied": cancel_applied,
+                "terminal": bool(cancel_applied),
+            }
+
+    def consume_cancel_request(
+        self,
+        *,
+        job_id: str,
+        actor_type: str = "worker",
+    ) -> dict[str, Any] | None:
+        """Apply a pending cancel request; return the canceled job or ``None``."""
+        with self._write() as conn:
+            job = self._fetch_job(conn, job_id)
+            if job is None:
+                return None
+
+            status = str(job.get("status") or "queued")
+            if status in _TERMINAL_STATES:
+                return job
+            if not job.get("cancel_requested_at"):
+                return None
+            if "canceled" not in _ALLOWED_TRANSITIONS.get(status, frozenset()):
+                return None
+
+            now = _utc_now_iso()
+            job["status"] = "canceled"
+            job["finished_at"] = now
+            job["canceled_at"] = now
+            job["canceled_by"] = str(job.get("canceled_by") or "worker")
+            job["cancel_reason"] = str(job.get("cancel_reason") or "cancel_requested")
+            job["updated_at"] = now
+            self._update_job(conn, job)
+            self._insert_event(
+                conn,
+                job_id=str(job_id),
+                event_type="job.canceled",
+                actor_type=actor_type,
+                payload={
+                    "status": "canceled",
+                    "progress_percent": job.get("progress_percent", 0),
+                    "cancel_requested_at": job.get("cancel_requested_at"),
+                },
+            )
+            return job
+
+    # ------------------------------------------------------------------
+    # create_result
+    # ------------------------------------------------------------------
+
+    def create_result(
+        self,
+        *,
+        job_id: str,
+        result_payload: dict[str, Any],
+        result_kind: str = "final",
+        schema_version: str = "v1",
+        lease_owner: str | None = None,
+    ) -> dict[str, Any]:
+        """Insert a job result; return the result record.
+
+        The payload is stored inline, or as a blob when a blob store is
+        configured (the row then only carries the ``s3_*`` reference).
+        ``lease_owner`` fences claim-mode workers as in ``transition_job``.
+        """
+        normalized_kind = str(result_kind or "").strip().lower()
+        blob_ref = self.blob_store.put_json(result_payload) if self.blob_store is not None else None
+
+        with self._write() as conn:
+            job = self._fetch_job(conn, job_id)
+            if job is None:
+                raise KeyError(f"unknown job_id: {job_id}")
+            self._check_lease(conn, job_id, lease_owner)
+            if normalized_kind not in {"partial", "final"}:
+                raise ValueError("result_kind must be one of {'partial', 'final'}")
+
+            if normalized_kind == "final":
+                existing_final = conn.execute(
+                    "SELECT 1 FROM job_results WHERE job_id = ? AND result_kind = 'final'",
+                    (str(job_id),),
+                ).fetchone()
+                if existing_final is not None:
+                    raise ValueError("final result already exists for job")
+
+            max_seq = conn.execute(
+                "SELECT COALESCE(MAX(result_seq), 0) FROM job_results WHERE job_id = ?",
+                (str(job_id),),
+            ).fetchone()[0]
+
+            record = {
+                "result_id": str(uuid.uuid4()),
+                "job_id": str(job_id),
+                "owner_user_id": job.get("owner_user_id"),
+                "owner_org_id": job.get("owner_org_id"),
+                "result_kind": normalized_kind,
+                "result_seq": int(max_seq) + 1,
+                "schema_version": schema_version,
+                "summary_json": {
+                    "status": str(job.get("status", "queued")),
+                    "query": str(job.get("query", "")),
+                    "intelligence_mode": str(job.get("intelligence_mode", "basic")),
+                },
+                "created_at": _utc_now_iso(),
+            }
+            if blob_ref is not None:
+                record.update(blob_ref)
+                payload_json = None
+                size_bytes = blob_ref["size_bytes"]
+            else:
+                record["result_payload"] = result_payload
+                payload_json = _dump_json(result_payload)
+                size_bytes = len(payload_json.encode("utf-8"))
+            conn.execute(
+                """
+                INSERT INTO job_results (
+                    result_id, job_id, org_id, user_id, result_kind, result_seq, schema_version,
+                    s3_bucket, s3_key, checksum_sha256,
+                    content_type, size_bytes, summary_json, created_at, result_payload_json
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'application/json', ?, ?, ?, ?)
+                """,
+                (
+                    record["result_id"], record["job_id"], record["owner_org_id"],
+                    record["owner_user_id"], normalized_kind, record["result_seq"],
+                    schema_version, record.get("s3_bucket"), record.get("s3_key"),
+                    record.get("checksum_sha256"), size_bytes,
+                    _dump_json(record["summary_json"]), record["created_at"], payload_json,
+                ),
+            )
+        return deepcopy(record)
+
+    # ------------------------------------------------------------------
+    # Claim leases
+    # ------------------------------------------------------------------
+
+    def claim_jobs(
+        self,
+        *,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = 30.0,
+    ) -> list[dict[str, Any]]:
+        """Lease up to ``limit`` open jobs for ``worker_id``; return the claimed jobs.
+
+        ``BEGIN IMMEDIATE`` serialises claims across processes sharing the
+        file (pre-fork workers), so a job is never handed out twice.  Open
+        jobs without a lease or with an expired lease are claimable.
+        """
+        with self._write() as conn:
+            rows = conn.execute(
+                """
+                SELECT job_id FROM jobs
+                WHERE status IN ('queued', 'running', 'partial')
+                  AND (lease_expires_at IS NULL OR lease_expires_at < ?)
+                ORDER BY queued_at ASC, job_id ASC
+                LIMIT ?
+                """,
+                (_lease_deadline_iso(), max(1, int(limit))),
+            ).fetchall()
+            claimed: list[dict[str, Any]] = []
+            lease_expires_at = _lease_deadline_iso(lease_seconds)
+            for row in rows:
+                conn.execute(
+                    """
+                    UPDATE jobs
+                    SET lease_owner = ?, lease_expires_at = ?, claim_count = claim_count + 1
+                    WHERE job_id = ?
+                    """,
+                    (str(worker_id), lease_expires_at, row["job_id"]),
+                )
+                leased = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (row["job_id"],)).fetchone()
+                job = _job_from_row(leased)
+                job.update(
+                    lease_owner=leased["lease_owner"],
+                    lease_expires_at=leased["lease_expires_at"],
+                    claim_count=int(leased["claim_count"] or 0),
+                )
+                claimed.append(job)
+            return claimed
+
+    def renew_lease(self, *, job_id: str, worker_id: str, lease_seconds: float = 30.0) -> bool:
+        """Heartbeat: extend the lease; False if ``worker_id`` no longer holds it."""
+        with self._write() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE job_id = ? AND lease_owner = ?",
+                (_lease_deadline_iso(lease_seconds), str(job_id), str(worker_id)),
+            )
+            return cur.rowcount > 0
+
+    def release_lease(self, *, job_id: str, worker_id: str) -> bool:
+        """Drop the lease held by ``worker_id``; open jobs become claimable again."""
+        with self._write() as conn:
+            cur = conn.execute(
+                """
+                UPDATE jobs SET lease_owner = NULL, lease_expires_at = NULL
+                WHERE job_id = ? AND lease_owner = ?
+                """,
+                (str(job_id), str(worker_id)),
+            )
+            return cur.rowcount > 0
+
+    def requeue_expired_leases(self) -> int:
+        """Clear expired leases (crashed/stalled workers); return the number of jobs.
+
+        There is no NOTIFY here: workers in other processes pick the jobs up
+        on their next poll.
+        """
+        with self._write() as conn:
+            cur = conn.execute(
+                """
+                UPDATE jobs SET lease_owner = NULL, lease_expires_at = NULL
+                WHERE lease_owner IS NOT NULL AND lease_expires_at < ?
+                """,
+                (_lease_deadline_iso(),),
+            )
+            return max(0, int(cur.rowcount or 0))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_job(self, job_id: str) -> dict[str, Any] | None:
+        return self._fetch_job(self._reader(), job_id)
+
+    def get_result(self, result_id: str) -> dict[str, Any] | None:
+        row = self._reader().execute(
+            "SELECT * FROM job_results WHERE result_id = ?", (str(result_id),)
+        ).fetchone()
+        return _result_from_row(row) if row is not None else None
+
+    def get_result_with_org_guard(self, result_id: str, *, org_id: str) -> dict[str, Any] | None:
+        """Fetch result only if org_id matches (tenant guard)."""
+        row = self._reader().execute(
+            "SELECT * FROM job_results WHERE result_id = ? AND org_id = ?",
+            (str(result_id), str(org_id)),
+        ).fetchone()
+        return _result_from_row(row) if row is not None else None
+
+    def list_job_ids(self, *, statuses: Iterable[str] | None = None) -> list[str]:
+        sql = "SELECT job_id FROM jobs"
+        params: list[Any] = []
+        if statuses is not None:
+            status_list = [str(status) for status in statuses]
+            if not status_list:
+                return []
+            sql += f" WHERE status IN ({', '.join('?' for _ in status_list)})"
+            params.extend(status_list)
+        sql += " ORDER BY queued_at ASC, job_id ASC"
+        return [row[0] for row in self._reader().execute(sql, params).fetchall()]
+
+    def list_results(self, job_id: str, *, after_seq: int = 0) -> list[dict[str, Any]]:
+        rows = self._reader().execute(
+            "SELECT * FROM job_results WHERE job_id = ? AND result_seq > ? ORDER BY result_seq ASC",
+            (str(job_id), int(after_seq)),
+        ).fetchall()
+        return [_result_from_row(row) for row in rows]
+
+    def list_events(self, job_id: str, *, after_seq: int = 0) -> list[dict[str, Any]]:
+        rows = self._reader().execute(
+            "SELECT * FROM job_events WHERE job_id = ? AND event_seq > ? ORDER BY event_seq ASC",
+            (str(job_id), int(after_seq)),
+        ).fetchall()
+        return [_event_from_row(row) for row in rows]
+
+    def list_notifications(self, job_id: str, *, channel: str | None = None) -> list[dict[str, Any]]:
+        sql = "SELECT * FROM notifications WHERE job_id = ?"
+        params: list[Any] = [str(job_id)]
+        normalized_channel = str(channel).strip().lower() if channel else None
+        if normalized_channel is not None:
+            sql += " AND lower(trim(channel)) = ?"
+            params.append(normalized_channel)
+        sql += " ORDER BY created_at DESC, notification_id DESC"
+        return [_notification_from_row(row) for row in self._reader().execute(sql, params).fetchall()]
+
+    # ------------------------------------------------------------------
+    # History (same contract as DbAsyncJobStore)
+    # ------------------------------------------------------------------
+
+    def list_jobs_for_org(
+        self,
+        org_id: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        status: str | None = None,
+        before: tuple[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return jobs for an org, newest first (paginated; ``before`` = keyset cursor)."""
+        sql = "SELECT * FROM jobs WHERE org_id = ?"
+        params: list[Any] = [str(org_id)]
+        if status:
+            sql += " AND status = ?"
+            params.append(str(status))
+        sql, params = _append_history_page(sql, params, limit=limit, offset=offset, before=before)
+        return [_job_from_row(row) for row in self._reader().execute(sql, params).fetchall()]
+
+    def count_jobs_for_org(self, org_id: str, *, status: str | None = None) -> int:
+        sql = "SELECT COUNT(*) FROM jobs WHERE org_id = ?"
+        params: list[Any] = [str(org_id)]
+        if status:
+            sql += " AND status = ?"
+            params.append(str(status))
+        return int(self._reader().execute(sql, params).fetchone()[0])
+
+    def list_jobs_for_user(
+        self,
+        user_id: str,
+        *,
+        org_id: str,
+        limit: int = 20,
+        offset: int = 0,
+        status: str | None = None,
+        before: tuple[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return jobs for a user within an org (paginated); both keys are required."""
+        sql = "SELECT * FROM jobs WHERE user_id = ? AND org_id = ?"
+        params: list[Any] = [str(user_id), str(org_id)]
+        if status:
+            sql += " AND status = ?"
+            params.append(str(status))
+        sql, params = _append_history_page(sql, params, limit=limit, offset=offset, before=before)
+        return [_job_from_row(row) for row in self._reader().execute(sql, params).fetchall()]
+
+    def count_jobs_for_user(self, user_id: str, *, org_id: str, status: str | None = None) -> int:
+        sql = "SELECT COUNT(*) FROM jobs WHERE user_id = ? AND org_id = ?"
+        params: list[Any] = [str(user_id), str(org_id)]
+        if status:
+            sql += " AND status = ?"
+            params.append(str(status))
+        return int(self._reader().execute(sql, params).fetchone()[0])
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _normalize_ttl_seconds(value: float | int | None, *, field_name: str) -> float | None:
+        if value is None:
+            return None
+        try:
+            parsed = float(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{field_name} must be a numeric value") from exc
+        if parsed < 0:
+            raise ValueError(f"{field_name} must be >= 0")
+        return parsed
+
+    def cleanup_retention(
+        self,
+        *,
+        results_ttl_seconds: float | int | None,
+        events_ttl_seconds: float | int | None,
+        dry_run: bool = False,
+        now: datetime | None = None,
+        blob_min_age_seconds: float = BLOB_GC_MIN_AGE_SECONDS,
+    ) -> dict[str, Any]:
+        """Delete expired results/events of terminal jobs (same summary as the file store).
+
+        Timestamps are compared as ISO-8601 UTC strings, which is how this
+        store writes them; rows without a timestamp are kept.  With a blob
+        store, blobs no longer referenced by ``job_results.s3_key`` are
+        collected afterwards (summary under ``blobs``).
+        """
+        now_dt = now or datetime.now(timezone.utc)
+        if now_dt.tzinfo is None:
+            now_dt = now_dt.replace(tzinfo=timezone.utc)
+        now_dt = now_dt.astimezone(timezone.utc)
+
+        results_ttl = self._normalize_ttl_seconds(results_ttl_seconds, field_name="results_ttl_seconds")
+        events_ttl = self._normalize_ttl_seconds(events_ttl_seconds, field_name="events_ttl_seconds")
+        results_cutoff = now_dt - timedelta(seconds=results_ttl) if results_ttl is not None else None
+        events_cutoff = now_dt - timedelta(seconds=events_ttl) if events_ttl is not None else None
+
+        terminal = "SELECT job_id FROM jobs WHERE status IN ('completed', 'failed', 'canceled')"
+        with self._write() as conn:
+            job_counts = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(job_id IN ({terminal})), 0) FROM jobs"  # noqa: S608
+            ).fetchone()
+
+            def _table_stats(table: str, ts_column: str, cutoff: datetime | None) -> dict[str, Any]:
+                total = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+                eligible = conn.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE job_id IN ({terminal})"  # noqa: S608
+                ).fetchone()[0]
+                missing = delete_count = 0
+                if cutoff is not None:
+                    missing = conn.execute(
+                        f"SELECT COUNT(*) FROM {table} WHERE job_id IN ({terminal})"  # noqa: S608
+                        f" AND COALESCE({ts_column}, '') = ''"
+                    ).fetchone()[0]
+                    where = f"job_id IN ({terminal}) AND {ts_column} <> '' AND {ts_column} <= ?"
+                    delete_count = conn.execute(
+                        f"SELECT COUNT(*) FROM {table} WHERE {where}",  # noqa: S608
+                        (cutoff.isoformat(),),
+                    ).fetchone()[0]
+                    if not dry_run and delete_count:
+                        conn.execute(f"DELETE FROM {table} WHERE {where}", (cutoff.isoformat(),))  # noqa: S608
+                return {
+                    "total": int(total),
+                    "eligible_terminal": int(eligible),
+                    "delete_count": int(delete_count),
+                    "kept_count": max(0, int(total) - int(delete_count)),
+                    "skipped_missing_timestamp": int(missing),
+                    "cutoff": cutoff.isoformat() if cutoff else None,
+                }
+
+            results_summary = _table_stats("job_results", "created_at", results_cutoff)
+            events_summary = _table_stats("job_events", "occurred_at", events_cutoff)
+
+        # A dry run must not count the results it would delete as references.
+        expired_sql = ""
+        expired_params: tuple[str, ...] = ()
+        if dry_run and results_cutoff is not None:
+            expired_sql = f" AND NOT (job_id IN ({terminal}) AND created_at <> '' AND created_at <= ?)"
+            expired_params = (results_cutoff.isoformat(),)
+
+        def _referenced(keys: list[str]) -> set[str]:
+            placeholders = ", ".join("?" for _ in keys)
+            rows = self._reader().execute(
+                f"SELECT DISTINCT s3_key FROM job_results WHERE s3_key IN ({placeholders}){expired_sql}",  # noqa: S608
+                (*keys, *expired_params),
+            ).fetchall()
+            return {str(row[0]) for row in rows}
+
+        blobs_summary = (
+            collect_unreferenced_blobs(
+                self.blob_store, _referenced, dry_run=dry_run, min_age_seconds=blob_min_age_seconds
+            )
+            if self.blob_store is not None
+            else None
+        )
+
+        return {
+            "now": now_dt.isoformat(),
+            "dry_run": bool(dry_run),
+            "terminal_job_count": int(job_counts[1]),
+            "active_job_count": max(0, int(job_counts[0]) - int(job_counts[1])),
+            "ttl_seconds": {"results": results_ttl, "events": events_ttl},
+            "results": results_summary,
+            "events": events_summary,
+            "blobs": blobs_summary,
+        }
@@ -0,0 +1,245 @@
+"""Bounded, thread-safe DB connection pool (DB-API 2.0 / psycopg2).
+
+Used by ``DbAsyncJobStore`` so that job transitions reuse open connections
+instead of paying a TCP/TLS/auth handshake per call.
+
+Behaviour:
+- At most ``max_size`` connections exist at a time; ``connection()`` waits up
+  to ``acquire_timeout_seconds`` for a free one, then raises
+  ``PoolTimeoutError``.
+- Connections are reused LIFO (warm connections first).
+- Health check: a connection that sat idle for longer than
+  ``health_check_idle_seconds`` is probed with ``SELECT 1`` before it is
+  handed out; broken or closed connections are discarded and replaced.
+- Max lifetime: connections older than ``max_lifetime_seconds`` are closed on
+  release/acquire instead of being reused (e.g. to follow DNS failovers and
+  rotate credentials).
+- On release every connection is rolled back, so no transaction (and no row
+  lock) leaks to the next borrower; a connection whose rollback fails is
+  discarded.
+
+Usage::
+
+    pool = ConnectionPool(lambda: psycopg2.connect(url), max_size=10)
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        ...
+        conn.commit()
+
+Environment variables (read by ``pool_settings_from_env``):
+    ASYNC_DB_POOL_MAX_SIZE            max open connections (default: 10)
+    ASYNC_DB_POOL_MAX_LIFETIME_SECONDS  recycle connections after N seconds (default: 1800)
+    ASYNC_DB_POOL_HEALTH_CHECK_IDLE_SECONDS  probe connections idle longer than N seconds (default: 30)
+    ASYNC_DB_POOL_ACQUIRE_TIMEOUT_SECONDS  wait for a free connection (default: 10)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_SIZE = 10
+_DEFAULT_MAX_LIFETIME_SECONDS = 1800.0
+_DEFAULT_HEALTH_CHECK_IDLE_SECONDS = 30.0
+_DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 10.0
+
+
+class PoolTimeoutError(RuntimeError):
+    """No connection became available within the acquire timeout."""
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "created_at", "last_used_at")
+
+    def __init__(self, conn: Any, now: float) -> None:
+        self.conn = conn
+        self.created_at = now
+        self.last_used_at = now
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = str(os.getenv(name, "") or "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def pool_settings_from_env() -> dict[str, Any]:
+    """Return ``ConnectionPool`` keyword arguments from ``ASYNC_DB_POOL_*``."""
+    return {
+        "max_size": max(1, int(_env_float("ASYNC_DB_POOL_MAX_SIZE", _DEFAULT_MAX_SIZE))),
+        "max_lifetime_seconds": _env_float(
+            "ASYNC_DB_POOL_MAX_LIFETIME_SECONDS", _DEFAULT_MAX_LIFETIME_SECONDS
+        ),
+        "health_check_idle_seconds": _env_float(
+            "ASYNC_DB_POOL_HEALTH_CHECK_IDLE_SECONDS", _DEFAULT_HEALTH_CHECK_IDLE_SECONDS
+        ),
+        "acquire_timeout_seconds": _env_float(
+            "ASYNC_DB_POOL_ACQUIRE_TIMEOUT_SECONDS", _DEFAULT_ACQUIRE_TIMEOUT_SECONDS
+        ),
+    }
+
+
+class ConnectionPool:
+    """Bounded LIFO connection pool with idle health checks and max lifetime."""
+
+    def __init__(
+        self,
+        conn_factory: Callable[[], Any],
+        *,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        max_lifetime_seconds: float = _DEFAULT_MAX_LIFETIME_SECONDS,
+        health_check_idle_seconds: float = _DEFAULT_HEALTH_CHECK_IDLE_SECONDS,
+        acquire_timeout_seconds: float = _DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._conn_factory = conn_factory
+        self._max_size = int(max_size)
+        self._max_lifetime_seconds = float(max_lifetime_seconds)
+        self._health_check_idle_seconds = float(health_check_idle_seconds)
+        self._acquire_timeout_seconds = float(acquire_timeout_seconds)
+        self._clock = clock
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: list[_PooledConnection] = []
+        self._open_count = 0
+        self._closed = False
+        self._created_total = 0
+        self._discarded_total = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection; it is rolled back and returned on exit."""
+        pooled = self._acquire()
+        try:
+            yield pooled.conn
+        finally:
+            self._release(pooled)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "max_size": self._max_size,
+                "open": self._open_count,
+                "idle": len(self._idle),
+                "in_use": self._open_count - len(self._idle),
+                "created_total": self._created_total,
+                "discarded_total": self._discarded_total,
+            }
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open_count -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._close_quietly(pooled.conn)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _acquire(self) -> _PooledConnection:
+        deadline = self._clock() + self._acquire_timeout_seconds
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("connection pool is closed")
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    if self._open_count < self._max_size:
+                        self._open_count += 1
+                    else:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            raise PoolTimeoutError(
+                                f"no DB connection available within {self._acquire_timeout_seconds:.1f}s "
+                                f"(max_size={self._max_size})"
+                            )
+                        self._cond.wait(timeout=remaining)
+                        continue
+
+            if pooled is None:
+                # Slot reserved; connect outside the lock.
+                try:
+                    conn = self._conn_factory()
+                except BaseException:
+                    with self._cond:
+                        self._open_count -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created_total += 1
+                return _PooledConnection(conn, self._clock())
+
+            if self._usable(pooled):
+                pooled.last_used_at = self._clock()
+                return pooled
+            self._discard(pooled)
+
+    def _usable(self, pooled: _PooledConnection) -> bool:
+        now = self._clock()
+        if self._expired(pooled, now) or getattr(pooled.conn, "closed", 0):
+            return False
+        if now - pooled.last_used_at < self._health_check_idle_seconds:
+            return True
+        try:
+            cur = pooled.conn.cursor()
+            try:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            finally:
+                cur.close()
+            pooled.conn.rollback()
+            return True
+        except Exception:
+            logger.warning("db_pool: discarding connection that failed the health check")
+            return False
+
+    def _expired(self, pooled: _PooledConnection, now: float) -> bool:
+        return self._max_lifetime_seconds > 0 and now - pooled.created_at >= self._max_lifetime_seconds
+
+    def _release(self, pooled: _PooledConnection) -> None:
+        try:
+            pooled.conn.rollback()
+        except Exception:
+            self._discard(pooled)
+            return
+        now = self._clock()
+        with self._cond:
+            if not self._closed and not self._expired(pooled, now):
+                pooled.last_used_at = now
+                self._idle.append(pooled)
+                self._cond.notify()
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        self._close_quietly(pooled.conn)
+        with self._cond:
+            self._open_count -= 1
+            self._discarded_total += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
@@ -5,10 +5,20 @@ Das Modul liefert bewusst ein schlankes, API-first Frontend ohne externe
 Abhängigkeiten. Fachlogik bleibt serverseitig in ``POST /analyze``;
 Frontend-Module (Adresseingabe, Kartenklick, Ergebnisdarstellung) sind additiv,
 sodass spätere HTML5-/Mobile-Ausbaupfade ohne Rewrite möglich bleiben.
+
+Auslieferung: CSS und App-JS werden beim Modul-Import einmal aus dem Template
+extrahiert und als content-hashed Assets (``/gui/assets/gui-mvp.<hash>.css|js``,
+``immutable``) ausgeliefert. Die kleine HTML-Shell mit dem inline Konfig-Block
+(Endpoints) wird pro Konfiguration einmal gerendert und aus dem Speicher bedient.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import re
+from dataclasses import dataclass
 from html import escape
 
 _GUI_MVP_HTML_TEMPLATE = """<!doctype html>
@@ -1154,6 +1164,15 @@ _GUI_MVP_HTML_TEMPLATE = """<!doctype html>
       </section>
     </main>
 
+    <script>
+      const ANALYZE_ENDPOINT = __ANALYZE_ENDPOINT_JSON__;
+      const TRACE_DEBUG_ENDPOINT = __TRACE_DEBUG_ENDPOINT_JSON__;
+      const ANALYZE_JOBS_ENDPOINT_BASE = __ANALYZE_JOBS_ENDPOINT_BASE_JSON__;
+      const ANALYZE_HISTORY_ENDPOINT = __ANALYZE_HISTORY_ENDPOINT_JSON__;
+      const AUTH_LOGIN_ENDPOINT = __AUTH_LOGIN_ENDPOINT_JSON__;
+      const AUTH_LOGOUT_ENDPOINT = __AUTH_LOGOUT_ENDPOINT_JSON__;
+      const AUTH_ME_ENDPOINT = __AUTH_ME_ENDPOINT_JSON__;
+    </script>
     <script>
       const CH_BOUNDS = {
         latMin: 45.8179,
@@ -1175,12 +1194,6 @@ _GUI_MVP_HTML_TEMPLATE = """<!doctype html>
       const ANALYZE_DRAFT_STORAGE_KEY = "geo-ranking-ui-analyze-draft-v1";
       const SESSION_EXPIRY_WARNING_LEAD_MS = 120000;
       const AUTH_SESSION_POLL_INTERVAL_MS = 60000;
-      const TRACE_DEBUG_ENDPOINT = "/debug/trace";
-      const ANALYZE_JOBS_ENDPOINT_BASE = "/analyze/jobs";
-      const ANALYZE_HISTORY_ENDPOINT = "/analyze/history";
-      const AUTH_LOGIN_ENDPOINT = "__AUTH_LOGIN_ENDPOINT__";
-      const AUTH_LOGOUT_ENDPOINT = "__AUTH_LOGOUT_ENDPOINT__";
-      const AUTH_ME_ENDPOINT = "__AUTH_ME_ENDPOINT__";
       const AUTH_CHECK_CACHE_TTL_MS = 12000;
       const DEV_CLIENT_REQUEST_POLICY = Object.freeze({
         requestTimeoutMs: 12000,
@@ -5033,7 +5046,7 @@ _GUI_MVP_HTML_TEMPLATE = """<!doctype html>
 
         let response;
         try {
-          response = await fetch("/analyze", {
+          response = await fetch(ANALYZE_ENDPOINT, {
             method: "POST",
             headers,
             credentials: "include",
@@ -5918,6 +5931,126 @@ _GUI_MVP_HTML_TEMPLATE = """<!doctype html>
 """
 
 
+GUI_ASSET_PATH_PREFIX = "/gui/assets/"
+GUI_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+GUI_SHELL_CACHE_CONTROL = "private, no-cache"
+
+_SHELL_CACHE_SIZE = 32
+_PLACEHOLDER_RE = re.compile(r"__([A-Z_]+)__")
+
+
+@dataclass(frozen=True)
+class GuiAsset:
+    """Fingerprinted GUI-Asset (CSS/JS), einmal pro Prozess aus dem Template extrahiert."""
+
+    name: str
+    body: bytes
+    content_type: str
+    etag: str
+
+    @property
+    def path(self) -> str:
+        return f"{GUI_ASSET_PATH_PREFIX}{self.name}"
+
+
+@dataclass(frozen=True)
+class GuiShell:
+    """Gerenderte HTML-Shell einer GUI-Konfiguration (verweist auf die Assets)."""
+
+    html: str
+    etag: str
+
+
+def _fingerprinted_asset(stem: str, suffix: str, text: str, content_type: str) -> GuiAsset:
+    body = text.encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    return GuiAsset(
+        name=f"{stem}.{digest}.{suffix}",
+        body=body,
+        content_type=content_type,
+        etag=f'"{stem}-{suffix}-{digest}"',
+    )
+
+
+def _split_template(template: str) -> tuple[str, GuiAsset, GuiAsset]:
+    """Zerlegt das Template in HTML-Shell, CSS- und JS-Asset.
+
+    Der letzte ``<script>``-Block ist der konfigurationsunabhängige App-Code;
+    der vorangehende Konfig-Block (Endpoints) bleibt inline in der Shell.
+    """
+
+    style_open = template.index("    <style>\n")
+    style_close = template.index("    </style>\n", style_open) + len("    </style>\n")
+    css = template[style_open + len("    <style>\n") : style_close - len("    </style>\n")]
+
+    script_open = template.rindex("    <script>\n")
+    script_close = template.index("    </script>\n", script_open) + len("    </script>\n")
+    js = template[script_open + len("    <script>\n") : script_close - len("    </script>\n")]
+
+    css_asset = _fingerprinted_asset("gui-mvp", "css", css, "text/css; charset=utf-8")
+    js_asset = _fingerprinted_asset("gui-mvp", "js", js, "text/javascript; charset=utf-8")
+    shell = (
+        template[:style_open]
+        + f'    <link rel="stylesheet" href="{css_asset.path}" />\n'
+        + template[style_close:script_open]
+        + f'    <script src="{js_asset.path}"></script>\n'
+        + template[script_close:]
+    )
+    return shell, css_asset, js_asset
+
+
+_GUI_SHELL_TEMPLATE, _GUI_CSS_ASSET, _GUI_JS_ASSET = _split_template(_GUI_MVP_HTML_TEMPLATE)
+_GUI_ASSETS = {asset.name: asset for asset in (_GUI_CSS_ASSET, _GUI_JS_ASSET)}
+
+
+def get_gui_asset(name: str) -> GuiAsset | None:
+    """Liefert ein GUI-Asset anhand seines fingerprinted Dateinamens (sonst ``None``)."""
+    return _GUI_ASSETS.get(str(name or ""))
+
+
+def _js_string(value: str) -> str:
+    # ``</`` escapen, damit ein Wert den inline Konfig-Block nicht schliessen kann.
+    return json.dumps(value).replace("</", "<\\/")
+
+
+@functools.lru_cache(maxsize=_SHELL_CACHE_SIZE)
+def render_gui_mvp_shell(
+    *,
+    app_version: str,
+    auth_login_endpoint: str = "/auth/login",
+    auth_logout_endpoint: str = "/auth/logout",
+    auth_me_endpoint: str = "/auth/me",
+    analyze_endpoint: str = "/analyze",
+    trace_debug_endpoint: str = "/debug/trace",
+    analyze_jobs_endpoint_base: str = "/analyze/jobs",
+    analyze_history_endpoint: str = "/analyze/history",
+) -> GuiShell:
+    """Rendert die HTML-Shell einmal pro Konfiguration (prozesslokal gecacht).
+
+    HTML-Platzhalter werden escaped, ``*_JSON``-Platzhalter im Konfig-Block als
+    JS-String-Literale eingesetzt. CSS/JS kommen über fingerprinted Asset-Routen.
+    """
+
+    login_endpoint = str(auth_login_endpoint or "/auth/login")
+    logout_endpoint = str(auth_logout_endpoint or "/auth/logout")
+    me_endpoint = str(auth_me_endpoint or "/auth/me")
+    values = {
+        "APP_VERSION": escape(app_version or "dev"),
+        "AUTH_LOGIN_ENDPOINT": escape(login_endpoint, quote=True),
+        "AUTH_LOGOUT_ENDPOINT": escape(logout_endpoint, quote=True),
+        "ANALYZE_ENDPOINT_JSON": _js_string(str(analyze_endpoint or "/analyze")),
+        "TRACE_DEBUG_ENDPOINT_JSON": _js_string(str(trace_debug_endpoint or "/debug/trace")),
+        "ANALYZE_JOBS_ENDPOINT_BASE_JSON": _js_string(str(analyze_jobs_endpoint_base or "/analyze/jobs")),
+        "ANALYZE_HISTORY_ENDPOINT_JSON": _js_string(str(analyze_history_endpoint or "/analyze/history")),
+        "AUTH_LOGIN_ENDPOINT_JSON": _js_string(login_endpoint),
+        "AUTH_LOGOUT_ENDPOINT_JSON": _js_string(logout_endpoint),
+        "AUTH_ME_ENDPOINT_JSON": _js_string(me_endpoint),
+    }
+    html = _PLACEHOLDER_RE.sub(lambda match: values.get(match.group(1), match.group(0)), _GUI_SHELL_TEMPLATE)
+    digest = hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+    return GuiShell(html=html, etag=f'"gui-shell-{digest}"')
+
+
 def render_gui_mvp_html(
     *,
     app_version: str,
@@ -5925,15 +6058,11 @@ def render_gui_mvp_html(
     auth_logout_endpoint: str = "/auth/logout",
     auth_me_endpoint: str = "/auth/me",
 ) -> str:
-    """Render das statische GUI-MVP-HTML mit sicher escaped Version."""
-
-    safe_version = escape(app_version or "dev")
-    safe_login_endpoint = escape(str(auth_login_endpoint or "/auth/login"), quote=True)
-    safe_logout_endpoint = escape(str(auth_logout_endpoint or "/auth/logout"), quote=True)
-    safe_me_endpoint = escape(str(auth_me_endpoint or "/auth/me"), quote=True)
-
-    html = _GUI_MVP_HTML_TEMPLATE.replace("__APP_VERSION__", safe_version)
-    html = html.replace("__AUTH_LOGIN_ENDPOINT__", safe_login_endpoint)
-    html = html.replace("__AUTH_LOGOUT_ENDPOINT__", safe_logout_endpoint)
-    html = html.replace("__AUTH_ME_ENDPOINT__", safe_me_endpoint)
-    return html
+    """Render die GUI-MVP-Shell mit sicher escaped Version (CSS/JS als Assets)."""
+
+    return render_gui_mvp_shell(
+        app_version=app_version,
+        auth_login_endpoint=auth_login_endpoint,
+        auth_logout_endpoint=auth_logout_endpoint,
+        auth_me_endpoint=auth_me_endpoint,
+    ).html
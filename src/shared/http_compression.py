@@ -0,0 +1,225 @@
+"""HTTP-Response-Kompression mit ``Accept-Encoding``-Negotiation.
+
+Wird von API (``src/api/web_service.py``) und UI-Service (``src/ui/service.py``)
+genutzt. Unterstützt ``gzip`` (Stdlib) und ``br`` (nur wenn das optionale
+``brotli``-Modul installiert ist).
+
+- Bodies unterhalb von ``HTTP_COMPRESSION_MIN_BYTES`` bleiben unkomprimiert
+  (Header-Overhead + CPU lohnen sich nicht).
+- Dynamische Bodies (z. B. ``/analyze``-Results) werden mit moderatem Level
+  komprimiert; statische Seiten (GUI-Shell) werden mit maximalem Level einmal
+  komprimiert und pro Inhalt + Encoding im Prozess gecacht.
+- Responses, deren Encoding vom Request abhängt, tragen ``Vary: Accept-Encoding``.
+- Gestreamte Bodies (z. B. Result-Payloads aus dem Blob-Store) werden mit
+  ``stream_encoder`` chunkweise komprimiert, ohne den Body im Speicher
+  zusammenzusetzen.
+
+Env vars:
+- HTTP_COMPRESSION_ENABLED: ``1`` (Default) | ``0``
+- HTTP_COMPRESSION_MIN_BYTES: Mindestgrösse in Bytes (Default: 1024)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+try:  # optional dependency
+    import brotli as _brotli
+except ImportError:  # pragma: no cover - depends on environment
+    _brotli = None
+
+
+HTTP_COMPRESSION_ENABLED_ENV = "HTTP_COMPRESSION_ENABLED"
+HTTP_COMPRESSION_MIN_BYTES_ENV = "HTTP_COMPRESSION_MIN_BYTES"
+DEFAULT_MIN_BYTES = 1024
+
+_DYNAMIC_LEVELS = {"gzip": 5, "br": 4}
+_STATIC_LEVELS = {"gzip": 9, "br": 11}
+_STATIC_CACHE_MAX_ENTRIES = 64
+
+_STATIC_CACHE: "OrderedDict[tuple[str, str], bytes]" = OrderedDict()
+_STATIC_CACHE_LOCK = threading.Lock()
+
+
+def compression_enabled() -> bool:
+    raw = str(os.getenv(HTTP_COMPRESSION_ENABLED_ENV, "1")).strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def min_compress_bytes() -> int:
+    raw = str(os.getenv(HTTP_COMPRESSION_MIN_BYTES_ENV, "")).strip()
+    if not raw:
+        return DEFAULT_MIN_BYTES
+    try:
+        value = int(raw)
+    except ValueError:
+        return DEFAULT_MIN_BYTES
+    return max(0, value)
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Serverseitig verfügbare Encodings in Präferenzreihenfolge."""
+    return ("br", "gzip") if _brotli is not None else ("gzip",)
+
+
+def _parse_accept_encoding(header_value: str) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for raw_part in str(header_value or "").split(","):
+        part = raw_part.strip()
+        if not part:
+            continue
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        if coding == "x-gzip":
+            coding = "gzip"
+        accepted[coding] = max(quality, accepted.get(coding, 0.0))
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Wählt das beste unterstützte Encoding oder ``None`` (identity)."""
+    if not accept_encoding:
+        return None
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*")
+
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in supported_encodings():
+        quality = accepted.get(encoding, wildcard if wildcard is not None else 0.0)
+        if quality > best_quality:
+            best = encoding
+            best_quality = quality
+    return best
+
+
+def compress(body: bytes, encoding: str, *, static: bool = False) -> bytes:
+    level = (_STATIC_LEVELS if static else _DYNAMIC_LEVELS)[encoding]
+    if encoding == "gzip":
+        # mtime=0 → deterministische Bytes (stabile Caches/ETags für statische Seiten).
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    if encoding == "br" and _brotli is not None:
+        return _brotli.compress(body, quality=level)
+    raise ValueError(f"unsupported content encoding: {encoding}")
+
+
+class _StreamEncoder:
+    """Inkrementeller Encoder: ``compress(chunk)`` pro Chunk, am Ende ``flush()``."""
+
+    def __init__(self, encoding: str) -> None:
+        level = _DYNAMIC_LEVELS[encoding]
+        if encoding == "gzip":
+            # wbits=31 → gzip-Header/-Trailer (statt zlib).
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self._process = compressor.compress
+            self._finish = compressor.flush
+        elif encoding == "br" and _brotli is not None:
+            compressor = _brotli.Compressor(quality=level)
+            self._process = compressor.process
+            self._finish = compressor.finish
+        else:
+            raise ValueError(f"unsupported content encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._process(chunk)
+
+    def flush(self) -> bytes:
+        return self._finish()
+
+
+def stream_encoder(accept_encoding: str | None, body_size: int) -> tuple[_StreamEncoder | None, dict[str, str]]:
+    """Wie ``encode_response_body``, aber für Bodies, die gestreamt werden.
+
+    Returns ``(encoder, headers)``; ``encoder`` ist ``None`` für identity
+    (Kompression aus, Body zu klein oder kein unterstütztes Encoding).
+    """
+    if not compression_enabled():
+        return None, {}
+
+    headers = {"Vary": "Accept-Encoding"}
+    if body_size < min_compress_bytes():
+        return None, headers
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return None, headers
+
+    headers["Content-Encoding"] = encoding
+    return _StreamEncoder(encoding), headers
+
+
+def _static_variant(body: bytes, encoding: str) -> bytes:
+    key = (hashlib.sha256(body).hexdigest(), encoding)
+    with _STATIC_CACHE_LOCK:
+        cached = _STATIC_CACHE.get(key)
+        if cached is not None:
+            _STATIC_CACHE.move_to_end(key)
+            return cached
+
+    compressed = compress(body, encoding, static=True)
+    with _STATIC_CACHE_LOCK:
+        _STATIC_CACHE[key] = compressed
+        _STATIC_CACHE.move_to_end(key)
+        while len(_STATIC_CACHE) > _STATIC_CACHE_MAX_ENTRIES:
+            _STATIC_CACHE.popitem(last=False)
+    return compressed
+
+
+def clear_static_cache() -> None:
+    with _STATIC_CACHE_LOCK:
+        _STATIC_CACHE.clear()
+
+
+def merge_vary(existing: str | None, addition: str) -> str:
+    """Kombiniert ``Vary``-Werte ohne Duplikate (case-insensitive)."""
+    parts = [part.strip() for part in str(existing or "").split(",") if part.strip()]
+    seen = {part.lower() for part in parts}
+    for part in addition.split(","):
+        part = part.strip()
+        if part and part.lower() not in seen:
+            parts.append(part)
+            seen.add(part.lower())
+    return ", ".join(parts)
+
+
+def encode_response_body(
+    body: bytes,
+    accept_encoding: str | None,
+    *,
+    static: bool = False,
+) -> tuple[bytes, dict[str, str]]:
+    """Komprimiert ``body`` gemäss ``Accept-Encoding``.
+
+    Returns ``(body, headers)``; ``headers`` enthält ``Vary`` und ggf.
+    ``Content-Encoding`` und ist leer, wenn Kompression deaktiviert ist.
+    """
+    if not compression_enabled():
+        return body, {}
+
+    headers = {"Vary": "Accept-Encoding"}
+    if len(body) < min_compress_bytes():
+        return body, headers
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return body, headers
+
+    encoded = _static_variant(body, encoding) if static else compress(body, encoding)
+    if len(encoded) >= len(body):
+        return body, headers
+
+    headers["Content-Encoding"] = encoding
+    return encoded, headers
@@ -0,0 +1,188 @@
+"""HTTP/1.1 Keep-Alive für die ``BaseHTTPRequestHandler``-Server (API + UI).
+
+``BaseHTTPRequestHandler`` spricht per Default HTTP/1.0 und schliesst jede
+Verbindung nach einer Response. ``KeepAliveHandlerMixin`` schaltet auf
+HTTP/1.1 mit persistenten Verbindungen um und sichert die Randfälle ab:
+
+- Idle-Timeout: Warten auf Request-Line + Header ist begrenzt; danach wird die
+  Verbindung geschlossen. Die eigentliche Request-Verarbeitung läuft wie
+  bisher ohne Socket-Timeout.
+- Maximal ``HTTP_KEEPALIVE_MAX_REQUESTS`` Requests pro Verbindung; die letzte
+  Response trägt ``Connection: close``.
+- Responses mit Body, aber ohne ``Content-Length`` bzw.
+  ``Transfer-Encoding: chunked`` (oder mit ungelesenem
+  Request-Body, z. B. bei frühem 4xx auf ``POST``) beenden die Verbindung,
+  damit der nächste Request nicht falsch geframt wird.
+
+Server, die Verbindungen pro Request verteilen (``WorkerPoolHTTPServer``:
+Lane-Wahl pro Verbindung, begrenzte Worker), setzen ``supports_keepalive =
+False``; dort trägt jede Response ``Connection: close``.
+
+Env vars:
+- HTTP_KEEPALIVE_ENABLED: ``1`` (Default) | ``0`` (jede Response mit ``Connection: close``)
+- HTTP_KEEPALIVE_IDLE_TIMEOUT_SECONDS: Default 5
+- HTTP_KEEPALIVE_MAX_REQUESTS: Default 100
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any
+
+HTTP_KEEPALIVE_ENABLED_ENV = "HTTP_KEEPALIVE_ENABLED"
+HTTP_KEEPALIVE_IDLE_TIMEOUT_ENV = "HTTP_KEEPALIVE_IDLE_TIMEOUT_SECONDS"
+HTTP_KEEPALIVE_MAX_REQUESTS_ENV = "HTTP_KEEPALIVE_MAX_REQUESTS"
+DEFAULT_IDLE_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_REQUESTS = 100
+
+# Status-Codes ohne Body (RFC 9110): kein Content-Length nötig.
+_BODYLESS_STATUS_CODES = frozenset({204, 304})
+
+
+def keepalive_enabled() -> bool:
+    raw = str(os.getenv(HTTP_KEEPALIVE_ENABLED_ENV, "1")).strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def keepalive_idle_timeout_seconds() -> float:
+    raw = str(os.getenv(HTTP_KEEPALIVE_IDLE_TIMEOUT_ENV, "")).strip()
+    if not raw:
+        return DEFAULT_IDLE_TIMEOUT_SECONDS
+    try:
+        parsed = float(raw)
+    except ValueError:
+        return DEFAULT_IDLE_TIMEOUT_SECONDS
+    return parsed if math.isfinite(parsed) and parsed > 0 else DEFAULT_IDLE_TIMEOUT_SECONDS
+
+
+def keepalive_max_requests() -> int:
+    raw = str(os.getenv(HTTP_KEEPALIVE_MAX_REQUESTS_ENV, "")).strip()
+    if not raw:
+        return DEFAULT_MAX_REQUESTS
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return DEFAULT_MAX_REQUESTS
+
+
+class _BodyTrackingReader:
+    """Zählt gelesene Request-Body-Bytes (für das Framing-Urteil nach dem Handler)."""
+
+    def __init__(self, raw: Any, declared_length: int) -> None:
+        self._raw = raw
+        self.remaining = declared_length
+
+    def _consume(self, data: bytes) -> bytes:
+        self.remaining = max(0, self.remaining - len(data))
+        return data
+
+    def read(self, size: int = -1) -> bytes:
+        return self._consume(self._raw.read(size))
+
+    def readline(self, size: int = -1) -> bytes:
+        return self._consume(self._raw.readline(size))
+
+    def readinto(self, buffer: Any) -> int:
+        count = self._raw.readinto(buffer)
+        self.remaining = max(0, self.remaining - int(count or 0))
+        return count
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+
+class KeepAliveHandlerMixin:
+    """Vor ``BaseHTTPRequestHandler`` in die Basisklassen mischen."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()  # type: ignore[misc]
+        server_supports_keepalive = getattr(self.server, "supports_keepalive", True)  # type: ignore[attr-defined]
+        self._keepalive_enabled = keepalive_enabled() and server_supports_keepalive
+        self._keepalive_idle_timeout = keepalive_idle_timeout_seconds()
+        self._keepalive_max_requests = keepalive_max_requests()
+        self._keepalive_requests_served = 0
+        self._keepalive_raw_rfile = self.rfile
+        self._reset_keepalive_response_state()
+
+    def _reset_keepalive_response_state(self) -> None:
+        self._keepalive_status: int | None = None
+        self._keepalive_has_length = False
+        self._keepalive_sent_close = False
+
+    def handle_one_request(self) -> None:
+        self.rfile = self._keepalive_raw_rfile
+        self._reset_keepalive_response_state()
+        self.connection.settimeout(self._keepalive_idle_timeout)
+        try:
+            super().handle_one_request()  # type: ignore[misc]
+        finally:
+            body_reader = self.rfile
+            self.rfile = self._keepalive_raw_rfile
+            if isinstance(body_reader, _BodyTrackingReader) and body_reader.remaining > 0:
+                self.close_connection = True
+
+    def parse_request(self) -> bool:
+        ok = super().parse_request()  # type: ignore[misc]
+        if not ok:
+            return False
+        self._keepalive_requests_served += 1
+        try:
+            self.connection.settimeout(None)
+        except OSError:
+            self.close_connection = True
+
+        if self.headers.get("Transfer-Encoding"):
+            # Chunked Request-Bodies werden nicht unterstützt → kein sicheres Framing.
+            self.close_connection = True
+        try:
+            declared_length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            declared_length = 0
+            self.close_connection = True
+        if declared_length > 0:
+            self.rfile = _BodyTrackingReader(self._keepalive_raw_rfile, declared_length)
+
+        if not self._keepalive_enabled or self._keepalive_requests_served >= self._keepalive_max_requests:
+            self.close_connection = True
+        return True
+
+    def send_response_only(self, code: int, message: str | None = None) -> None:
+        self._reset_keepalive_response_state()
+        self._keepalive_status = int(code)
+        super().send_response_only(code, message)  # type: ignore[misc]
+
+    def send_header(self, keyword: str, value: str) -> None:
+        normalized = keyword.lower()
+        if normalized == "content-length":
+            self._keepalive_has_length = True
+        elif normalized == "transfer-encoding" and str(value).strip().lower() == "chunked":
+            # Chunked-Bodies sind selbst-begrenzend (letzter Chunk mit Länge 0).
+            self._keepalive_has_length = True
+        elif normalized == "connection" and str(value).strip().lower() == "close":
+            self._keepalive_sent_close = True
+        super().send_header(keyword, value)  # type: ignore[misc]
+
+    def end_headers(self) -> None:
+        status = self._keepalive_status
+        framed = (
+            self._keepalive_has_length
+            or status is None
+            or status < 200
+            or status in _BODYLESS_STATUS_CODES
+            or getattr(self, "command", "") == "HEAD"
+        )
+        body_reader = self.rfile
+        if not framed or (isinstance(body_reader, _BodyTrackingReader) and body_reader.remaining > 0):
+            self.close_connection = True
+        if self.close_connection and not self._keepalive_sent_close and self.request_version != "HTTP/0.9":
+            self.send_header("Connection", "close")
+        super().end_headers()  # type: ignore[misc]
+
+    def log_error(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        # Idle-Timeout einer Keep-Alive-Verbindung ist Normalbetrieb, kein Fehler.
+        if format.startswith("Request timed out") and self._keepalive_requests_served > 0:
+            return
+        super().log_error(format, *args)  # type: ignore[misc]
@@ -0,0 +1,135 @@
+"""JSON-Serialisierung mit optionalem nativen Encoder.
+
+Hotpaths (API-Responses, ETags, Payload-Hashes, File-Job-Store) serialisieren
+über dieses Modul statt direkt über ``json.dumps``. Ist ``orjson`` installiert,
+wird es verwendet; sonst (oder bei nicht unterstützten Werten wie Integern
+> 64 Bit, nicht-String-Keys oder Lone-Surrogates) greift die Stdlib.
+
+Modi:
+- ``dumps_wire``: Response-Bodies (UTF-8, kompakt). Mit orjson entfallen die
+  Leerzeichen nach ``,``/``:``; der JSON-Inhalt bleibt gleich.
+- ``dumps_canonical``: Hash-/ETag-Input (``sort_keys``, kompakte Separatoren).
+  Byte-identisch zur Stdlib-Ausgabe, unabhängig vom Encoder: Enthält die
+  orjson-Ausgabe Zahlen, die die Stdlib anders schreibt (Exponent-Floats,
+  sehr kleine Floats), oder der Payload NaN/Infinity (orjson: ``null``), wird
+  mit der Stdlib neu serialisiert. Geprüft werden nur Werte-Positionen, nicht
+  String-Inhalte (Hashes/UUIDs wie ``"2e4f…"``); der Payload wird nur bei
+  ``null``-Werten nach nicht-endlichen Floats durchsucht.
+- ``dumps_pretty``: menschenlesbare Persistenz (``sort_keys``, ``indent=2``).
+
+Env vars:
+- JSON_CODEC: ``auto`` (Default, orjson falls verfügbar) | ``stdlib``
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from typing import Any
+
+try:  # optional dependency
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+# Ältere orjson-Versionen werden ignoriert (Stdlib-Fallback): getestet ist der
+# Codec ab 3.8, siehe requirements.txt.
+_ORJSON_MIN_VERSION = (3, 8)
+
+
+def _version_tuple(raw: str) -> tuple[int, ...]:
+    parts: list[int] = []
+    for part in str(raw).split(".")[:2]:
+        digits = re.match(r"\d+", part)
+        parts.append(int(digits.group(0)) if digits else 0)
+    return tuple(parts)
+
+
+if _orjson is not None and _version_tuple(getattr(_orjson, "__version__", "0")) < _ORJSON_MIN_VERSION:
+    _orjson = None  # pragma: no cover - depends on environment
+
+
+JSON_CODEC_ENV = "JSON_CODEC"
+
+# Zahlformen, die orjson anders als ``repr(float)`` schreibt: Exponenten
+# ("1e16" vs. "1e+16") und kleine Floats ("0.00001" vs. "1e-05"). Zahlen stehen
+# in der kompakten Ausgabe am Anfang oder direkt nach ``:``, ``,`` oder ``[``.
+_NON_CANONICAL_NUMBER_RE = re.compile(rb"(?:^|[:,\[])-?(?:[0-9.]+[eE]|0\.0000)")
+_NULL_VALUE_RE = re.compile(rb"(?:^|[:,\[])null(?:$|[,}\]])")
+
+
+def _native_enabled() -> bool:
+    if _orjson is None:
+        return False
+    return str(os.getenv(JSON_CODEC_ENV, "auto")).strip().lower() != "stdlib"
+
+
+def native_encoder_name() -> str:
+    """Name des aktiven Encoders (``orjson`` oder ``stdlib``)."""
+    return "orjson" if _native_enabled() else "stdlib"
+
+
+def _stdlib_wire(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _stdlib_canonical(payload: Any) -> bytes:
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _stdlib_pretty(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, indent=2).encode("utf-8")
+
+
+def _contains_non_finite_float(payload: Any) -> bool:
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumps_wire(payload: Any) -> bytes:
+    if _native_enabled():
+        try:
+            return _orjson.dumps(payload)
+        except (TypeError, _orjson.JSONEncodeError):
+            pass
+    return _stdlib_wire(payload)
+
+
+def dumps_canonical(payload: Any) -> bytes:
+    if _native_enabled():
+        try:
+            encoded = _orjson.dumps(payload, option=_orjson.OPT_SORT_KEYS)
+        except (TypeError, _orjson.JSONEncodeError):
+            encoded = None
+        if (
+            encoded is not None
+            and not _NON_CANONICAL_NUMBER_RE.search(encoded)
+            and not (_NULL_VALUE_RE.search(encoded) and _contains_non_finite_float(payload))
+        ):
+            return encoded
+    return _stdlib_canonical(payload)
+
+
+def dumps_pretty(payload: Any) -> bytes:
+    if _native_enabled():
+        try:
+            return _orjson.dumps(payload, option=_orjson.OPT_SORT_KEYS | _orjson.OPT_INDENT_2)
+        except (TypeError, _orjson.JSONEncodeError):
+            pass
+    return _stdlib_pretty(payload)
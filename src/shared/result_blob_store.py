@@ -0,0 +1,292 @@
+"""Content-addressed, compressed blob storage for async result payloads.
+
+The job stores keep result rows small: when a blob store is configured, the
+full ``result_payload`` is written here and the result row only carries the
+reference columns of migration 003 (``s3_bucket``, ``s3_key``,
+``checksum_sha256``, ``size_bytes``).  Readers load the payload lazily —
+``GET /analyze/results/<id>`` streams it straight from the blob into the
+response; history and status queries never touch it.
+
+Layout:
+- The blob key is derived from the SHA-256 of the canonical JSON bytes
+  (``dumps_canonical``), so identical payloads share one blob and a second
+  ``put_json`` of the same payload writes nothing.
+- Blobs are gzip files: ``<root>/sha256/<2 hex>/<64 hex>.json.gz``.
+  ``size_bytes`` is the uncompressed size, i.e. the number of bytes a reader
+  gets from ``open``.
+- Writes go to a temp file in the target directory and are moved into place
+  with ``os.replace``, so readers never see a partial blob; concurrent writers
+  of the same content race harmlessly.
+
+Blobs are immutable and may be referenced by several results, so deleting a
+result never deletes its blob.  Unreferenced blobs are removed by
+``collect_unreferenced_blobs``, which the job stores run at the end of
+``cleanup_retention``.  Blobs are written before the row that references them
+is committed, so the collector leaves blobs younger than ``min_age_seconds``
+alone; ``put_bytes`` refreshes the mtime of a blob it deduplicates against,
+which keeps an old blob that is about to be referenced again inside that
+window.
+
+Backends: only the local filesystem for now (``bucket = "local"``).  For an
+S3 backend, implement ``bucket``, ``put_json``, ``open`` and ``read_json``
+with the same key scheme.
+
+Environment variables (read by ``blob_store_from_env``):
+    ASYNC_RESULT_BLOB_DIR   root directory of the local backend; unset or empty
+                            keeps payloads inline in the job store (default)
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
+
+from src.shared.json_codec import dumps_canonical
+
+LOCAL_BUCKET = "local"
+BLOB_DIR_ENV = "ASYNC_RESULT_BLOB_DIR"
+
+_DEFAULT_COMPRESS_LEVEL = 6
+# Grace period of collect_unreferenced_blobs; must exceed the longest gap
+# between put_json and the commit of the referencing row.
+BLOB_GC_MIN_AGE_SECONDS = 3600.0
+# Keys per reference lookup issued by collect_unreferenced_blobs.
+BLOB_GC_LOOKUP_BATCH_SIZE = 500
+_KEY_RE = re.compile(r"^sha256/([0-9a-f]{2})/([0-9a-f]{64})\.json\.gz$")
+
+
+def blob_key_for_digest(digest: str) -> str:
+    """Blob key for a hex SHA-256 digest."""
+    return f"sha256/{digest[:2]}/{digest}.json.gz"
+
+
+class LocalBlobStore:
+    """Blob store on a local (or mounted, e.g. NFS/EFS) directory.
+
+    Thread- and process-safe: blobs are never modified after they are moved
+    into place.  Multi-node deployments need a directory shared by all nodes.
+    """
+
+    bucket = LOCAL_BUCKET
+
+    def __init__(self, root: str | Path, *, compress_level: int = _DEFAULT_COMPRESS_LEVEL) -> None:
+        self._root = Path(root)
+        self._compress_level = int(compress_level)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _path(self, key: str) -> Path:
+        match = _KEY_RE.match(str(key or ""))
+        if match is None or not match.group(2).startswith(match.group(1)):
+            raise KeyError(f"invalid blob key: {key}")
+        return self._root / key
+
+    def put_bytes(self, data: bytes) -> dict[str, Any]:
+        """Store ``data`` (if not present yet); return the reference columns."""
+        digest = hashlib.sha256(data).hexdigest()
+        key = blob_key_for_digest(digest)
+        path = self._root / key
+        try:
+            # Existing blob: refresh its mtime so a concurrent GC run treats
+            # it as recent until the new reference is committed.
+            os.utime(path)
+        except FileNotFoundError:
+            self._write(path, data)
+        except PermissionError:
+            pass
+        return {
+            "s3_bucket": self.bucket,
+            "s3_key": key,
+            "checksum_sha256": digest,
+            "size_bytes": len(data),
+        }
+
+    def _write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                # mtime=0 → identical payloads produce identical blob files.
+                with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=self._compress_level, mtime=0) as gz:
+                    gz.write(data)
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def put_json(self, payload: Any) -> dict[str, Any]:
+        """Store ``payload`` as canonical JSON; return the reference columns."""
+        return self.put_bytes(dumps_canonical(payload))
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def iter_keys(self) -> Iterator[tuple[str, float]]:
+        """All blob keys with their mtime; temp files of running writes are skipped."""
+        base = self._root / "sha256"
+        if not base.is_dir():
+            return
+        for shard in sorted(base.iterdir()):
+            if not shard.is_dir():
+                continue
+            for path in sorted(shard.glob("*.json.gz")):
+                key = f"sha256/{shard.name}/{path.name}"
+                if _KEY_RE.match(key) is None:
+                    continue
+                try:
+                    mtime = path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                yield key, mtime
+
+    def delete(self, key: str, *, older_than: float | None = None) -> bool:
+        """Remove a blob; with ``older_than`` only if its mtime is not newer.
+
+        Returns whether the blob was removed.
+        """
+        path = self._path(key)
+        try:
+            if older_than is not None and path.stat().st_mtime > older_than:
+                return False
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def open(self, key: str) -> BinaryIO:
+        """Open the blob for reading; yields the uncompressed bytes."""
+        path = self._path(key)
+        try:
+            return gzip.open(path, "rb")  # type: ignore[return-value]
+        except FileNotFoundError as exc:
+            raise KeyError(f"unknown blob key: {key}") from exc
+
+    def read_json(self, key: str) -> Any:
+        """Load and verify a blob (SHA-256 of the uncompressed bytes)."""
+        with self.open(key) as handle:
+            data = handle.read()
+        if hashlib.sha256(data).hexdigest() != _KEY_RE.match(key).group(2):  # type: ignore[union-attr]
+            raise ValueError(f"checksum mismatch for blob {key}")
+        return json.loads(data)
+
+
+def verified_chunks(handle: BinaryIO, key: str, *, size_bytes: int, chunk_size: int) -> Iterator[bytes]:
+    """Read ``handle`` (from ``open(key)``) in chunks and verify it while streaming.
+
+    Raises ``ValueError`` as soon as more than ``size_bytes`` arrive, and at
+    EOF if the size or SHA-256 does not match the key.  The last chunk is held
+    back until the checksum passes, so a corrupt blob is never delivered
+    completely.
+    """
+    match = _KEY_RE.match(str(key or ""))
+    if match is None:
+        raise KeyError(f"invalid blob key: {key}")
+    digest = hashlib.sha256()
+    received = 0
+    pending = b""
+    for chunk in iter(lambda: handle.read(chunk_size), b""):
+        received += len(chunk)
+        if received > size_bytes:
+            raise ValueError(f"size mismatch for blob {key}")
+        digest.update(chunk)
+        if pending:
+            yield pending
+        pending = chunk
+    if received != size_bytes or digest.hexdigest() != match.group(2):
+        raise ValueError(f"checksum mismatch for blob {key}")
+    if pending:
+        yield pending
+
+
+def blob_store_from_env() -> LocalBlobStore | None:
+    """Blob store configured via ``ASYNC_RESULT_BLOB_DIR`` (``None`` = inline payloads)."""
+    root = str(os.getenv(BLOB_DIR_ENV, "") or "").strip()
+    return LocalBlobStore(root) if root else None
+
+
+def collect_unreferenced_blobs(
+    blob_store: LocalBlobStore,
+    referenced: Callable[[list[str]], set[str]],
+    *,
+    dry_run: bool = False,
+    min_age_seconds: float = BLOB_GC_MIN_AGE_SECONDS,
+    batch_size: int = BLOB_GC_LOOKUP_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Delete blobs that no job store row references; return a summary.
+
+    ``referenced(keys)`` returns the subset of ``keys`` that is still
+    referenced; it is called with at most ``batch_size`` keys at a time, so a
+    store can answer with one indexed lookup per batch.  Blobs modified within
+    the last ``min_age_seconds`` (wall clock) are kept, and the age is checked
+    again right before each delete.  ``dry_run`` only counts.
+    """
+    cutoff = time.time() - max(0.0, float(min_age_seconds))
+    total = skipped_recent = delete_count = 0
+    batch: list[str] = []
+
+    def _flush() -> None:
+        nonlocal delete_count
+        if not batch:
+            return
+        keep = referenced(list(batch))
+        for key in batch:
+            if key in keep:
+                continue
+            if dry_run or blob_store.delete(key, older_than=cutoff):
+                delete_count += 1
+        batch.clear()
+
+    for key, mtime in blob_store.iter_keys():
+        total += 1
+        if mtime > cutoff:
+            skipped_recent += 1
+            continue
+        batch.append(key)
+        if len(batch) >= batch_size:
+            _flush()
+    _flush()
+    return {
+        "total": total,
+        "delete_count": delete_count,
+        "kept_count": total - delete_count,
+        "skipped_recent": skipped_recent,
+        "min_age_seconds": max(0.0, float(min_age_seconds)),
+    }
+
+
+def blob_reference(result: dict[str, Any], blob_store: LocalBlobStore | None) -> str | None:
+    """Blob key of a result record, if its payload lives in ``blob_store``.
+
+    Records with an inline ``result_payload`` and references into a different
+    bucket (e.g. S3 keys written by another backend) return ``None``.
+    """
+    if blob_store is None or "result_payload" in result:
+        return None
+    key = str(result.get("s3_key") or "")
+    if not key or str(result.get("s3_bucket") or "") != blob_store.bucket:
+        return None
+    return key
+
+
+def load_result_payload(result: dict[str, Any], blob_store: LocalBlobStore | None) -> Any:
+    """Full payload of a result record: inline, from the blob store, or ``{}``."""
+    if "result_payload" in result:
+        return result["result_payload"]
+    key = blob_reference(result, blob_store)
+    if key is None:
+        return {}
+    return blob_store.read_json(key)  # type: ignore[union-attr]
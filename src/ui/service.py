@@ -9,7 +9,8 @@ Async-freundliche Deep-Link Pages:
   `GET /analyze/results/<result_id>` lädt.
 - Job-Status/Notification-Page (`/jobs/<job_id>`), die Job-Status + In-App
   Notifications über `GET /analyze/jobs/<job_id>` und
-  `GET /analyze/jobs/<job_id>/notifications` lädt.
+  `GET /analyze/jobs/<job_id>/notifications` lädt und Updates per Long-Poll
+  auf `GET /analyze/jobs/<job_id>/events` abwartet.
 
 Hinweis: Die Result-Page ist bewusst minimal (API-first) und soll vor allem
 Deep-Link-/Sharing-Workflows für Async-Results abdecken.
@@ -28,7 +29,16 @@ from urllib import error as urllib_error
 from urllib import request as urllib_request
 from urllib.parse import parse_qs, parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 
-from src.shared.gui_mvp import render_gui_mvp_html
+from src.shared.gui_mvp import (
+    GUI_ASSET_CACHE_CONTROL,
+    GUI_ASSET_PATH_PREFIX,
+    GUI_SHELL_CACHE_CONTROL,
+    GuiShell,
+    get_gui_asset,
+    render_gui_mvp_shell,
+)
+from src.shared.http_compression import encode_response_body
+from src.shared.http_keepalive import KeepAliveHandlerMixin
 from src.shared.ui_pages import build_history_page_html, build_result_tabs_page_html
 
 _RESULT_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,199}$")
@@ -491,7 +501,7 @@ _JOB_PAGE_TEMPLATE = """<!doctype html>
     <main>
       <section class="card">
         <h2>Loader</h2>
-        <p class="meta">Die Seite lädt JSON via <code>GET /analyze/jobs/&lt;job_id&gt;</code> und <code>GET /analyze/jobs/&lt;job_id&gt;/notifications</code>. Optional kann ein Bearer-Token gesetzt werden (z. B. für geschützte Deployments). Tenant-Scope via <code>X-Org-Id</code>.</p>
+        <p class="meta">Die Seite lädt JSON via <code>GET /analyze/jobs/&lt;job_id&gt;</code> und <code>GET /analyze/jobs/&lt;job_id&gt;/notifications</code>; Updates kommen per Long-Poll über <code>GET /analyze/jobs/&lt;job_id&gt;/events</code>. Optional kann ein Bearer-Token gesetzt werden (z. B. für geschützte Deployments). Tenant-Scope via <code>X-Org-Id</code>.</p>
         <div class="grid-2">
           <label>
             API Token (optional)
@@ -548,6 +558,7 @@ _JOB_PAGE_TEMPLATE = """<!doctype html>
         let pollingActive = true;
         let pollingDelayMs = 1000;
         let lastNotificationId = "";
+        let lastEventSeq = 0;
 
         function prettyPrint(value) {
           try {
@@ -599,6 +610,11 @@ _JOB_PAGE_TEMPLATE = """<!doctype html>
           return `${JOBS_ENDPOINT_BASE}/${encodedId}/notifications?channel=in_app&limit=20`;
         }
 
+        function buildEventsUrl() {
+          const encodedId = encodeURIComponent(JOB_ID);
+          return `${JOBS_ENDPOINT_BASE}/${encodedId}/events?since_event_seq=${lastEventSeq}&timeout=25`;
+        }
+
         function headersFromInputs() {
           const headers = { "Accept": "application/json" };
           const token = String(tokenEl.value || "").trim();
@@ -719,6 +735,10 @@ _JOB_PAGE_TEMPLATE = """<!doctype html>
 
           const job = (jobPayload && jobPayload.job) ? jobPayload.job : {};
           const status = String(job.status || "").trim().toLowerCase();
+          const events = Array.isArray(job.events) ? job.events : [];
+          for (const event of events) {
+            lastEventSeq = Math.max(lastEventSeq, Number(event && event.event_seq) || 0);
+          }
           const resultId = String(job.result_id || "").trim();
           const notifications = Array.isArray(notificationsPayload.notifications) ? notificationsPayload.notifications : [];
 
@@ -770,6 +790,18 @@ _JOB_PAGE_TEMPLATE = """<!doctype html>
           return { ok: true, terminal: false };
         }
 
+        // Long-Poll statt Timer: true, sobald neue Job-Events vorliegen. fetch statt
+        // EventSource, weil EventSource keine Authorization-/X-Org-Id-Header setzen kann.
+        async function waitForEvents() {
+          while (pollingActive) {
+            const payload = await fetchJson(buildEventsUrl());
+            const events = Array.isArray(payload.events) ? payload.events : [];
+            if (events.length) return true;
+            if (!payload.timed_out) return false;
+          }
+          return false;
+        }
+
         async function pollLoop() {
           if (!pollingActive) return;
           const result = await refreshOnce();
@@ -778,6 +810,19 @@ _JOB_PAGE_TEMPLATE = """<!doctype html>
             togglePollingBtn.textContent = "Polling: off";
             return;
           }
+          if (result && result.ok) {
+            let hasEvents = false;
+            try {
+              hasEvents = await waitForEvents();
+            } catch (error) {
+              // Fallback auf Timer-Polling (z. B. API ohne /events oder 503 bei Überlast).
+            }
+            if (hasEvents) {
+              pollingDelayMs = 1000;
+              void pollLoop();
+              return;
+            }
+          }
           pollingDelayMs = Math.min(10000, Math.round(pollingDelayMs * 1.35));
           window.setTimeout(() => { void pollLoop(); }, pollingDelayMs);
         }
@@ -1377,41 +1422,32 @@ def _normalize_job_id(raw_value: str) -> str:
     return normalized
 
 
-def _build_gui_html(*, app_version: str, api_base_url: str) -> str:
+def _build_gui_shell(*, app_version: str, api_base_url: str) -> GuiShell:
     normalized_base_url = api_base_url.rstrip("/") if api_base_url else ""
     # Auth-Entry bleibt UI-owned: Login immer über /login auf der UI-Domain.
-    auth_login_url = "/login"
-    auth_logout_url = "/auth/logout"
-    auth_me_url = "/auth/me"
-
-    html = render_gui_mvp_html(
+    # Die Shell wird pro Konfiguration einmal gerendert (gecacht in gui_mvp).
+    return render_gui_mvp_shell(
         app_version=app_version,
-        auth_login_endpoint=auth_login_url,
-        auth_logout_endpoint=auth_logout_url,
-        auth_me_endpoint=auth_me_url,
+        auth_login_endpoint="/login",
+        auth_logout_endpoint="/auth/logout",
+        auth_me_endpoint="/auth/me",
+        analyze_endpoint=f"{normalized_base_url}/analyze",
+        trace_debug_endpoint=f"{normalized_base_url}/debug/trace",
+        analyze_jobs_endpoint_base=f"{normalized_base_url}/analyze/jobs",
+        analyze_history_endpoint=f"{normalized_base_url}/analyze/history",
     )
-    if not normalized_base_url:
-        return html
-
-    analyze_url = f"{normalized_base_url}/analyze"
-    trace_debug_url = f"{normalized_base_url}/debug/trace"
-    analyze_jobs_base = f"{normalized_base_url}/analyze/jobs"
-    analyze_history_url = f"{normalized_base_url}/analyze/history"
-
-    html = html.replace('fetch("/analyze", {', f"fetch({json.dumps(analyze_url)}, {{")
-    html = html.replace(
-        'const TRACE_DEBUG_ENDPOINT = "/debug/trace";',
-        f"const TRACE_DEBUG_ENDPOINT = {json.dumps(trace_debug_url)};",
-    )
-    html = html.replace(
-        'const ANALYZE_JOBS_ENDPOINT_BASE = "/analyze/jobs";',
-        f"const ANALYZE_JOBS_ENDPOINT_BASE = {json.dumps(analyze_jobs_base)};",
-    )
-    html = html.replace(
-        'const ANALYZE_HISTORY_ENDPOINT = "/analyze/history";',
-        f"const ANALYZE_HISTORY_ENDPOINT = {json.dumps(analyze_history_url)};",
-    )
-    return html
+
+
+def _if_none_match_matches(header_value: str | None, current_etag: str) -> bool:
+    if not header_value:
+        return False
+    for raw_part in str(header_value).split(","):
+        candidate = raw_part.strip()
+        if candidate.lower().startswith("w/"):
+            candidate = candidate[2:].strip()
+        if candidate in {"*", current_etag}:
+            return True
+    return False
 
 
 def _build_result_permalink_html(*, app_version: str, api_base_url: str, result_id: str) -> str:
@@ -1639,26 +1675,54 @@ def _build_login_entry_html(*, app_version: str, next_path: str, reason: str) ->
 """
 
 
-class _UiHandler(BaseHTTPRequestHandler):
+class _UiHandler(KeepAliveHandlerMixin, BaseHTTPRequestHandler):
     server_version = "geo-ranking-ui/1.0"
 
-    def _send_json(self, payload: dict, *, status: int = HTTPStatus.OK) -> None:
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    def _send_body(
+        self,
+        body: bytes,
+        *,
+        content_type: str,
+        status: int,
+        static: bool = False,
+        cache_control: str = "no-store",
+        etag: str | None = None,
+    ) -> None:
+        body, encoding_headers = encode_response_body(body, self.headers.get("Accept-Encoding"), static=static)
         self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Cache-Control", "no-store")
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", cache_control)
+        if etag:
+            self.send_header("ETag", etag)
+        for key, value in encoding_headers.items():
+            self.send_header(key, value)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
-    def _send_html(self, html: str, *, status: int = HTTPStatus.OK) -> None:
-        body = html.encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Cache-Control", "no-store")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+    def _send_json(self, payload: dict, *, status: int = HTTPStatus.OK) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_body(body, content_type="application/json; charset=utf-8", status=status)
+
+    def _send_html(self, html: str, *, status: int = HTTPStatus.OK, static: bool = False) -> None:
+        self._send_body(html.encode("utf-8"), content_type="text/html; charset=utf-8", status=status, static=static)
+
+    def _send_cacheable(self, body: bytes, *, content_type: str, cache_control: str, etag: str) -> None:
+        """Statische Inhalte mit ETag; passender ``If-None-Match`` → ``304`` ohne Body."""
+        if _if_none_match_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self._send_body(
+            body,
+            content_type=content_type,
+            status=HTTPStatus.OK,
+            static=True,
+            cache_control=cache_control,
+            etag=etag,
+        )
 
     def _build_api_target_url(self, *, request_path: str, raw_query: str) -> str | None:
         normalized_base_url = str(self.server.ui_api_base_url or "").strip().rstrip("/")
@@ -1847,11 +1911,32 @@ class _UiHandler(BaseHTTPRequestHandler):
         request_path = _normalize_path(parsed.path)
 
         if request_path in {"/", "/gui"}:
-            html = _build_gui_html(
+            shell = _build_gui_shell(
                 app_version=self.server.app_version,
                 api_base_url=self.server.ui_api_base_url,
             )
-            self._send_html(html)
+            self._send_cacheable(
+                shell.html.encode("utf-8"),
+                content_type="text/html; charset=utf-8",
+                cache_control=GUI_SHELL_CACHE_CONTROL,
+                etag=shell.etag,
+            )
+            return
+
+        if request_path.startswith("/gui/assets/"):
+            asset = get_gui_asset(request_path[len(GUI_ASSET_PATH_PREFIX) :])
+            if asset is None:
+                self._send_json(
+                    {"ok": False, "error": "not_found", "message": f"Unknown GUI asset: {request_path}"},
+                    status=HTTPStatus.NOT_FOUND,
+                )
+                return
+            self._send_cacheable(
+                asset.body,
+                content_type=asset.content_type,
+                cache_control=GUI_ASSET_CACHE_CONTROL,
+                etag=asset.etag,
+            )
             return
 
         if request_path == "/login":
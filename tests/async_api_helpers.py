@@ -0,0 +1,152 @@
+"""Gemeinsame Test-Basis für Async-Store- und Async-API-Tests.
+
+- ``StoreBackendTestCase``: ``self.backend_store(backend)`` liefert je einen
+  frischen File- bzw. SQLite-Store (Tests laufen als ``subTest`` pro Backend).
+- ``AsyncApiTestCase``: startet ``web_service.Handler`` auf einem freien Port
+  mit eigenem File-Store; Subklassen ergänzen Hub/Runtime über
+  ``web_service_overrides`` und Umgebungsvariablen über ``env``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.client import HTTPConnection, HTTPResponse
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from src.api import web_service
+from src.api.async_jobs import AsyncJobStore
+from src.shared.async_job_store_sqlite import SqliteAsyncJobStore
+from src.shared.result_blob_store import LocalBlobStore
+
+STORE_BACKENDS = ("file", "sqlite")
+
+
+def make_store(backend: str, root: Path, *, blob_store: LocalBlobStore | None = None) -> Any:
+    """Async-Store des Backends ``backend`` unter ``root``."""
+    if backend == "file":
+        return AsyncJobStore(store_file=root / "store.json", journal_fsync="off", blob_store=blob_store)
+    return SqliteAsyncJobStore(db_path=root / "store.sqlite3", blob_store=blob_store)
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_path = Path(self._tmp.name)
+
+    def set_env(self, **values: str) -> None:
+        patcher = mock.patch.dict(os.environ, values)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def unset_env(self, *names: str) -> None:
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in names:
+            os.environ.pop(name, None)
+
+
+class StoreBackendTestCase(TempDirTestCase):
+    """Tests laufen pro Backend: ``for backend in STORE_BACKENDS: with self.subTest(...)``."""
+
+    with_blob_store = False
+
+    def backend_store(self, backend: str) -> Any:
+        """Frischer Store des Backends unter ``<tmp>/<backend>`` (Blobs unter ``.../blobs``)."""
+        root = self.tmp_path / backend
+        root.mkdir()
+        blob_store = LocalBlobStore(root / "blobs") if self.with_blob_store else None
+        store = make_store(backend, root, blob_store=blob_store)
+        if isinstance(store, SqliteAsyncJobStore):
+            self.addCleanup(store.close)
+        return store
+
+
+class AsyncApiTestCase(TempDirTestCase):
+    """HTTP-Server mit eigenem Async-Store (``self.api_store``) pro Test."""
+
+    org_id = "org-a"
+    env: dict[str, str] = {}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.api_store = self.create_api_store()
+        overrides = {"_ASYNC_JOB_STORE": self.api_store, "_ASYNC_RUNTIME_STARTED": True}
+        overrides.update(self.web_service_overrides())
+        for name, value in overrides.items():
+            self.patch_web_service(name, value)
+        if self.env:
+            self.set_env(**self.env)
+        web_service._async_result_cache_clear()
+        self.addCleanup(web_service._async_result_cache_clear)
+        # Nach den Patches: Cleanups laufen rückwärts, Worker stoppen also vor dem Zurücksetzen.
+        self.start_workers()
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), web_service.Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.port = int(server.server_address[1])
+
+        def _stop_server() -> None:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+        self.addCleanup(_stop_server)
+
+    def create_api_store(self) -> Any:
+        return AsyncJobStore(store_file=self.tmp_path / "api-store.json", journal_fsync="off")
+
+    def web_service_overrides(self) -> dict[str, Any]:
+        """Zusätzliche Modul-Globals von ``web_service`` (z. B. Event-Hub, Runtime)."""
+        return {}
+
+    def start_workers(self) -> None:
+        """Hintergrund-Threads (z. B. ``AsyncJobRuntime``) starten und per ``addCleanup`` stoppen."""
+
+    def patch_web_service(self, name: str, value: Any) -> None:
+        patcher = mock.patch.object(web_service, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def connect(self) -> HTTPConnection:
+        """Eigene Verbindung für Streaming-Tests; wird nach dem Test geschlossen."""
+        conn = HTTPConnection("127.0.0.1", self.port, timeout=15)
+        self.addCleanup(conn.close)
+        return conn
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        payload: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[HTTPResponse, bytes]:
+        request_headers = {"X-Org-Id": self.org_id, **(headers or {})}
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode("utf-8")
+            request_headers.setdefault("Content-Type", "application/json")
+        conn = HTTPConnection("127.0.0.1", self.port, timeout=15)
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def get(self, path: str, headers: dict[str, str] | None = None) -> tuple[HTTPResponse, bytes]:
+        return self.request("GET", path, headers=headers)
+
+    def post(self, path: str, payload: dict[str, Any]) -> tuple[HTTPResponse, bytes]:
+        return self.request("POST", path, payload=payload)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import unittest
+from typing import Any
+
+from src.api import web_service
+from src.api.address_intel import normalize_error_row
+from src.api.address_intel_errors import AddressIntelError
+from src.api.analyze_batch import iter_batch_results, parse_batch_queries, summarize_batch
+from src.api.async_job_events import JobEventHub
+from src.api.async_worker_runtime import AsyncJobRuntime
+from tests.async_api_helpers import STORE_BACKENDS, AsyncApiTestCase, StoreBackendTestCase
+
+
+def _fake_report(query: str, **kwargs: Any) -> dict[str, Any]:
+    if query.startswith("fail"):
+        raise AddressIntelError(f"no match for {query}")
+    return {
+        "query": query,
+        "match": {"selected_score": 0.98},
+        "sources": {"geoadmin_search": {"status": "ok"}},
+        "building": {"baujahr": 1910},
+    }
+
+
+class TestBatchHelpers(unittest.TestCase):
+    def test_parse_batch_queries_validates_items(self):
+        self.assertEqual(parse_batch_queries({"queries": [" a ", "b"]}), ["a", "b"])
+        with self.assertRaisesRegex(ValueError, "non-empty list"):
+            parse_batch_queries({"queries": []})
+        with self.assertRaisesRegex(ValueError, "non-empty list"):
+            parse_batch_queries({"queries": "a"})
+        with self.assertRaisesRegex(ValueError, r"queries\[1\]"):
+            parse_batch_queries({"queries": ["a", "  "]})
+        with self.assertRaisesRegex(ValueError, "at most 2"):
+            parse_batch_queries({"queries": ["a", "b", "c"]}, max_items=2)
+
+    def test_iter_batch_results_bounds_concurrency_and_isolates_errors(self):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def _analyze(query: str) -> dict[str, Any]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                time.sleep(0.02)
+                if query == "q3":
+                    raise AddressIntelError("boom")
+                return {"query": query}
+            finally:
+                with lock:
+                    active -= 1
+
+        queries = [f"q{index}" for index in range(8)]
+        rows = list(iter_batch_results(queries, _analyze, concurrency=3))
+
+        self.assertLessEqual(peak, 3)
+        self.assertEqual(sorted(row["index"] for row in rows), list(range(8)))
+        failed = [row for row in rows if not row["ok"]]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0]["index"], 3)
+        # Gleiche Fehlerzeile wie der CLI-Batch-Modus.
+        expected = normalize_error_row("q3", 4, AddressIntelError("boom"))
+        self.assertEqual({key: value for key, value in failed[0].items() if key not in ("index", "ok")}, expected)
+
+        summary = summarize_batch(8, rows)
+        self.assertEqual((summary["processed"], summary["ok"], summary["error"]), (8, 7, 1))
+        self.assertEqual([item["index"] for item in summary["items"]], list(range(8)))
+        error_code = expected["batch_meta"]["error_code"]
+        self.assertEqual(
+            summary["items"][3], {"index": 3, "query": "q3", "status": "error", "error_code": error_code}
+        )
+
+    def test_iter_batch_results_skips_persisted_items(self):
+        rows = list(
+            iter_batch_results(
+                ["a", "b", "c", "d"], lambda query: {"query": query}, concurrency=2, skip_indices={0, 2}
+            )
+        )
+
+        self.assertEqual(sorted(row["index"] for row in rows), [1, 3])
+        self.assertEqual({row["index"]: row["batch_meta"]["row"] for row in rows}, {1: 2, 3: 4})
+
+
+class TestBatchResultStore(StoreBackendTestCase):
+    def test_list_results_after_seq(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                job = store.create_job(
+                    request_payload={"queries": ["a"]},
+                    request_id="req-batch",
+                    query="batch (1 queries)",
+                    intelligence_mode="basic",
+                )
+                job_id = str(job["job_id"])
+                for index in range(3):
+                    store.create_result(job_id=job_id, result_payload={"index": index}, result_kind="partial")
+
+                self.assertEqual([row["result_seq"] for row in store.list_results(job_id, after_seq=1)], [2, 3])
+                self.assertEqual(store.list_results(job_id, after_seq=3), [])
+                self.assertEqual(len(store.list_results(job_id)), 3)
+
+
+class TestAnalyzeBatchEndpoint(AsyncApiTestCase):
+    env = {"ASYNC_JOB_EVENTS_POLL_SECONDS": "30", "ANALYZE_BATCH_MAX_ITEMS": "5"}
+
+    def web_service_overrides(self) -> dict[str, Any]:
+        hub = JobEventHub(max_subscribers=4)
+        self.api_store.add_event_listener(hub.publish)
+        self.runtime = AsyncJobRuntime(
+            store=self.api_store,
+            analysis_runner=web_service._run_async_analysis_stages,
+            stage_delay_seconds=0.0,
+            workers=1,
+        )
+        return {
+            "_ASYNC_JOB_EVENT_HUB": hub,
+            "_ASYNC_JOB_RUNTIME": self.runtime,
+            "build_report": _fake_report,
+        }
+
+    def start_workers(self) -> None:
+        self.runtime.start()
+        self.addCleanup(self.runtime.stop)
+
+    def _wait_until_completed(self, job_id: str) -> None:
+        deadline = time.monotonic() + 10
+        while self.api_store.get_job(job_id)["status"] != "completed" and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+    def test_batch_streams_items_as_ndjson(self):
+        queries = ["Bahnhofstrasse 1, 8001 Zürich", "fail here", "Marktgasse 5, 3011 Bern"]
+
+        response, body = self.post("/analyze/batch", {"queries": queries})
+
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.getheader("Content-Type").startswith("application/x-ndjson"))
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        lines = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+        self.assertEqual(lines[0]["type"], "batch")
+        self.assertEqual(lines[0]["total"], 3)
+        items = [line for line in lines if line["type"] == "item"]
+        self.assertEqual(sorted(item["index"] for item in items), [0, 1, 2])
+        failed = next(item for item in items if item["index"] == 1)
+        self.assertIs(failed["ok"], False)
+        self.assertEqual(failed["batch_meta"]["status"], "error")
+        ok_item = next(item for item in items if item["index"] == 0)
+        self.assertIs(ok_item["ok"], True)
+        self.assertTrue(ok_item["result"]["data"]["modules"]["building"])
+        self.assertTrue(ok_item["result_id"])
+
+        summary = lines[-1]
+        self.assertEqual(summary["type"], "summary")
+        self.assertEqual(summary["status"], "completed")
+        self.assertEqual((summary["total"], summary["ok"], summary["error"]), (3, 2, 1))
+
+        job = self.api_store.get_job(lines[0]["job_id"])
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(
+            [r["result_kind"] for r in self.api_store.list_results(job["job_id"])], ["partial"] * 3 + ["final"]
+        )
+
+    def test_batch_async_mode_returns_job(self):
+        response, body = self.post(
+            "/analyze/batch",
+            {"queries": ["Bahnhofstrasse 1, 8001 Zürich"], "options": {"async_mode": {"requested": True}}},
+        )
+
+        self.assertEqual(response.status, 202)
+        payload = json.loads(body)
+        self.assertIs(payload["accepted"], True)
+        self.assertEqual(payload["batch"], {"total": 1})
+        job_id = payload["job"]["job_id"]
+        self._wait_until_completed(job_id)
+        final = self.api_store.list_results(job_id)[-1]
+        self.assertEqual(final["result_payload"]["batch"]["ok"], 1)
+
+    def test_batch_above_sync_limit_runs_async(self):
+        self.set_env(ANALYZE_BATCH_SYNC_MAX_ITEMS="2")
+
+        response, body = self.post("/analyze/batch", {"queries": ["a", "b", "c"]})
+
+        self.assertEqual(response.status, 202)
+        payload = json.loads(body)
+        self.assertEqual(payload["batch"], {"total": 3})
+        job_id = payload["job"]["job_id"]
+        self._wait_until_completed(job_id)
+        self.assertEqual(self.api_store.list_results(job_id)[-1]["result_payload"]["batch"]["ok"], 3)
+
+    def test_batch_rejects_invalid_queries(self):
+        response, body = self.post("/analyze/batch", {"queries": ["a"] * 6})
+        self.assertEqual(response.status, 400)
+        self.assertIn("at most 5", json.loads(body)["message"])
+
+        response, body = self.post("/analyze/batch", {"queries": ["a", 1]})
+        self.assertEqual(response.status, 400)
+        self.assertEqual(json.loads(body)["error"], "bad_request")
+
+
+if __name__ == "__main__":
+    unittest.main()
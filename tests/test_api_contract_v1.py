@@ -135,6 +135,7 @@ def validate_request(payload: Any) -> list[str]:
                 "language",
                 "timeout_seconds",
                 "response_mode",
+                "modules",
                 "capabilities",
                 "entitlements",
             }
@@ -155,6 +156,12 @@ def validate_request(payload: Any) -> list[str]:
             if response_mode is not None and response_mode not in {"compact", "verbose"}:
                 errors.append("options.response_mode invalid")
 
+            modules = options.get("modules")
+            if modules is not None and (
+                not isinstance(modules, list) or not modules or not all(isinstance(item, str) for item in modules)
+            ):
+                errors.append("options.modules must be non-empty string array")
+
             capabilities = options.get("capabilities")
             if capabilities is not None and not isinstance(capabilities, dict):
                 errors.append("options.capabilities must be object")
@@ -0,0 +1,180 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.api import web_service
+from src.api.address_intel_errors import AddressIntelError
+from src.api.async_jobs import AsyncJobStore
+from src.api.async_worker_runtime import AsyncJobRuntime
+from src.shared.async_job_store_db import DbAsyncJobStore
+
+
+def _fake_report(query: str, **kwargs):
+    modules = kwargs.get("modules")
+    report = {
+        "query": query,
+        "match": {"selected_score": 0.98},
+        "sources": {"geoadmin_search": {"status": "ok"}},
+    }
+    if modules is None or "building" in modules:
+        report["building"] = {"baujahr": 1910}
+    return report
+
+
+class TestAsyncAnalysisStagePlan(unittest.TestCase):
+    def test_full_report_runs_all_four_stages(self):
+        plan = web_service._async_analysis_stage_plan(None)
+
+        self.assertEqual(
+            [name for name, _ in plan],
+            ["resolution", "building_energy", "cross_source", "intelligence"],
+        )
+        self.assertIn("match", plan[0][1])
+        self.assertTrue(plan[0][1] < plan[1][1] < plan[2][1])
+        self.assertIsNone(plan[-1][1])
+
+    def test_module_selection_skips_stages_without_new_modules(self):
+        plan = web_service._async_analysis_stage_plan(frozenset({"match", "building"}))
+        self.assertEqual(plan, [("resolution", frozenset({"match"})), ("final", frozenset({"match", "building"}))])
+
+        self.assertEqual(
+            web_service._async_analysis_stage_plan(frozenset({"match"})),
+            [("final", frozenset({"match"}))],
+        )
+
+
+class TestAsyncAnalysisRunner(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = AsyncJobStore(store_file=Path(self._tmp.name) / "store.json")
+
+    def _create_job(self, payload: dict) -> str:
+        job = self.store.create_job(
+            request_payload=payload,
+            request_id="req-stages",
+            query=payload["query"],
+            intelligence_mode="basic",
+        )
+        return str(job["job_id"])
+
+    def test_each_stage_is_persisted_as_partial_before_the_final_result(self):
+        job_id = self._create_job({"query": "Bahnhofstrasse 1, 8001 Zürich"})
+        runtime = AsyncJobRuntime(store=self.store, analysis_runner=web_service._run_async_analysis_stages)
+
+        with mock.patch.object(web_service, "build_report", side_effect=_fake_report) as build_report:
+            runtime._process_one(job_id)
+
+        self.assertEqual(build_report.call_count, 4)
+        client_ids = {id(call.kwargs["client"]) for call in build_report.call_args_list}
+        self.assertEqual(len(client_ids), 1, "alle Stufen teilen einen HttpClient (Upstream-Cache)")
+
+        job = self.store.get_job(job_id)
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["progress_percent"], 100)
+
+        results = self.store.list_results(job_id)
+        self.assertEqual([r["result_kind"] for r in results], ["partial", "partial", "partial", "final"])
+        runtime_modules = [r["result_payload"]["result"]["data"]["modules"]["runtime"] for r in results]
+        self.assertEqual(
+            [(m["stage"], m["progress_percent"]) for m in runtime_modules],
+            [("resolution", 25), ("building_energy", 50), ("cross_source", 75), ("intelligence", 100)],
+        )
+        self.assertEqual(runtime_modules[-1]["status"], "completed")
+        self.assertNotIn("building", results[0]["result_payload"]["result"]["data"]["modules"])
+        self.assertIn("building", results[-1]["result_payload"]["result"]["data"]["modules"])
+
+    def test_recovered_partial_job_resumes_after_persisted_stages(self):
+        job_id = self._create_job({"query": "Bahnhofstrasse 1, 8001 Zürich"})
+        runtime = AsyncJobRuntime(store=self.store, analysis_runner=web_service._run_async_analysis_stages)
+        # Stand nach Worker-Absturz: zwei Stufen (25/50 %) persistiert.
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+        for progress in (25, 50):
+            self.store.create_result(job_id=job_id, result_payload={"stage": progress}, result_kind="partial")
+            self.store.transition_job(job_id=job_id, to_status="partial", progress_percent=progress)
+
+        with mock.patch.object(web_service, "build_report", side_effect=_fake_report) as build_report:
+            runtime._process_one(job_id)
+
+        self.assertEqual(build_report.call_count, 2)
+        job = self.store.get_job(job_id)
+        self.assertEqual((job["status"], job["progress_percent"]), ("completed", 100))
+        results = self.store.list_results(job_id)
+        self.assertEqual([r["result_kind"] for r in results], ["partial", "partial", "partial", "final"])
+        self.assertEqual(
+            [r["result_payload"]["result"]["data"]["modules"]["runtime"]["stage"] for r in results[2:]],
+            ["cross_source", "intelligence"],
+        )
+
+    def test_recovered_stub_job_does_not_fail_on_progress_monotonicity(self):
+        job_id = self._create_job({"query": "Bahnhofstrasse 1, 8001 Zürich"})
+        runtime = AsyncJobRuntime(store=self.store, stage_delay_seconds=0.0)
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+        self.store.create_result(job_id=job_id, result_payload={"stage": 1}, result_kind="partial")
+        self.store.transition_job(job_id=job_id, to_status="partial", progress_percent=35)
+
+        runtime._process_one(job_id)
+
+        self.assertEqual(self.store.get_job(job_id)["status"], "completed")
+        self.assertEqual(
+            [r["result_kind"] for r in self.store.list_results(job_id)], ["partial", "partial", "final"]
+        )
+
+    def test_stage_failure_keeps_earlier_partials_and_fails_job(self):
+        job_id = self._create_job({"query": "Bahnhofstrasse 1, 8001 Zürich"})
+        runtime = AsyncJobRuntime(store=self.store, analysis_runner=web_service._run_async_analysis_stages)
+
+        def _failing_report(query, **kwargs):
+            if kwargs.get("modules") and "building" in kwargs["modules"]:
+                raise AddressIntelError("building layer unavailable")
+            return _fake_report(query, **kwargs)
+
+        with mock.patch.object(web_service, "build_report", side_effect=_failing_report):
+            runtime._process_one(job_id)
+
+        job = self.store.get_job(job_id)
+        self.assertEqual(job["status"], "failed")
+        self.assertEqual(job["error_code"], "address_intel")
+        self.assertEqual([r["result_kind"] for r in self.store.list_results(job_id)], ["partial"])
+
+    def test_intermediate_stages_share_the_timeout_budget(self):
+        job_id = self._create_job({"query": "Bahnhofstrasse 1, 8001 Zürich", "timeout_seconds": 0.05})
+        runtime = AsyncJobRuntime(store=self.store, analysis_runner=web_service._run_async_analysis_stages)
+
+        def _slow_report(query, **kwargs):
+            time.sleep(0.06)
+            return _fake_report(query, **kwargs)
+
+        with mock.patch.object(web_service, "build_report", side_effect=_slow_report) as build_report:
+            runtime._process_one(job_id)
+
+        # Budget nach der ersten Stufe aufgebraucht: direkt weiter zur finalen Stufe.
+        self.assertEqual(build_report.call_count, 2)
+        self.assertEqual(self.store.get_job(job_id)["status"], "completed")
+        results = self.store.list_results(job_id)
+        self.assertEqual(
+            [r["result_payload"]["result"]["data"]["modules"]["runtime"]["stage"] for r in results],
+            ["resolution", "intelligence"],
+        )
+
+    def test_db_job_without_blob_dir_carries_request_options_inline(self):
+        request_payload = {"query": "q", "timeout_seconds": 5, "options": {"response_mode": "compact"}}
+        db_job = {"job_id": "job-1", "request_payload_ref": None, "request_payload_json": request_payload}
+        db_store = mock.Mock(spec=DbAsyncJobStore)
+        db_store.blob_store = None
+
+        with mock.patch.object(web_service, "_async_job_store", return_value=db_store):
+            self.assertEqual(web_service._async_job_request_payload(db_job), request_payload)
+            self.assertEqual(web_service._async_job_request_payload({"job_id": "job-2"}), {})
+
+    def test_stub_mode_keeps_runtime_without_runner(self):
+        with mock.patch.dict("os.environ", {"ASYNC_WORKER_ANALYSIS": "stub"}):
+            self.assertIsNone(web_service._resolve_async_analysis_runner())
+        with mock.patch.dict("os.environ", {"ASYNC_WORKER_ANALYSIS": ""}):
+            self.assertIs(web_service._resolve_async_analysis_runner(), web_service._run_async_analysis_stages)
+
+
+if __name__ == "__main__":
+    unittest.main()
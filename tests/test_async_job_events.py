@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import unittest
+from typing import Any
+
+from src.api import web_service
+from src.api.async_job_events import JobEventCapacityError, JobEventHub
+from tests.async_api_helpers import STORE_BACKENDS, AsyncApiTestCase, StoreBackendTestCase, TempDirTestCase
+
+
+def _create_job(store: Any) -> str:
+    job = store.create_job(
+        request_payload={"query": "Bahnhofstrasse 1, 8001 Zürich"},
+        request_id="req-events",
+        query="Bahnhofstrasse 1, 8001 Zürich",
+        intelligence_mode="basic",
+        org_id="org-a",
+    )
+    return str(job["job_id"])
+
+
+class TestJobEventHub(unittest.TestCase):
+    def test_hub_wakes_subscribers_and_drops_idle_channels(self):
+        hub = JobEventHub(max_subscribers=2)
+        hub.publish("job-a", 1)  # ohne Wartende: no-op
+        self.assertEqual(hub.stats()["channels"], 0)
+
+        with hub.subscribe("job-a") as subscription:
+            self.assertFalse(subscription.wait(after_seq=0, timeout=0.01))
+            timer = threading.Timer(0.05, hub.publish, args=("job-a", 2))
+            timer.start()
+            started = time.monotonic()
+            self.assertTrue(subscription.wait(after_seq=1, timeout=5))
+            self.assertLess(time.monotonic() - started, 2)
+            # Bereits publizierte Events gelten sofort, andere Jobs wecken nicht.
+            self.assertTrue(subscription.wait(after_seq=1, timeout=0))
+            hub.publish("job-b", 9)
+            self.assertFalse(subscription.wait(after_seq=2, timeout=0.01))
+
+        self.assertEqual(hub.stats(), {"subscribers": 0, "channels": 0, "max_subscribers": 2})
+
+    def test_hub_rejects_subscribers_beyond_capacity(self):
+        hub = JobEventHub(max_subscribers=1)
+        with hub.subscribe("job-a"):
+            with self.assertRaises(JobEventCapacityError):
+                with hub.subscribe("job-b"):
+                    pass
+        with hub.subscribe("job-b"):
+            pass
+
+
+class TestJobEventWiring(TempDirTestCase):
+    def test_max_waiters_leave_pool_workers_free(self):
+        self.unset_env("ASYNC_JOB_EVENTS_MAX_WAITERS", "API_SERVER_MODE")
+        self.assertEqual(web_service._async_job_events_max_waiters(), 64)
+
+        self.set_env(API_SERVER_MODE="pool", API_WORKER_POOL_SIZE="16")
+        self.assertEqual(web_service._async_job_events_max_waiters(), 8)
+        self.set_env(ASYNC_JOB_EVENTS_MAX_WAITERS="64")
+        self.assertEqual(web_service._async_job_events_max_waiters(), 15)
+        self.set_env(ASYNC_JOB_EVENTS_MAX_WAITERS="4")
+        self.assertEqual(web_service._async_job_events_max_waiters(), 4)
+
+    def test_event_feed_publishes_notifications_of_other_nodes(self):
+        stop = threading.Event()
+
+        class _Listener:
+            def __init__(self, batches: list[Any]) -> None:
+                self._batches = batches
+                self.closed = False
+
+            def wait(self, timeout: float) -> list[str]:
+                if not self._batches:
+                    stop.set()
+                    return []
+                batch = self._batches.pop(0)
+                if isinstance(batch, Exception):
+                    raise batch
+                return batch
+
+            def close(self) -> None:
+                self.closed = True
+
+        listeners = [_Listener([["job-a:2", "garbage", "job-b:x"], ConnectionError("gone")]), _Listener([["job-a:3"]])]
+
+        class _Store:
+            def open_job_event_listener(self) -> _Listener:
+                return listeners.pop(0) if listeners else _Listener([])
+
+        published: list[tuple[str, int]] = []
+
+        class _Hub:
+            def publish(self, job_id: str, event_seq: int) -> None:
+                published.append((job_id, event_seq))
+
+        self.set_env(ASYNC_JOB_EVENTS_POLL_SECONDS="0.01")
+        web_service._run_async_job_event_feed(_Store(), _Hub(), stop)
+
+        self.assertEqual(published, [("job-a", 2), ("job-a", 3)])
+
+
+class TestStoreEventListeners(StoreBackendTestCase):
+    def test_store_publishes_committed_events(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                published: list[tuple[str, int]] = []
+                store.add_event_listener(lambda job_id, event_seq: published.append((job_id, event_seq)))
+
+                job_id = _create_job(store)
+                store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+                store.transition_job(job_id=job_id, to_status="completed", progress_percent=100)
+
+                self.assertEqual(published, [(job_id, 1), (job_id, 2), (job_id, 3)])
+                self.assertEqual([event["event_seq"] for event in store.list_events(job_id, after_seq=1)], [2, 3])
+                self.assertEqual(store.list_events(job_id, after_seq=3), [])
+
+
+class TestJobEventsEndpoint(AsyncApiTestCase):
+    # Langes Fallback-Intervall: die Tests sehen nur Push-Wakeups.
+    env = {"ASYNC_JOB_EVENTS_POLL_SECONDS": "30"}
+
+    def web_service_overrides(self) -> dict[str, Any]:
+        self.hub = JobEventHub(max_subscribers=4)
+        self.api_store.add_event_listener(self.hub.publish)
+        return {"_ASYNC_JOB_EVENT_HUB": self.hub}
+
+    def test_long_poll_returns_when_the_job_transitions(self):
+        job_id = _create_job(self.api_store)
+
+        timer = threading.Timer(
+            0.2,
+            self.api_store.transition_job,
+            kwargs={"job_id": job_id, "to_status": "running", "progress_percent": 5},
+        )
+        timer.start()
+        started = time.monotonic()
+        response, body = self.get(f"/analyze/jobs/{job_id}/events?since_event_seq=1&timeout=20")
+        elapsed = time.monotonic() - started
+        timer.join()
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Cache-Control"), "no-store")
+        payload = json.loads(body)
+        self.assertLess(elapsed, 10)
+        self.assertIs(payload["timed_out"], False)
+        self.assertEqual([event["event_type"] for event in payload["events"]], ["job.running"])
+        self.assertEqual(payload["last_event_seq"], 2)
+        self.assertEqual(payload["job"]["status"], "running")
+        self.assertNotIn("events", payload["job"])
+
+    def test_long_poll_answers_immediately_with_pending_events_and_times_out(self):
+        job_id = _create_job(self.api_store)
+
+        response, body = self.get(f"/analyze/jobs/{job_id}/events")
+        payload = json.loads(body)
+        self.assertEqual([event["event_seq"] for event in payload["events"]], [1])
+
+        response, body = self.get(f"/analyze/jobs/{job_id}/events?since_event_seq=1&timeout=0.2")
+        payload = json.loads(body)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(payload["events"], [])
+        self.assertIs(payload["timed_out"], True)
+        self.assertEqual(payload["last_event_seq"], 1)
+
+    def test_events_endpoint_validates_params_and_visibility(self):
+        job_id = _create_job(self.api_store)
+
+        response, body = self.get(f"/analyze/jobs/{job_id}/events?since_event_seq=-1")
+        self.assertEqual(response.status, 400)
+        self.assertIn("since_event_seq", json.loads(body)["message"])
+
+        response, _ = self.get(f"/analyze/jobs/{job_id}/events", headers={"X-Org-Id": "org-b"})
+        self.assertEqual(response.status, 404)
+
+        self.patch_web_service("_ASYNC_JOB_EVENT_HUB", JobEventHub(max_subscribers=0))
+        response, body = self.get(f"/analyze/jobs/{job_id}/events?timeout=0")
+        self.assertEqual(response.status, 503)
+        self.assertEqual(response.getheader("Retry-After"), "30")
+        self.assertEqual(json.loads(body)["error"], "server_overloaded")
+
+    def test_sse_streams_transitions_until_the_job_is_terminal(self):
+        job_id = _create_job(self.api_store)
+
+        def _run_job() -> None:
+            deadline = time.monotonic() + 5
+            while self.hub.stats()["subscribers"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.api_store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+            result = self.api_store.create_result(
+                job_id=job_id, result_payload={"partial": True}, result_kind="partial"
+            )
+            self.api_store.transition_job(
+                job_id=job_id, to_status="partial", progress_percent=50, result_id=result["result_id"]
+            )
+            self.api_store.transition_job(job_id=job_id, to_status="completed", progress_percent=100)
+
+        worker = threading.Thread(target=_run_job)
+        worker.start()
+        self.addCleanup(worker.join, 5)
+        conn = self.connect()
+        conn.request(
+            "GET",
+            f"/analyze/jobs/{job_id}/events",
+            headers={"X-Org-Id": "org-a", "Accept": "text/event-stream", "Last-Event-ID": "1"},
+        )
+        response = conn.getresponse()
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.getheader("Content-Type").startswith("text/event-stream"))
+        frames = _read_sse_frames(response)
+
+        self.assertEqual(frames[0], {"retry": "3000"})
+        events = [frame for frame in frames[1:] if frame.get("event") != "end"]
+        self.assertEqual([frame["event"] for frame in events], ["job.running", "job.partial", "job.completed"])
+        self.assertEqual([frame["id"] for frame in events], ["2", "3", "4"])
+        self.assertTrue(json.loads(events[1]["data"])["payload_json"]["result_id"])
+        self.assertEqual(
+            json.loads(frames[-1]["data"]), {"job_id": job_id, "status": "completed", "last_event_seq": 4}
+        )
+
+
+def _read_sse_frames(response: Any) -> list[dict[str, str]]:
+    frames: list[dict[str, str]] = []
+    current: dict[str, str] = {}
+    for raw_line in response:
+        line = raw_line.decode("utf-8").rstrip("\n")
+        if not line:
+            if current:
+                frames.append(current)
+                if current.get("event") == "end":
+                    break
+            current = {}
+            continue
+        field, _, value = line.partition(": ")
+        current[field] = value
+    return frames
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,9 @@ Strategy: mock the psycopg2 connection/cursor to capture SQL and verify:
   - create_job inserts correct fields
   - transition_job validates allowed transitions
   - create_result validates result_kind + duplicate final guard
+  - timestamptz values are returned as UTC ISO strings; retention deletes in batches
+    and collects blobs neither job_results nor jobs reference
+  - with a blob store, create_result stores the payload as blob and keeps the reference
 
 No live DB required.
 
@@ -19,10 +22,12 @@ from __future__ import annotations
 
 import json
 import re
+import tempfile
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, PropertyMock, call, patch
 
 from src.shared.async_job_store_db import DbAsyncJobStore, _canonical_payload_hash
+from src.shared.result_blob_store import LocalBlobStore
 
 
 # ---------------------------------------------------------------------------
@@ -99,6 +104,36 @@ class TestOrgGuardInListJobs(unittest.TestCase):
         self.assertIn("status", sqls)
 
 
+class TestHistoryKeysetPagination(unittest.TestCase):
+    """History pages use a (queued_at, job_id) keyset and maintained counters."""
+
+    def test_before_cursor_adds_keyset_predicate(self):
+        factory, mock_cursor, _ = _make_conn_factory(fetchall_values=[])
+        store = DbAsyncJobStore(conn_factory=factory)
+        store.list_jobs_for_user("user-1", org_id="org-a", limit=10, before=("2026-01-01T00:00:00+00:00", "job-9"))
+
+        sql, params = mock_cursor.execute.call_args_list[-1][0]
+        self.assertIn("(queued_at, job_id) < (%s, %s)", sql)
+        self.assertIn("ORDER BY queued_at DESC, job_id DESC", sql)
+        self.assertIn("job-9", params)
+
+    def test_unfiltered_counts_read_job_counts(self):
+        factory, mock_cursor, _ = _make_conn_factory(fetchone_values=[(7,)])
+        store = DbAsyncJobStore(conn_factory=factory)
+        self.assertEqual(store.count_jobs_for_org("org-a"), 7)
+
+        sqls = _all_sqls_joined(mock_cursor)
+        self.assertIn("job_counts", sqls)
+        self.assertNotIn("COUNT(*)", sqls)
+
+    def test_status_filtered_count_scans_jobs(self):
+        factory, mock_cursor, _ = _make_conn_factory(fetchone_values=[(2,)])
+        store = DbAsyncJobStore(conn_factory=factory)
+        self.assertEqual(store.count_jobs_for_org("org-a", status="queued"), 2)
+
+        self.assertIn("COUNT(*) FROM jobs", _all_sqls_joined(mock_cursor))
+
+
 class TestUserOrgGuardInListJobs(unittest.TestCase):
     """list_jobs_for_user must include BOTH user_id AND org_id in WHERE clause."""
 
@@ -234,6 +269,39 @@ class TestCreateJob(unittest.TestCase):
         )
         self.assertIsNone(job["user_id"])
 
+    def test_reused_job_is_inserted_completed_with_two_events(self):
+        store, mock_cursor, _ = self._make_store()
+        job = store.create_job(
+            request_payload={"query": "q"},
+            request_id="req-7",
+            query="q",
+            intelligence_mode="basic",
+            org_id="org-1",
+            reused_from={"job_id": "job-src", "result_id": "res-src"},
+        )
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn("reused_from_job_id", sql)
+        self.assertIn("job.completed", params)
+        self.assertEqual(params[16], 2)  # last_event_seq
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["result_id"], "res-src")
+        self.assertEqual(job["reused_from_job_id"], "job-src")
+
+    def test_find_reusable_job_uses_hash_lookup(self):
+        factory, mock_cursor, _ = _make_conn_factory(fetchone_values=[None])
+        store = DbAsyncJobStore(conn_factory=factory)
+        payload = {"query": "q"}
+
+        self.assertIsNone(
+            store.find_reusable_job(org_id="org-1", request_payload=payload, max_age_seconds=60, owner_user_id="u-1")
+        )
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn("request_payload_hash = %s", sql)
+        self.assertIn("reused_from_job_id IS NULL", sql)
+        self.assertIn("ORDER BY finished_at DESC LIMIT 1", sql)
+        self.assertEqual(params[:2], ["org-1", _canonical_payload_hash(payload)])
+        self.assertEqual(params[-1], "u-1")
+
 
 # ---------------------------------------------------------------------------
 # transition_job
@@ -323,6 +391,267 @@ class TestTransitionJob(unittest.TestCase):
         with self.assertRaises(ValueError):
             store.transition_job(job_id="job-1", to_status="running", progress_percent=101)
 
+    def test_event_seq_allocated_in_same_statement_as_update(self):
+        store, mock_cursor = self._store_with_job(self._base_job())
+        mock_cursor.fetchone.side_effect = [tuple(self._base_job().values()), (7,)]
+        job = store.transition_job(job_id="job-1", to_status="running")
+
+        sqls = _get_executed_sqls(mock_cursor)
+        self.assertEqual(len(sqls), 2)
+        self.assertIn("last_event_seq = last_event_seq + 1", sqls[1])
+        self.assertIn("INSERT INTO job_events", sqls[1])
+        self.assertNotIn("COUNT(*)", "\n".join(sqls))
+        self.assertEqual(job["last_event_seq"], 7)
+
+    def test_create_job_inserts_job_and_event_in_one_statement(self):
+        factory, mock_cursor, _ = _make_conn_factory()
+        store = DbAsyncJobStore(conn_factory=factory)
+        store.create_job(request_payload={}, request_id="req-7", query="q", intelligence_mode="basic")
+        sqls = _get_executed_sqls(mock_cursor)
+        self.assertEqual(len(sqls), 1)
+        self.assertIn("INSERT INTO jobs", sqls[0])
+        self.assertIn("INSERT INTO job_events", sqls[0])
+
+    def test_create_job_stores_request_payload_inline_without_blob_store(self):
+        factory, mock_cursor, _ = _make_conn_factory()
+        store = DbAsyncJobStore(conn_factory=factory)
+        payload = {"query": "q", "options": {"response_mode": "compact"}, "timeout_seconds": 5}
+
+        job = store.create_job(request_payload=payload, request_id="req-8", query="q", intelligence_mode="basic")
+
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn("request_payload_ref, request_payload_json", sql)
+        self.assertIn(json.dumps(payload, ensure_ascii=False), params)
+        self.assertEqual(job["request_payload_json"], payload)
+        self.assertIsNone(job["request_payload_ref"])
+
+    def test_create_job_keeps_request_payload_as_blob_with_blob_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            factory, _, _ = _make_conn_factory()
+            store = DbAsyncJobStore(conn_factory=factory, blob_store=LocalBlobStore(tmp))
+
+            job = store.create_job(request_payload={"query": "q"}, request_id="req-9", query="q", intelligence_mode="basic")
+
+            self.assertIsNone(job["request_payload_json"])
+            self.assertEqual(store.blob_store.read_json(job["request_payload_ref"]), {"query": "q"})
+
+    def test_job_row_is_locked_for_update(self):
+        store, mock_cursor = self._store_with_job(self._base_job())
+        store.transition_job(job_id="job-1", to_status="running")
+        select_sql = _get_executed_sqls(mock_cursor)[0]
+        self.assertIn("FROM jobs", select_sql)
+        self.assertIn("FOR UPDATE", select_sql)
+
+
+# ---------------------------------------------------------------------------
+# Connection pooling
+# ---------------------------------------------------------------------------
+
+class TestConnectionPooling(unittest.TestCase):
+    def test_sequential_calls_reuse_pooled_connection(self):
+        factory, mock_cursor, mock_conn = _make_conn_factory(fetchone_values=[None, None, None])
+        mock_conn.closed = 0
+        counting_factory = MagicMock(side_effect=factory)
+        store = DbAsyncJobStore(conn_factory=counting_factory)
+
+        for _ in range(3):
+            self.assertIsNone(store.get_job("job-1"))
+
+        self.assertEqual(counting_factory.call_count, 1)
+        self.assertEqual(mock_conn.rollback.call_count, 3)
+        mock_conn.close.assert_not_called()
+
+    def test_pool_settings_are_forwarded(self):
+        factory, _, _ = _make_conn_factory()
+        store = DbAsyncJobStore(conn_factory=factory, max_size=3, acquire_timeout_seconds=1.5)
+        self.assertEqual(store._pool.stats()["max_size"], 3)
+
+    def test_close_closes_idle_connections(self):
+        factory, _, mock_conn = _make_conn_factory(fetchone_values=[None])
+        mock_conn.closed = 0
+        store = DbAsyncJobStore(conn_factory=factory)
+        store.get_job("job-1")
+        store.close()
+        mock_conn.close.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Multi-node claiming (leases, LISTEN/NOTIFY)
+# ---------------------------------------------------------------------------
+
+class TestClaimLeases(unittest.TestCase):
+    def test_claim_uses_skip_locked_and_returns_leased_jobs(self):
+        from datetime import datetime, timezone
+
+        factory, mock_cursor, mock_conn = _make_conn_factory()
+        expires = datetime(2026, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+        mock_cursor.fetchall.return_value = [("job-1", "queued", "worker-a", expires, 1)]
+        mock_cursor.description = [("job_id",), ("status",), ("lease_owner",), ("lease_expires_at",), ("claim_count",)]
+        store = DbAsyncJobStore(conn_factory=factory)
+
+        claimed = store.claim_jobs(worker_id="worker-a", limit=2, lease_seconds=15)
+
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertIn("lease_expires_at < now()", sql)
+        self.assertIn("claim_count = claim_count + 1", sql)
+        self.assertEqual(params, (2, "worker-a", 15.0))
+        self.assertEqual(claimed[0]["job_id"], "job-1")
+        self.assertEqual(claimed[0]["lease_expires_at"], "2026-01-01T12:00:30+00:00")
+        mock_conn.commit.assert_called_once()
+
+    def test_renew_and_release_are_scoped_to_lease_owner(self):
+        factory, mock_cursor, _ = _make_conn_factory(rowcount=0)
+        store = DbAsyncJobStore(conn_factory=factory)
+
+        self.assertFalse(store.renew_lease(job_id="job-1", worker_id="worker-a", lease_seconds=30))
+        self.assertIn("lease_owner = %s", mock_cursor.execute.call_args[0][0])
+        self.assertFalse(store.release_lease(job_id="job-1", worker_id="worker-a"))
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn("lease_owner = NULL", sql)
+        self.assertEqual(params, ("job-1", "worker-a"))
+
+    def test_requeue_expired_leases_returns_count(self):
+        factory, mock_cursor, _ = _make_conn_factory(rowcount=3)
+        store = DbAsyncJobStore(conn_factory=factory)
+        self.assertEqual(store.requeue_expired_leases(), 3)
+        self.assertIn("lease_expires_at < now()", mock_cursor.execute.call_args[0][0])
+
+    def test_listener_listens_and_drains_notifications(self):
+        from src.shared.async_job_store_db import JobNotificationListener
+
+        conn = MagicMock()
+        conn.notifies = []
+
+        def _poll():
+            conn.notifies.extend([MagicMock(payload="job-1"), MagicMock(payload="job-2")])
+
+        conn.poll.side_effect = _poll
+        listener = JobNotificationListener(conn)
+        self.assertTrue(conn.autocommit)
+        conn.cursor.return_value.execute.assert_called_once_with("LISTEN async_jobs")
+
+        with patch("src.shared.async_job_store_db.select.select", return_value=([conn], [], [])) as sel:
+            self.assertEqual(listener.wait(0.5), ["job-1", "job-2"])
+        sel.assert_called_once_with([conn], [], [], 0.5)
+        self.assertEqual(conn.notifies, [])
+
+        with patch("src.shared.async_job_store_db.select.select", return_value=([], [], [])):
+            self.assertEqual(listener.wait(0.1), [])
+
+    def test_event_listener_listens_on_events_channel(self):
+        conn = MagicMock()
+        store = DbAsyncJobStore(conn_factory=lambda: conn)
+
+        store.open_job_event_listener()
+
+        conn.cursor.return_value.execute.assert_called_once_with("LISTEN async_job_events")
+
+
+class TestTimestamptzBoundary(unittest.TestCase):
+    """Migration 007: timestamptz values leave the store as UTC ISO strings."""
+
+    def test_timestamptz_columns_are_rendered_as_utc_iso(self):
+        from datetime import datetime, timedelta, timezone
+
+        factory, mock_cursor, _ = _make_conn_factory()
+        zurich = timezone(timedelta(hours=1))
+        mock_cursor.fetchone.side_effect = [
+            ("job-1", datetime(2026, 1, 1, 11, 0, 0, 250000, tzinfo=zurich), None, "2026-01-01T10:00:01+00:00"),
+        ]
+        mock_cursor.description = [("job_id",), ("queued_at",), ("finished_at",), ("updated_at",)]
+        store = DbAsyncJobStore(conn_factory=factory)
+
+        job = store.get_job("job-1")
+
+        self.assertEqual(job["queued_at"], "2026-01-01T10:00:00.250000+00:00")
+        self.assertIsNone(job["finished_at"])
+        # pre-007 text columns pass through unchanged
+        self.assertEqual(job["updated_at"], "2026-01-01T10:00:01+00:00")
+
+    def test_cleanup_retention_deletes_time_range_in_batches(self):
+        from datetime import datetime, timezone
+
+        factory, mock_cursor, mock_conn = _make_conn_factory(
+            # jobs (total, terminal), then remaining (total, terminal) per table after its deletes
+            fetchone_values=[(5, 2), (117, 80), (40, 12)],
+            fetchall_values=[("jobs", 5), ("job_results", 120), ("job_events", 40)],
+        )
+        # job_results: full batch, then a short one; job_events: one short batch
+        type(mock_cursor).rowcount = PropertyMock(side_effect=[2, 1, 0])
+        store = DbAsyncJobStore(conn_factory=factory)
+
+        summary = store.cleanup_retention(
+            results_ttl_seconds=3600,
+            events_ttl_seconds=60,
+            now=datetime(2026, 1, 2, 0, 0, tzinfo=timezone.utc),
+            batch_size=2,
+        )
+
+        deletes = [c[0] for c in mock_cursor.execute.call_args_list if str(c[0][0]).startswith("DELETE")]
+        result_deletes = [params for sql, params in deletes if "job_results" in sql]
+        self.assertTrue(all("created_at <= %s" in sql and "LIMIT %s" in sql for sql, _ in deletes if "job_results" in sql))
+        self.assertEqual(result_deletes, [("2026-01-01T23:00:00+00:00", 2)] * 2)
+        self.assertEqual(summary["results"]["delete_count"], 3)
+        # Results/events are only counted after their deletes have finished.
+        sqls = _get_executed_sqls(mock_cursor)
+        last_result_delete = max(i for i, sql in enumerate(sqls) if sql.startswith("DELETE FROM job_results"))
+        first_result_count = min(i for i, sql in enumerate(sqls) if "COUNT(*)" in sql and "FROM job_results" in sql)
+        self.assertLess(last_result_delete, first_result_count)
+        self.assertEqual(summary["counts"], "exact")
+        self.assertEqual((summary["terminal_job_count"], summary["active_job_count"]), (2, 3))
+        self.assertEqual(summary["estimated_job_count"], 5)
+        self.assertEqual(summary["results"]["total"], 120)
+        self.assertEqual(summary["results"]["eligible_terminal"], 83)
+        self.assertEqual(summary["results"]["kept_count"], 117)
+        self.assertEqual(summary["results"]["estimated_total"], 120)
+        self.assertEqual(
+            (summary["events"]["total"], summary["events"]["delete_count"], summary["events"]["kept_count"]),
+            (40, 0, 40),
+        )
+        for field in ("total", "eligible_terminal", "delete_count", "kept_count"):
+            self.assertIsInstance(summary["results"][field], int)
+        self.assertEqual(summary["results"]["cutoff"], "2026-01-01T23:00:00+00:00")
+        self.assertGreaterEqual(mock_conn.commit.call_count, 2)
+
+    def test_cleanup_retention_dry_run_only_counts(self):
+        factory, mock_cursor, mock_conn = _make_conn_factory(fetchone_values=[(1, 1), (4, 4), (3,), (6, 6), (6,)])
+        store = DbAsyncJobStore(conn_factory=factory)
+
+        summary = store.cleanup_retention(results_ttl_seconds=0, events_ttl_seconds=0, dry_run=True)
+
+        self.assertNotIn("DELETE", _all_sqls_joined(mock_cursor))
+        self.assertEqual(summary["results"]["delete_count"], 3)
+        self.assertEqual(summary["events"]["kept_count"], 0)
+        self.assertEqual(summary["counts"], "exact")
+        self.assertEqual(summary["terminal_job_count"], 1)
+        mock_conn.commit.assert_not_called()
+
+    def test_cleanup_retention_collects_unreferenced_blobs(self):
+        import os
+        import time
+
+        with tempfile.TemporaryDirectory() as tmp:
+            blobs = LocalBlobStore(tmp)
+            kept = blobs.put_json({"kept": True})["s3_key"]
+            orphan = blobs.put_json({"orphan": True})["s3_key"]
+            two_hours_ago = time.time() - 7200
+            for key in (kept, orphan):
+                os.utime(os.path.join(tmp, key), (two_hours_ago, two_hours_ago))
+            factory, mock_cursor, _ = _make_conn_factory(fetchone_values=[(2, 1), (1, 1), (0, 0)])
+            mock_cursor.fetchall.side_effect = [[("jobs", 2)], [(kept,)]]
+            store = DbAsyncJobStore(conn_factory=factory, blob_store=blobs)
+
+            summary = store.cleanup_retention(results_ttl_seconds=None, events_ttl_seconds=None)
+
+            lookup_sql, lookup_params = mock_cursor.execute.call_args_list[-1][0]
+            self.assertIn("s3_key = ANY(%s)", lookup_sql)
+            self.assertIn("request_payload_ref = ANY(%s)", lookup_sql)
+            self.assertEqual(sorted(lookup_params[0]), sorted([kept, orphan]))
+            self.assertTrue(blobs.exists(kept))
+            self.assertFalse(blobs.exists(orphan))
+            self.assertEqual((summary["blobs"]["total"], summary["blobs"]["delete_count"]), (2, 1))
+
 
 # ---------------------------------------------------------------------------
 # create_result
@@ -336,13 +665,13 @@ class TestCreateResult(unittest.TestCase):
         has_final: bool = False,
         max_seq: int = 0,
     ):
-        job_row = ("job-1", "org-1", "user-1") if job_exists else None
+        # UPDATE jobs ... RETURNING org_id, user_id, last_result_seq
+        job_row = ("org-1", "user-1", max_seq + 1) if job_exists else None
         final_row = (1,) if has_final else None
-        seq_row = (max_seq,)
 
         mock_cursor = MagicMock()
-        # fetchone sequence: job lookup, final-check, max-seq
-        mock_cursor.fetchone.side_effect = [job_row, final_row, seq_row]
+        # fetchone sequence: counter bump on the job row, final-check
+        mock_cursor.fetchone.side_effect = [job_row, final_row]
         mock_cursor.fetchall.return_value = []
         mock_cursor.rowcount = 1
         mock_cursor.description = [("org_id",), ("user_id",), ("job_id",)]
@@ -419,6 +748,39 @@ class TestCreateResult(unittest.TestCase):
         self.assertIn("results/abc.json", all_params)
         self.assertIn("deadbeef", all_params)
 
+    def test_result_seq_comes_from_job_counter_without_max_scan(self):
+        store, mock_cursor = self._make_store_for_result(max_seq=4)
+        result = store.create_result(job_id="job-1", result_payload={}, result_kind="partial", org_id="org-1")
+        self.assertEqual(result["result_seq"], 5)
+        sqls = _all_sqls_joined(mock_cursor)
+        self.assertIn("last_result_seq = last_result_seq + 1", sqls)
+        self.assertNotIn("MAX(result_seq)", sqls)
+        self.assertEqual(len(_get_executed_sqls(mock_cursor)), 2)
+
+    def test_payload_goes_to_blob_store_and_row_keeps_reference(self):
+        store, mock_cursor = self._make_store_for_result()
+        with tempfile.TemporaryDirectory() as tmp:
+            store.blob_store = LocalBlobStore(tmp)
+            payload = {"summary": {"score": 7}, "modules": {"building": {"floors": 4}}}
+            result = store.create_result(job_id="job-1", result_payload=payload, org_id="org-1")
+
+            self.assertEqual(result["s3_bucket"], "local")
+            self.assertEqual(result["s3_key"], f"sha256/{result['checksum_sha256'][:2]}/{result['checksum_sha256']}.json.gz")
+            self.assertEqual(store.blob_store.read_json(result["s3_key"]), payload)
+            self.assertNotIn("result_payload", result)
+
+        insert_params = mock_cursor.execute.call_args_list[-1][0][1]
+        self.assertIn(result["s3_key"], insert_params)
+        self.assertIn(result["checksum_sha256"], insert_params)
+        self.assertIn(result["size_bytes"], insert_params)
+        self.assertNotIn("floors", str(insert_params))
+
+    def test_explicit_s3_key_bypasses_blob_store(self):
+        store, mock_cursor = self._make_store_for_result()
+        store.blob_store = MagicMock()
+        store.create_result(job_id="job-1", result_payload={}, org_id="org-1", s3_bucket="b", s3_key="k")
+        store.blob_store.put_json.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # from_env
@@ -0,0 +1,236 @@
+"""
+tests/test_async_job_store_db_postgres.py
+
+Opt-in integration test for DbAsyncJobStore against a real Postgres:
+concurrent result creation on the same job must yield gap-free, unique
+result_seq values (row lock via SELECT ... FOR UPDATE) while the pool keeps
+the number of open connections bounded.
+
+Runs only when ASYNC_DB_TEST_URL points to a disposable database and
+psycopg2 is installed; the test works in its own schema and drops it again.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import unittest
+import uuid
+from pathlib import Path
+
+try:  # pragma: no cover - depends on the environment
+    import psycopg2
+except ImportError:  # pragma: no cover
+    psycopg2 = None
+
+from src.shared.async_job_store_db import DbAsyncJobStore
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MIGRATIONS = [
+    REPO_ROOT / "db" / "migrations" / "002_async_jobs_schema.sql",
+    REPO_ROOT / "db" / "migrations" / "003_async_jobs_results.sql",
+    REPO_ROOT / "db" / "migrations" / "004_async_jobs_seq_counters.sql",
+    REPO_ROOT / "db" / "migrations" / "005_async_jobs_claim_leases.sql",
+    REPO_ROOT / "db" / "migrations" / "006_async_jobs_history_keyset.sql",
+    REPO_ROOT / "db" / "migrations" / "007_async_jobs_timestamptz.sql",
+    REPO_ROOT / "db" / "migrations" / "008_async_jobs_result_reuse.sql",
+    REPO_ROOT / "db" / "migrations" / "009_async_jobs_blob_refs.sql",
+    REPO_ROOT / "db" / "migrations" / "010_async_jobs_event_notify.sql",
+    REPO_ROOT / "db" / "migrations" / "011_async_jobs_request_payload.sql",
+]
+
+
+@unittest.skipUnless(os.getenv("ASYNC_DB_TEST_URL"), "ASYNC_DB_TEST_URL nicht gesetzt")
+@unittest.skipUnless(psycopg2 is not None, "psycopg2 nicht installiert")
+class TestDbAsyncJobStorePostgres(unittest.TestCase):
+    def setUp(self):
+        self.url = os.environ["ASYNC_DB_TEST_URL"]
+        self.schema = f"async_pool_test_{uuid.uuid4().hex[:12]}"
+        admin = psycopg2.connect(self.url)
+        try:
+            admin.autocommit = True
+            admin.cursor().execute(f"CREATE SCHEMA {self.schema}")
+        finally:
+            admin.close()
+        self.addCleanup(self._drop_schema)
+
+        options = f"-c search_path={self.schema}"
+        self.created = 0
+
+        def _factory():
+            self.created += 1
+            return psycopg2.connect(self.url, options=options)
+
+        setup_conn = psycopg2.connect(self.url, options=options)
+        try:
+            for path in MIGRATIONS:
+                setup_conn.cursor().execute(path.read_text(encoding="utf-8"))
+            setup_conn.commit()
+        finally:
+            setup_conn.close()
+
+        self.store = DbAsyncJobStore(conn_factory=_factory, max_size=4)
+        self.addCleanup(self.store.close)
+
+    def _drop_schema(self):
+        admin = psycopg2.connect(self.url)
+        try:
+            admin.autocommit = True
+            admin.cursor().execute(f"DROP SCHEMA IF EXISTS {self.schema} CASCADE")
+        finally:
+            admin.close()
+
+    def test_concurrent_results_get_unique_sequence_numbers(self):
+        job = self.store.create_job(
+            request_payload={"query": "Bahnhofstrasse 1", "options": {}},
+            request_id="req-pg",
+            query="Bahnhofstrasse 1",
+            intelligence_mode="basic",
+            org_id="org-a",
+        )
+        job_id = str(job["job_id"])
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+
+        errors: list[BaseException] = []
+
+        def _worker():
+            try:
+                for _ in range(5):
+                    self.store.create_result(job_id=job_id, result_payload={}, result_kind="partial")
+            except BaseException as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=_worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(errors, [])
+        seqs = [row["result_seq"] for row in self.store.list_results(job_id)]
+        self.assertEqual(seqs, list(range(1, 41)))
+        job = self.store.get_job(job_id)
+        self.assertEqual(job["last_result_seq"], 40)
+        self.assertEqual(job["last_event_seq"], 2)
+        self.assertLessEqual(self.created, 4)
+
+
+    def test_concurrent_claims_never_hand_out_a_job_twice(self):
+        job_ids = {
+            str(self.store.create_job(
+                request_payload={"query": f"claim-{i}"},
+                request_id=f"req-claim-{i}",
+                query=f"claim-{i}",
+                intelligence_mode="basic",
+            )["job_id"])
+            for i in range(20)
+        }
+        claimed: list[str] = []
+        claimed_lock = threading.Lock()
+
+        def _claimer(worker_id: str):
+            while True:
+                jobs = self.store.claim_jobs(worker_id=worker_id, limit=3, lease_seconds=60)
+                if not jobs:
+                    return
+                with claimed_lock:
+                    claimed.extend(str(job["job_id"]) for job in jobs)
+
+        threads = [threading.Thread(target=_claimer, args=(f"worker-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(sorted(claimed), sorted(job_ids))
+
+    def test_listener_is_notified_about_queued_jobs_and_released_leases(self):
+        listener = self.store.open_job_listener()
+        self.addCleanup(listener.close)
+        job = self.store.create_job(
+            request_payload={"query": "notify"},
+            request_id="req-notify",
+            query="notify",
+            intelligence_mode="basic",
+        )
+        job_id = str(job["job_id"])
+        self.assertEqual(listener.wait(5), [job_id])
+
+        self.store.claim_jobs(worker_id="worker-a", lease_seconds=60)
+        self.assertTrue(self.store.renew_lease(job_id=job_id, worker_id="worker-a", lease_seconds=60))
+        self.assertFalse(self.store.renew_lease(job_id=job_id, worker_id="worker-b", lease_seconds=60))
+        self.assertTrue(self.store.release_lease(job_id=job_id, worker_id="worker-a"))
+        self.assertEqual(listener.wait(5), [job_id])
+
+    def test_event_listener_is_notified_about_committed_events(self):
+        listener = self.store.open_job_event_listener()
+        self.addCleanup(listener.close)
+        job = self.store.create_job(
+            request_payload={"query": "events"},
+            request_id="req-events",
+            query="events",
+            intelligence_mode="basic",
+        )
+        job_id = str(job["job_id"])
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+
+        received: list[str] = []
+        for _ in range(5):
+            received += listener.wait(1)
+            if len(received) >= 2:
+                break
+        self.assertEqual(received, [f"{job_id}:1", f"{job_id}:2"])
+
+    def test_timestamps_keep_iso_wire_format_and_retention_deletes_by_range(self):
+        job = self.store.create_job(
+            request_payload={"query": "retention"},
+            request_id="req-retention",
+            query="retention",
+            intelligence_mode="basic",
+        )
+        job_id = str(job["job_id"])
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+        result = self.store.create_result(job_id=job_id, result_payload={}, result_kind="final")
+        self.store.transition_job(job_id=job_id, to_status="completed", progress_percent=100)
+
+        stored = self.store.get_job(job_id)
+        self.assertTrue(stored["queued_at"].endswith("+00:00"))
+        self.assertEqual(self.store.get_result(result["result_id"])["created_at"], result["created_at"])
+
+        summary = self.store.cleanup_retention(results_ttl_seconds=0, events_ttl_seconds=0, batch_size=2)
+        self.assertEqual(summary["results"]["delete_count"], 1)
+        self.assertEqual(summary["events"]["delete_count"], 3)
+        self.assertEqual(self.store.list_results(job_id), [])
+
+    def test_reusable_job_lookup_and_reused_job_insert(self):
+        payload = {"query": "reuse", "options": {"async_mode": {"requested": True}}}
+        source = self.store.create_job(
+            request_payload=payload, request_id="req-src", query="reuse", intelligence_mode="basic"
+        )
+        source_id = str(source["job_id"])
+        self.store.transition_job(job_id=source_id, to_status="running", progress_percent=5)
+        result = self.store.create_result(job_id=source_id, result_payload={}, result_kind="final")
+        self.store.transition_job(
+            job_id=source_id, to_status="completed", progress_percent=100, result_id=result["result_id"]
+        )
+
+        match = self.store.find_reusable_job(org_id="default-org", request_payload=payload, max_age_seconds=60)
+        self.assertEqual(match["job_id"], source_id)
+        reused = self.store.create_job(
+            request_payload=payload, request_id="req-reuse", query="reuse", intelligence_mode="basic",
+            reused_from=match,
+        )
+        stored = self.store.get_job(reused["job_id"])
+        self.assertEqual(stored["status"], "completed")
+        self.assertEqual(stored["result_id"], result["result_id"])
+        self.assertEqual([e["event_seq"] for e in self.store.list_events(reused["job_id"])], [1, 2])
+
+    def test_request_payload_round_trips_inline(self):
+        payload = {"query": "Zürich", "options": {"response_mode": "compact"}, "timeout_seconds": 5}
+        job = self.store.create_job(request_payload=payload, request_id="req-payload", query="Zürich", intelligence_mode="basic")
+
+        self.assertEqual(self.store.get_job(job["job_id"])["request_payload_json"], payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
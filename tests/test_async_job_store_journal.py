@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.api.async_jobs import AsyncJobStore, journal_file_for
+
+
+def _run_job(store: AsyncJobStore, query: str) -> str:
+    job = store.create_job(
+        request_payload={"query": query, "options": {}},
+        request_id=f"req-{query}",
+        query=query,
+        intelligence_mode="basic",
+    )
+    job_id = str(job["job_id"])
+    store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+    result = store.create_result(job_id=job_id, result_payload={"query": query}, result_kind="final")
+    store.transition_job(
+        job_id=job_id,
+        to_status="completed",
+        progress_percent=100,
+        result_id=str(result["result_id"]),
+    )
+    return job_id
+
+
+def _snapshot(store: AsyncJobStore, job_id: str) -> dict:
+    return {
+        "job": store.get_job(job_id),
+        "results": store.list_results(job_id),
+        "events": store.list_events(job_id),
+        "notifications": store.list_notifications(job_id),
+    }
+
+
+class TestAsyncJobStoreJournal(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="async-job-journal-")
+        self.addCleanup(self._tmp.cleanup)
+        self.store_path = Path(self._tmp.name) / "store.json"
+        self.journal_path = journal_file_for(self.store_path)
+
+    def test_mutations_append_to_journal_without_rewriting_snapshot(self):
+        store = AsyncJobStore(store_file=self.store_path, journal_fsync="off")
+        snapshot_before = self.store_path.read_bytes()
+
+        with patch("src.api.async_jobs.os.replace") as replace:
+            job_id = _run_job(store, "Bahnhofstrasse 1")
+        store.close()
+
+        replace.assert_not_called()
+        self.assertEqual(self.store_path.read_bytes(), snapshot_before)
+        records = [json.loads(line) for line in self.journal_path.read_bytes().splitlines()]
+        self.assertEqual([r["seq"] for r in records], [1, 2, 3, 4])
+
+        reopened = AsyncJobStore(store_file=self.store_path)
+        self.assertEqual(_snapshot(reopened, job_id), _snapshot(store, job_id))
+        self.assertEqual(reopened.get_job(job_id)["status"], "completed")
+
+    def test_torn_last_line_is_ignored_and_journal_stays_appendable(self):
+        store = AsyncJobStore(store_file=self.store_path, journal_fsync="off")
+        job_id = _run_job(store, "Torn")
+        expected = _snapshot(store, job_id)
+        store.close()
+
+        with open(self.journal_path, "ab") as handle:
+            handle.write(b'{"seq": 5, "ops": [["job", "x", {"job_id"')
+
+        recovered = AsyncJobStore(store_file=self.store_path, journal_fsync="off")
+        self.assertEqual(_snapshot(recovered, job_id), expected)
+        second_id = _run_job(recovered, "After crash")
+        recovered.close()
+
+        reopened = AsyncJobStore(store_file=self.store_path)
+        self.assertEqual(reopened.get_job(job_id), expected["job"])
+        self.assertEqual(reopened.get_job(second_id)["status"], "completed")
+
+    def test_compaction_writes_snapshot_and_truncates_journal(self):
+        store = AsyncJobStore(store_file=self.store_path, journal_fsync="off", compact_every=3)
+        job_id = _run_job(store, "Compact")
+
+        snapshot = json.loads(self.store_path.read_text(encoding="utf-8"))
+        self.assertEqual(snapshot["journal_seq"], 3)
+        self.assertIn(job_id, snapshot["jobs"])
+        self.assertEqual(len(self.journal_path.read_bytes().splitlines()), 1)
+        store.close()
+
+        reopened = AsyncJobStore(store_file=self.store_path)
+        self.assertEqual(_snapshot(reopened, job_id), _snapshot(store, job_id))
+
+    def test_replay_skips_records_already_in_snapshot(self):
+        store = AsyncJobStore(store_file=self.store_path, journal_fsync="off")
+        job_id = _run_job(store, "Crash before truncate")
+        with store._lock:
+            # Crash zwischen Snapshot und Journal-Truncate simulieren.
+            store._persist_state_atomic(store._state)
+        store.close()
+        self.assertTrue(self.journal_path.read_bytes())
+
+        reopened = AsyncJobStore(store_file=self.store_path)
+        self.assertEqual(len(reopened.list_events(job_id)), len(store.list_events(job_id)))
+        self.assertEqual(reopened.list_results(job_id), store.list_results(job_id))
+
+    def test_retention_cleanup_is_journaled(self):
+        store = AsyncJobStore(store_file=self.store_path, journal_fsync="always")
+        job_id = _run_job(store, "Retention")
+        summary = store.cleanup_retention(results_ttl_seconds=0, events_ttl_seconds=0)
+        self.assertEqual(summary["results"]["delete_count"], 1)
+        store.close()
+
+        reopened = AsyncJobStore(store_file=self.store_path)
+        self.assertEqual(reopened.list_results(job_id), [])
+        self.assertEqual(reopened.list_events(job_id), [])
+        self.assertEqual(reopened.get_job(job_id)["status"], "completed")
+
+    def test_from_env_reads_journal_settings(self):
+        env = {
+            "ASYNC_JOBS_STORE_FILE": str(self.store_path),
+            "ASYNC_JOBS_JOURNAL_FSYNC": "always",
+            "ASYNC_JOBS_JOURNAL_FSYNC_INTERVAL_MS": "250",
+            "ASYNC_JOBS_COMPACT_EVERY": "50",
+            "ASYNC_JOBS_COMPACT_MAX_BYTES": "4096",
+        }
+        with patch.dict(os.environ, env):
+            store = AsyncJobStore.from_env()
+
+        self.assertEqual(store._journal_fsync, "always")
+        self.assertEqual(store._fsync_interval_seconds, 0.25)
+        self.assertEqual(store._compact_every, 50)
+        self.assertEqual(store._compact_max_bytes, 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()
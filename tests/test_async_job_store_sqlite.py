@@ -0,0 +1,311 @@
+"""
+tests/test_async_job_store_sqlite.py
+
+Tests for SqliteAsyncJobStore (src/shared/async_job_store_sqlite.py) against a
+real temporary SQLite database:
+  - schema parity with migrations 002 + 003 (tables, columns, indexes)
+  - lifecycle with file-store record shapes (events, results, notifications)
+  - cancel semantics, history listing with tenant guard, retention cleanup
+  - concurrent readers while a writer is active (WAL)
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.shared.async_job_store_sqlite import SqliteAsyncJobStore
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MIGRATIONS = [
+    REPO_ROOT / "db" / "migrations" / "002_async_jobs_schema.sql",
+    REPO_ROOT / "db" / "migrations" / "003_async_jobs_results.sql",
+    REPO_ROOT / "db" / "migrations" / "005_async_jobs_claim_leases.sql",
+]
+
+
+def _migration_columns_and_indexes() -> tuple[dict[str, set[str]], set[str]]:
+    columns: dict[str, set[str]] = {}
+    indexes: set[str] = set()
+    for path in MIGRATIONS:
+        sql = path.read_text(encoding="utf-8")
+        for table, body in re.findall(r"CREATE TABLE IF NOT EXISTS (\w+) \((.*?)\n\);", sql, re.S):
+            for line in body.splitlines():
+                match = re.match(r"\s+(\w+)\s+\w+", line)
+                if match and match.group(1).upper() not in {"CONSTRAINT", "CHECK"}:
+                    columns.setdefault(table, set()).add(match.group(1))
+        for table, column in re.findall(r"ALTER TABLE (\w+) ADD COLUMN IF NOT EXISTS (\w+)", sql):
+            columns.setdefault(table, set()).add(column)
+        indexes.update(re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)", sql))
+    return columns, indexes
+
+
+class TestSqliteAsyncJobStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="async-job-sqlite-")
+        self.addCleanup(self._tmp.cleanup)
+        self.db_path = Path(self._tmp.name) / "store.sqlite3"
+        self.store = SqliteAsyncJobStore(db_path=self.db_path)
+        self.addCleanup(self.store.close)
+
+    def _create_job(self, query: str = "Bahnhofstrasse 1", **kwargs) -> str:
+        job = self.store.create_job(
+            request_payload={"query": query, "options": {}},
+            request_id=f"req-{query}",
+            query=query,
+            intelligence_mode="basic",
+            **kwargs,
+        )
+        return str(job["job_id"])
+
+    def _complete(self, job_id: str) -> str:
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+        self.store.create_result(job_id=job_id, result_payload={"stage": 1}, result_kind="partial")
+        self.store.transition_job(job_id=job_id, to_status="partial", progress_percent=50)
+        final = self.store.create_result(job_id=job_id, result_payload={"ok": True}, result_kind="final")
+        self.store.transition_job(
+            job_id=job_id, to_status="completed", progress_percent=100, result_id=final["result_id"]
+        )
+        return str(final["result_id"])
+
+    def test_schema_matches_migrations_002_and_003(self):
+        expected_columns, expected_indexes = _migration_columns_and_indexes()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            for table, columns in expected_columns.items():
+                actual = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                self.assertLessEqual(columns, actual, table)
+            actual_indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            self.assertLessEqual(expected_indexes, actual_indexes)
+        finally:
+            conn.close()
+
+    def test_lifecycle_returns_file_store_record_shapes(self):
+        job_id = self._create_job(org_id="org-a", owner_user_id="user-1")
+        result_id = self._complete(job_id)
+
+        job = self.store.get_job(job_id)
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["owner_user_id"], "user-1")
+        self.assertEqual(job["owner_org_id"], "org-a")
+        self.assertEqual(job["request_payload_json"], {"query": "Bahnhofstrasse 1", "options": {}})
+        self.assertEqual(job["partial_count"], 1)
+        self.assertEqual(job["result_id"], result_id)
+
+        results = self.store.list_results(job_id)
+        self.assertEqual([(r["result_kind"], r["result_seq"]) for r in results], [("partial", 1), ("final", 2)])
+        self.assertEqual(self.store.get_result(result_id)["result_payload"], {"ok": True})
+        self.assertIsNone(self.store.get_result_with_org_guard(result_id, org_id="org-b"))
+
+        events = self.store.list_events(job_id)
+        self.assertEqual(
+            [e["event_type"] for e in events],
+            ["job.queued", "job.running", "job.partial", "job.completed"],
+        )
+        self.assertEqual([e["event_seq"] for e in events], [1, 2, 3, 4])
+
+        with self.assertRaises(ValueError):
+            self.store.create_result(job_id=job_id, result_payload={}, result_kind="final")
+        with self.assertRaises(ValueError):
+            self.store.transition_job(job_id=job_id, to_status="running")
+
+        notifications = self.store.list_notifications(job_id, channel="in_app")
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(notifications[0]["payload_json"]["status"], "completed")
+
+    def test_failed_transition_keeps_retry_metadata(self):
+        job_id = self._create_job()
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+        job = self.store.transition_job(
+            job_id=job_id, to_status="failed", error_code="timeout", retry_hint="retry_later", retryable=False
+        )
+
+        self.assertEqual(self.store.get_job(job_id), job)
+        self.assertIs(job["retryable"], False)
+        self.assertEqual(job["retry_hint"], "retry_later")
+        self.assertEqual(self.store.list_notifications(job_id)[0]["template_key"], "async.job.failed")
+
+    def test_cancel_queued_and_running_jobs(self):
+        queued_id = self._create_job("queued")
+        outcome = self.store.request_cancel(job_id=queued_id)
+        self.assertTrue(outcome["cancel_applied"])
+        self.assertEqual(self.store.get_job(queued_id)["status"], "canceled")
+
+        running_id = self._create_job("running")
+        self.store.transition_job(job_id=running_id, to_status="running", progress_percent=5)
+        outcome = self.store.request_cancel(job_id=running_id)
+        self.assertFalse(outcome["cancel_applied"])
+        self.assertTrue(self.store.get_job(running_id)["cancel_requested_at"])
+
+        canceled = self.store.consume_cancel_request(job_id=running_id)
+        self.assertEqual(canceled["status"], "canceled")
+        self.assertEqual(self.store.list_job_ids(statuses=["canceled"]), [queued_id, running_id])
+
+    def test_history_listing_is_scoped_to_user_and_org(self):
+        own = [self._create_job(f"own-{i}", org_id="org-a", owner_user_id="user-1") for i in range(3)]
+        self._create_job("other-user", org_id="org-a", owner_user_id="user-2")
+        self._create_job("other-org", org_id="org-b", owner_user_id="user-1")
+
+        page = self.store.list_jobs_for_user("user-1", org_id="org-a", limit=2, offset=0)
+        self.assertEqual(len(page), 2)
+        self.assertTrue({row["job_id"] for row in page} <= set(own))
+        self.assertEqual(self.store.count_jobs_for_user("user-1", org_id="org-a"), 3)
+        self.assertEqual(self.store.count_jobs_for_org("org-a"), 4)
+        self.assertEqual(self.store.count_jobs_for_org("org-a", status="queued"), 4)
+        self.assertEqual(len(self.store.list_jobs_for_org("org-b")), 1)
+
+    def test_history_keyset_pages_are_disjoint_and_newest_first(self):
+        created = [self._create_job(f"page-{i}", org_id="org-a", owner_user_id="user-1") for i in range(5)]
+
+        seen: list[str] = []
+        before = None
+        while True:
+            page = self.store.list_jobs_for_user("user-1", org_id="org-a", limit=2, before=before)
+            if not page:
+                break
+            seen.extend(row["job_id"] for row in page)
+            before = (page[-1]["queued_at"], page[-1]["job_id"])
+
+        self.assertEqual(sorted(seen), sorted(created))
+        self.assertEqual(len(seen), len(set(seen)))
+        org_rows = self.store.list_jobs_for_org("org-a", limit=10)
+        self.assertEqual([row["job_id"] for row in org_rows], seen)
+
+    def test_schema_v2_database_gains_reuse_column_on_open(self):
+        self.store.close()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("DROP INDEX jobs_reuse_lookup_idx")
+            conn.execute("ALTER TABLE jobs DROP COLUMN reused_from_job_id")
+            conn.execute("PRAGMA user_version = 2")
+            conn.commit()
+        finally:
+            conn.close()
+
+        self.store = SqliteAsyncJobStore(db_path=self.db_path)
+        self.addCleanup(self.store.close)
+        job_id = self._create_job()
+        self.assertIsNone(self.store.get_job(job_id)["reused_from_job_id"])
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 5)
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            self.assertIn("jobs_reuse_lookup_idx", indexes)
+        finally:
+            conn.close()
+
+    def test_claim_jobs_hands_out_each_open_job_once_across_connections(self):
+        job_ids = [self._create_job(f"claim-{index}") for index in range(6)]
+        self._complete(job_ids[0])
+        other = SqliteAsyncJobStore(db_path=self.db_path)
+        self.addCleanup(other.close)
+        claimed: dict[str, list[str]] = {"a": [], "b": []}
+
+        def _claim_all(store: SqliteAsyncJobStore, worker_id: str) -> None:
+            while jobs := store.claim_jobs(worker_id=worker_id, limit=1, lease_seconds=30):
+                claimed[worker_id].extend(job["job_id"] for job in jobs)
+
+        threads = [
+            threading.Thread(target=_claim_all, args=(self.store, "a")),
+            threading.Thread(target=_claim_all, args=(other, "b")),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(sorted(claimed["a"] + claimed["b"]), sorted(job_ids[1:]))
+        owner = "a" if claimed["a"] else "b"
+        job_id = claimed[owner][0]
+        self.assertFalse(self.store.renew_lease(job_id=job_id, worker_id="intruder"))
+        self.assertTrue(self.store.renew_lease(job_id=job_id, worker_id=owner))
+        self.assertFalse(self.store.release_lease(job_id=job_id, worker_id="intruder"))
+        self.assertTrue(self.store.release_lease(job_id=job_id, worker_id=owner))
+        reclaimed = self.store.claim_jobs(worker_id="c")
+        self.assertEqual([(job["job_id"], job["claim_count"]) for job in reclaimed], [(job_id, 2)])
+
+    def test_expired_lease_is_claimable_again(self):
+        job_id = self._create_job()
+        first = self.store.claim_jobs(worker_id="crashed", lease_seconds=-1)
+        self.assertEqual(first[0]["claim_count"], 1)
+        self.assertEqual(first[0]["lease_owner"], "crashed")
+
+        self.assertEqual(self.store.requeue_expired_leases(), 1)
+        self.assertEqual(self.store.requeue_expired_leases(), 0)
+        second = self.store.claim_jobs(worker_id="survivor", lease_seconds=30)
+        self.assertEqual([(job["job_id"], job["claim_count"]) for job in second], [(job_id, 2)])
+        self.assertEqual(self.store.claim_jobs(worker_id="other"), [])
+
+    def test_worker_writes_are_fenced_by_the_lease(self):
+        job_id = self._create_job()
+        self.store.claim_jobs(worker_id="owner", lease_seconds=30)
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=5, lease_owner="owner")
+
+        with self.assertRaisesRegex(ValueError, "lease not held"):
+            self.store.create_result(job_id=job_id, result_payload={}, result_kind="partial", lease_owner="stale")
+        with self.assertRaisesRegex(ValueError, "lease not held"):
+            self.store.transition_job(job_id=job_id, to_status="failed", lease_owner="stale")
+        self.assertEqual(self.store.list_results(job_id), [])
+        self.assertEqual(self.store.get_job(job_id)["status"], "running")
+
+        self.store.create_result(job_id=job_id, result_payload={}, result_kind="partial", lease_owner="owner")
+        self.assertEqual(len(self.store.list_results(job_id)), 1)
+
+    def test_cleanup_retention_deletes_only_expired_terminal_rows(self):
+        terminal_id = self._create_job("terminal")
+        self._complete(terminal_id)
+        active_id = self._create_job("active")
+        self.store.transition_job(job_id=active_id, to_status="running", progress_percent=5)
+        self.store.create_result(job_id=active_id, result_payload={}, result_kind="partial")
+
+        later = datetime.now(timezone.utc) + timedelta(hours=1)
+        dry = self.store.cleanup_retention(
+            results_ttl_seconds=60, events_ttl_seconds=60, dry_run=True, now=later
+        )
+        self.assertEqual(dry["results"]["delete_count"], 2)
+        self.assertEqual(dry["events"]["delete_count"], 4)
+        self.assertEqual(len(self.store.list_results(terminal_id)), 2)
+
+        summary = self.store.cleanup_retention(results_ttl_seconds=60, events_ttl_seconds=60, now=later)
+        self.assertEqual(summary["terminal_job_count"], 1)
+        self.assertEqual(summary["active_job_count"], 1)
+        self.assertEqual(self.store.list_results(terminal_id), [])
+        self.assertEqual(self.store.list_events(terminal_id), [])
+        self.assertEqual(len(self.store.list_results(active_id)), 1)
+        self.assertEqual(len(self.store.list_events(active_id)), 2)
+
+    def test_readers_see_committed_state_while_writer_is_busy(self):
+        job_id = self._create_job()
+        reopened = SqliteAsyncJobStore(db_path=self.db_path)
+        self.addCleanup(reopened.close)
+        errors: list[BaseException] = []
+
+        def _read_loop():
+            try:
+                for _ in range(200):
+                    job = reopened.get_job(job_id)
+                    assert job is not None and job["status"] in {"queued", "running", "partial"}
+            except BaseException as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        readers = [threading.Thread(target=_read_loop) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        self.store.transition_job(job_id=job_id, to_status="running", progress_percent=1)
+        for progress in range(2, 60):
+            self.store.transition_job(job_id=job_id, to_status="partial", progress_percent=progress)
+        for thread in readers:
+            thread.join(timeout=10)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(reopened.get_job(job_id)["progress_percent"], 59)
+
+
+if __name__ == "__main__":
+    unittest.main()
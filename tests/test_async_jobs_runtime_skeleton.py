@@ -42,6 +42,15 @@ def _http_json(method: str, url: str, payload=None, headers=None, timeout: float
         return exc.code, parsed
 
 
+def _http_status_and_headers(url: str, headers=None, timeout: float = 10.0):
+    req = request.Request(url, method="GET", headers=headers or {})
+    try:
+        with request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.headers, resp.read()
+    except error.HTTPError as exc:
+        return exc.code, exc.headers, exc.read()
+
+
 class TestAsyncJobsRuntimeSkeleton(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -60,6 +69,7 @@ class TestAsyncJobsRuntimeSkeleton(unittest.TestCase):
                 "API_AUTH_TOKEN": "async-token",
                 "ASYNC_JOBS_STORE_FILE": str(cls._store_file),
                 "ASYNC_WORKER_STAGE_DELAY_MS": "250",
+                "ASYNC_WORKER_ANALYSIS": "stub",
                 "ENABLE_E2E_FAULT_INJECTION": "1",
             }
         )
@@ -350,6 +360,139 @@ class TestAsyncJobsRuntimeSkeleton(unittest.TestCase):
         self.assertEqual(requested_body.get("result_id"), partial_result_id)
         self.assertEqual(requested_body.get("result_kind"), "partial")
 
+    def test_history_cursor_pages_are_disjoint(self):
+        tenant_headers = {
+            "Authorization": "Bearer async-token",
+            "X-Org-Id": "tenant-keyset",
+        }
+        job_ids = []
+        for query in ("Marktgasse 1, 3011 Bern", "Marktgasse 2, 3011 Bern", "Marktgasse 3, 3011 Bern"):
+            status, body = _http_json(
+                "POST",
+                f"{self.base_url}/analyze",
+                headers=tenant_headers,
+                payload={"query": query, "intelligence_mode": "basic", "options": {"async_mode": {"requested": True}}},
+            )
+            self.assertEqual(status, 202)
+            job_ids.append(str(body.get("job", {}).get("job_id") or ""))
+        for job_id in job_ids:
+            status_job, _ = self._poll_job(
+                job_id=job_id,
+                expected_statuses={"completed"},
+                timeout_seconds=12,
+                headers={"X-Org-Id": "tenant-keyset"},
+            )
+            self.assertEqual(status_job, 200)
+
+        seen: list[str] = []
+        cursor = ""
+        for _ in range(10):
+            status, body = _http_json(
+                "GET",
+                f"{self.base_url}/analyze/history?limit=1&cursor={cursor}",
+                headers={"X-Org-Id": "tenant-keyset"},
+            )
+            self.assertEqual(status, 200)
+            self.assertLessEqual(len(body.get("history", [])), 1)
+            seen.extend(str(row.get("job_id") or "") for row in body.get("history", []))
+            cursor = body.get("next_cursor") or ""
+            if not cursor:
+                break
+
+        self.assertEqual(sorted(seen), sorted(job_ids))
+        self.assertEqual(body.get("total"), 3)
+
+        invalid_status, invalid_body = _http_json(
+            "GET",
+            f"{self.base_url}/analyze/history?cursor=not-a-cursor",
+            headers={"X-Org-Id": "tenant-keyset"},
+        )
+        self.assertEqual(invalid_status, 400)
+        self.assertEqual(invalid_body.get("error"), "bad_request")
+
+        mixed_status, _ = _http_json(
+            "GET",
+            f"{self.base_url}/analyze/history?cursor={cursor or 'x'}&offset=1",
+            headers={"X-Org-Id": "tenant-keyset"},
+        )
+        self.assertEqual(mixed_status, 400)
+
+    def test_result_and_job_endpoints_support_etag_revalidation(self):
+        tenant_headers = {"X-Org-Id": "tenant-etag"}
+        status, body = _http_json(
+            "POST",
+            f"{self.base_url}/analyze",
+            headers={"Authorization": "Bearer async-token", **tenant_headers},
+            payload={
+                "query": "Bahnhofstrasse 1, 8001 Zürich",
+                "intelligence_mode": "basic",
+                "options": {"async_mode": {"requested": True}},
+            },
+        )
+        self.assertEqual(status, 202)
+        job_id = str(body.get("job", {}).get("job_id") or "")
+
+        status_job, body_job = self._poll_job(
+            job_id=job_id,
+            expected_statuses={"completed"},
+            timeout_seconds=12,
+            headers=tenant_headers,
+        )
+        self.assertEqual(status_job, 200)
+        result_id = str(body_job.get("job", {}).get("result_id") or "")
+        self.assertTrue(result_id)
+
+        job_url = f"{self.base_url}/analyze/jobs/{job_id}"
+        job_status, job_headers, _ = _http_status_and_headers(job_url, headers=tenant_headers)
+        self.assertEqual(job_status, 200)
+        self.assertEqual(job_headers.get("Cache-Control"), "private, no-cache")
+        job_etag = job_headers.get("ETag")
+        self.assertTrue(job_etag)
+        revalidated_status, _, revalidated_body = _http_status_and_headers(
+            job_url,
+            headers={**tenant_headers, "If-None-Match": job_etag},
+        )
+        self.assertEqual(revalidated_status, 304)
+        self.assertEqual(revalidated_body, b"")
+
+        result_url = f"{self.base_url}/analyze/results/{result_id}"
+        first_status, first_headers, first_body = _http_status_and_headers(result_url, headers=tenant_headers)
+        self.assertEqual(first_status, 200)
+        self.assertIn("immutable", first_headers.get("Cache-Control", ""))
+        etag = first_headers.get("ETag")
+        self.assertTrue(etag)
+
+        # Zweiter Abruf kommt aus dem Result-Cache: gleicher Inhalt, neue request_id.
+        cached_status, cached_headers, cached_body = _http_status_and_headers(result_url, headers=tenant_headers)
+        self.assertEqual(cached_status, 200)
+        self.assertEqual(cached_headers.get("ETag"), etag)
+        first_payload = json.loads(first_body)
+        cached_payload = json.loads(cached_body)
+        self.assertNotEqual(first_payload.pop("request_id"), cached_payload.pop("request_id"))
+        self.assertEqual(first_payload, cached_payload)
+
+        not_modified_status, not_modified_headers, not_modified_body = _http_status_and_headers(
+            result_url,
+            headers={**tenant_headers, "If-None-Match": etag},
+        )
+        self.assertEqual(not_modified_status, 304)
+        self.assertEqual(not_modified_headers.get("ETag"), etag)
+        self.assertEqual(not_modified_body, b"")
+
+        denied_status, _, denied_body = _http_status_and_headers(
+            result_url,
+            headers={"X-Org-Id": "tenant-other", "If-None-Match": etag},
+        )
+        self.assertEqual(denied_status, 404)
+        self.assertEqual(json.loads(denied_body).get("error"), "not_found")
+
+        requested_status, requested_headers, _ = _http_status_and_headers(
+            f"{result_url}?view=requested",
+            headers={**tenant_headers, "If-None-Match": etag},
+        )
+        self.assertEqual(requested_status, 200)
+        self.assertNotEqual(requested_headers.get("ETag"), etag)
+
     def test_cancel_endpoint_stops_running_job_idempotently(self):
         status, body = _http_json(
             "POST",
@@ -45,6 +45,7 @@ class TestAsyncJobsSmokeScript(unittest.TestCase):
                 "PYTHONPATH": str(REPO_ROOT),
                 "ENABLE_E2E_FAULT_INJECTION": "1",
                 "ASYNC_WORKER_STAGE_DELAY_MS": "0",
+                "ASYNC_WORKER_ANALYSIS": "stub",
             }
         )
 
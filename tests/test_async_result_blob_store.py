@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from http.client import IncompleteRead
+from pathlib import Path
+from typing import Any
+
+from src.api import web_service
+from src.api.async_jobs import AsyncJobStore
+from src.shared.result_blob_store import (
+    LocalBlobStore,
+    blob_store_from_env,
+    collect_unreferenced_blobs,
+    load_result_payload,
+    verified_chunks,
+)
+from tests.async_api_helpers import STORE_BACKENDS, AsyncApiTestCase, StoreBackendTestCase, TempDirTestCase
+
+PAYLOAD = {
+    "query": "Bahnhofstrasse 1, 8001 Zürich",
+    "result": {"data": {"modules": {"building": {"floors": 4, "notes": "x" * 4000}}}},
+}
+
+
+def _blob_files(root: Path) -> list[Path]:
+    return [path for path in root.rglob("*.json.gz")]
+
+
+def _age_blobs(root: Path, seconds: float) -> None:
+    past = time.time() - seconds
+    for path in _blob_files(root):
+        os.utime(path, (past, past))
+
+
+def _create_result(store: Any, payload: dict[str, Any]) -> dict[str, Any]:
+    job = store.create_job(
+        request_payload={"query": payload["query"]},
+        request_id="req-blob",
+        query=payload["query"],
+        intelligence_mode="basic",
+        org_id="org-a",
+    )
+    store.transition_job(job_id=str(job["job_id"]), to_status="running", progress_percent=5)
+    return store.create_result(job_id=str(job["job_id"]), result_payload=payload, result_kind="final")
+
+
+class TestLocalBlobStore(TempDirTestCase):
+    def test_identical_payloads_share_one_compressed_blob(self):
+        blobs = LocalBlobStore(self.tmp_path / "blobs")
+
+        first = blobs.put_json(PAYLOAD)
+        second = blobs.put_json(json.loads(json.dumps(PAYLOAD)))
+
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first["s3_key"], f"sha256/{first['checksum_sha256'][:2]}/{first['checksum_sha256']}.json.gz"
+        )
+        files = _blob_files(self.tmp_path / "blobs")
+        self.assertEqual(len(files), 1)
+        self.assertLess(files[0].stat().st_size, first["size_bytes"])
+        with blobs.open(first["s3_key"]) as handle:
+            self.assertEqual(len(handle.read()), first["size_bytes"])
+        self.assertEqual(blobs.read_json(first["s3_key"]), PAYLOAD)
+
+    def test_invalid_and_unknown_keys_are_rejected(self):
+        blobs = LocalBlobStore(self.tmp_path)
+
+        with self.assertRaises(KeyError):
+            blobs.open("../../etc/passwd")
+        with self.assertRaises(KeyError):
+            blobs.open(f"sha256/00/{'ab' * 32}.json.gz")
+
+    def test_corrupted_blob_fails_checksum(self):
+        blobs = LocalBlobStore(self.tmp_path)
+        ref = blobs.put_json(PAYLOAD)
+        (self.tmp_path / ref["s3_key"]).write_bytes(gzip.compress(b'{"tampered": true}'))
+
+        with self.assertRaisesRegex(ValueError, "checksum mismatch"):
+            blobs.read_json(ref["s3_key"])
+
+    def test_verified_chunks_hold_back_the_tail_of_a_corrupt_blob(self):
+        blobs = LocalBlobStore(self.tmp_path)
+        ref = blobs.put_json(PAYLOAD)
+        with blobs.open(ref["s3_key"]) as handle:
+            data = b"".join(verified_chunks(handle, ref["s3_key"], size_bytes=ref["size_bytes"], chunk_size=1024))
+        self.assertEqual(json.loads(data), PAYLOAD)
+
+        original = gzip.decompress((self.tmp_path / ref["s3_key"]).read_bytes())
+        (self.tmp_path / ref["s3_key"]).write_bytes(gzip.compress(original[:-1] + b" "))
+        received = []
+        with blobs.open(ref["s3_key"]) as handle, self.assertRaisesRegex(ValueError, "checksum mismatch"):
+            for chunk in verified_chunks(handle, ref["s3_key"], size_bytes=ref["size_bytes"], chunk_size=1024):
+                received.append(chunk)
+        self.assertTrue(0 < len(b"".join(received)) < ref["size_bytes"])
+
+        (self.tmp_path / ref["s3_key"]).write_bytes(gzip.compress(original + b" " * 10))
+        with blobs.open(ref["s3_key"]) as handle, self.assertRaisesRegex(ValueError, "size mismatch"):
+            list(verified_chunks(handle, ref["s3_key"], size_bytes=ref["size_bytes"], chunk_size=1024))
+
+    def test_blob_store_from_env(self):
+        self.unset_env("ASYNC_RESULT_BLOB_DIR")
+        self.assertIsNone(blob_store_from_env())
+        self.set_env(ASYNC_RESULT_BLOB_DIR=str(self.tmp_path))
+        self.assertEqual(blob_store_from_env().root, self.tmp_path)
+
+    def test_gc_keeps_referenced_and_recent_blobs(self):
+        blobs = LocalBlobStore(self.tmp_path)
+        kept = blobs.put_json({"kept": True})["s3_key"]
+        orphan = blobs.put_json({"orphan": True})["s3_key"]
+        _age_blobs(self.tmp_path, 7200)
+        recent = blobs.put_json({"recent": True})["s3_key"]
+        lookups: list[list[str]] = []
+
+        def _referenced(keys: list[str]) -> set[str]:
+            lookups.append(keys)
+            return {kept} & set(keys)
+
+        dry = collect_unreferenced_blobs(blobs, _referenced, dry_run=True)
+        self.assertEqual((dry["total"], dry["delete_count"], dry["skipped_recent"]), (3, 1, 1))
+        self.assertTrue(blobs.exists(orphan))
+
+        summary = collect_unreferenced_blobs(blobs, _referenced, batch_size=1)
+        self.assertEqual(summary["delete_count"], 1)
+        self.assertEqual([blobs.exists(key) for key in (kept, orphan, recent)], [True, False, True])
+        self.assertTrue(all(len(keys) == 1 and recent not in keys for keys in lookups[1:]))
+
+    def test_put_refreshes_mtime_of_deduplicated_blob(self):
+        blobs = LocalBlobStore(self.tmp_path)
+        key = blobs.put_json(PAYLOAD)["s3_key"]
+        _age_blobs(self.tmp_path, 7200)
+
+        blobs.put_json(PAYLOAD)
+
+        summary = collect_unreferenced_blobs(blobs, lambda keys: set())
+        self.assertEqual(summary["skipped_recent"], 1)
+        self.assertTrue(blobs.exists(key))
+
+
+class TestStoreBlobReferences(StoreBackendTestCase):
+    with_blob_store = True
+
+    def test_store_keeps_only_the_blob_reference(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                root = self.tmp_path / backend
+                first = _create_result(store, PAYLOAD)
+                second = _create_result(store, PAYLOAD)
+
+                self.assertEqual(first["s3_key"], second["s3_key"])
+                self.assertEqual(len(_blob_files(root / "blobs")), 1)
+                for result in (first, store.get_result(first["result_id"]), *store.list_results(first["job_id"])):
+                    self.assertNotIn("result_payload", result)
+                    self.assertEqual(result["s3_key"], first["s3_key"])
+                    self.assertEqual(load_result_payload(result, store.blob_store), PAYLOAD)
+
+                persisted = b"".join(path.read_bytes() for path in root.glob("store.*") if path.is_file())
+                self.assertNotIn(b"x" * 4000, persisted)
+
+    def test_retention_collects_blobs_of_deleted_results(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                root = self.tmp_path / backend
+                expired = _create_result(store, {**PAYLOAD, "query": "expired"})
+                store.transition_job(job_id=str(expired["job_id"]), to_status="completed", progress_percent=100)
+                active = _create_result(store, PAYLOAD)
+                _age_blobs(root / "blobs", 7200)
+                later = datetime.now(timezone.utc) + timedelta(hours=1)
+
+                dry = store.cleanup_retention(results_ttl_seconds=60, events_ttl_seconds=None, dry_run=True, now=later)
+                self.assertEqual((dry["blobs"]["total"], dry["blobs"]["delete_count"]), (2, 1))
+                self.assertEqual(len(_blob_files(root / "blobs")), 2)
+
+                summary = store.cleanup_retention(results_ttl_seconds=60, events_ttl_seconds=None, now=later)
+                self.assertEqual(summary["results"]["delete_count"], 1)
+                self.assertEqual(summary["blobs"]["delete_count"], 1)
+                self.assertFalse(store.blob_store.exists(expired["s3_key"]))
+                self.assertEqual(
+                    load_result_payload(store.get_result(active["result_id"]), store.blob_store), PAYLOAD
+                )
+
+    def test_store_reloads_blob_references_from_disk(self):
+        blobs = LocalBlobStore(self.tmp_path / "blobs")
+        store = AsyncJobStore(store_file=self.tmp_path / "store.json", journal_fsync="off", blob_store=blobs)
+        result = _create_result(store, PAYLOAD)
+        store.close()
+
+        reloaded = AsyncJobStore(store_file=self.tmp_path / "store.json", journal_fsync="off", blob_store=blobs)
+        stored = reloaded.get_result(result["result_id"])
+        self.assertNotIn("result_payload", stored)
+        self.assertEqual(load_result_payload(stored, blobs), PAYLOAD)
+
+
+class TestResultEndpointBlobs(AsyncApiTestCase):
+    def create_api_store(self) -> Any:
+        return AsyncJobStore(
+            store_file=self.tmp_path / "api-store.json",
+            journal_fsync="off",
+            blob_store=LocalBlobStore(self.tmp_path / "blobs"),
+        )
+
+    def test_result_endpoint_streams_payload_from_blob(self):
+        result = _create_result(self.api_store, PAYLOAD)
+        result_id = str(result["result_id"])
+        self.api_store.transition_job(job_id=str(result["job_id"]), to_status="completed", progress_percent=100)
+
+        response, body = self.get(f"/analyze/results/{result_id}", headers={"Accept-Encoding": "identity"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(int(response.getheader("Content-Length")), len(body))
+        payload = json.loads(body)
+        self.assertEqual(payload["result"], PAYLOAD)
+        self.assertEqual(payload["result_id"], result_id)
+        self.assertTrue(payload["request_id"])
+
+        # Zweiter Abruf aus dem Prozess-Cache (ohne Payload-Bytes), gzip-komprimiert gestreamt.
+        cached = list(web_service._ASYNC_RESULT_CACHE.values())
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(cached[0]["payload_blob"]["key"], result["s3_key"])
+        self.assertNotIn(b"floors", cached[0]["body_prefix"])
+        response, body = self.get(f"/analyze/results/{result_id}", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(response.getheader("Transfer-Encoding"), "chunked")
+        self.assertEqual(json.loads(gzip.decompress(body))["result"], PAYLOAD)
+
+        etag = response.getheader("ETag")
+        response, body = self.get(f"/analyze/results/{result_id}", headers={"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+    def test_result_endpoint_aborts_stream_of_corrupt_blob(self):
+        result = _create_result(self.api_store, PAYLOAD)
+        blob_path = self.tmp_path / "blobs" / result["s3_key"]
+        original = gzip.decompress(blob_path.read_bytes())
+        blob_path.write_bytes(gzip.compress(original.replace(b'"floors":4', b'"floors":5')))
+
+        conn = self.connect()
+        conn.request("GET", f"/analyze/results/{result['result_id']}", headers={"X-Org-Id": "org-a"})
+        response = conn.getresponse()
+        self.assertEqual(response.status, 200)
+        with self.assertRaises(IncompleteRead):
+            response.read()
+
+    def test_requested_view_revalidates_after_guard_without_listing_results(self):
+        result = _create_result(self.api_store, PAYLOAD)
+        path = f"/analyze/results/{result['result_id']}?view=requested"
+
+        response, _ = self.get(path)
+        self.assertEqual(response.status, 200)
+        etag = response.getheader("ETag")
+
+        web_service._async_result_cache_clear()
+
+        def _no_list_results(*_args: Any, **_kwargs: Any) -> Any:
+            raise AssertionError("list_results on revalidation")
+
+        self.api_store.list_results = _no_list_results  # type: ignore[method-assign]
+        response, body = self.get(path, headers={"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(response.getheader("ETag"), etag)
+        self.assertIn("Accept-Encoding", response.getheader("Vary") or "")
+        self.assertEqual(body, b"")
+
+        # Ohne Zugriff auf die Org bzw. für unbekannte IDs gibt es keinen 304.
+        response, _ = self.get(path, headers={"X-Org-Id": "org-b", "If-None-Match": etag})
+        self.assertEqual(response.status, 404)
+        response, _ = self.get("/analyze/results/unknown-result?view=requested", headers={"If-None-Match": "*"})
+        self.assertEqual(response.status, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
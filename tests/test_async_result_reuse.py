@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import unittest
+from typing import Any
+
+from tests.async_api_helpers import STORE_BACKENDS, AsyncApiTestCase, StoreBackendTestCase
+
+PAYLOAD = {
+    "query": "Bahnhofstrasse 1, 8001 Zürich",
+    "intelligence_mode": "basic",
+    "options": {"async_mode": {"requested": True}},
+}
+
+
+def _run_job(store: Any, payload: dict[str, Any], *, org_id: str = "org-a", owner_user_id: str | None = None) -> dict:
+    job = store.create_job(
+        request_payload=payload,
+        request_id="req-source",
+        query=str(payload["query"]),
+        intelligence_mode="basic",
+        org_id=org_id,
+        owner_user_id=owner_user_id,
+    )
+    job_id = str(job["job_id"])
+    store.transition_job(job_id=job_id, to_status="running", progress_percent=5)
+    result = store.create_result(job_id=job_id, result_payload={"ok": True}, result_kind="final")
+    return store.transition_job(
+        job_id=job_id, to_status="completed", progress_percent=100, result_id=str(result["result_id"])
+    )
+
+
+class TestResultReuseLookup(StoreBackendTestCase):
+    def test_reused_job_is_completed_and_points_at_source_result(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                source = _run_job(store, PAYLOAD)
+
+                match = store.find_reusable_job(org_id="org-a", request_payload=dict(PAYLOAD), max_age_seconds=60)
+                self.assertIsNotNone(match)
+                self.assertEqual(match["job_id"], source["job_id"])
+
+                reused = store.create_job(
+                    request_payload=dict(PAYLOAD),
+                    request_id="req-reuse",
+                    query=PAYLOAD["query"],
+                    intelligence_mode="basic",
+                    org_id="org-a",
+                    reused_from=match,
+                )
+                self.assertEqual(reused["status"], "completed")
+                self.assertEqual(reused["progress_percent"], 100)
+                self.assertEqual(reused["result_id"], source["result_id"])
+                self.assertEqual(reused["reused_from_job_id"], source["job_id"])
+                self.assertTrue(reused["finished_at"])
+                self.assertEqual(
+                    [e["event_type"] for e in store.list_events(reused["job_id"])], ["job.queued", "job.completed"]
+                )
+                self.assertEqual(
+                    [n["template_key"] for n in store.list_notifications(reused["job_id"])], ["async.job.completed"]
+                )
+                self.assertEqual(store.get_job(reused["job_id"])["reused_from_job_id"], source["job_id"])
+
+                # Reused jobs never become sources themselves; the window counts from the real run.
+                again = store.find_reusable_job(org_id="org-a", request_payload=dict(PAYLOAD), max_age_seconds=60)
+                self.assertEqual(again["job_id"], source["job_id"])
+
+    def test_lookup_respects_org_owner_payload_and_window(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                _run_job(store, PAYLOAD, owner_user_id="user-1")
+                other_payload = {**PAYLOAD, "query": "Limmatquai 12, 8001 Zürich"}
+
+                self.assertIsNone(store.find_reusable_job(org_id="org-b", request_payload=PAYLOAD, max_age_seconds=60))
+                self.assertIsNone(
+                    store.find_reusable_job(org_id="org-a", request_payload=other_payload, max_age_seconds=60)
+                )
+                self.assertIsNone(
+                    store.find_reusable_job(
+                        org_id="org-a", request_payload=PAYLOAD, max_age_seconds=60, owner_user_id="user-2"
+                    )
+                )
+                self.assertIsNone(
+                    store.find_reusable_job(org_id="org-a", request_payload=PAYLOAD, max_age_seconds=1e-9)
+                )
+                self.assertIsNotNone(
+                    store.find_reusable_job(
+                        org_id="org-a", request_payload=PAYLOAD, max_age_seconds=60, owner_user_id="user-1"
+                    )
+                )
+
+    def test_unfinished_jobs_are_not_reused(self):
+        for backend in STORE_BACKENDS:
+            with self.subTest(backend=backend):
+                store = self.backend_store(backend)
+                job = store.create_job(
+                    request_payload=PAYLOAD,
+                    request_id="req-open",
+                    query=PAYLOAD["query"],
+                    intelligence_mode="basic",
+                    org_id="org-a",
+                )
+                store.transition_job(job_id=str(job["job_id"]), to_status="running", progress_percent=5)
+
+                self.assertIsNone(store.find_reusable_job(org_id="org-a", request_payload=PAYLOAD, max_age_seconds=60))
+
+
+class _RecordingRuntime:
+    queue_mode = "local"
+
+    def __init__(self) -> None:
+        self.enqueued: list[str] = []
+
+    def enqueue(self, job_id: str, *, job: dict[str, Any] | None = None) -> None:
+        self.enqueued.append(job_id)
+
+
+class TestAnalyzeResultReuse(AsyncApiTestCase):
+    def web_service_overrides(self) -> dict[str, Any]:
+        self.runtime = _RecordingRuntime()
+        return {"_ASYNC_JOB_RUNTIME": self.runtime}
+
+    def test_analyze_reuses_fresh_result_when_enabled(self):
+        source = _run_job(self.api_store, PAYLOAD)
+        self.set_env(ASYNC_RESULT_REUSE_MAX_AGE_SECONDS="600")
+
+        response, raw = self.post("/analyze", PAYLOAD)
+        body = json.loads(raw)
+
+        self.assertEqual(response.status, 202)
+        self.assertIs(body["result_reused"], True)
+        self.assertEqual(body["job"]["status"], "completed")
+        self.assertEqual(body["job"]["result_id"], source["result_id"])
+        self.assertEqual(body["job"]["reused_from_job_id"], source["job_id"])
+        self.assertEqual(self.runtime.enqueued, [])
+
+    def test_analyze_without_reuse_setting_runs_pipeline(self):
+        _run_job(self.api_store, PAYLOAD)
+        self.unset_env("ASYNC_RESULT_REUSE_MAX_AGE_SECONDS")
+
+        response, raw = self.post("/analyze", PAYLOAD)
+        body = json.loads(raw)
+
+        self.assertEqual(response.status, 202)
+        self.assertIs(body["result_reused"], False)
+        self.assertEqual(body["job"]["status"], "queued")
+        self.assertEqual(self.runtime.enqueued, [body["job"]["job_id"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ Tests for src/api/async_store_factory.py.
 Verifies:
 - ASYNC_STORE_BACKEND=file (default) → AsyncJobStore
 - ASYNC_STORE_BACKEND=db → DbAsyncJobStore (when ASYNC_DB_URL set)
+- ASYNC_STORE_BACKEND=sqlite → SqliteAsyncJobStore (ASYNC_SQLITE_PATH)
 - ASYNC_STORE_BACKEND=<unknown> → ValueError
 - ASYNC_STORE_BACKEND=db without DB URL → RuntimeError
 - Default (no env var) → AsyncJobStore (file backend)
@@ -89,6 +90,22 @@ class TestBuildAsyncJobStore(unittest.TestCase):
                 store = build_async_job_store()
                 self.assertIsInstance(store, DbAsyncJobStore)
 
+    def test_sqlite_backend_returns_sqlite_store(self):
+        """ASYNC_STORE_BACKEND=sqlite → SqliteAsyncJobStore at ASYNC_SQLITE_PATH."""
+        import tempfile
+        from pathlib import Path
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "jobs.sqlite3"
+            env = {"ASYNC_STORE_BACKEND": "sqlite", "ASYNC_SQLITE_PATH": str(db_path)}
+            with patch.dict(os.environ, env, clear=True):
+                from src.api.async_store_factory import build_async_job_store
+                from src.shared.async_job_store_sqlite import SqliteAsyncJobStore
+                store = build_async_job_store()
+                self.assertIsInstance(store, SqliteAsyncJobStore)
+                store.close()
+            self.assertTrue(db_path.exists())
+
     def test_file_backend_unaffected_by_db_url(self):
         """ASYNC_STORE_BACKEND=file should not use DB even if ASYNC_DB_URL is set."""
         env = {
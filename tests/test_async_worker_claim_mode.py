@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+from src.api.async_jobs import AsyncJobStore
+from src.api.async_worker_runtime import AnalysisStage, AsyncJobRuntime
+from src.shared.async_job_store_sqlite import SqliteAsyncJobStore
+
+
+class _Listener:
+    def __init__(self) -> None:
+        self.notifications: queue.Queue[str] = queue.Queue()
+        self.closed = False
+
+    def wait(self, timeout: float) -> list[str]:
+        try:
+            return [self.notifications.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _LeasingStore:
+    """File-Store plus Lease-Semantik von DbAsyncJobStore (SKIP LOCKED, NOTIFY) im Speicher."""
+
+    def __init__(self, store: AsyncJobStore, *, with_listener: bool = True) -> None:
+        self._store = store
+        self._lock = threading.Lock()
+        self.leases: dict[str, tuple[str, float]] = {}
+        self.claim_counts: dict[str, int] = {}
+        self.listeners: list[_Listener] = []
+        self.released: list[str] = []
+        if not with_listener:
+            self.open_job_listener = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._store, name)
+
+    def create_job(self, **kwargs: Any) -> dict[str, Any]:
+        job = self._store.create_job(**kwargs)
+        self._notify(str(job["job_id"]))
+        return job
+
+    def _check_lease(self, job_id: str, lease_owner: str | None) -> None:
+        if lease_owner is None:
+            return
+        with self._lock:
+            lease = self.leases.get(job_id)
+        if lease is None or lease[0] != lease_owner:
+            raise ValueError(f"job lease not held by {lease_owner}: {job_id}")
+
+    def transition_job(self, *, lease_owner: str | None = None, **kwargs: Any) -> dict[str, Any]:
+        self._check_lease(str(kwargs["job_id"]), lease_owner)
+        return self._store.transition_job(**kwargs)
+
+    def create_result(self, *, lease_owner: str | None = None, **kwargs: Any) -> dict[str, Any]:
+        self._check_lease(str(kwargs["job_id"]), lease_owner)
+        return self._store.create_result(**kwargs)
+
+    def _notify(self, job_id: str) -> None:
+        for listener in list(self.listeners):
+            listener.notifications.put(job_id)
+
+    def claim_jobs(self, *, worker_id: str, limit: int = 1, lease_seconds: float = 30.0) -> list[dict[str, Any]]:
+        with self._lock:
+            now = time.monotonic()
+            claimed: list[dict[str, Any]] = []
+            for job_id in self._store.list_job_ids(statuses={"queued", "running", "partial"}):
+                lease = self.leases.get(job_id)
+                if lease is not None and lease[1] > now:
+                    continue
+                self.leases[job_id] = (worker_id, now + lease_seconds)
+                self.claim_counts[job_id] = self.claim_counts.get(job_id, 0) + 1
+                claimed.append({**self._store.get_job(job_id), "claim_count": self.claim_counts[job_id]})
+                if len(claimed) >= limit:
+                    break
+            return claimed
+
+    def renew_lease(self, *, job_id: str, worker_id: str, lease_seconds: float = 30.0) -> bool:
+        with self._lock:
+            lease = self.leases.get(job_id)
+            if lease is None or lease[0] != worker_id:
+                return False
+            self.leases[job_id] = (worker_id, time.monotonic() + lease_seconds)
+            return True
+
+    def release_lease(self, *, job_id: str, worker_id: str) -> bool:
+        with self._lock:
+            lease = self.leases.get(job_id)
+            if lease is None or lease[0] != worker_id:
+                return False
+            del self.leases[job_id]
+            self.released.append(job_id)
+        return True
+
+    def requeue_expired_leases(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            expired = [job_id for job_id, (_, expires) in self.leases.items() if expires < now]
+            for job_id in expired:
+                del self.leases[job_id]
+        for job_id in expired:
+            self._notify(job_id)
+        return len(expired)
+
+    def open_job_listener(self) -> _Listener:
+        listener = _Listener()
+        self.listeners.append(listener)
+        return listener
+
+
+@pytest.fixture()
+def store(tmp_path: Path) -> _LeasingStore:
+    return _LeasingStore(AsyncJobStore(store_file=tmp_path / "store.json", journal_fsync="off"))
+
+
+def _create_job(store: _LeasingStore, query: str) -> str:
+    job = store.create_job(
+        request_payload={"query": query, "options": {}},
+        request_id=f"req-{query}",
+        query=query,
+        intelligence_mode="basic",
+    )
+    return str(job["job_id"])
+
+
+def _runtime(store: _LeasingStore, node_id: str, **kwargs: Any) -> AsyncJobRuntime:
+    kwargs.setdefault("lease_seconds", 30.0)
+    return AsyncJobRuntime(
+        store=store,
+        stage_delay_seconds=0.0,
+        queue_mode="db",
+        node_id=node_id,
+        **kwargs,
+    )
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_db_queue_mode_requires_claiming_store(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="ASYNC_WORKER_QUEUE=db"):
+        AsyncJobRuntime(store=AsyncJobStore(store_file=tmp_path / "store.json"), queue_mode="db")
+
+
+def test_two_nodes_process_each_job_exactly_once(store: _LeasingStore) -> None:
+    job_ids = [_create_job(store, f"job-{index}") for index in range(12)]
+    nodes = [_runtime(store, "node-a", workers=3), _runtime(store, "node-b", workers=3)]
+    for node in nodes:
+        node.start()
+    try:
+        assert _wait_for(lambda: all(store.get_job(job_id)["status"] == "completed" for job_id in job_ids))
+        assert _wait_for(lambda: not store.leases)
+    finally:
+        for node in nodes:
+            node.stop()
+
+    for job_id in job_ids:
+        assert [r["result_kind"] for r in store.list_results(job_id)] == ["partial", "partial", "final"]
+        assert store.claim_counts[job_id] == 1
+    assert sorted(store.released) == sorted(job_ids)
+
+
+def test_notify_wakes_idle_worker_node_without_polling(store: _LeasingStore) -> None:
+    # Lease 30 s → Polling-Fallback erst nach 10 s; schneller geht es nur per NOTIFY.
+    worker_node = _runtime(store, "worker", workers=1)
+    worker_node.start()
+    try:
+        assert _wait_for(lambda: bool(store.listeners))
+        time.sleep(0.05)
+        job_id = _create_job(store, "accepted-by-api-node")
+        assert _wait_for(lambda: store.get_job(job_id)["status"] == "completed", timeout=3.0)
+    finally:
+        worker_node.stop()
+    assert store.listeners[0].closed
+
+
+def test_expired_lease_of_crashed_node_is_taken_over(store: _LeasingStore) -> None:
+    job_id = _create_job(store, "crashed")
+    assert store.claim_jobs(worker_id="dead-node", lease_seconds=0.2)
+
+    node = _runtime(store, "survivor", workers=1, lease_seconds=0.3)
+    node.start()
+    try:
+        assert _wait_for(lambda: store.get_job(job_id)["status"] == "completed")
+    finally:
+        node.stop()
+    assert store.claim_counts[job_id] == 2
+
+
+def test_worker_stops_writing_after_losing_its_lease(store: _LeasingStore) -> None:
+    job_id = _create_job(store, "stolen")
+    first_stage_written = threading.Event()
+    continue_pipeline = threading.Event()
+
+    def _runner(job: dict[str, Any]) -> Iterator[AnalysisStage]:
+        yield AnalysisStage(name="stage_1", payload={"stage": 1}, progress_percent=40)
+        first_stage_written.set()
+        continue_pipeline.wait(timeout=5)
+        yield AnalysisStage(name="final", payload={"final": True}, progress_percent=100, final=True)
+
+    node = _runtime(store, "slow-node", workers=1, lease_seconds=0.3, analysis_runner=_runner)
+    node.start()
+    try:
+        assert first_stage_written.wait(timeout=5)
+        with store._lock:
+            store.leases[job_id] = ("other-node", time.monotonic() + 60)
+        assert _wait_for(lambda: job_id in node._lost_lease_ids)
+        continue_pipeline.set()
+        assert _wait_for(lambda: node.stats()["busy_workers"] == 0)
+    finally:
+        continue_pipeline.set()
+        node.stop()
+
+    assert [r["result_kind"] for r in store.list_results(job_id)] == ["partial"]
+    assert store.leases[job_id][0] == "other-node"
+    assert job_id not in store.released
+
+
+def test_store_fences_writes_of_a_worker_that_lost_its_lease(store: _LeasingStore) -> None:
+    job_id = _create_job(store, "fenced")
+    first_stage_written = threading.Event()
+    continue_pipeline = threading.Event()
+
+    def _runner(job: dict[str, Any]) -> Iterator[AnalysisStage]:
+        yield AnalysisStage(name="stage_1", payload={"stage": 1}, progress_percent=40)
+        first_stage_written.set()
+        continue_pipeline.wait(timeout=5)
+        yield AnalysisStage(name="final", payload={"final": True}, progress_percent=100, final=True)
+
+    # Lange Lease: der Heartbeat bemerkt den Verlust nicht vor dem nächsten Write.
+    node = _runtime(store, "stale-node", workers=1, lease_seconds=30.0, analysis_runner=_runner)
+    node.start()
+    try:
+        assert first_stage_written.wait(timeout=5)
+        with store._lock:
+            store.leases[job_id] = ("other-node", time.monotonic() + 60)
+        continue_pipeline.set()
+        assert _wait_for(lambda: node.stats()["busy_workers"] == 0)
+    finally:
+        continue_pipeline.set()
+        node.stop()
+
+    assert [r["result_kind"] for r in store.list_results(job_id)] == ["partial"]
+    assert store.get_job(job_id)["status"] == "partial"
+
+
+def test_job_claimed_too_often_is_failed_as_lease_expired(store: _LeasingStore) -> None:
+    job_id = _create_job(store, "poison")
+    store.claim_counts[job_id] = 3
+
+    node = _runtime(store, "node", workers=1, max_claims=3)
+    node.start()
+    try:
+        assert _wait_for(lambda: store.get_job(job_id)["status"] == "failed")
+    finally:
+        node.stop()
+
+    job = store.get_job(job_id)
+    assert job["error_code"] == "lease_expired"
+    assert job["retryable"] is True
+    assert store.list_results(job_id) == []
+
+
+def test_polling_fallback_without_listener(tmp_path: Path) -> None:
+    store = _LeasingStore(AsyncJobStore(store_file=tmp_path / "store.json"), with_listener=False)
+    node = _runtime(store, "node", workers=1, lease_seconds=0.3)
+    node.start()
+    try:
+        job_id = _create_job(store, "polled")
+        assert _wait_for(lambda: store.get_job(job_id)["status"] == "completed")
+        stats = node.stats()
+    finally:
+        node.stop()
+
+    assert stats["queue_mode"] == "db"
+    assert stats["node_id"] == "node"
+
+
+def test_sqlite_store_shares_claims_between_processes(tmp_path: Path) -> None:
+    # Zwei Store-Instanzen auf derselben Datei stehen für zwei Pre-Fork-Worker.
+    stores = [SqliteAsyncJobStore(db_path=tmp_path / "store.sqlite3") for _ in range(2)]
+    job_ids = [_create_job(stores[0], f"job-{index}") for index in range(8)]
+    # Lease eines abgestürzten Workers: der Job wird trotzdem genau einmal fertig.
+    assert stores[1].claim_jobs(worker_id="dead-worker", lease_seconds=-1)[0]["job_id"] == job_ids[0]
+    nodes = [_runtime(stores[index], f"worker-{index}", workers=2, lease_seconds=0.3) for index in range(2)]
+    for node in nodes:
+        node.start()
+    try:
+        assert _wait_for(
+            lambda: all(stores[0].get_job(job_id)["status"] == "completed" for job_id in job_ids)
+        )
+    finally:
+        for node in nodes:
+            node.stop()
+        for sqlite_store in stores:
+            sqlite_store.close()
+    reopened = SqliteAsyncJobStore(db_path=tmp_path / "store.sqlite3")
+    try:
+        for job_id in job_ids:
+            assert [r["result_kind"] for r in reopened.list_results(job_id)] == ["partial", "partial", "final"]
+    finally:
+        reopened.close()
+
+
+def test_api_node_without_embedded_worker_does_not_start_runtime(monkeypatch: pytest.MonkeyPatch) -> None:
+    from src.api import web_service
+
+    class _Runtime:
+        queue_mode = "db"
+        started = False
+
+        def start(self) -> None:
+            self.started = True
+
+        def enqueue_pending_jobs(self) -> None:
+            raise AssertionError("API-only node must not recover jobs")
+
+    class _Store:
+        def open_job_event_listener(self) -> Any:
+            raise AssertionError("the feed thread opens the listener")
+
+    feeds: list[tuple[Any, Any]] = []
+    fed = threading.Event()
+
+    def _feed(store: Any, hub: Any) -> None:
+        feeds.append((store, hub))
+        fed.set()
+
+    store = _Store()
+    runtime = _Runtime()
+    monkeypatch.setenv("ASYNC_WORKER_EMBEDDED", "0")
+    monkeypatch.setattr(web_service, "_ASYNC_JOB_STORE", store)
+    monkeypatch.setattr(web_service, "_ASYNC_JOB_EVENT_HUB", None)
+    monkeypatch.setattr(web_service, "_ASYNC_JOB_EVENT_FEED", None)
+    monkeypatch.setattr(web_service, "_run_async_job_event_feed", _feed)
+    monkeypatch.setattr(web_service, "_ASYNC_JOB_RUNTIME", runtime)
+    monkeypatch.setattr(web_service, "_ASYNC_RUNTIME_STARTED", False)
+
+    web_service._ensure_async_runtime_started()
+
+    assert runtime.started is False
+    assert web_service._ASYNC_RUNTIME_STARTED is True
+    # Job-Events der Worker-Nodes kommen per LISTEN-Feed in den Hub.
+    assert fed.wait(5)
+    assert feeds == [(store, web_service._ASYNC_JOB_EVENT_HUB)]
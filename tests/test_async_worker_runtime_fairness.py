@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+
+from src.api.async_worker_runtime import AsyncJobRuntime
+
+
+class _NoStore:
+    def get_job(self, job_id: str):
+        return None
+
+
+class _RecordingRuntime(AsyncJobRuntime):
+    def __init__(self, *, release: threading.Event | None = None, **kwargs):
+        super().__init__(store=_NoStore(), stage_delay_seconds=0.0, **kwargs)
+        self.release = release
+        self.started: list[str] = []
+        self.running_by_org: dict[str, int] = {}
+        self.max_running_by_org: dict[str, int] = {}
+        self._record_lock = threading.Lock()
+
+    def _process_one(self, job_id: str) -> None:
+        org = job_id.split("-", 1)[0]
+        with self._record_lock:
+            self.started.append(job_id)
+            self.running_by_org[org] = self.running_by_org.get(org, 0) + 1
+            self.max_running_by_org[org] = max(self.max_running_by_org.get(org, 0), self.running_by_org[org])
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        with self._record_lock:
+            self.running_by_org[org] -= 1
+
+
+def _enqueue(runtime: AsyncJobRuntime, org: str, count: int) -> None:
+    for index in range(count):
+        runtime.enqueue(f"{org}-{index}", job={"org_id": org})
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_round_robin_interleaves_tenants_behind_a_burst() -> None:
+    runtime = _RecordingRuntime(workers=1, per_tenant_concurrency=1)
+    _enqueue(runtime, "big", 5)
+    _enqueue(runtime, "small", 2)
+
+    runtime.start()
+    try:
+        assert _wait_for(lambda: len(runtime.started) == 7)
+    finally:
+        runtime.stop()
+
+    assert runtime.started[:4] == ["big-0", "small-0", "big-1", "small-1"]
+
+
+def test_per_tenant_cap_leaves_workers_for_other_tenants() -> None:
+    release = threading.Event()
+    runtime = _RecordingRuntime(release=release, workers=4, per_tenant_concurrency=2)
+    _enqueue(runtime, "big", 6)
+    runtime.start()
+    try:
+        assert _wait_for(lambda: runtime.stats()["busy_workers"] == 2)
+        _enqueue(runtime, "small", 1)
+        assert _wait_for(lambda: "small-0" in runtime.started)
+
+        stats = runtime.stats()
+        assert stats["busy_workers"] == 3
+        assert stats["tenants"]["big"]["queue_depth"] == 4
+        assert stats["tenants"]["big"]["running"] == 2
+        assert stats["tenants"]["big"]["oldest_wait_ms"] > 0
+        assert stats["tenants"]["small"]["started_total"] == 1
+    finally:
+        release.set()
+        assert _wait_for(lambda: len(runtime.started) == 7)
+        runtime.stop()
+
+    assert runtime.max_running_by_org["big"] == 2
+    assert runtime.stats()["queue_depth"] == 0
+
+
+def test_enqueue_of_running_job_is_deferred_until_it_finishes() -> None:
+    release = threading.Event()
+    runtime = _RecordingRuntime(release=release, workers=2, per_tenant_concurrency=2)
+    runtime.enqueue("org-1", job={"org_id": "org"})
+    runtime.start()
+    try:
+        assert _wait_for(lambda: runtime.started == ["org-1"])
+        runtime.enqueue("org-1", job={"org_id": "org"})
+        time.sleep(0.05)
+        assert runtime.started == ["org-1"]
+        release.set()
+        assert _wait_for(lambda: runtime.started == ["org-1", "org-1"])
+    finally:
+        runtime.stop()
+
+    assert runtime.max_running_by_org["org"] == 1
+
+
+def test_fairness_key_user_and_default_tenant() -> None:
+    runtime = AsyncJobRuntime(store=_NoStore(), stage_delay_seconds=0.0, workers=1, fairness_key="user")
+    runtime.enqueue("j1", job={"org_id": "org-a", "owner_user_id": "user-1"})
+    runtime.enqueue("j2", job={"org_id": "org-a"})
+    runtime.enqueue("j3")
+
+    tenants = runtime.stats()["tenants"]
+    assert set(tenants) == {"user-1", "org-a", "default"}
+    assert runtime.stats()["fairness_key"] == "user"
+
+
+def test_health_details_hides_tenant_ids() -> None:
+    from src.api import web_service
+
+    runtime = AsyncJobRuntime(store=_NoStore(), stage_delay_seconds=0.0, workers=1)
+    runtime.enqueue("j1", job={"org_id": "org-secret"})
+    runtime.enqueue("j2", job={"org_id": "org-secret"})
+    runtime.enqueue("j3", job={"org_id": "org-other"})
+
+    payload = web_service._build_health_details_payload(
+        request_id="req-1", query_params={}, async_runtime_stats=runtime.stats()
+    )
+
+    tenants = payload["async_runtime"]["tenants"]
+    serialized = json.dumps(payload)
+    assert "org-secret" not in serialized
+    assert hashlib.sha256(b"org-secret").hexdigest()[:12] not in serialized
+    assert set(tenants) == {"count", "queue_depth_total", "queue_depth_max", "oldest_wait_ms_max"}
+    assert (tenants["count"], tenants["queue_depth_total"], tenants["queue_depth_max"]) == (2, 3, 2)
+    assert payload["async_runtime"]["queue_depth"] == 3
+    assert set(runtime.stats()["tenants"]) == {"org-secret", "org-other"}
@@ -64,6 +64,7 @@ class TestAuthPhase1Core(unittest.TestCase):
                 # Async runtime
                 "ASYNC_JOBS_STORE_FILE": str(cls._store_file),
                 "ASYNC_WORKER_STAGE_DELAY_MS": "250",
+                "ASYNC_WORKER_ANALYSIS": "stub",
                 "ENABLE_E2E_FAULT_INJECTION": "1",
             }
         )
@@ -173,6 +173,22 @@ class TestInsertEventsForJob(unittest.TestCase):
         self.assertIn("ON CONFLICT DO NOTHING", sql)
 
 
+class TestSyncSeqCounters(unittest.TestCase):
+    def test_counters_raised_to_backfilled_maxima(self):
+        cur = _make_mock_cursor()
+        _mod._sync_seq_counters(cur, ["j1", "j2"])
+        sql, params = cur.execute.call_args[0]
+        self.assertIn("last_event_seq", sql)
+        self.assertIn("last_result_seq", sql)
+        self.assertIn("GREATEST", sql)
+        self.assertEqual(params, (["j1", "j2"],))
+
+    def test_no_jobs_no_query(self):
+        cur = _make_mock_cursor()
+        _mod._sync_seq_counters(cur, [])
+        cur.execute.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _insert_result_if_not_exists
 # ---------------------------------------------------------------------------
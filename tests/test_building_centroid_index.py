@@ -0,0 +1,161 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.api import building_centroid_index as bci
+from src.api import web_service
+
+
+def _centroid(egid: int, e: float, n: float, street: str = "Bahnhofstrasse 1") -> bci.BuildingCentroid:
+    return bci.BuildingCentroid(
+        egid=egid,
+        edid=0,
+        lv95_e=e,
+        lv95_n=n,
+        street=street,
+        postal_code="8001",
+        city="Zürich",
+    )
+
+
+class TestBuildingCentroidIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.index_path = Path(self._tmp.name) / "centroids.idx"
+
+    def tearDown(self):
+        bci.reset_centroid_index_cache()
+        self._tmp.cleanup()
+
+    def test_approx_transform_matches_lv95_origin(self):
+        e, n = bci.wgs84_to_lv95_approx(lat=46.951082877, lon=7.438632495)
+        self.assertAlmostEqual(e, 2600000.0, delta=1.0)
+        self.assertAlmostEqual(n, 1200000.0, delta=1.0)
+
+    def test_nearest_returns_closest_centroid_across_cells(self):
+        bci.write_centroid_index(
+            self.index_path,
+            [
+                _centroid(1, 2683000.0, 1247000.0, "Weit 1"),
+                _centroid(2, 2683099.0, 1247001.0, "Nah 2"),
+                _centroid(3, 2683150.0, 1247050.0, "Mittel 3"),
+            ],
+        )
+        index = bci.BuildingCentroidIndex(self.index_path)
+        try:
+            self.assertEqual(len(index), 3)
+            hit = index.nearest(lv95_e=2683101.0, lv95_n=1247000.0, max_distance_m=120.0)
+        finally:
+            index.close()
+
+        self.assertIsNotNone(hit)
+        distance_m, centroid = hit
+        self.assertEqual(centroid.egid, 2)
+        self.assertEqual(centroid.street, "Nah 2")
+        self.assertEqual(centroid.city, "Zürich")
+        self.assertEqual(centroid.feature_id, "2_0")
+        self.assertAlmostEqual(distance_m, 2.236, places=2)
+
+    def test_nearest_breaks_ties_by_lowest_egid_across_cells(self):
+        # Equidistant, but in different grid cells; the higher EGID is stored first.
+        bci.write_centroid_index(
+            self.index_path,
+            [
+                _centroid(9, 2683090.0, 1247000.0, "West 9"),
+                _centroid(5, 2683110.0, 1247000.0, "Ost 5"),
+            ],
+        )
+        index = bci.BuildingCentroidIndex(self.index_path)
+        try:
+            hit = index.nearest(lv95_e=2683100.0, lv95_n=1247000.0, max_distance_m=50.0)
+        finally:
+            index.close()
+
+        self.assertIsNotNone(hit)
+        distance_m, centroid = hit
+        self.assertEqual(centroid.egid, 5)
+        self.assertAlmostEqual(distance_m, 10.0)
+
+    def test_nearest_respects_max_distance(self):
+        bci.write_centroid_index(self.index_path, [_centroid(1, 2683000.0, 1247000.0)])
+        index = bci.BuildingCentroidIndex(self.index_path)
+        try:
+            self.assertIsNone(index.nearest(lv95_e=2683300.0, lv95_n=1247000.0, max_distance_m=120.0))
+        finally:
+            index.close()
+
+    def test_truncated_file_is_rejected(self):
+        bci.write_centroid_index(self.index_path, [_centroid(1, 2683000.0, 1247000.0)])
+        raw = self.index_path.read_bytes()
+        self.index_path.write_bytes(raw[: len(raw) // 2])
+
+        with self.assertRaises(bci.CentroidIndexError):
+            bci.BuildingCentroidIndex(self.index_path)
+
+    def test_env_loader_remembers_broken_path_as_disabled(self):
+        with mock.patch.dict(os.environ, {bci.GWR_CENTROID_INDEX_PATH_ENV: str(self.index_path)}):
+            self.assertIsNone(bci.get_centroid_index_from_env())
+
+
+class TestWebServiceCentroidSnapping(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.index_path = Path(self._tmp.name) / "centroids.idx"
+        click_e, click_n = bci.wgs84_to_lv95_approx(lat=47.4245, lon=9.3767)
+        bci.write_centroid_index(
+            self.index_path,
+            [
+                bci.BuildingCentroid(
+                    egid=1072597,
+                    edid=0,
+                    lv95_e=click_e + 8.0,
+                    lv95_n=click_n + 6.0,
+                    street="Spisergasse 6",
+                    postal_code="9000",
+                    city="St. Gallen",
+                )
+            ],
+        )
+
+    def tearDown(self):
+        bci.reset_centroid_index_cache()
+        self._tmp.cleanup()
+
+    def test_resolves_click_in_process_without_upstream_calls(self):
+        with mock.patch.dict(os.environ, {bci.GWR_CENTROID_INDEX_PATH_ENV: str(self.index_path)}):
+            with mock.patch.object(web_service, "_fetch_json_url", side_effect=AssertionError("no upstream")):
+                query, meta = web_service._resolve_query_from_coordinates(lat=47.4245, lon=9.3767)
+
+        self.assertEqual(query, "Spisergasse 6, 9000 St. Gallen")
+        self.assertEqual(meta["resolver"], "local_centroid_index")
+        self.assertEqual(meta["feature_id"], "1072597_0")
+        self.assertAlmostEqual(meta["distance_m"], 10.0, places=1)
+
+    def test_falls_back_to_identify_when_no_centroid_in_range(self):
+        with mock.patch.dict(os.environ, {bci.GWR_CENTROID_INDEX_PATH_ENV: str(self.index_path)}):
+            with mock.patch.object(web_service, "_wgs84_to_lv95", return_value=(2600000.0, 1200000.0)) as lv95:
+                with mock.patch.object(
+                    web_service,
+                    "_identify_gwr_candidates",
+                    return_value=[
+                        {
+                            "feature_id": "42_0",
+                            "street": "Bundesplatz 3",
+                            "postal_code": "3005",
+                            "city": "Bern",
+                            "lv95_e": 2600010.0,
+                            "lv95_n": 1200000.0,
+                        }
+                    ],
+                ):
+                    query, meta = web_service._resolve_query_from_coordinates(lat=46.951, lon=7.4386)
+
+        lv95.assert_called_once()
+        self.assertEqual(query, "Bundesplatz 3, 3005 Bern")
+        self.assertEqual(meta["resolver"], "gwr_identify")
+
+
+if __name__ == "__main__":
+    unittest.main()
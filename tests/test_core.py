@@ -161,6 +161,156 @@ class TestCoreFunctions(unittest.TestCase):
         s_fuzzy, _ = address_intel.score_candidate_pre(fuzzy, qp)
         self.assertGreater(s_exact, s_fuzzy)
 
+    def test_address_matcher_keeps_baseline_scores(self):
+        # Expected values captured from the implementation before AddressMatcher.
+        qp = address_intel.parse_query_parts("St. Leonhard-Str. 39, 9000 St. Gallen")
+        matcher = address_intel.AddressMatcher(qp)
+        pre_cases = [
+            (
+                {
+                    "featureId": "111_0",
+                    "label": "St. Leonhard-Strasse 39 <b>9000 St. Gallen</b>",
+                    "detail": "st. leonhard-strasse 39 9000 st. gallen",
+                    "origin": "address",
+                    "rank": 2,
+                },
+                108.0,
+                [
+                    "Strasse exakt im Treffertext",
+                    "Hausnummer passt",
+                    "PLZ passt",
+                    "Ort passt",
+                    "Origin=address",
+                    "Search-Rank-Bonus 8.0",
+                    "Feature-ID vorhanden",
+                    "Label startet mit Strasse",
+                ],
+            ),
+            (
+                {"label": "Leonhardweg 3 <b>9001 Gallen</b>", "detail": "", "rank": 9},
+                -41.0,
+                [
+                    "Strasse nicht ausreichend enthalten",
+                    "Hausnummer fehlt",
+                    "PLZ fehlt",
+                    "Ort nicht erkannt",
+                    "Search-Rank-Bonus 1.0",
+                ],
+            ),
+            ({}, -42.0, ["Strasse nicht ausreichend enthalten", "Hausnummer fehlt", "PLZ fehlt", "Ort nicht erkannt"]),
+        ]
+        for attrs, expected_score, expected_reasons in pre_cases:
+            self.assertEqual(matcher.score_pre(attrs), (expected_score, expected_reasons))
+            self.assertEqual(address_intel.score_candidate_pre(attrs, qp), (expected_score, expected_reasons))
+
+        gwr = {"strname_deinr": "St. Leonhard-Strasse 39", "plz_plz6": "900000", "dplzname": "St. Gallen", "gstat": 1004}
+        score, reasons = matcher.score_detail({"adr_official": True}, gwr)
+        self.assertEqual(score, 56.0)
+        self.assertIn("Amtliche Adresse", reasons)
+        score, reasons = address_intel.score_candidate_detail(qp, {}, gwr)
+        self.assertEqual(score, 20 + 8 + 12 + 8 + 3)
+        self.assertIn("GWR-Hausnummer bestätigt", reasons)
+
+        other_qp = address_intel.parse_query_parts("Wassergasse 24, 9000 St. Gallen")
+        score, _ = address_intel.AddressMatcher(other_qp).score_pre(
+            {
+                "featureId": "222_0",
+                "label": "Burgstrasse 24 <b>9000 St. Gallen</b>",
+                "detail": "burgstrasse 24 9000 st. gallen",
+                "origin": "address",
+                "rank": 7,
+            }
+        )
+        self.assertEqual(score, 42.0)
+        mismatch_gwr = {"strname_deinr": "Wassergasse 26", "plz_plz6": "900100", "dplzname": "St. Gallen", "gstat": 1007}
+        self.assertEqual(
+            address_intel.AddressMatcher(other_qp).score_detail({}, mismatch_gwr),
+            (
+                17.0,
+                ["GWR-Strasse bestätigt", "GWR-Hausnummer abweichend", "GWR-PLZ abweichend", "GWR-Ort/Gemeinde bestätigt"],
+            ),
+        )
+
+    def test_normalize_text_is_memoized(self):
+        address_intel._normalize_text_cached.cache_clear()
+        first = address_intel.normalize_text("Zürich <b>Hauptbahnhof</b>")
+        second = address_intel.normalize_text("Zürich <b>Hauptbahnhof</b>")
+
+        self.assertEqual(first, "zurich hauptbahnhof")
+        self.assertEqual(second, first)
+        self.assertEqual(address_intel._normalize_text_cached.cache_info().hits, 1)
+        self.assertEqual(address_intel.tokenize("Zürich <b>HB</b>"), ["zurich", "hb"])
+
+    def _build_report_offline(self, **kwargs):
+        selected = address_intel.CandidateEval(
+            feature_id="111_0",
+            label="Wassergasse 24 9000 St. Gallen",
+            detail="",
+            origin="address",
+            rank=1,
+            lat=47.42,
+            lon=9.37,
+            pre_score=70,
+            total_score=95,
+            address_attrs={"adr_official": True},
+            gwr_attrs={"egid": "111", "gkode": 2746000.0, "gkodn": 1254000.0, "plz_plz6": 9000, "gstat": 1004},
+        )
+        fetches = dict(
+            search_candidates=mock.Mock(return_value=[]),
+            build_candidate_list=mock.Mock(return_value=[selected]),
+            hydrate_candidates=mock.Mock(return_value=selected),
+            fetch_heating_layer=mock.Mock(return_value={"genh1_de": "Erdwärme"}),
+            fetch_plz_layer_at_lv95=mock.Mock(return_value={"plz": 9000}),
+            fetch_swissboundaries_at_lv95=mock.Mock(return_value={"gemname": "St. Gallen"}),
+            fetch_swisstopo_height=mock.Mock(return_value={"height_m": 670.0}),
+            fetch_osm_reverse=mock.Mock(return_value={}),
+            fetch_osm_poi_overpass_adaptive=mock.Mock(return_value=({"source_url": None, "pois": []}, {})),
+            fetch_google_news_rss=mock.Mock(return_value={"items": []}),
+        )
+        with mock.patch.multiple(address_intel, **fetches):
+            report = address_intel.build_report("Wassergasse 24, 9000 St. Gallen", client=mock.Mock(), **kwargs)
+        return report, fetches
+
+    def test_build_report_modules_skip_unrequested_fetches(self):
+        report, fetches = self._build_report_offline(modules=["building", "energy"])
+
+        self.assertIn("building", report)
+        self.assertEqual(report["energy"]["heating_layer"]["energiequelle_heizung_1"], "Erdwärme")
+        for module_name in ("match", "cross_source", "intelligence", "suitability_light", "summary_compact", "links"):
+            self.assertNotIn(module_name, report)
+        for name in ("fetch_plz_layer_at_lv95", "fetch_swissboundaries_at_lv95", "fetch_swisstopo_height", "fetch_osm_reverse"):
+            fetches[name].assert_not_called()
+        self.assertEqual(report["sources"]["swisstopo_height"]["status"], "disabled")
+        self.assertTrue(all(path.split(".")[0] in {"ids", "administrative", "building", "energy"} for path in report["field_provenance"]))
+        self.assertIn("confidence", report)
+
+    def test_build_report_modules_select_single_intelligence_layer(self):
+        report, fetches = self._build_report_offline(
+            modules=["intelligence.incidents_timeline"],
+            intelligence_mode="risk",
+        )
+
+        self.assertEqual(set(report["intelligence"]) - {"mode", "source_policy"}, {"incidents_timeline"})
+        fetches["fetch_google_news_rss"].assert_called_once()
+        fetches["fetch_osm_poi_overpass_adaptive"].assert_not_called()
+        fetches["fetch_heating_layer"].assert_not_called()
+        self.assertEqual(report["sources"]["osm_poi_overpass"]["status"], "disabled")
+
+        full_report, full_fetches = self._build_report_offline(intelligence_mode="risk")
+        self.assertIn("summary_compact", full_report)
+        full_fetches["fetch_osm_poi_overpass_adaptive"].assert_called_once()
+
+    def test_normalize_report_modules_rejects_unknown_names(self):
+        self.assertIsNone(address_intel.normalize_report_modules(None))
+        self.assertEqual(
+            address_intel.normalize_report_modules(["Intelligence", "intelligence.incidents_timeline"]),
+            frozenset({"intelligence"}),
+        )
+        for invalid in (["weather"], ["building.codes"], ["intelligence.unknown"], [], "building"):
+            with self.subTest(invalid=invalid):
+                with self.assertRaises(ValueError):
+                    address_intel.normalize_report_modules(invalid)
+
     def test_confidence_levels(self):
         sources = address_intel.SourceRegistry()
         sources.note_success("geoadmin_search", "https://example")
@@ -268,6 +418,30 @@ class TestCoreFunctions(unittest.TestCase):
         self.assertEqual(call_count["n"], 1)
         self.assertEqual(a, b)
 
+    def test_min_request_interval_spaces_concurrent_threads(self):
+        import threading
+
+        client = address_intel.HttpClient(min_request_interval_seconds=10.0, enable_disk_cache=False)
+        waits = []
+        barrier = threading.Barrier(6)
+
+        def worker():
+            barrier.wait()
+            client._enforce_min_interval()
+
+        with mock.patch.object(address_intel.time, "sleep", side_effect=waits.append):
+            threads = [threading.Thread(target=worker) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        # Ohne Lock lasen mehrere Threads denselben Startzeitpunkt und
+        # starteten gleichzeitig; jetzt bekommt jeder einen eigenen Slot.
+        self.assertEqual(len(waits), 5)
+        for slot, wait in enumerate(sorted(waits), start=1):
+            self.assertAlmostEqual(wait, slot * 10.0, delta=1.0)
+
     def test_batch_recovers_unquoted_commas(self):
         captured = []
         original_build_report = address_intel.build_report
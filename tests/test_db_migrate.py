@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import hashlib
 import importlib.util
+import re
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -113,6 +114,54 @@ class TestMigrationContent:
         content = async_schema.read_text()
         assert "CREATE TABLE IF NOT EXISTS jobs" in content
 
+    def test_seq_counter_migration_adds_and_backfills_counters(self):
+        content = (MIGRATIONS_DIR / "004_async_jobs_seq_counters.sql").read_text()
+        for column in ("last_event_seq", "last_result_seq"):
+            assert f"ADD COLUMN IF NOT EXISTS {column}" in content
+        assert "MAX(e.event_seq)" in content
+        assert "MAX(r.result_seq)" in content
+
+    def test_claim_lease_migration_adds_leases_and_notify_triggers(self):
+        content = (MIGRATIONS_DIR / "005_async_jobs_claim_leases.sql").read_text()
+        for column in ("lease_owner", "lease_expires_at", "claim_count"):
+            assert f"ADD COLUMN IF NOT EXISTS {column}" in content
+        assert "pg_notify('async_jobs', NEW.job_id)" in content
+        assert "AFTER INSERT ON jobs" in content
+        assert "AFTER UPDATE OF lease_owner ON jobs" in content
+
+    def test_history_keyset_migration_adds_indexes_and_counters(self):
+        content = (MIGRATIONS_DIR / "006_async_jobs_history_keyset.sql").read_text()
+        assert "jobs(org_id, user_id, queued_at DESC, job_id DESC)" in content
+        assert "jobs(org_id, queued_at DESC, job_id DESC)" in content
+        assert "CREATE TABLE IF NOT EXISTS job_counts" in content
+        assert "AFTER INSERT OR DELETE ON jobs" in content
+
+    def test_timestamptz_migration_converts_columns_and_adds_range_indexes(self):
+        content = (MIGRATIONS_DIR / "007_async_jobs_timestamptz.sql").read_text()
+        for column in ("queued_at", "started_at", "finished_at", "updated_at", "occurred_at", "created_at"):
+            assert re.search(rf"ALTER COLUMN {column}\s+TYPE timestamptz", content), column
+        assert "USING brin (occurred_at)" in content
+        assert "USING brin (created_at)" in content
+
+    def test_result_reuse_migration_adds_lookup_index(self):
+        content = (MIGRATIONS_DIR / "008_async_jobs_result_reuse.sql").read_text()
+        assert "ADD COLUMN IF NOT EXISTS reused_from_job_id" in content
+        assert "jobs(org_id, request_payload_hash, finished_at DESC)" in content
+
+    def test_blob_refs_migration_indexes_reference_columns(self):
+        content = (MIGRATIONS_DIR / "009_async_jobs_blob_refs.sql").read_text()
+        assert "ON job_results(s3_key)" in content
+        assert "ON jobs(request_payload_ref)" in content
+
+    def test_event_notify_migration_announces_job_events(self):
+        content = (MIGRATIONS_DIR / "010_async_jobs_event_notify.sql").read_text()
+        assert "pg_notify('async_job_events', NEW.job_id || ':' || NEW.event_seq)" in content
+        assert "AFTER INSERT ON job_events" in content
+
+    def test_request_payload_migration_adds_jsonb_column(self):
+        content = (MIGRATIONS_DIR / "011_async_jobs_request_payload.sql").read_text()
+        assert "ADD COLUMN IF NOT EXISTS request_payload_json jsonb" in content
+
     def test_migration_files_wrapped_in_transactions(self):
         """All migrations should be wrapped in BEGIN/COMMIT."""
         for version, path in _mod.collect_migration_files():
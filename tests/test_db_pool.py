@@ -0,0 +1,188 @@
+"""
+tests/test_db_pool.py
+
+Unit tests for ConnectionPool (src/shared/db_pool.py) with fake DB-API
+connections: reuse, bound + acquire timeout, idle health check, max lifetime,
+rollback on release.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.shared.db_pool import ConnectionPool, PoolTimeoutError, pool_settings_from_env
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self._conn = conn
+
+    def execute(self, sql: str, params=None) -> None:
+        if self._conn.broken:
+            raise RuntimeError("server closed the connection unexpectedly")
+        self._conn.executed.append(sql)
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.closed = 0
+        self.broken = False
+        self.rollbacks = 0
+        self.executed: list[str] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def rollback(self) -> None:
+        if self.broken:
+            raise RuntimeError("connection already closed")
+        self.rollbacks += 1
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.created: list[_FakeConnection] = []
+        self.clock = _Clock()
+
+    def _factory(self) -> _FakeConnection:
+        conn = _FakeConnection(len(self.created))
+        self.created.append(conn)
+        return conn
+
+    def _pool(self, **kwargs) -> ConnectionPool:
+        kwargs.setdefault("clock", self.clock)
+        return ConnectionPool(self._factory, **kwargs)
+
+    def test_sequential_calls_reuse_one_connection_and_roll_back(self):
+        pool = self._pool()
+        for _ in range(3):
+            with pool.connection() as conn:
+                self.assertIs(conn, self.created[0])
+
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(self.created[0].rollbacks, 3)
+        self.assertEqual(pool.stats()["idle"], 1)
+
+    def test_exception_in_body_returns_healthy_connection(self):
+        pool = self._pool()
+        with self.assertRaises(KeyError):
+            with pool.connection():
+                raise KeyError("unknown job_id")
+
+        with pool.connection() as conn:
+            self.assertIs(conn, self.created[0])
+
+    def test_pool_is_bounded_and_times_out(self):
+        pool = ConnectionPool(self._factory, max_size=1, acquire_timeout_seconds=0.05)
+        with pool.connection():
+            with self.assertRaises(PoolTimeoutError):
+                with pool.connection():
+                    pass
+        self.assertEqual(len(self.created), 1)
+
+    def test_waiter_gets_connection_released_by_other_thread(self):
+        pool = ConnectionPool(self._factory, max_size=1, acquire_timeout_seconds=5)
+        borrowed = threading.Event()
+        release = threading.Event()
+
+        def _holder():
+            with pool.connection():
+                borrowed.set()
+                release.wait(timeout=5)
+
+        thread = threading.Thread(target=_holder)
+        thread.start()
+        self.assertTrue(borrowed.wait(timeout=5))
+        threading.Timer(0.05, release.set).start()
+        with pool.connection() as conn:
+            self.assertIs(conn, self.created[0])
+        thread.join(timeout=5)
+        self.assertEqual(pool.stats()["open"], 1)
+
+    def test_idle_connection_failing_health_check_is_replaced(self):
+        pool = self._pool(health_check_idle_seconds=30)
+        with pool.connection():
+            pass
+        self.clock.now += 10
+        with pool.connection() as conn:
+            self.assertIs(conn, self.created[0])
+            self.assertEqual(conn.executed, [], "no probe for recently used connections")
+
+        self.created[0].broken = True
+        self.clock.now += 31
+        with pool.connection() as conn:
+            self.assertIs(conn, self.created[1])
+
+        self.assertEqual(self.created[0].closed, 1)
+        self.assertEqual(pool.stats()["discarded_total"], 1)
+        self.assertEqual(pool.stats()["open"], 1)
+
+    def test_connections_past_max_lifetime_are_recycled(self):
+        pool = self._pool(max_lifetime_seconds=60)
+        with pool.connection():
+            pass
+        self.clock.now += 61
+        with pool.connection() as conn:
+            self.assertIs(conn, self.created[1])
+        self.assertEqual(self.created[0].closed, 1)
+
+    def test_failed_rollback_discards_connection(self):
+        pool = self._pool()
+        with pool.connection() as conn:
+            conn.broken = True
+        self.assertEqual(pool.stats()["open"], 0)
+        self.assertEqual(self.created[0].closed, 1)
+
+    def test_close_closes_idle_connections(self):
+        pool = self._pool()
+        with pool.connection():
+            pass
+        pool.close()
+        self.assertEqual(self.created[0].closed, 1)
+        with self.assertRaises(RuntimeError):
+            with pool.connection():
+                pass
+
+    def test_settings_from_env(self):
+        env = {
+            "ASYNC_DB_POOL_MAX_SIZE": "4",
+            "ASYNC_DB_POOL_MAX_LIFETIME_SECONDS": "600",
+            "ASYNC_DB_POOL_HEALTH_CHECK_IDLE_SECONDS": "5",
+            "ASYNC_DB_POOL_ACQUIRE_TIMEOUT_SECONDS": "2.5",
+        }
+        with patch.dict(os.environ, env):
+            settings = pool_settings_from_env()
+        self.assertEqual(
+            settings,
+            {
+                "max_size": 4,
+                "max_lifetime_seconds": 600.0,
+                "health_check_idle_seconds": 5.0,
+                "acquire_timeout_seconds": 2.5,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ Tests for:
 - _resolve_history_limit(): existing function, smoke-checks
 - History endpoint DB-store path: per-user filter, pagination metadata (total/limit/offset)
 - History endpoint file-store path: pagination via offset+limit slice
+- Keyset cursor helpers: _encode_history_cursor() / _decode_history_cursor()
 - Result tenant guard: DB store uses get_result_with_org_guard (org_id required)
 - Negative: wrong org → 404 (not 200 with data)
 
@@ -91,6 +92,41 @@ class TestResolveHistoryLimit(unittest.TestCase):
             self.fn("-5")
 
 
+# ---------------------------------------------------------------------------
+# Keyset cursor (next_cursor / cursor)
+# ---------------------------------------------------------------------------
+
+class TestHistoryCursor(unittest.TestCase):
+    def setUp(self):
+        self.ws = _load_web_service_symbols()
+
+    def test_roundtrip(self):
+        key = ("2026-01-01T10:00:00+00:00", "job-1")
+        cursor = self.ws._encode_history_cursor(key)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(self.ws._decode_history_cursor(cursor, size=2), key)
+
+    def test_empty_returns_none(self):
+        self.assertIsNone(self.ws._decode_history_cursor(None, size=2))
+        self.assertIsNone(self.ws._decode_history_cursor("  ", size=2))
+
+    def test_garbage_or_wrong_size_raises(self):
+        with self.assertRaises(ValueError):
+            self.ws._decode_history_cursor("not-a-cursor", size=2)
+        with self.assertRaises(ValueError):
+            self.ws._decode_history_cursor(self.ws._encode_history_cursor(("a", "b", "c")), size=2)
+
+    def test_timestamp_first_rejects_non_iso_queued_at(self):
+        key = ("2026-01-01T10:00:00+00:00", "job-1")
+        cursor = self.ws._encode_history_cursor(key)
+        self.assertEqual(self.ws._decode_history_cursor(cursor, size=2, timestamp_first=True), key)
+        for bad in ("yesterday", "2026-13-01T00:00:00+00:00", ""):
+            with self.subTest(queued_at=bad), self.assertRaisesRegex(ValueError, "cursor is invalid"):
+                self.ws._decode_history_cursor(
+                    self.ws._encode_history_cursor((bad, "job-1")), size=2, timestamp_first=True
+                )
+
+
 # ---------------------------------------------------------------------------
 # DB-store history path: per-user filter + pagination metadata
 # ---------------------------------------------------------------------------
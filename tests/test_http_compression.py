@@ -0,0 +1,140 @@
+import gzip
+import os
+import threading
+import unittest
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+from src.api import web_service
+from src.shared import http_compression
+
+
+class TestAcceptEncodingNegotiation(unittest.TestCase):
+    def test_negotiates_supported_encoding_by_quality(self):
+        self.assertEqual(http_compression.negotiate_encoding("gzip, deflate"), "gzip")
+        self.assertEqual(http_compression.negotiate_encoding("x-gzip"), "gzip")
+        self.assertEqual(http_compression.negotiate_encoding("*;q=0.5"), http_compression.supported_encodings()[0])
+        self.assertIsNone(http_compression.negotiate_encoding("gzip;q=0, identity"))
+        self.assertIsNone(http_compression.negotiate_encoding("deflate"))
+        self.assertIsNone(http_compression.negotiate_encoding(None))
+
+    def test_merge_vary_keeps_existing_values(self):
+        self.assertEqual(http_compression.merge_vary("Origin", "Accept-Encoding"), "Origin, Accept-Encoding")
+        self.assertEqual(http_compression.merge_vary("accept-encoding", "Accept-Encoding"), "accept-encoding")
+        self.assertEqual(http_compression.merge_vary(None, "Accept-Encoding"), "Accept-Encoding")
+
+
+class TestEncodeResponseBody(unittest.TestCase):
+    def setUp(self):
+        http_compression.clear_static_cache()
+
+    def test_compresses_above_threshold_and_round_trips(self):
+        body = b'{"ok": true, "items": [' + b'"Bahnhofstrasse 1, 8001 Z\xc3\xbcrich", ' * 200 + b'"x"]}'
+        encoded, headers = http_compression.encode_response_body(body, "gzip")
+
+        self.assertEqual(headers, {"Vary": "Accept-Encoding", "Content-Encoding": "gzip"})
+        self.assertLess(len(encoded), len(body))
+        self.assertEqual(gzip.decompress(encoded), body)
+
+    def test_small_bodies_and_identity_clients_stay_uncompressed(self):
+        small = b'{"ok": true}'
+        self.assertEqual(http_compression.encode_response_body(small, "gzip"), (small, {"Vary": "Accept-Encoding"}))
+
+        large = b"a" * 4096
+        self.assertEqual(http_compression.encode_response_body(large, None), (large, {"Vary": "Accept-Encoding"}))
+
+    def test_threshold_and_kill_switch_are_configurable(self):
+        body = b"b" * 600
+        with mock.patch.dict(os.environ, {http_compression.HTTP_COMPRESSION_MIN_BYTES_ENV: "512"}):
+            _, headers = http_compression.encode_response_body(body, "gzip")
+            self.assertEqual(headers.get("Content-Encoding"), "gzip")
+
+        with mock.patch.dict(os.environ, {http_compression.HTTP_COMPRESSION_ENABLED_ENV: "0"}):
+            self.assertEqual(http_compression.encode_response_body(b"c" * 4096, "gzip"), (b"c" * 4096, {}))
+
+    def test_static_variants_are_cached_per_content(self):
+        body = b"<html>" + b"<div>GUI</div>" * 500 + b"</html>"
+        first, _ = http_compression.encode_response_body(body, "gzip", static=True)
+        with mock.patch.object(http_compression, "compress", side_effect=AssertionError("not cached")):
+            second, headers = http_compression.encode_response_body(body, "gzip", static=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(second), body)
+
+
+class TestStreamEncoder(unittest.TestCase):
+    def test_chunked_gzip_stream_round_trips(self):
+        chunks = [b'{"items": [', b'"Bahnhofstrasse 1", ' * 300, b'"x"]}']
+        encoder, headers = http_compression.stream_encoder("gzip", sum(len(chunk) for chunk in chunks))
+
+        self.assertEqual(headers, {"Vary": "Accept-Encoding", "Content-Encoding": "gzip"})
+        encoded = b"".join(encoder.compress(chunk) for chunk in chunks) + encoder.flush()
+        self.assertEqual(gzip.decompress(encoded), b"".join(chunks))
+
+    def test_small_or_identity_streams_have_no_encoder(self):
+        self.assertEqual(http_compression.stream_encoder("gzip", 10), (None, {"Vary": "Accept-Encoding"}))
+        self.assertEqual(http_compression.stream_encoder("identity", 10_000), (None, {"Vary": "Accept-Encoding"}))
+        with mock.patch.dict(os.environ, {"HTTP_COMPRESSION_ENABLED": "0"}):
+            self.assertEqual(http_compression.stream_encoder("gzip", 10_000), (None, {}))
+
+
+class TestWebServiceResponseCompression(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._server = ThreadingHTTPServer(("127.0.0.1", 0), web_service.Handler)
+        cls._port = int(cls._server.server_address[1])
+        cls._thread = threading.Thread(target=cls._server.serve_forever, daemon=True)
+        cls._thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._server.shutdown()
+        cls._server.server_close()
+        cls._thread.join(timeout=2)
+
+    def _get(self, path: str, headers: dict[str, str]) -> tuple[int, bytes, dict[str, str]]:
+        conn = HTTPConnection("127.0.0.1", self._port, timeout=15)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            return int(response.status), body, {key.lower(): value for key, value in response.getheaders()}
+        finally:
+            conn.close()
+
+    def test_gui_html_is_gzip_encoded_when_accepted(self):
+        status, body, headers = self._get("/gui", {"Accept-Encoding": "gzip"})
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get("content-encoding"), "gzip")
+        self.assertIn("Accept-Encoding", headers.get("vary", ""))
+        self.assertEqual(int(headers["content-length"]), len(body))
+        self.assertIn(b"<html", gzip.decompress(body).lower())
+
+    def test_gui_html_stays_identity_without_accept_encoding(self):
+        status, body, headers = self._get("/gui", {"Accept-Encoding": "identity"})
+
+        self.assertEqual(status, 200)
+        self.assertNotIn("content-encoding", headers)
+        self.assertIn(b"<html", body.lower())
+
+    def test_encoded_representation_has_its_own_etag(self):
+        _, _, identity_headers = self._get("/gui", {"Accept-Encoding": "identity"})
+        _, _, gzip_headers = self._get("/gui", {"Accept-Encoding": "gzip"})
+
+        identity_etag = identity_headers["etag"]
+        self.assertEqual(gzip_headers["etag"], identity_etag[:-1] + '-gzip"')
+
+        status, body, headers = self._get("/gui", {"Accept-Encoding": "gzip", "If-None-Match": gzip_headers["etag"]})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(headers["etag"], gzip_headers["etag"])
+
+        status, _, _ = self._get("/gui", {"If-None-Match": identity_etag})
+        self.assertEqual(status, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
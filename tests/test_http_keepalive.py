@@ -0,0 +1,140 @@
+import os
+import socket
+import threading
+import unittest
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+from src.api import web_service
+from src.shared import http_keepalive
+from src.ui import service as ui_service
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def _read_response(conn: HTTPConnection, method: str, path: str, **kwargs) -> tuple[int, dict[str, str], bytes]:
+    conn.request(method, path, **kwargs)
+    response = conn.getresponse()
+    body = response.read()
+    return int(response.status), {k.lower(): v for k, v in response.getheaders()}, body
+
+
+class TestApiKeepAlive(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._server = ThreadingHTTPServer(("127.0.0.1", 0), web_service.Handler)
+        cls._port = int(cls._server.server_address[1])
+        cls._thread = _serve(cls._server)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._server.shutdown()
+        cls._server.server_close()
+        cls._thread.join(timeout=2)
+
+    def setUp(self):
+        self.conn = HTTPConnection("127.0.0.1", self._port, timeout=15)
+        self.addCleanup(self.conn.close)
+
+    def test_sequential_requests_reuse_one_connection(self):
+        status, headers, _ = _read_response(self.conn, "GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers.get("connection"), "close")
+        first_socket = self.conn.sock
+
+        for path in ("/version", "/gui", "/does-not-exist"):
+            status, _, _ = _read_response(self.conn, "GET", path)
+            self.assertIn(status, {200, 404}, path)
+            self.assertIs(self.conn.sock, first_socket, path)
+
+    def test_not_modified_keeps_connection_open(self):
+        _, headers, _ = _read_response(self.conn, "GET", "/api/v1/dictionaries")
+        etag = headers["etag"]
+        first_socket = self.conn.sock
+
+        status, _, body = _read_response(self.conn, "GET", "/api/v1/dictionaries", headers={"If-None-Match": etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+
+        status, _, _ = _read_response(self.conn, "GET", "/health")
+        self.assertEqual(status, 200)
+        self.assertIs(self.conn.sock, first_socket)
+
+    def test_unread_request_body_closes_connection(self):
+        status, headers, _ = _read_response(
+            self.conn,
+            "POST",
+            "/not-a-route",
+            body=b'{"query": "x"}',
+            headers={"Content-Type": "application/json"},
+        )
+        self.assertEqual(status, 404)
+        self.assertEqual(headers.get("connection"), "close")
+
+    def test_max_requests_per_connection_announces_close(self):
+        with mock.patch.dict(os.environ, {http_keepalive.HTTP_KEEPALIVE_MAX_REQUESTS_ENV: "2"}):
+            conn = HTTPConnection("127.0.0.1", self._port, timeout=15)
+            self.addCleanup(conn.close)
+            _, first_headers, _ = _read_response(conn, "GET", "/health")
+            _, second_headers, _ = _read_response(conn, "GET", "/health")
+
+        self.assertNotEqual(first_headers.get("connection"), "close")
+        self.assertEqual(second_headers.get("connection"), "close")
+
+    def test_idle_connection_is_closed_after_timeout(self):
+        received = b""
+        with mock.patch.dict(os.environ, {http_keepalive.HTTP_KEEPALIVE_IDLE_TIMEOUT_ENV: "0.2"}):
+            sock = socket.create_connection(("127.0.0.1", self._port), timeout=5)
+            self.addCleanup(sock.close)
+            sock.sendall(b"GET /health HTTP/1.1\r\nHost: test\r\n\r\n")
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                received += chunk
+        self.assertTrue(received.startswith(b"HTTP/1.1 200"))
+
+    def test_disabled_keepalive_closes_every_response(self):
+        with mock.patch.dict(os.environ, {http_keepalive.HTTP_KEEPALIVE_ENABLED_ENV: "0"}):
+            conn = HTTPConnection("127.0.0.1", self._port, timeout=15)
+            self.addCleanup(conn.close)
+            _, headers, _ = _read_response(conn, "GET", "/health")
+        self.assertEqual(headers.get("connection"), "close")
+
+
+class TestUiKeepAlive(unittest.TestCase):
+    def test_gui_and_redirect_share_one_connection(self):
+        server = ui_service._UiHttpServer(
+            ("127.0.0.1", 0),
+            ui_service._UiHandler,
+            app_version="test",
+            ui_api_base_url="",
+        )
+        thread = _serve(server)
+        conn = HTTPConnection("127.0.0.1", int(server.server_address[1]), timeout=15)
+        try:
+            status, _, _ = _read_response(conn, "GET", "/gui")
+            self.assertEqual(status, 200)
+            first_socket = conn.sock
+
+            status, headers, _ = _read_response(conn, "GET", "/history")
+            self.assertEqual(status, 302)
+            self.assertEqual(headers.get("location"), "/gui/history")
+            self.assertIs(conn.sock, first_socket)
+
+            status, _, _ = _read_response(conn, "GET", "/healthz")
+            self.assertIs(conn.sock, first_socket)
+        finally:
+            conn.close()
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
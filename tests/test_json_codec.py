@@ -0,0 +1,65 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from src.shared import json_codec
+
+
+def _stdlib_canonical(payload):
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+_CANONICAL_CASES = [
+    {"query": "Bahnhofstrasse 1, 8001 Zürich", "intelligence_mode": "risk", "options": {"response_mode": "verbose"}},
+    {"b": 1, "a": [1.5, 0.1, -0.0, 1e15], "é": {"z": True, "y": False}},
+    {"tiny": 1e-05, "huge": 1e16, "nested": [{"x": 2.5e-7}]},
+    {"missing": None, "list": [None, 1]},
+    {"nan": float("nan"), "inf": float("inf")},
+    {"big": 2**70},
+    {"control": "tab\tnewline\nnull\u0000 emoji 😀  "},
+]
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_canonical_output_is_identical_for_all_encoders(self):
+        for codec in ("auto", "stdlib"):
+            with mock.patch.dict(os.environ, {json_codec.JSON_CODEC_ENV: codec}):
+                for payload in _CANONICAL_CASES:
+                    with self.subTest(codec=codec, payload=payload):
+                        self.assertEqual(json_codec.dumps_canonical(payload), _stdlib_canonical(payload))
+
+    @unittest.skipIf(json_codec._orjson is None, "orjson not installed")
+    def test_canonical_keeps_native_output_for_nulls_and_hex_strings(self):
+        payload = {"missing": None, "sha256": "2e4f0e9a" * 8, "labels": [None, "1e5"], "score": 0.5}
+        with mock.patch.dict(os.environ, {json_codec.JSON_CODEC_ENV: "auto"}):
+            with mock.patch.object(json_codec, "_stdlib_canonical", side_effect=AssertionError("fallback")):
+                self.assertEqual(json_codec.dumps_canonical(payload), _stdlib_canonical(payload))
+
+    def test_orjson_minimum_version_parsing(self):
+        self.assertGreaterEqual(json_codec._version_tuple("3.8.3"), json_codec._ORJSON_MIN_VERSION)
+        self.assertGreaterEqual(json_codec._version_tuple("3.10.0rc1"), json_codec._ORJSON_MIN_VERSION)
+        self.assertLess(json_codec._version_tuple("3.6.9"), json_codec._ORJSON_MIN_VERSION)
+
+    def test_canonical_falls_back_for_non_string_keys(self):
+        payload = {2: "b", 1: "a"}
+        self.assertEqual(json_codec.dumps_canonical({"k": payload}), _stdlib_canonical({"k": payload}))
+
+    def test_wire_and_pretty_round_trip(self):
+        payload = {"ok": True, "result": {"score": 81.5, "labels": ["Zürich", None]}, "request_id": "req-1"}
+        for codec in ("auto", "stdlib"):
+            with mock.patch.dict(os.environ, {json_codec.JSON_CODEC_ENV: codec}):
+                with self.subTest(codec=codec):
+                    self.assertEqual(json.loads(json_codec.dumps_wire(payload)), payload)
+                    pretty = json_codec.dumps_pretty(payload)
+                    self.assertEqual(json.loads(pretty), payload)
+                    self.assertTrue(pretty.startswith(b'{\n  "ok": true'))
+
+    def test_stdlib_codec_env_forces_stdlib_wire_format(self):
+        with mock.patch.dict(os.environ, {json_codec.JSON_CODEC_ENV: "stdlib"}):
+            self.assertEqual(json_codec.native_encoder_name(), "stdlib")
+            self.assertEqual(json_codec.dumps_wire({"ok": True}), b'{"ok": true}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import os
+import signal
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.api import web_service
+from src.api.prefork_server import PreforkSupervisor, prefork_supported
+from src.shared.async_job_store_sqlite import SqliteAsyncJobStore
+
+
+def _wait_for(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@unittest.skipUnless(prefork_supported(), "requires os.fork and SO_REUSEPORT")
+class TestPreforkSupervisor(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.marker_dir = Path(self._tmp.name)
+
+    def _markers(self) -> list[str]:
+        return sorted(path.name for path in self.marker_dir.iterdir())
+
+    def _run_in_thread(self, supervisor: PreforkSupervisor) -> tuple[threading.Thread, dict]:
+        outcome: dict = {}
+
+        def _target():
+            outcome["exit_code"] = supervisor.run(install_signal_handlers=False)
+
+        thread = threading.Thread(target=_target, daemon=True)
+        thread.start()
+        return thread, outcome
+
+    def test_spawns_workers_and_restarts_crashed_slot(self):
+        marker_dir = self.marker_dir
+
+        def run_worker(worker_index: int, generation: int) -> None:
+            (marker_dir / f"w{worker_index}-g{generation}-{os.getpid()}").touch()
+            if worker_index == 1 and generation == 0:
+                raise RuntimeError("simulated crash")
+            signal.pause()
+
+        events: list[tuple[str, dict]] = []
+        supervisor = PreforkSupervisor(
+            processes=2,
+            run_worker=run_worker,
+            restart_backoff_seconds=0.0,
+            on_event=lambda event, fields: events.append((event, fields)),
+        )
+        thread, outcome = self._run_in_thread(supervisor)
+        try:
+            self.assertTrue(
+                _wait_for(lambda: {m.rsplit("-", 1)[0] for m in self._markers()} >= {"w0-g0", "w1-g0", "w1-g1"})
+            )
+        finally:
+            supervisor.request_stop()
+            thread.join(timeout=15)
+
+        self.assertEqual(outcome.get("exit_code"), 0)
+        self.assertNotIn("w0-g1", {m.rsplit("-", 1)[0] for m in self._markers()})
+        exited = [fields for event, fields in events if event == "worker_exited"]
+        self.assertIn((1, 0, 1), {(f["worker_index"], f["generation"], f["exit_code"]) for f in exited})
+
+        worker_pids = [int(m.rsplit("-", 1)[1]) for m in self._markers()]
+        for pid in worker_pids:
+            with self.assertRaises(ProcessLookupError):
+                os.kill(pid, 0)
+
+    def test_crash_loop_stops_supervisor_with_exit_code(self):
+        def run_worker(worker_index: int, generation: int) -> None:
+            raise SystemExit(3)
+
+        supervisor = PreforkSupervisor(
+            processes=1,
+            run_worker=run_worker,
+            restart_backoff_seconds=0.0,
+            max_restarts=2,
+        )
+        thread, outcome = self._run_in_thread(supervisor)
+        thread.join(timeout=15)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(outcome.get("exit_code"), 1)
+
+
+class TestWebServicePreforkWiring(unittest.TestCase):
+    def test_process_count_parsing(self):
+        with mock.patch.dict(os.environ, {"API_SERVER_PROCESSES": ""}):
+            self.assertEqual(web_service._resolve_server_process_count(), 1)
+        with mock.patch.dict(os.environ, {"API_SERVER_PROCESSES": "4"}):
+            self.assertEqual(web_service._resolve_server_process_count(), 4)
+        with mock.patch.dict(os.environ, {"API_SERVER_PROCESSES": "auto"}):
+            self.assertGreaterEqual(web_service._resolve_server_process_count(), 1)
+        with mock.patch.dict(os.environ, {"API_SERVER_PROCESSES": "0"}):
+            with self.assertRaises(ValueError):
+                web_service._resolve_server_process_count()
+
+    def test_prefork_rejects_process_local_file_store(self):
+        with mock.patch.object(web_service, "is_bff_oidc_enabled", return_value=False):
+            with self.assertRaisesRegex(ValueError, "ASYNC_STORE_BACKEND=db"):
+                web_service._ensure_prefork_compatible()
+
+    @unittest.skipUnless(prefork_supported(), "requires SO_REUSEPORT")
+    def test_reuse_port_allows_several_listeners_on_one_port(self):
+        first = web_service._build_api_http_server("127.0.0.1", 0, reuse_port=True)
+        try:
+            port = int(first.server_address[1])
+            second = web_service._build_api_http_server("127.0.0.1", port, reuse_port=True)
+            second.server_close()
+        finally:
+            first.server_close()
+
+    def test_prefork_defaults_to_lease_claims(self):
+        with mock.patch.object(web_service, "is_bff_oidc_enabled", return_value=False), mock.patch.object(
+            web_service, "_async_job_store", return_value=mock.Mock(spec=SqliteAsyncJobStore)
+        ):
+            with mock.patch.dict(os.environ, {"ASYNC_WORKER_QUEUE": ""}):
+                web_service._ensure_prefork_compatible()
+                self.assertEqual(os.environ["ASYNC_WORKER_QUEUE"], "db")
+            with mock.patch.dict(os.environ, {"ASYNC_WORKER_QUEUE": "local"}):
+                with self.assertRaisesRegex(ValueError, "ASYNC_WORKER_QUEUE=db"):
+                    web_service._ensure_prefork_compatible()
+
+    def test_restarted_workers_serve_with_reuse_port(self):
+        for worker_index, generation in ((0, 0), (0, 1), (1, 0)):
+            with self.subTest(worker_index=worker_index, generation=generation), mock.patch.object(
+                web_service, "_serve_api"
+            ) as serve_api:
+                web_service._run_prefork_worker(
+                    worker_index, generation, host="127.0.0.1", port=0, tls_settings=None
+                )
+                self.assertTrue(serve_api.call_args.kwargs["reuse_port"])
+                self.assertEqual(serve_api.call_args.kwargs["worker_index"], worker_index)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "profile_startup.py"
+SPEC = importlib.util.spec_from_file_location("profile_startup", MODULE_PATH)
+assert SPEC and SPEC.loader
+MODULE = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+def test_parse_importtime_reads_self_cumulative_and_depth() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   _io",
+            "import time:      4104 |     124524 | src.api.web_service",
+            "import time:       967 |      21911 |     http.server",
+            "some unrelated warning",
+        ]
+    )
+
+    timings = MODULE.parse_importtime(stderr)
+
+    assert [t.module for t in timings] == ["_io", "src.api.web_service", "http.server"]
+    assert timings[1].self_us == 4104
+    assert timings[1].cumulative_us == 124524
+    assert [t.depth for t in timings] == [1, 0, 2]
+
+
+def test_bench_row_flags_budget_and_eager_lazy_modules() -> None:
+    row = MODULE._bench_row(
+        "src.api.web_service",
+        [90.0, 120.0, 300.0],
+        {"src.api.web_service", "src.shared.gui_mvp"},
+        budget_ms=100.0,
+    )
+
+    assert row["median_ms"] == 120.0
+    assert row["over_budget"] is True
+    assert row["eager_lazy_modules"] == ["src.shared.gui_mvp"]
+
+
+def test_web_service_import_keeps_heavy_modules_lazy() -> None:
+    _, loaded = MODULE.measure_import("src.api.web_service")
+
+    assert "src.api.web_service" in loaded
+    assert "src.api.address_intel" not in loaded
+    assert "src.shared.gui_mvp" not in loaded
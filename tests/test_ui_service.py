@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import socket
 import subprocess
 import sys
@@ -46,6 +47,17 @@ def _http(url: str, *, timeout: float = 10.0, follow_redirects: bool = True):
         )
 
 
+def _http_gui_assets_text(base_url: str, shell_html: str) -> str:
+    """Lädt die von der GUI-Shell referenzierten CSS/JS-Assets."""
+    parts = []
+    for asset_path in re.findall(r'(?:href|src)="(/gui/assets/[^"]+)"', shell_html):
+        status, asset_body, headers = _http(f"{base_url}{asset_path}")
+        assert status == 200, asset_path
+        assert headers.get("cache-control") == "public, max-age=31536000, immutable", asset_path
+        parts.append(asset_body)
+    return "\n" + "\n".join(parts)
+
+
 class _UpstreamAuthStubHandler(BaseHTTPRequestHandler):
     server_version = "auth-stub/1.0"
 
@@ -194,7 +206,9 @@ class TestUiService(unittest.TestCase):
         self.assertIn("text/html", headers.get("content-type", ""))
         self.assertIn("geo-ranking.ch GUI MVP", body)
         self.assertIn("Version ui-test-v1", body)
-        self.assertIn(f'fetch("{self.api_base_url}/analyze"', body)
+        self.assertIn(f'const ANALYZE_ENDPOINT = "{self.api_base_url}/analyze";', body)
+        body += _http_gui_assets_text(self.base_url, body)
+        self.assertIn("fetch(ANALYZE_ENDPOINT, {", body)
         self.assertIn(f'const TRACE_DEBUG_ENDPOINT = "{self.api_base_url}/debug/trace";', body)
         self.assertIn('function projectTraceEvent(rawEvent, index)', body)
         self.assertIn('function normalizeTraceEvents(rawEvents)', body)
@@ -410,6 +424,7 @@ class TestUiService(unittest.TestCase):
         """GET /gui: kein Bearer-Token-Input, keine Authorization-Header-Injektion, Session-UX-Texte vorhanden."""
         status, body, _ = _http(f"{self.base_url}/gui")
         self.assertEqual(status, 200)
+        body += _http_gui_assets_text(self.base_url, body)
         self.assertNotIn('id="api-token"', body, "/gui darf kein manuelles Token-Input mehr enthalten")
         self.assertNotIn('headers["Authorization"]', body, "/gui darf keinen Browser-Authorization-Header setzen")
         self.assertIn('Session ungültig oder abgelaufen — bitte erneut einloggen.', body)
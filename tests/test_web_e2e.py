@@ -607,6 +607,24 @@ class TestWebServiceE2E(unittest.TestCase):
         self.assertEqual(body.get("error"), "bad_request")
         self.assertIn("options.response_mode", body.get("message", ""))
 
+    def test_bad_request_modules_rejects_unknown_module_names(self):
+        for modules in (["building", "weather"], "building", []):
+            with self.subTest(modules=modules):
+                status, body = _http_json(
+                    "POST",
+                    f"{self.base_url}/analyze",
+                    payload={
+                        "query": "__ok__",
+                        "intelligence_mode": "basic",
+                        "timeout_seconds": 2,
+                        "options": {"modules": modules},
+                    },
+                    headers={"Authorization": "Bearer bl18-token"},
+                )
+                self.assertEqual(status, 400)
+                self.assertEqual(body.get("error"), "bad_request")
+                self.assertIn("options.modules", body.get("message", ""))
+
     def test_analyze_code_first_is_default_without_include_labels(self):
         status, body = _http_json(
             "POST",
@@ -1,5 +1,6 @@
 import json
 import unittest
+from copy import deepcopy
 
 from src.web_service import _grouped_api_result
 
@@ -281,6 +282,39 @@ class TestGroupedApiResult(unittest.TestCase):
             ),
         )
 
+    def test_projection_does_not_mutate_report_and_is_deterministic(self):
+        report = {
+            "query": "Bahnhofstrasse 1, 8001 Zürich",
+            "match": {"selected_score": 0.99, "candidate_count": 3, "status": "ok"},
+            "building": {"baujahr": 1999, "codes": {"gkat": 1020}, "decoded": {"gkat": "Wohnhaus"}},
+            "energy": {"raw_codes": {"gwaerzh1": 7410}, "decoded_summary": {"heizung": ["Wärmepumpe"]}},
+            "intelligence": {"tenants_businesses": {"entities": [{"name": "Muster AG", "status": "ok"}]}},
+            "sources": {"geoadmin_search": {"status": "ok"}, "osm_reverse": {"status": "ok"}},
+            "source_attribution": {
+                "match": ["geoadmin_search"],
+                "building_energy": ["geoadmin_search", "osm_reverse"],
+                "intelligence": ["osm_reverse"],
+            },
+            "field_provenance": {
+                "building.baujahr": {"primary_source": "geoadmin_search", "sources": ["geoadmin_search"], "present": True}
+            },
+        }
+        snapshot = deepcopy(report)
+
+        for mode in ("compact", "verbose"):
+            with self.subTest(mode=mode):
+                grouped = _grouped_api_result(report, response_mode=mode)
+                reference = _grouped_api_result(deepcopy(snapshot), response_mode=mode)
+
+                self.assertEqual(report, snapshot)
+                self.assertEqual(
+                    json.dumps(grouped, ensure_ascii=False),
+                    json.dumps(reference, ensure_ascii=False),
+                )
+                self.assertIn("decoded", report["building"])
+                self.assertNotIn("decoded", grouped["data"]["modules"]["building"])
+                self.assertEqual(grouped["data"]["modules"]["energy"]["codes"], {"gwaerzh1": "7410"})
+
 
 if __name__ == "__main__":
     unittest.main()
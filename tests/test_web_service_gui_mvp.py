@@ -1,4 +1,5 @@
 import os
+import re
 import socket
 import subprocess
 import sys
@@ -32,6 +33,20 @@ def _http_text(url: str, *, timeout: float = 10.0):
         return exc.code, body, headers
 
 
+_GUI_ASSET_REF_RE = re.compile(r'(?:href|src)="(/gui/assets/[^"]+)"')
+
+
+def _http_gui_text(base_url: str):
+    """GET /gui plus referenzierte CSS/JS-Assets (Shell + Assets als ein Text)."""
+    status, body, headers = _http_text(f"{base_url}/gui")
+    parts = [body]
+    for asset_path in _GUI_ASSET_REF_RE.findall(body):
+        asset_status, asset_body, _ = _http_text(f"{base_url}{asset_path}")
+        assert asset_status == 200, asset_path
+        parts.append(asset_body)
+    return status, "\n".join(parts), headers
+
+
 class TestWebServiceGuiMvp(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -78,7 +93,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
             cls.proc.kill()
 
     def test_gui_shell_is_served_with_html_content_type(self):
-        status, body, headers = _http_text(f"{self.base_url}/gui")
+        status, body, headers = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn("text/html", headers.get("content-type", ""))
         self.assertIn("geo-ranking.ch GUI MVP", body)
@@ -99,7 +114,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn("Version test-gui-v1", body)
 
     def test_gui_shell_exposes_state_machine_markers(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn('Status: idle', body)
         self.assertIn('idle -> loading -> success/error', body)
@@ -293,7 +308,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn('window.addEventListener("keydown"', body)
 
     def test_gui_results_empty_state_cta_resets_filters_and_reloads(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn('title: "Keine Daten in der aktuellen Auswahl"', body)
         self.assertIn('description: "Für den aktuellen Zeitraum oder die aktive Auswahl liegen keine Einträge vor."', body)
@@ -307,7 +322,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertNotIn('Beispieladresse einfügen', body)
 
     def test_gui_results_empty_state_supports_network_and_unauthorized_recovery(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn('loading: "Ergebnisliste wird aktualisiert …"', body)
         self.assertIn('network: "Ergebnisliste aktuell wegen Netzwerkproblem nicht verfügbar."', body)
@@ -331,7 +346,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn('renderResultsList();', body)
 
     def test_gui_map_marker_legibility_styles_present(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn(".map-surface.has-marker .map-crosshair", body)
         self.assertIn('mapSurface.classList.add("has-marker")', body)
@@ -347,7 +362,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn("width: 22px", body)
 
     def test_gui_map_legend_mobile_overlap_contract_present(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn('class="map-legend map-legend--actions"', body)
         self.assertIn(".map-legend--actions", body)
@@ -362,7 +377,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn("line-height: 1.4", body)
 
     def test_gui_mobile_touch_target_css_contract_present(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn("--touch-target-min: 44px", body)
         self.assertIn('.burger-menu[hidden],', body)
@@ -391,7 +406,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn('id="map-zoom-in"', body)
 
     def test_gui_results_table_mobile_card_mode_contract_present(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
         self.assertIn("@media (max-width: 390px)", body)
         self.assertIn(".results-table td::before", body)
@@ -406,7 +421,7 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertIn('tdActions.dataset.label = "Aktionen";', body)
 
     def test_trace_deep_link_state_flow_markers_present(self):
-        status, body, _ = _http_text(f"{self.base_url}/gui")
+        status, body, _ = _http_gui_text(self.base_url)
         self.assertEqual(status, 200)
 
         required_markers = [
@@ -433,6 +448,35 @@ class TestWebServiceGuiMvp(unittest.TestCase):
         self.assertEqual(status, 200)
         self.assertIn("Result-Panel", body)
 
+    def test_gui_assets_are_fingerprinted_and_immutable(self):
+        status, shell, headers = _http_text(f"{self.base_url}/gui")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get("cache-control"), "private, no-cache")
+        self.assertNotIn("function projectTraceEvent(rawEvent, index)", shell)
+        asset_paths = _GUI_ASSET_REF_RE.findall(shell)
+        self.assertEqual(len(asset_paths), 2)
+
+        for asset_path in asset_paths:
+            self.assertRegex(asset_path, r"^/gui/assets/gui-mvp\.[0-9a-f]{16}\.(css|js)$")
+            status, _, asset_headers = _http_text(f"{self.base_url}{asset_path}")
+            self.assertEqual(status, 200)
+            self.assertEqual(asset_headers.get("cache-control"), "public, max-age=31536000, immutable")
+            self.assertTrue(asset_headers.get("etag"))
+
+        status, _, _ = _http_text(f"{self.base_url}/gui/assets/gui-mvp.0000000000000000.js")
+        self.assertEqual(status, 404)
+
+    def test_gui_shell_revalidates_with_etag(self):
+        _, _, headers = _http_text(f"{self.base_url}/gui")
+        etag = headers.get("etag")
+        self.assertTrue(etag)
+
+        req = request.Request(f"{self.base_url}/gui", headers={"If-None-Match": etag}, method="GET")
+        with self.assertRaises(error.HTTPError) as ctx:
+            request.urlopen(req, timeout=10)
+        self.assertEqual(ctx.exception.code, 304)
+        self.assertEqual(ctx.exception.read(), b"")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -251,7 +251,7 @@ class TestWebServiceRequestLifecycleLogging(unittest.TestCase):
             )
 
         self.assertEqual(status, 200)
-        self.assertIn('"ok": true', body.lower())
+        self.assertIs(json.loads(body).get("ok"), True)
 
         upstream_events = [
             event
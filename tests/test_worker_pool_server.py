@@ -0,0 +1,225 @@
+import json
+import os
+import socket
+import threading
+import time
+import unittest
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.api import web_service
+from src.api.worker_pool_server import WorkerPoolHTTPServer
+
+
+class _BlockingHandler(BaseHTTPRequestHandler):
+    release = threading.Event()
+
+    def do_GET(self):  # noqa: N802
+        if self.path.startswith("/slow"):
+            self.release.wait(timeout=10)
+        body = json.dumps({"ok": True, "path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        return
+
+
+def _get(port: int, path: str, timeout: float = 5.0) -> tuple[int, dict[str, str], bytes]:
+    conn = HTTPConnection("127.0.0.1", port, timeout=timeout)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        return int(response.status), {k.lower(): v for k, v in response.getheaders()}, response.read()
+    finally:
+        conn.close()
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestWorkerPoolHTTPServer(unittest.TestCase):
+    def setUp(self):
+        _BlockingHandler.release = threading.Event()
+        self.shed_events = []
+        self.server = WorkerPoolHTTPServer(
+            ("127.0.0.1", 0),
+            _BlockingHandler,
+            workers=1,
+            queue_size=1,
+            priority_workers=1,
+            retry_after_seconds=3,
+            on_shed=lambda lane, stats: self.shed_events.append(lane),
+        )
+        self.port = int(self.server.server_address[1])
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.slow_sockets: list[socket.socket] = []
+
+    def tearDown(self):
+        _BlockingHandler.release.set()
+        for sock in self.slow_sockets:
+            sock.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=2)
+
+    def _open_slow_request(self) -> socket.socket:
+        sock = socket.create_connection(("127.0.0.1", self.port), timeout=5)
+        sock.sendall(b"GET /slow HTTP/1.1\r\nHost: test\r\n\r\n")
+        self.slow_sockets.append(sock)
+        return sock
+
+    def _saturate_normal_lane(self) -> None:
+        self._open_slow_request()
+        self.assertTrue(_wait_until(lambda: self.server.stats()["lanes"]["normal"]["busy_workers"] == 1))
+        self._open_slow_request()
+        self.assertTrue(_wait_until(lambda: self.server.stats()["lanes"]["normal"]["queue_depth"] == 1))
+
+    def test_rejects_with_503_and_retry_after_when_queue_is_full(self):
+        self._saturate_normal_lane()
+
+        status, headers, body = _get(self.port, "/analyze")
+
+        self.assertEqual(status, 503)
+        self.assertEqual(headers.get("retry-after"), "3")
+        self.assertEqual(headers.get("connection"), "close")
+        self.assertEqual(json.loads(body)["error"], "server_overloaded")
+        self.assertEqual(self.shed_events, ["normal"])
+
+        stats = self.server.stats()
+        self.assertEqual(stats["rejected_total"], 1)
+        self.assertEqual(stats["lanes"]["normal"]["rejected_total"], 1)
+        self.assertEqual(stats["lanes"]["normal"]["queue_capacity"], 1)
+
+    def test_health_and_version_use_priority_lane_under_load(self):
+        self._saturate_normal_lane()
+
+        for path in ("/health", "/healthz/", "/version?x=1"):
+            status, _, body = _get(self.port, path)
+            self.assertEqual(status, 200, path)
+            self.assertTrue(json.loads(body)["ok"])
+
+        stats = self.server.stats()
+        self.assertEqual(stats["lanes"]["priority"]["accepted_total"], 3)
+        self.assertEqual(stats["rejected_total"], 0)
+
+    def test_queued_requests_complete_once_workers_free_up(self):
+        first = self._open_slow_request()
+        second = self._open_slow_request()
+        _BlockingHandler.release.set()
+
+        for sock in (first, second):
+            self.assertTrue(sock.recv(4096).startswith(b"HTTP/1.0 200"))
+        self.assertEqual(self.server.stats()["lanes"]["normal"]["accepted_total"], 2)
+
+    def test_idle_connections_do_not_stall_accepts(self):
+        server = WorkerPoolHTTPServer(
+            ("127.0.0.1", 0),
+            _BlockingHandler,
+            workers=1,
+            queue_size=4,
+            priority_workers=1,
+            classify_timeout_seconds=5.0,
+        )
+        port = int(server.server_address[1])
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        idle = [socket.create_connection(("127.0.0.1", port), timeout=5) for _ in range(3)]
+        try:
+            self.assertTrue(_wait_until(lambda: server.stats()["classify_pending"] == 3))
+            started = time.monotonic()
+            status, _, _ = _get(port, "/health")
+            self.assertEqual(status, 200)
+            self.assertLess(time.monotonic() - started, 1.0)
+
+            # Eine später eintreffende Request-Line wird noch klassifiziert.
+            idle[0].sendall(b"GET /version HTTP/1.1\r\nHost: test\r\n\r\n")
+            self.assertTrue(idle[0].recv(4096).startswith(b"HTTP/1.0 200"))
+            self.assertEqual(server.stats()["lanes"]["priority"]["accepted_total"], 2)
+            self.assertEqual(server.stats()["classify_pending"], 2)
+        finally:
+            for sock in idle:
+                sock.close()
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+
+class TestApiServerSettings(unittest.TestCase):
+    def test_defaults_to_threading_server(self):
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("API_SERVER_MODE", None)
+            server = web_service._build_api_http_server("127.0.0.1", 0)
+        try:
+            self.assertIs(type(server), ThreadingHTTPServer)
+        finally:
+            server.server_close()
+
+    def test_pool_mode_reads_sizes_from_env(self):
+        env = {
+            "API_SERVER_MODE": "pool",
+            "API_WORKER_POOL_SIZE": "3",
+            "API_WORKER_QUEUE_SIZE": "7",
+            "API_PRIORITY_WORKERS": "1",
+        }
+        with mock.patch.dict(os.environ, env, clear=False):
+            server = web_service._build_api_http_server("127.0.0.1", 0)
+        try:
+            self.assertIsInstance(server, WorkerPoolHTTPServer)
+            lanes = server.stats()["lanes"]
+            self.assertEqual(lanes["normal"]["workers"], 3)
+            self.assertEqual(lanes["normal"]["queue_capacity"], 7)
+            self.assertEqual(lanes["priority"]["workers"], 1)
+        finally:
+            server.server_close()
+
+    def test_invalid_settings_fail_fast(self):
+        for env in ({"API_SERVER_MODE": "forking"}, {"API_SERVER_MODE": "pool", "API_WORKER_POOL_SIZE": "0"}):
+            with self.subTest(env=env), mock.patch.dict(os.environ, env, clear=False):
+                with self.assertRaises(ValueError):
+                    web_service._resolve_server_settings()
+
+    def test_health_details_exposes_pool_stats(self):
+        with mock.patch.dict(os.environ, {"API_SERVER_MODE": "pool"}, clear=False):
+            server = web_service._build_api_http_server("127.0.0.1", 0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            status, _, body = _get(int(server.server_address[1]), "/health/details", timeout=15)
+            payload = json.loads(body)
+            self.assertEqual(status, 200)
+            self.assertEqual(payload["server"]["mode"], "pool")
+            self.assertIn("queue_depth", payload["server"]["lanes"]["normal"])
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=2)
+
+    def test_pool_mode_closes_connections_after_each_response(self):
+        with mock.patch.dict(os.environ, {"API_SERVER_MODE": "pool", "HTTP_KEEPALIVE_ENABLED": "1"}, clear=False):
+            server = web_service._build_api_http_server("127.0.0.1", 0)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                status, headers, _ = _get(int(server.server_address[1]), "/health", timeout=15)
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join(timeout=2)
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get("connection"), "close")
+
+
+if __name__ == "__main__":
+    unittest.main()